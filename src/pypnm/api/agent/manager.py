@@ -13,9 +13,25 @@ from typing import Optional
 from fastapi import WebSocket
 
 from pypnm.api.agent.models import ConnectedAgent, PendingTask
+from pypnm.lib.telemetry.metrics import REGISTRY
+from pypnm.lib.telemetry.tracing import trace_span
 
 logger = logging.getLogger(__name__)
 
+AGENT_PENDING_TASKS = REGISTRY.gauge(
+    "pypnm_agent_pending_tasks",
+    "Tasks sent to remote agents and not yet answered or expired.",
+)
+AGENT_TASK_RTT_SECONDS = REGISTRY.histogram(
+    "pypnm_agent_task_rtt_seconds",
+    "Round-trip time from sending a task to receiving the agent response, by command.",
+    ("command",),
+)
+AGENT_TASK_TIMEOUTS = REGISTRY.counter(
+    "pypnm_agent_task_timeouts_total",
+    "Tasks whose waiter timed out before the agent responded.",
+)
+
 
 class AgentManager:
     """Manages WebSocket connections to remote agents."""
@@ -149,6 +165,7 @@ class AgentManager:
         task.completed = True
         task.result = data.get('result')
         task.error = data.get('error')
+        AGENT_TASK_RTT_SECONDS.observe(time.time() - task.created_at, command=task.command)
 
         in_sync  = request_id in self._task_queues
         in_async = request_id in self._async_task_queues
@@ -256,6 +273,7 @@ class AgentManager:
         self.pending_tasks[task_id] = task
         self._task_queues[task_id] = Queue()
         self._async_task_queues[task_id] = asyncio.Queue(maxsize=1)
+        AGENT_PENDING_TASKS.set(len(self.pending_tasks))
         
         # Send command to agent
         msg = json.dumps({
@@ -272,6 +290,7 @@ class AgentManager:
             self.logger.error(f"Failed to send task {task_id} to '{agent_id}': {e}")
             del self.pending_tasks[task_id]
             del self._task_queues[task_id]
+            AGENT_PENDING_TASKS.set(len(self.pending_tasks))
             raise
         
         return task_id
@@ -285,36 +304,38 @@ class AgentManager:
             result = self._task_queues[task_id].get(timeout=timeout)
             return result
         except Empty:
+            AGENT_TASK_TIMEOUTS.inc()
             return None
         finally:
-            if task_id in self._task_queues:
-                del self._task_queues[task_id]
-            if task_id in self._async_task_queues:
-                del self._async_task_queues[task_id]
-            if task_id in self.pending_tasks:
-                del self.pending_tasks[task_id]
+            self._discard_task(task_id)
     
     async def wait_for_task_async(self, task_id: str, timeout: float = 30.0) -> Optional[dict]:
         """Wait for task result (async - for async code)."""
         if task_id not in self._async_task_queues:
             return None
         
+        task = self.pending_tasks.get(task_id)
+        command = task.command if task else 'unknown'
         try:
-            result = await asyncio.wait_for(
-                self._async_task_queues[task_id].get(),
-                timeout=timeout
-            )
+            with trace_span('agent.task', command=command, task_id=task_id):
+                result = await asyncio.wait_for(
+                    self._async_task_queues[task_id].get(),
+                    timeout=timeout
+                )
             return result
         except asyncio.TimeoutError:
             self.logger.error(f"Timeout ({timeout}s) waiting for task {task_id} — agent is still running; increase timeout or reduce SNMP repetitions")
+            AGENT_TASK_TIMEOUTS.inc()
             return None
         finally:
-            if task_id in self._task_queues:
-                del self._task_queues[task_id]
-            if task_id in self._async_task_queues:
-                del self._async_task_queues[task_id]
-            if task_id in self.pending_tasks:
-                del self.pending_tasks[task_id]
+            self._discard_task(task_id)
+
+    def _discard_task(self, task_id: str) -> None:
+        """Drop a task's queues and pending entry once its waiter is done."""
+        self._task_queues.pop(task_id, None)
+        self._async_task_queues.pop(task_id, None)
+        self.pending_tasks.pop(task_id, None)
+        AGENT_PENDING_TASKS.set(len(self.pending_tasks))
 
 
 # Global instance
@@ -1,16 +1,20 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import pathlib
 import sys
+from collections.abc import Awaitable, Callable
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse
 
 from pypnm.api.utils.auto_load import RouterRegistrar
+from pypnm.lib.telemetry.metrics import CONTENT_TYPE_LATEST, REGISTRY
+from pypnm.lib.telemetry.tracing import trace_span
 from pypnm.startup.startup import StartUp
 from pypnm.version import __version__
 
@@ -69,6 +73,24 @@ def clear_cache() -> dict[str, str]:
     _enrichment_cache.clear()
     return {"status": "ok", "cleared": str(count)}
 
+@app.get("/metrics", tags=["health"], response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """In-process metrics (SNMP, agent, TFTP, parse/analysis, JSON DB, spans) in Prometheus text format."""
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE_LATEST)
+
+
+TRACE_HEADER = "X-Trace-Id"
+
+
+@app.middleware("http")
+async def trace_requests(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """Open a root span per request; SNMP, agent, fetch, parse and analysis spans nest under it."""
+    with trace_span("http.request", trace_id=request.headers.get(TRACE_HEADER),
+                    method=request.method, path=request.url.path) as span:
+        response = await call_next(request)
+    response.headers[TRACE_HEADER] = span.trace_id
+    return response
+
 app.add_middleware(GZipMiddleware, minimum_size=100_000)
 app.add_middleware(
     CORSMiddleware,
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -24,6 +24,11 @@ from pypnm.lib.csv.manager import CSVManager
 from pypnm.lib.db.json_transaction import JsonTransactionDb
 from pypnm.lib.mac_address import MacAddress, cast
 from pypnm.lib.matplot.manager import MatplotManager
+from pypnm.lib.matplot.render_pool import (
+    PLOT_RENDER_CACHE_DIR,
+    MatplotRenderPool,
+    PlotRenderCache,
+)
 from pypnm.lib.types import ChannelId, JSONScalar, PathArray, PathLike, TimeStamp
 from pypnm.lib.utils import Generate, TimeUnit
 
@@ -56,6 +61,7 @@ class MultiAnalysisRpt(ABC):
         self.csv_files: list[PathLike]  = []
         self.plot_files: list[PathLike] = []
         self.json_files: list[PathLike] = []
+        self._archive_members: list[Path] = []
 
         self.logger.info(f"MultiAnalysisRpt: MAC: {self._mac_addresses}, "
                          f"Model: {self._sys_descr_model.model_dump()}, "
@@ -162,12 +168,17 @@ class MultiAnalysisRpt(ABC):
         """
         return self._generate_fname()
 
-    def build_report(self) -> Path:
+    def build_report(self, archive: bool = True) -> Path:
         """
         Run the full report pipeline: `_process()` → CSV generation → plot rendering → ZIP.
 
+        Args:
+            archive: When False, skip writing the ZIP to `archive_dir`; the members
+                remain available via `get_archive_members()` for a streamed download.
+
         Returns:
-            The path to the created ZIP archive.
+            The path to the created ZIP archive (the planned archive path when
+            `archive` is False).
 
         Typical use:
             archive = report.build_report()
@@ -187,17 +198,28 @@ class MultiAnalysisRpt(ABC):
             self.csv_files.append(csv_mgr.get_path_fname())
             f.append(csv_mgr.get_path_fname())
 
-        for matplot_mgr in self.create_matplot():
-            for fn in matplot_mgr.get_png_files():
-                self.logger.debug(f'Wrote Matplotlib Figure: {fn}')
-                self.plot_files.append(fn)
-                f.append(fn)
+        with MatplotManager.deferred_rendering() as jobs:
+            self.create_matplot()
+
+        rendered = MatplotRenderPool.render(
+            jobs,
+            cache   = PlotRenderCache(Path(self._png_dir) / PLOT_RENDER_CACHE_DIR),
+        )
+        for fn in rendered:
+            self.logger.debug(f'Wrote Matplotlib Figure: {fn}')
+            self.plot_files.append(fn)
+            f.append(fn)
 
         if not self.json_files:
             self.logger.warning("No JSON files were registered for the report archive.")
         else:
             f.extend(self.json_files)
 
+        self._archive_members = [Path(p) for p in f[1:]]
+        if not archive:
+            self.archive_file = self.create_archive_fname()
+            return Path(self.archive_file)
+
         try:
             self.archive_file = ArchiveManager().zip_files(files=f, archive_path=self.create_archive_fname())
 
@@ -206,6 +228,16 @@ class MultiAnalysisRpt(ABC):
 
         return self.archive_file
 
+    def get_archive_members(self) -> list[Path]:
+        """
+        Return the files (CSVs, plots, JSON) that make up the report archive, in archive order.
+
+        Example:
+            report.build_report(archive=False)
+            stream = ArchiveManager.stream_zip(report.get_archive_members())
+        """
+        return self._archive_members
+
     def _generate_fname(self, tags: list[str] = None, ext: str = "") -> str:
         """
         Construct a sanitized filename from:
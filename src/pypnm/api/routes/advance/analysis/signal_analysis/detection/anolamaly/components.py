@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+from pypnm.lib.types import NDArrayF64, NDArrayI64
+
+__all__ = ["AnomalyRegions", "StreamingRegionLabeler", "label_regions"]
+
+
+@dataclass(frozen=True)
+class AnomalyRegions:
+    """
+    4-connected anomaly regions of a boolean mask.
+
+    Attributes
+    ----------
+    region_ids : NDArrayI64
+        Shape (K,); id of each region as used in ``labels``. Regions are ordered
+        by their first cell in row-major order.
+    boxes : NDArrayI64
+        Shape (K, 4); ``(row_min, col_min, row_max, col_max)``, inclusive.
+    areas : NDArrayI64
+        Shape (K,); number of cells per region.
+    peak_deviation : NDArrayF64
+        Shape (K,); value with the largest magnitude inside each region (signed),
+        NaN when no values were supplied.
+    labels : NDArrayI64 | None
+        Region id per cell (0 = background), or None when not requested.
+    """
+    region_ids: NDArrayI64
+    boxes: NDArrayI64
+    areas: NDArrayI64
+    peak_deviation: NDArrayF64
+    labels: NDArrayI64 | None = None
+
+    def __len__(self) -> int:
+        return int(self.region_ids.size)
+
+
+@dataclass(frozen=True)
+class _Runs:
+    """Horizontal runs of True cells, in row-major order; ``end`` is exclusive."""
+    row: NDArrayI64
+    start: NDArrayI64
+    end: NDArrayI64
+
+
+def _runs(mask: NDArray[np.bool_]) -> _Runs:
+    rows, cols = mask.shape
+    padded = np.zeros((rows, cols + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    edges = np.diff(padded, axis=1)
+    r, start = np.nonzero(edges == 1)
+    _, end = np.nonzero(edges == -1)
+    return _Runs(r.astype(np.int64), start.astype(np.int64), end.astype(np.int64))
+
+
+def _overlaps(upper: _Runs, lower: _Runs, cols: int) -> tuple[NDArrayI64, NDArrayI64]:
+    """
+    Return ``(upper_idx, lower_idx)`` pairs of runs that touch vertically.
+
+    Each lower run in row ``r`` is matched against upper runs in row ``r - 1``.
+    Runs are flattened to keys ``row * (cols + 1) + col``, which are sorted for
+    both starts and ends, so two ``searchsorted`` calls bound the overlapping
+    upper runs of every lower run.
+    """
+    stride = cols + 1
+    base = (lower.row - 1) * stride
+    lo = np.searchsorted(upper.row * stride + upper.end, base + lower.start, side="right")
+    hi = np.searchsorted(upper.row * stride + upper.start, base + lower.end, side="left")
+    count = np.maximum(hi - lo, 0)
+    lower_idx = np.repeat(np.arange(lower.row.size, dtype=np.int64), count)
+    offsets = np.arange(int(count.sum()), dtype=np.int64) - np.repeat(np.cumsum(count) - count, count)
+    return np.repeat(lo, count) + offsets, lower_idx
+
+
+def _compress(parent: NDArrayI64) -> NDArrayI64:
+    while True:
+        grand = parent[parent]
+        if np.array_equal(grand, parent):
+            return parent
+        parent = grand
+
+
+def _union(parent: NDArrayI64, u: NDArrayI64, v: NDArrayI64) -> NDArrayI64:
+    """
+    Array union-find: hook the larger root of every differing edge onto the smaller,
+    then pointer-jump, until all edges agree. Roots end up as the smallest member id.
+    """
+    parent = _compress(parent)
+    while u.size:
+        pu, pv = parent[u], parent[v]
+        differ = pu != pv
+        if not differ.any():
+            break
+        np.minimum.at(parent, np.maximum(pu[differ], pv[differ]), np.minimum(pu[differ], pv[differ]))
+        parent = _compress(parent)
+    return parent
+
+
+def _peaks(groups: NDArrayI64, values: NDArrayF64, n_groups: int) -> NDArrayF64:
+    """Signed value with the largest magnitude in each group (NaN for empty groups)."""
+    out = np.full(n_groups, np.nan, dtype=np.float64)
+    if groups.size == 0:
+        return out
+    order = np.lexsort((-np.abs(values), groups))
+    first_groups, first = np.unique(groups[order], return_index=True)
+    out[first_groups] = values[order][first]
+    return out
+
+
+def _reduce(groups: NDArrayI64, n_groups: int, boxes: NDArrayI64,
+            areas: NDArrayI64) -> tuple[NDArrayI64, NDArrayI64]:
+    """Merge per-item ``(row_min, col_min, row_max, col_max)`` boxes and areas into per-group ones."""
+    out = np.empty((n_groups, 4), dtype=np.int64)
+    out[:, :2] = np.iinfo(np.int64).max
+    out[:, 2:] = -1
+    for k, ufunc in enumerate((np.minimum, np.minimum, np.maximum, np.maximum)):
+        ufunc.at(out[:, k], groups, boxes[:, k])
+    return out, np.bincount(groups, weights=areas, minlength=n_groups).astype(np.int64)
+
+
+def label_regions(mask: ArrayLike, values: ArrayLike | None = None, *,
+                  include_labels: bool = True) -> AnomalyRegions:
+    """
+    Label 4-connected regions of ``mask`` in one pass, with NumPy only.
+
+    Rows are run-length encoded, runs that overlap a run in the previous row
+    are joined by an array union-find, and region statistics are reduced per
+    run, so the cost scales with the number of runs rather than cells.
+
+    Parameters
+    ----------
+    mask : ArrayLike
+        2-D boolean anomaly mask.
+    values : ArrayLike | None
+        Optional 2-D array (e.g. z-scores) used for each region's peak deviation.
+    include_labels : bool
+        Also return the per-cell label image.
+
+    Returns
+    -------
+    AnomalyRegions
+        Regions with ids ``1..K`` in row-major order of first appearance.
+    """
+    m = np.asarray(mask, dtype=bool)
+    if m.ndim != 2:
+        raise ValueError("mask must be a 2-D array.")
+    vals = None if values is None else np.asarray(values, dtype=np.float64)
+    if vals is not None and vals.shape != m.shape:
+        raise ValueError("values must have the same shape as mask.")
+
+    runs = _runs(m)
+    up, down = _overlaps(runs, runs, m.shape[1])
+    parent = _union(np.arange(runs.row.size, dtype=np.int64), up, down)
+    # Roots are the first run of each region, so sorted roots give row-major order.
+    _, region = np.unique(parent, return_inverse=True)
+    n_regions = int(region.max()) + 1 if region.size else 0
+
+    lengths = runs.end - runs.start
+    boxes, areas = _reduce(region, n_regions,
+                           np.column_stack((runs.row, runs.start, runs.row, runs.end - 1)), lengths)
+
+    labels = None
+    peaks = np.full(n_regions, np.nan, dtype=np.float64)
+    if include_labels or vals is not None:
+        cells = np.repeat(runs.row * m.shape[1] + runs.start - np.cumsum(lengths) + lengths, lengths) \
+            + np.arange(int(lengths.sum()), dtype=np.int64)
+        cell_region = np.repeat(region, lengths)
+        if vals is not None:
+            peaks = _peaks(cell_region, vals.ravel()[cells], n_regions)
+        if include_labels:
+            labels = np.zeros(m.size, dtype=np.int64)
+            labels[cells] = cell_region + 1
+            labels = labels.reshape(m.shape)
+
+    return AnomalyRegions(
+        region_ids      = np.arange(1, n_regions + 1, dtype=np.int64),
+        boxes           = boxes,
+        areas           = areas,
+        peak_deviation  = peaks,
+        labels          = labels,
+    )
+
+
+class StreamingRegionLabeler:
+    """
+    Incremental 4-connected labeling for heatmaps that grow by rows (captures).
+
+    Each appended block of rows is labeled on its own with :func:`label_regions`;
+    its first row is then joined to the previous last row through the same
+    run-overlap test, and the union-find over region ids absorbs any merges
+    (including older regions bridged by new cells). Per-block statistics are
+    kept per id and reduced by root only when :meth:`regions` is called.
+
+    Region ids are stable: a region keeps its id as it grows, and when regions
+    merge the result takes the smallest id.
+
+    Parameters
+    ----------
+    cols : int
+        Heatmap width (subcarriers).
+    """
+
+    def __init__(self, cols: int) -> None:
+        if cols < 1:
+            raise ValueError("cols must be >= 1")
+        self.cols = int(cols)
+        self.rows = 0
+        self._parent: NDArrayI64    = np.zeros(1, dtype=np.int64)  # id 0 = background
+        self._boxes: NDArrayI64     = np.zeros((1, 4), dtype=np.int64)
+        self._areas: NDArrayI64     = np.zeros(1, dtype=np.int64)
+        self._peaks: NDArrayF64     = np.full(1, np.nan, dtype=np.float64)
+        self._blocks: list[NDArrayI64] = []
+        self._last_row: NDArrayI64  = np.zeros((1, self.cols), dtype=np.int64)
+
+    def append(self, mask_rows: ArrayLike, values: ArrayLike | None = None) -> None:
+        """
+        Append one row ``(cols,)`` or a block of rows ``(n, cols)``.
+
+        Parameters
+        ----------
+        mask_rows : ArrayLike
+            Boolean anomaly mask for the new rows.
+        values : ArrayLike | None
+            Optional values (same shape) for peak deviation.
+        """
+        m = np.atleast_2d(np.asarray(mask_rows, dtype=bool))
+        if m.ndim != 2 or m.shape[1] != self.cols:
+            raise ValueError(f"mask_rows must have {self.cols} columns.")
+        vals = None if values is None else np.atleast_2d(np.asarray(values, dtype=np.float64))
+
+        block = label_regions(m, vals)
+        assert block.labels is not None
+        offset = self._parent.size - 1
+        n_new = len(block)
+
+        labels = np.where(block.labels > 0, block.labels + offset, 0)
+        self._parent = np.concatenate((self._parent, np.arange(offset + 1, offset + 1 + n_new, dtype=np.int64)))
+        self._boxes = np.vstack((self._boxes, block.boxes + np.array([self.rows, 0, self.rows, 0])))
+        self._areas = np.concatenate((self._areas, block.areas))
+        self._peaks = np.concatenate((self._peaks, block.peak_deviation))
+
+        if self.rows and m.shape[0]:
+            upper, lower = _runs(self._last_row > 0), _runs(labels[:1] > 0)
+            lower = _Runs(lower.row + 1, lower.start, lower.end)
+            up, down = _overlaps(upper, lower, self.cols)
+            self._parent = _union(self._parent,
+                                  self._last_row[0, upper.start[up]],
+                                  labels[0, lower.start[down]])
+
+        if m.shape[0]:
+            self._blocks.append(labels)
+            self._last_row = labels[-1:]
+        self.rows += m.shape[0]
+
+    def regions(self, *, include_labels: bool = False) -> AnomalyRegions:
+        """
+        Return the current regions, merging per-block statistics by root id.
+
+        Parameters
+        ----------
+        include_labels : bool
+            Also build the full ``(rows, cols)`` label image (copies every row).
+        """
+        parent = self._parent = _compress(self._parent)
+        ids = np.arange(1, parent.size, dtype=np.int64)
+        root_ids, group = np.unique(parent[ids], return_inverse=True)
+        boxes, areas = _reduce(group, root_ids.size, self._boxes[ids], self._areas[ids])
+        known = ~np.isnan(self._peaks[ids])
+        peaks = _peaks(group[known], self._peaks[ids][known], root_ids.size)
+
+        labels = None
+        if include_labels:
+            stacked = np.vstack(self._blocks) if self._blocks else np.zeros((0, self.cols), dtype=np.int64)
+            labels = parent[stacked]
+
+        return AnomalyRegions(
+            region_ids      = root_ids,
+            boxes           = boxes,
+            areas           = areas,
+            peak_deviation  = peaks,
+            labels          = labels,
+        )
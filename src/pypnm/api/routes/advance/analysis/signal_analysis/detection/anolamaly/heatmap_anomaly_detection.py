@@ -1,12 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 from __future__ import annotations
 
-from collections.abc import Generator
 from typing import Any
 
 import numpy as np
 
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.anolamaly.components import (
+    AnomalyRegions,
+    label_regions,
+)
+
 
 class HeatmapAnomalyDetector:
     """
@@ -20,6 +24,8 @@ class HeatmapAnomalyDetector:
         mask (np.ndarray): boolean mask where |z| > threshold.
         boxes (List[Tuple[int, int, int, int]]): list of
             (row_min, col_min, row_max, col_max) bounding boxes.
+        regions (AnomalyRegions | None): labels, boxes, areas and peak
+            z-score of every connected component, set by find_boxes().
     """
 
     def __init__(self, data: np.ndarray, threshold: float = 3.0) -> None:
@@ -30,6 +36,7 @@ class HeatmapAnomalyDetector:
         self.zmap: np.ndarray = None  # will be computed
         self.mask: np.ndarray = None
         self.boxes: list[tuple[int, int, int, int]] = []
+        self.regions: AnomalyRegions | None = None
 
     def compute_zmap(self) -> np.ndarray:
         """
@@ -62,7 +69,9 @@ class HeatmapAnomalyDetector:
     def find_boxes(self) -> list[tuple[int, int, int, int]]:
         """
         Identify connected components in the anomaly mask (4-connectivity)
-        and compute their bounding boxes.
+        and compute their bounding boxes, in row-major order of each
+        component's first cell. Labeling is a single run-length union-find
+        pass (see label_regions); full statistics are kept in self.regions.
 
         Returns:
             List[Tuple[int, int, int, int]]: list of bounding boxes
@@ -71,37 +80,8 @@ class HeatmapAnomalyDetector:
         if self.mask is None:
             self.detect()
 
-        visited = np.zeros_like(self.mask, dtype=bool)
-        rows, cols = self.data.shape
-        boxes: list[tuple[int, int, int, int]] = []
-
-        def neighbors(r: int, c: int) -> Generator[tuple[int, int], Any, None]:
-            for dr, dc in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    yield nr, nc
-
-        for i in range(rows):
-            for j in range(cols):
-                if self.mask[i, j] and not visited[i, j]:
-                    rmin = rmax = i
-                    cmin = cmax = j
-                    stack = [(i, j)]
-                    visited[i, j] = True
-
-                    while stack:
-                        r, c = stack.pop()
-                        rmin = min(rmin, r)
-                        rmax = max(rmax, r)
-                        cmin = min(cmin, c)
-                        cmax = max(cmax, c)
-                        for nr, nc in neighbors(r, c):
-                            if self.mask[nr, nc] and not visited[nr, nc]:
-                                visited[nr, nc] = True
-                                stack.append((nr, nc))
-
-                    boxes.append((rmin, cmin, rmax, cmax))
-
+        self.regions = label_regions(self.mask, self.zmap)
+        boxes = [tuple(b) for b in self.regions.boxes.tolist()]
         self.boxes = boxes
         return boxes
 
@@ -1,10 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import logging
 from collections.abc import Sequence
+from dataclasses import dataclass
 from math import ceil, log2
 from typing import Literal, TypeAlias
 
@@ -41,6 +42,141 @@ ThresholdMode: TypeAlias = Literal["fractional", "db_down"]
 
 NDArrayC128: TypeAlias = NDArray[np.complex128]
 NDArrayF64: TypeAlias = NDArray[np.float64]
+NDArrayI64: TypeAlias = NDArray[np.int64]
+NDArrayBool: TypeAlias = NDArray[np.bool_]
+
+# One record per path (direct or echo) in batch results; echo rows are padded
+# with bin_index = -1 and NaN fields.
+ECHO_PATH_DTYPE: np.dtype = np.dtype([
+    ("bin_index", np.int64),
+    ("time_s", np.float64),
+    ("delay_s", np.float64),
+    ("amplitude", np.float64),
+    ("level_db", np.float64),
+    ("distance_m", np.float64),
+    ("distance_ft", np.float64),
+])
+
+
+def local_maxima_mask(mag: NDArrayF64) -> NDArrayBool:
+    """
+    Mask of local maxima along the last axis: ``mag[i] >= mag[i-1]`` and ``mag[i] > mag[i+1]``.
+
+    The first and last bin of each row are never maxima.
+    """
+    mag = np.asarray(mag, dtype=np.float64)
+    mask = np.zeros(mag.shape, dtype=bool)
+    if mag.shape[-1] >= 3:
+        mid = mag[..., 1:-1]
+        mask[..., 1:-1] = (mid >= mag[..., :-2]) & (mid > mag[..., 2:])
+    return mask
+
+
+def select_echo_peaks(mag: NDArrayF64, candidates: NDArrayBool,
+                      min_sep_bins: int, max_peaks: int) -> NDArrayI64:
+    """
+    Greedy strongest-first peak selection with minimum spacing, for all rows at once.
+
+    Each round takes the strongest remaining candidate of every row and masks
+    out its ``min_sep_bins`` neighbourhood, so the cost is ``max_peaks`` array
+    passes instead of a Python scan per row.
+
+    Parameters
+    ----------
+    mag : NDArrayF64
+        Magnitudes, shape (n,) or (M, n).
+    candidates : NDArrayBool
+        Bins eligible for selection, same shape as ``mag``.
+    min_sep_bins : int
+        Minimum spacing between accepted peaks (floored at 1 bin).
+    max_peaks : int
+        Maximum peaks per row.
+
+    Returns
+    -------
+    NDArrayI64
+        Shape (M, max_peaks): selected bins per row in descending-amplitude order,
+        padded with -1.
+    """
+    mag2 = np.atleast_2d(np.asarray(mag, dtype=np.float64))
+    rows, n = mag2.shape
+    out = np.full((rows, max(0, int(max_peaks))), -1, dtype=np.int64)
+    if rows == 0 or n == 0:
+        return out
+
+    score = np.where(np.atleast_2d(candidates), mag2, -np.inf)
+    sep = max(MIN_SEPARATION_BINS_FLOOR, int(min_sep_bins))
+    bins = np.arange(n)
+    row_idx = np.arange(rows)
+    for k in range(out.shape[1]):
+        pick = np.argmax(score, axis=1)
+        found = score[row_idx, pick] > -np.inf
+        if not found.any():
+            break
+        out[found, k] = pick[found]
+        score[found[:, None] & (np.abs(bins[None, :] - pick[:, None]) < sep)] = -np.inf
+    return out
+
+
+def _default_nfft(n: int) -> int:
+    return max(MIN_NFFT, 1 << ceil(log2(max(1, n))))
+
+
+def _resolve_threshold_frac(threshold_mode: ThresholdMode, threshold_frac: float,
+                            threshold_db_down: float | None) -> float:
+    if threshold_mode == "fractional":
+        if not (0.0 < threshold_frac <= 1.0):
+            raise ValueError("threshold_frac must be in (0, 1] for fractional mode")
+        return threshold_frac
+    if threshold_mode == "db_down":
+        db = DEFAULT_THRESHOLD_DB_DOWN if threshold_db_down is None else float(threshold_db_down)
+        return float(10.0 ** (-db / AMP_DB_SCALE))
+    raise ValueError('threshold_mode must be "fractional" or "db_down"')
+
+
+def _guard_bins_for_distance(distance_ft: float, fs: float, v: float) -> int:
+    """Convert a one-way distance (feet) to guard bins using fs and propagation speed v."""
+    if distance_ft <= 0.0:
+        return 0
+    d_m = float(distance_ft) / FEET_PER_METER  # ft → m
+    t_min = (2.0 * d_m) / v                    # round-trip time
+    return int(np.ceil(t_min * fs))
+
+
+def _stop_index(n_fft: int, fs: float, max_delay_s: float | None) -> int:
+    return n_fft if max_delay_s is None else min(n_fft, int(np.ceil(max_delay_s * fs)))
+
+
+def _search_mask(n_fft: int, i0: NDArrayI64, start: NDArrayI64, i_stop: int,
+                 edge_guard_bins: int) -> NDArrayBool:
+    """Per-row search window ``[start, i_stop - edge_guard)``, always excluding the direct bin."""
+    bins = np.arange(n_fft)[None, :]
+    end = i_stop - edge_guard_bins if edge_guard_bins > 0 else i_stop
+    return (bins >= start[:, None]) & (bins < end) & (bins != i0[:, None])
+
+
+def _mag_time(H: NDArrayC128, n_fft: int, window: WindowMode,
+              direct_at_zero: bool, normalize_power: bool) -> tuple[NDArrayF64, NDArrayI64]:
+    """
+    Batched |h(t)| for (M, N) H(f): one windowed, zero-padded IFFT along the subcarrier axis.
+
+    Returns ``(mag, i0)`` with ``mag`` shaped (M, n_fft) and ``i0`` the direct-path
+    bin of each row in ``mag`` (all zero when ``direct_at_zero``).
+    """
+    Hw = EchoDetector._apply_window(H, window)
+    mag = np.abs(np.fft.ifft(Hw, n=n_fft, axis=-1))
+    rows = np.arange(mag.shape[0])
+
+    i0 = np.argmax(mag, axis=-1).astype(np.int64)
+    if direct_at_zero:
+        mag = np.take_along_axis(mag, (np.arange(n_fft)[None, :] + i0[:, None]) % n_fft, axis=-1)
+        i0 = np.zeros_like(i0)
+
+    if normalize_power:
+        peak = mag[rows, i0]
+        mag = mag / np.where(peak > 0.0, peak, 1.0)[:, None]
+
+    return mag.astype(np.float64, copy=False), i0
 
 
 class EchoDataset(BaseModel):
@@ -119,7 +255,7 @@ class EchoDetector:
         self.logger.debug("Input normalized: N=%d, snapshots=%d", N, snapshots)
 
         if n_fft is None:
-            n_fft = max(MIN_NFFT, 1 << ceil(log2(max(1, N))))
+            n_fft = _default_nfft(N)
         if n_fft <= 0:
             raise ValueError("n_fft must be positive")
 
@@ -281,28 +417,16 @@ class EchoDetector:
         i0 = 0 if direct_at_zero else int(i0_unrolled)
         direct_amp = float(mag[i0])
 
-        # Resolve threshold
-        if threshold_mode == "fractional":
-            if not (0.0 < threshold_frac <= 1.0):
-                raise ValueError("threshold_frac must be in (0, 1] for fractional mode")
-            thr_frac_resolved = threshold_frac
-        elif threshold_mode == "db_down":
-            db = DEFAULT_THRESHOLD_DB_DOWN if threshold_db_down is None else float(threshold_db_down)
-            thr_frac_resolved = float(10.0 ** (-db / AMP_DB_SCALE))
-        else:
-            raise ValueError('threshold_mode must be "fractional" or "db_down"')
+        thr_frac_resolved = _resolve_threshold_frac(threshold_mode, threshold_frac, threshold_db_down)
 
         # Effective guard from explicit bins and minimum detectable distance
         min_sep_bins = max(0, int(round(min_separation_s * fs)))
-        guard_bins_dist = self._bins_for_min_distance(min_detect_distance_ft, fs) if min_detect_distance_ft else 0
+        guard_bins_dist = _guard_bins_for_distance(min_detect_distance_ft, fs, self._v) if min_detect_distance_ft else 0
         effective_guard_bins = max(int(guard_bins), int(guard_bins_dist))
         start_idx = i0 + max(0, effective_guard_bins)
 
         # Stop index (max window), apply edge guard
-        if max_delay_s is None:
-            i_stop = n_fft
-        else:
-            i_stop = min(n_fft, int(np.ceil(max_delay_s * fs)))
+        i_stop = _stop_index(n_fft, fs, max_delay_s)
 
         self.logger.debug(
             "Search window: start=%d, stop=%d (exclusive), min_sep_bins=%d, thr_frac=%.6f, "
@@ -312,27 +436,13 @@ class EchoDetector:
             0.0 if (min_detect_distance_ft is None) else float(min_detect_distance_ft),
         )
 
-        # Candidate selection
-        if i_stop <= start_idx:
-            candidates: list[int] = []
-        else:
-            thr = thr_frac_resolved * direct_amp
-            idx_range = np.arange(start_idx, i_stop, dtype=int)
-            if edge_guard_bins > 0:
-                idx_range = idx_range[idx_range < (i_stop - edge_guard_bins)]
-            idx_range = idx_range[idx_range != i0]  # keep direct path out even if guard==0
-            candidates = [int(i) for i in idx_range if mag[i] >= thr]
-        self.logger.debug("Candidates above threshold: %d", len(candidates))
-
-        # Greedy enforce spacing by amplitude
-        candidates.sort(key=lambda i: float(mag[i]), reverse=True)
-        selected: list[int] = []
-        for i in candidates:
-            if len(selected) >= max_peaks:
-                break
-            if all(abs(i - s) >= max(MIN_SEPARATION_BINS_FLOOR, min_sep_bins) for s in selected):
-                selected.append(i)
-        selected.sort()
+        # Candidate selection (direct path excluded even if guard==0), then greedy spacing by amplitude
+        candidates = _search_mask(n_fft, np.array([i0]), np.array([start_idx]), i_stop, edge_guard_bins)
+        candidates &= mag[None, :] >= thr_frac_resolved * direct_amp
+        self.logger.debug("Candidates above threshold: %d", int(candidates.sum()))
+
+        picks = select_echo_peaks(mag, candidates, min_sep_bins, max_peaks)[0]
+        selected = sorted(int(i) for i in picks[picks >= 0])
         self.logger.debug("Selected peaks: %s", selected)
 
         # Reporting conversions (time/distance) — may use fs_time override
@@ -491,36 +601,9 @@ class EchoDetector:
         normalize_power: bool,
     ) -> tuple[NDArrayF64, int]:
         """Compute |h(t)| magnitude and return (mag, direct_index_before_roll_or_zero)."""
-        Hw = self._apply_window(self._H_in, window)
-        self.logger.debug("Window applied: mode=%s", window)
-
-        Hn = self._pad_or_crop(Hw, self._n_fft)
-        self.logger.debug("Length adjusted: input=%d → n_fft=%d", Hw.size, self._n_fft)
-
-        h_time = np.fft.ifft(Hn, n=self._n_fft)
-        mag = np.abs(h_time)
-
-        i0 = int(np.argmax(mag))
-        if direct_at_zero:
-            mag = np.abs(np.roll(h_time, -i0))
-            i0 = 0
-            self.logger.debug("Direct-path rolled to zero")
-        else:
-            self.logger.debug("Direct-path at bin=%d (no roll)", i0)
-
-        if normalize_power and float(mag[i0]) > 0.0:
-            mag = mag / float(mag[i0])
-            self.logger.debug("Power normalized to direct-path amplitude=1.0")
-
-        return mag.astype(np.float64, copy=False), i0
-
-    def _bins_for_min_distance(self, distance_ft: float, fs: float) -> int:
-        """Convert a one-way distance (feet) to guard bins using fs and v=c*VF."""
-        if distance_ft <= 0.0:
-            return 0
-        d_m = float(distance_ft) / FEET_PER_METER  # ft → m
-        t_min = (2.0 * d_m) / self._v             # round-trip time
-        return int(np.ceil(t_min * fs))
+        mag, i0 = _mag_time(self._H_in[None, :], self._n_fft, window, direct_at_zero, normalize_power)
+        self.logger.debug("IFFT magnitude: window=%s, n_fft=%d, direct bin=%d", window, self._n_fft, int(i0[0]))
+        return mag[0], int(i0[0])
 
     @staticmethod
     def _coerce_freq_data(freq_data: NDArrayF64 | NDArrayC128 | Sequence) -> tuple[NDArrayC128, int]:
@@ -543,11 +626,11 @@ class EchoDetector:
 
     @staticmethod
     def _apply_window(H: NDArrayC128, window: WindowMode) -> NDArrayC128:
-        """Apply optional frequency-domain window."""
+        """Apply optional frequency-domain window along the last (subcarrier) axis."""
         if window == "none":
             return H
         if window == "hann":
-            w = np.hanning(H.size).astype(np.float64)
+            w = np.hanning(H.shape[-1]).astype(np.float64)
             return (H * w).astype(np.complex128)
         raise ValueError('Unsupported window. Use "hann" or "none".')
 
@@ -562,3 +645,188 @@ class EchoDetector:
             out[:N] = H
             return out
         return H[:n_fft]
+
+
+@dataclass(frozen=True)
+class EchoBatchResult:
+    """
+    Echo detection results for a batch of captures, as structured arrays.
+
+    Attributes
+    ----------
+    direct : NDArray
+        Shape (M,), :data:`ECHO_PATH_DTYPE`; direct path of each capture (delay/distance 0, level 0 dB).
+    echoes : NDArray
+        Shape (M, max_peaks), :data:`ECHO_PATH_DTYPE`; echoes per capture ordered by delay,
+        padded with ``bin_index = -1`` and NaN.
+    counts : NDArrayI64
+        Number of valid echoes per capture.
+    n_fft : int
+        IFFT length used.
+    sample_rate_hz : float
+        Time-domain sample rate used for time/distance conversion.
+    threshold_frac : float
+        Resolved detection threshold as a fraction of the direct-path amplitude.
+    guard_bins : int
+        Effective guard after the direct path (explicit or minimum-distance guard).
+    magnitude : NDArrayF64 | None
+        Shape (M, n_fft) |h(t)| when requested, else None.
+    """
+    direct: NDArray[np.void]
+    echoes: NDArray[np.void]
+    counts: NDArrayI64
+    n_fft: int
+    sample_rate_hz: float
+    threshold_frac: float
+    guard_bins: int
+    magnitude: NDArrayF64 | None = None
+
+
+class BatchEchoDetector:
+    """
+    Batched IFFT echo engine for many channel-estimate captures at once.
+
+    All captures of a batch (e.g. every snapshot of a capture group, or one
+    averaged H(f) per modem on a node) go through a single windowed,
+    zero-padded ``np.fft.ifft`` along the subcarrier axis. Peaks are picked
+    with array operations only: threshold and search-window masks, an
+    optional local-maximum neighbour test, and greedy strongest-first
+    selection with a minimum-separation mask (:func:`select_echo_peaks`).
+
+    Detection parameters mean the same as in :meth:`EchoDetector.multi_echo`;
+    with ``local_maxima=False`` the selected bins match it row for row.
+
+    Parameters
+    ----------
+    subcarrier_spacing_hz : float
+        Δf between adjacent subcarriers (Hz).
+    n_fft : int | None
+        IFFT length; None → next pow2 ≥ N, min 1024.
+    cable_type : CableTypes
+        Coax type used for the velocity factor.
+    """
+
+    def __init__(self, subcarrier_spacing_hz: float, n_fft: int | None = None,
+                 cable_type: CableTypes = "RG6") -> None:
+        if subcarrier_spacing_hz <= 0.0:
+            raise ValueError("subcarrier_spacing_hz must be > 0")
+        if n_fft is not None and n_fft <= 0:
+            raise ValueError("n_fft must be positive")
+        self.logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._df: float = float(subcarrier_spacing_hz)
+        self._n_fft: int | None = None if n_fft is None else int(n_fft)
+        self._cable_type: CableTypes = cable_type
+        self._v: float = SPEED_OF_LIGHT * float(CABLE_VF[cable_type])
+
+    @property
+    def propagation_speed(self) -> float: return self._v
+
+    def detect(
+        self,
+        freq_data: NDArrayF64 | NDArrayC128 | Sequence,
+        threshold_frac: float = DEFAULT_THRESHOLD_FRAC,
+        threshold_mode: ThresholdMode = "fractional",
+        threshold_db_down: float | None = None,
+        guard_bins: int = DEFAULT_GUARD_BINS,
+        min_separation_s: float = 0.0,
+        max_delay_s: float | None = DEFAULT_MAX_DELAY_S,
+        max_peaks: int = DEFAULT_MAX_PEAKS,
+        direct_at_zero: bool = True,
+        window: WindowMode = "hann",
+        normalize_power: bool = True,
+        edge_guard_bins: int = DEFAULT_EDGE_GUARD_BINS,
+        fs_time_hz: float | None = None,
+        min_detect_distance_ft: float | None = 10.0,
+        local_maxima: bool = True,
+        include_magnitude: bool = False,
+    ) -> EchoBatchResult:
+        """
+        Detect echoes in every capture of ``freq_data``.
+
+        Parameters
+        ----------
+        freq_data : array-like
+            (M, N) complex captures, or (M, N, 2) real/imag pairs; a single (N,)
+            complex capture is treated as M = 1.
+        local_maxima : bool
+            Require candidates to be local maxima of |h(t)| (rejects main-lobe
+            shoulders); False keeps every above-threshold bin as in ``multi_echo``.
+        include_magnitude : bool
+            Keep the (M, n_fft) magnitude matrix in the result.
+
+        Other parameters are as in :meth:`EchoDetector.multi_echo`.
+
+        Returns
+        -------
+        EchoBatchResult
+            Direct path and echo records per capture.
+        """
+        H = self._coerce_batch(freq_data)
+        n_fft = self._n_fft or _default_nfft(H.shape[1])
+        fs = float(n_fft) * self._df
+        fs_time = float(fs_time_hz) if fs_time_hz and fs_time_hz > 0 else fs
+
+        thr_frac = _resolve_threshold_frac(threshold_mode, threshold_frac, threshold_db_down)
+        min_sep_bins = max(0, int(round(min_separation_s * fs)))
+        guard_dist = _guard_bins_for_distance(min_detect_distance_ft, fs, self._v) if min_detect_distance_ft else 0
+        guard = max(int(guard_bins), int(guard_dist))
+        i_stop = _stop_index(n_fft, fs, max_delay_s)
+
+        mag, i0 = _mag_time(H, n_fft, window, direct_at_zero, normalize_power)
+        rows = np.arange(mag.shape[0])
+        direct_amp = mag[rows, i0]
+
+        candidates = _search_mask(n_fft, i0, i0 + max(0, guard), i_stop, edge_guard_bins)
+        candidates &= mag >= (thr_frac * direct_amp)[:, None]
+        if local_maxima:
+            candidates &= local_maxima_mask(mag)
+
+        picks = select_echo_peaks(mag, candidates, min_sep_bins, max_peaks)
+        picks = np.sort(np.where(picks >= 0, picks, n_fft), axis=1)
+        picks[picks == n_fft] = -1
+        self.logger.debug("detect: captures=%d, n_fft=%d, guard=%d, stop=%d, echoes=%d",
+                          mag.shape[0], n_fft, guard, i_stop, int((picks >= 0).sum()))
+
+        return EchoBatchResult(
+            direct          = self._paths(mag, i0[:, None], i0, direct_amp, fs_time)[:, 0],
+            echoes          = self._paths(mag, picks, i0, direct_amp, fs_time),
+            counts          = (picks >= 0).sum(axis=1).astype(np.int64),
+            n_fft           = n_fft,
+            sample_rate_hz  = fs_time,
+            threshold_frac  = thr_frac,
+            guard_bins      = guard,
+            magnitude       = mag if include_magnitude else None,
+        )
+
+    def _paths(self, mag: NDArrayF64, bins: NDArrayI64, i0: NDArrayI64,
+               direct_amp: NDArrayF64, fs_time: float) -> NDArray[np.void]:
+        """Fill :data:`ECHO_PATH_DTYPE` records for (M, K) bins (−1 → padding)."""
+        valid = bins >= 0
+        safe = np.where(valid, bins, 0)
+        amp = np.take_along_axis(mag, safe, axis=1)
+        delay = (safe - i0[:, None]) / fs_time
+        with np.errstate(divide="ignore", invalid="ignore"):
+            level = AMP_DB_SCALE * np.log10(amp / direct_amp[:, None])
+        dist_m = 0.5 * self._v * delay
+
+        out = np.empty(bins.shape, dtype=ECHO_PATH_DTYPE)
+        out["bin_index"]   = np.where(valid, bins, -1)
+        out["time_s"]      = np.where(valid, safe / fs_time, np.nan)
+        out["delay_s"]     = np.where(valid, delay, np.nan)
+        out["amplitude"]   = np.where(valid, amp, np.nan)
+        out["level_db"]    = np.where(valid, level, np.nan)
+        out["distance_m"]  = np.where(valid, dist_m, np.nan)
+        out["distance_ft"] = np.where(valid, dist_m * FEET_PER_METER, np.nan)
+        return out
+
+    @staticmethod
+    def _coerce_batch(freq_data: NDArrayF64 | NDArrayC128 | Sequence) -> NDArrayC128:
+        """Coerce input to (M, N) complex captures."""
+        arr = np.asarray(freq_data)
+        if arr.ndim == 3 and arr.shape[2] == 2 and not np.iscomplexobj(arr):
+            arr = arr[..., 0].astype(np.float64) + 1j * arr[..., 1].astype(np.float64)
+        elif arr.ndim == 1 and np.iscomplexobj(arr):
+            arr = arr[None, :]
+        if arr.ndim != 2 or not np.iscomplexobj(arr) or arr.shape[1] == 0:
+            raise ValueError("freq_data must be (M, N) complex or (M, N, 2) real/imag captures.")
+        return arr.astype(np.complex128, copy=False)
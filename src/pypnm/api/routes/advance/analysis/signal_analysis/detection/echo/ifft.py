@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -10,6 +10,10 @@ import numpy as np
 from numpy.typing import NDArray
 from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.echo_detector import (
+    local_maxima_mask,
+    select_echo_peaks,
+)
 from pypnm.lib.constants import FEET_PER_METER, SPEED_OF_LIGHT, CableTypes
 from pypnm.lib.types import ChannelId, ComplexArray, FloatSeries
 
@@ -232,15 +236,6 @@ class IfftMultiEchoDetectionModel(BaseModel):
     time_response: IfftEchoTimeResponseModel | None = Field(default=None)
 
 
-# ──────────────────────────────────────────────────────────────
-# Utilities
-# ──────────────────────────────────────────────────────────────
-def _local_maxima_indices(mag: NDArray[np.float64]) -> list[int]:
-    """Return indices i that are local maxima: mag[i] >= mag[i-1] and > mag[i+1]."""
-    if mag.size < 3:
-        return []
-    return [i for i in range(1, mag.size - 1) if mag[i] >= mag[i - 1] and mag[i] > mag[i + 1]]
-
 # ──────────────────────────────────────────────────────────────
 # IFFT Echo Detector (implementation)
 # ──────────────────────────────────────────────────────────────
@@ -324,13 +319,14 @@ class IfftEchoDetector:
     @staticmethod
     def _vec_to_pairs(vec: NDArray[np.complex128]) -> ComplexArray:
         """Encode a complex vector as (re, im) pairs."""
-        return [(float(np.real(v)), float(np.imag(v))) for v in vec]
+        vec = np.asarray(vec)
+        return list(zip(vec.real.tolist(), vec.imag.tolist(), strict=True))
 
     @staticmethod
     def _mat_to_pairs(mat: NDArray[np.complex128]) -> list[ComplexArray]:
         """Encode a complex matrix as (re, im) pairs, row-wise."""
-        M, _ = mat.shape
-        return [[(float(np.real(v)), float(np.imag(v))) for v in mat[m]] for m in range(M)]
+        mat = np.asarray(mat)
+        return [list(zip(re, im, strict=True)) for re, im in zip(mat.real.tolist(), mat.imag.tolist(), strict=True)]
 
     # ──────────────────────────────────────────────────────────
     # Core operations
@@ -398,13 +394,10 @@ class IfftEchoDetector:
         else:
             stop = n
 
-        ie: int | None = None
-        for idx in range(start, stop):
-            if mag[idx] >= thresh:
-                ie = int(idx)
-                break
-        if ie is None:
+        hits = np.flatnonzero(mag[start:stop] >= thresh)
+        if hits.size == 0:
             raise RuntimeError("No echo found above threshold within the search window.")
+        ie = int(start + hits[0])
 
         t0 = float(t[i0])
         te = float(t[ie])
@@ -495,22 +488,14 @@ class IfftEchoDetector:
         else:
             stop = n
 
-        # candidate local maxima above threshold within window
-        cand_region = mag[start:stop]
-        local_idxs = _local_maxima_indices(cand_region)
-        cand_idxs = [start + i for i in local_idxs if cand_region[i] >= thresh]
-
-        # sort by amplitude descending
-        cand_idxs.sort(key=lambda i: mag[i], reverse=True)
+        # candidate local maxima above threshold, strictly inside [start, stop)
+        bins = np.arange(n)
+        candidates = local_maxima_mask(mag) & (mag >= thresh) & (bins > start) & (bins < stop - 1)
 
-        # enforce minimum separation in bins
+        # strongest first, enforcing minimum separation in bins
         min_sep_bins = int(np.ceil(max(0.0, min_separation_s) * self.sample_rate))
-        selected: list[int] = []
-        for i in cand_idxs:
-            if not selected or all(abs(i - j) >= min_sep_bins for j in selected):
-                selected.append(i)
-            if len(selected) >= max_peaks:
-                break
+        picks = select_echo_peaks(mag, candidates, min_sep_bins, max_peaks)[0]
+        selected = [int(i) for i in picks[picks >= 0]]
 
         # propagation speed from cable type / override
         vf = float(velocity_factor) if velocity_factor is not None else float(_CABLE_VF[cable_type])
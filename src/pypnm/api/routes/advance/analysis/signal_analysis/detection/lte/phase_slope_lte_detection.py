@@ -1,11 +1,15 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
+from numpy.typing import NDArray
+
+from pypnm.lib.types import NDArrayF64, NDArrayI64
 
 
 class GroupDelayAnomalyDetector:
@@ -98,9 +102,7 @@ class GroupDelayAnomalyDetector:
         # forward difference for first point
         tau[0] = - (phi[1] - phi[0]) / (2 * np.pi * df[0])
         # central differences
-        for k in range(1, self.K - 1):
-            tau[k] = - (phi[k+1] - phi[k-1]) / (
-                2 * np.pi * (self.f[k+1] - self.f[k-1]))
+        tau[1:-1] = - (phi[2:] - phi[:-2]) / (2 * np.pi * (self.f[2:] - self.f[:-2]))
         # backward difference for last point
         tau[-1] = - (phi[-1] - phi[-2]) / (2 * np.pi * df[-1])
         # convert round-trip to one-way and ensure positivity
@@ -145,12 +147,20 @@ class GroupDelayAnomalyDetector:
         """
         f_min, f_max = self.f[0], self.f[-1]
         edges = np.arange(f_min, f_max + bin_width, bin_width)
+        n_bins = max(edges.size - 1, 0)
+
+        # Bin every subcarrier once; two-pass (mean, then squared deviation) sums per bin
+        b = np.searchsorted(edges, self.f, side="right") - 1
+        inside = (b >= 0) & (b < n_bins)
+        inside[inside] &= self.f[inside] < edges[b[inside] + 1]
+        b, x = b[inside], tau[inside]
+        count = np.bincount(b, minlength=n_bins)
+        mean = np.bincount(b, weights=x, minlength=n_bins) / np.maximum(count, 1)
+        ss = np.bincount(b, weights=(x - mean[b]) ** 2, minlength=n_bins)
+
         local_sigma: dict[tuple[float, float], float] = {}
-        for start, end in zip(edges[:-1], edges[1:], strict=False):
-            idx = (self.f >= start) & (self.f < end)
-            if np.sum(idx) < 2:
-                continue
-            local_sigma[(start, end)] = np.std(tau[idx], ddof=1)
+        for j in np.flatnonzero(count >= 2):
+            local_sigma[(edges[j], edges[j + 1])] = np.sqrt(ss[j] / (count[j] - 1))
         return local_sigma
 
     def detect_anomalies(
@@ -254,3 +264,138 @@ class GroupDelayAnomalyDetector:
             'coarse_anomalies': self.detect_anomalies(tau, threshold, bin_widths[0]),
             'detailed': self.multi_resolution_scan(threshold, bin_widths[0], bin_widths[1:])
         }
+
+
+@dataclass(frozen=True)
+class LteRippleBatch:
+    """
+    Per-capture LTE ripple screening results from :class:`PhaseSlopeLteDetector`.
+
+    Attributes
+    ----------
+    detected : NDArray[np.bool_]
+        Shape (C,); ripple is both strong enough and periodic enough.
+    confidence : NDArrayF64
+        Shape (C,); ``concentration * min(1, ripple_rms_s / threshold_s)`` in [0, 1].
+    ripple_rms_s : NDArrayF64
+        Shape (C,); RMS of the phase-slope residual (group delay, seconds).
+    concentration : NDArrayF64
+        Shape (C,); fraction of residual spectral power in the dominant ripple line.
+    ripple_cycles : NDArrayI64
+        Shape (C,); ripple periods across the band at the dominant line.
+    ripple_period_hz : NDArrayF64
+        Shape (C,); ripple period along the frequency axis (Hz).
+    residual_s : NDArrayF64
+        Shape (C, K-1); group-delay residual after removing each capture's linear trend.
+    """
+    detected: NDArray[np.bool_]
+    confidence: NDArrayF64
+    ripple_rms_s: NDArrayF64
+    concentration: NDArrayF64
+    ripple_cycles: NDArrayI64
+    ripple_period_hz: NDArrayF64
+    residual_s: NDArrayF64
+
+
+class PhaseSlopeLteDetector:
+    """
+    Batched phase-slope screening for LTE-like ripple in OFDM channel estimates.
+
+    An in-band LTE carrier shows up as a periodic ripple on the phase slope
+    (group delay) of the channel estimate. For a ``(captures x subcarriers)``
+    batch this detector:
+
+    1) unwraps the phase and differences it along the subcarrier axis,
+       ``tau = -dphi / (2*pi*df)``;
+    2) removes each capture's least-squares line (flat delay and tilt), leaving
+       the phase-slope residual;
+    3) takes one Hann-windowed ``rfft`` over all residuals and scores the
+       dominant ripple line by its share of the residual power.
+
+    A capture is flagged when the residual RMS reaches ``threshold_s`` and the
+    dominant line (plus its two neighbours, to absorb window leakage) holds at
+    least ``min_concentration`` of the power above ``min_cycles``. The residual
+    is treated as uniformly sampled, so excluded-subcarrier gaps only blur the
+    line rather than move it.
+
+    Parameters
+    ----------
+    threshold_s : float
+        Minimum residual RMS group delay (seconds) to flag a capture.
+    min_concentration : float
+        Minimum spectral concentration in (0, 1].
+    min_cycles : int
+        Ignore ripple with fewer periods across the band (slow curvature).
+    """
+
+    def __init__(self, threshold_s: float = 1e-9, *, min_concentration: float = 0.5,
+                 min_cycles: int = 2) -> None:
+        if threshold_s <= 0.0:
+            raise ValueError("threshold_s must be positive.")
+        if not (0.0 < min_concentration <= 1.0):
+            raise ValueError("min_concentration must be in (0, 1].")
+        self.threshold_s = float(threshold_s)
+        self.min_concentration = float(min_concentration)
+        self.min_cycles = max(1, int(min_cycles))
+
+    def detect(self, H: np.ndarray | list, freqs: np.ndarray | list[float]) -> LteRippleBatch:
+        """
+        Screen every capture of ``H``.
+
+        Parameters
+        ----------
+        H : array-like
+            (C, K) complex, (C, K, 2) real/imag pairs, or a single (K,) capture.
+        freqs : array-like of float
+            Subcarrier frequencies (Hz), shape (K,) shared by all captures or (C, K).
+
+        Returns
+        -------
+        LteRippleBatch
+            Per-capture detections, confidence and ripple metrics.
+        """
+        Hc = np.asarray(H)
+        if Hc.ndim >= 2 and Hc.shape[-1] == 2 and not np.iscomplexobj(Hc):
+            Hc = Hc[..., 0] + 1j * Hc[..., 1]
+        Hc = np.atleast_2d(Hc.astype(np.complex128))
+        f = np.asarray(freqs, dtype=np.float64)
+        if Hc.ndim != 2 or f.shape[-1] != Hc.shape[-1]:
+            raise ValueError(f"H shape {Hc.shape} does not match freqs shape {f.shape}.")
+        if Hc.shape[-1] < 2 * (self.min_cycles + 2):
+            raise ValueError("Too few subcarriers for ripple analysis.")
+
+        df = np.diff(f, axis=-1)
+        tau = -np.diff(np.unwrap(np.angle(Hc), axis=-1), axis=-1) / (2 * np.pi * df)
+
+        # Least-squares line per capture against the mid-point frequency of each difference
+        x = np.broadcast_to(0.5 * (f[..., 1:] + f[..., :-1]), tau.shape)
+        x = x - x.mean(axis=-1, keepdims=True)
+        centered = tau - tau.mean(axis=-1, keepdims=True)
+        slope = (x * centered).sum(axis=-1, keepdims=True) / (x * x).sum(axis=-1, keepdims=True)
+        residual = centered - slope * x
+
+        n = residual.shape[-1]
+        power = np.abs(np.fft.rfft(residual * np.hanning(n), axis=-1)) ** 2
+        band = power[:, self.min_cycles:]
+        peak = np.argmax(band, axis=-1)
+        padded = np.pad(band, ((0, 0), (1, 1)))
+        rows = np.arange(band.shape[0])
+        line = padded[rows, peak] + padded[rows, peak + 1] + padded[rows, peak + 2]
+        total = band.sum(axis=-1)
+        concentration = np.divide(line, total, out=np.zeros_like(line), where=total > 0)
+
+        cycles = (peak + self.min_cycles).astype(np.int64)
+        span = n * np.median(np.broadcast_to(np.abs(df), tau.shape), axis=-1)
+        rms = residual.std(axis=-1)
+        detected = (rms >= self.threshold_s) & (concentration >= self.min_concentration)
+        confidence = concentration * np.minimum(1.0, rms / self.threshold_s)
+
+        return LteRippleBatch(
+            detected            = detected,
+            confidence          = confidence,
+            ripple_rms_s        = rms,
+            concentration       = concentration,
+            ripple_cycles       = cycles,
+            ripple_period_hz    = span / cycles,
+            residual_s          = residual,
+        )
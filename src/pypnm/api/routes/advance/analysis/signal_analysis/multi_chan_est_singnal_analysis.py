@@ -1,11 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import logging
 from typing import cast
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.ifft import (
@@ -14,6 +15,7 @@ from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.ifft impor
 )
 from pypnm.api.routes.advance.analysis.signal_analysis.detection.lte.phase_slope_lte_detection import (
     GroupDelayAnomalyDetector,
+    PhaseSlopeLteDetector,
 )
 from pypnm.api.routes.advance.analysis.signal_analysis.group_delay_calculator import (
     GroupDelayCalculator,
@@ -95,6 +97,9 @@ class LteDetectionModel(BaseModel):
     anomalies: FloatSeries          = Field(..., description="Detected LTE interference magnitudes/indices")
     threshold: float                = Field(..., description="Group-delay ripple threshold")
     bin_widths: FloatSeries         = Field(..., description="Bin widths used for segmentation (Hz)")
+    ripple_detected: bool | None    = Field(default=None, description="Periodic phase-slope ripple found in any snapshot")
+    ripple_confidence: float | None = Field(default=None, description="Highest per-snapshot ripple confidence [0, 1]")
+    ripple_period_hz: float | None  = Field(default=None, description="Ripple period of the most confident snapshot (Hz)")
 
 
 class EchoDetectionPhaseSlopeModel(BaseModel):
@@ -325,6 +330,10 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
                     for bw, anom in zip(r.bin_widths, r.anomalies, strict=False):
                         csv.insert_row([bw, anom])
                     csv.insert_row(["Threshold", r.threshold])
+                    if r.ripple_detected is not None:
+                        csv.insert_row(["Ripple Detected", r.ripple_detected])
+                        csv.insert_row(["Ripple Confidence", r.ripple_confidence])
+                        csv.insert_row(["Ripple Period (Hz)", r.ripple_period_hz])
                     csv.set_path_fname(self.create_csv_fname(tags=[f"ch{r.channel_id}", "lte-detect"]))
                     csv.write()
                     csvs.append(csv)
@@ -639,14 +648,32 @@ class MultiChanEstimationSignalAnalysis(MultiAnalysisRpt):
             self.logger.error(f"LTE_DETECTION_PHASE_SLOPE parse failed: {e}")
 
         out: list[LteDetectionModel] = []
+        ripple_detector = PhaseSlopeLteDetector(threshold_s=threshold)
         for ch, cplx in channel_data.items():
             res = GroupDelayAnomalyDetector(cplx, list(freqs[ch])).run(bin_widths=bin_widths, threshold=threshold)
+
+            # All snapshots of the channel are screened in one batch
+            ripple_detected: bool | None = None
+            ripple_confidence: float | None = None
+            ripple_period_hz: float | None = None
+            try:
+                batch = ripple_detector.detect(cplx, np.asarray(freqs[ch], dtype=np.float64))
+                best = int(batch.confidence.argmax())
+                ripple_detected = bool(batch.detected.any())
+                ripple_confidence = float(batch.confidence[best])
+                ripple_period_hz = float(batch.ripple_period_hz[best])
+            except ValueError as e:
+                self.logger.warning(f"LTE ripple screening skipped for channel {ch}: {e}")
+
             out.append(
                 LteDetectionModel(
-                    channel_id      =   ch,
-                    anomalies       =   res.get("anomalies", []),
-                    threshold       =   threshold,
-                    bin_widths      =   bin_widths,
+                    channel_id          =   ch,
+                    anomalies           =   res.get("anomalies", []),
+                    threshold           =   threshold,
+                    bin_widths          =   bin_widths,
+                    ripple_detected     =   ripple_detected,
+                    ripple_confidence   =   ripple_confidence,
+                    ripple_period_hz    =   ripple_period_hz,
                 )
             )
         return out
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -26,6 +26,9 @@ from pypnm.api.routes.common.classes.collection.fec_summary_aggregator import (
     FecSummaryAggregator,
     FecSummaryTotalsModel,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.common_req_resp import (
+    DownsampleParameters,
+)
 from pypnm.lib.constants import INVALID_CAPTURE_TIME
 from pypnm.lib.csv.manager import CSVManager
 from pypnm.lib.matplot.manager import MatplotManager, PlotConfig
@@ -152,8 +155,38 @@ class MultiRxMerSignalAnalysis(MultiAnalysisRpt):
 
         return self._model
 
-    def to_dict(self) -> dict[str, Any]:
-        return self.to_model().model_dump()
+    def to_dict(self, downsample: DownsampleParameters | None = None) -> dict[str, Any]:
+        """
+        Result as a dict, with the per-subcarrier series of every channel
+        optionally reduced to ``downsample.points``.
+
+        Indices are chosen from the channel's average MER (the column mean for
+        the heat map) and applied to the frequency axis and every aligned series.
+        """
+        out = self.to_model().model_dump()
+        sampler = downsample.downsampler() if downsample is not None else None
+        data = out.get("data")
+        if sampler is None or not isinstance(data, dict):
+            return out
+
+        for cid, chan in data.items():
+            primary = self._downsample_primary(chan)
+            if primary.size <= sampler.points:
+                continue
+            idx = sampler.indices(primary, chan.get("frequency") or None)
+            data[cid] = sampler.take_aligned(chan, idx, primary.size)
+        return out
+
+    def _downsample_primary(self, chan: dict[str, Any]) -> np.ndarray:
+        if self.analysis_type == MultiRxMerAnalysisType.RXMER_HEAT_MAP:
+            values = chan.get("values") or []
+            width = len(chan.get("frequency") or [])
+            rows = [r for r in values if len(r) == width]
+            if not rows or width == 0:
+                return np.empty(0, dtype=float)
+            return np.nanmean(np.asarray(rows, dtype=float), axis=0)
+        key = "avg_mer" if self.analysis_type == MultiRxMerAnalysisType.OFDM_PROFILE_PERFORMANCE_1 else "avg"
+        return np.asarray(chan.get(key) or [], dtype=float)
 
     # -----------------------
     # Internals
@@ -3,15 +3,13 @@
 
 from __future__ import annotations
 
-import io
 import logging
 import os
-import zipfile
 from collections.abc import Callable
 from typing import cast
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 
 from pypnm.api.routes.advance.analysis.signal_analysis.multi_chan_est_singnal_analysis import (
     MultiChanEstAnalysisType,
@@ -38,13 +36,15 @@ from pypnm.api.routes.advance.multi_ds_chan_est.service import (
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
 from pypnm.api.routes.common.classes.common_endpoint_classes.snmp.schemas import (
     SnmpResponse,
 )
-from pypnm.api.routes.common.classes.file_capture.file_type import FileType
 from pypnm.api.routes.common.classes.operation.cable_modem_precheck import (
     CableModemServicePreCheck,
 )
@@ -66,7 +66,8 @@ class MultiDsChanEstRouter(AbstractService):
     def __init__(self) -> None:
         super().__init__()
         self.router = APIRouter(prefix="/advance/multiChannelEstimation",
-                                tags=["PNM Operations - Multi-DS-Channel-Estimation"])
+                                tags=["PNM Operations - Multi-DS-Channel-Estimation"],
+                                route_class=CompactArrayRoute)
         self.logger = logging.getLogger(self.__class__.__name__)
         self._add_routes()
 
@@ -143,24 +144,8 @@ class MultiDsChanEstRouter(AbstractService):
             svc: MultiChannelEstimationService = cast(MultiChannelEstimationService, self.getService(operation_id))
             samples = svc.results(operation_id)
             pnm_dir, mac = str(SystemConfigSettings.pnm_dir()), svc.cm.get_mac_address.mac_address
-            buf = io.BytesIO()
-
-            with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-                for s in samples:
-                    path = os.path.join(pnm_dir, s.filename)
-
-                    try:
-                        zf.write(path, arcname=os.path.basename(s.filename))
-
-                    except FileNotFoundError:
-                        self.logger.warning(f"[zip] Missing: {path}")
-
-                    except Exception as e:
-                        self.logger.warning(f"[zip] Skip {path}: {e}")
-
-            buf.seek(0)
-            headers = {"Content-Disposition": f"attachment; filename=multiChannelEstimation_{mac}_{operation_id}.zip"}
-            return StreamingResponse(buf, media_type="application/zip", headers=headers)
+            files = [os.path.join(pnm_dir, s.filename) for s in samples]
+            return PnmFileService().stream_archive(files, f"multiChannelEstimation_{mac}_{operation_id}.zip")
 
 
         @self.router.delete("/stop/{operation_id}",
@@ -195,7 +180,7 @@ class MultiDsChanEstRouter(AbstractService):
         @self.router.post("/analysis",
             response_model=MultiChanEstimationAnalysisResponse,
             summary="Perform signal analysis on a previously executed Multi-ChannelEstimation")
-        def analysis(request: MultiChanEstAnalysisRequest) -> MultiChanEstimationAnalysisResponse | FileResponse:
+        def analysis(request: MultiChanEstAnalysisRequest) -> MultiChanEstimationAnalysisResponse | StreamingResponse:
             """
             Perform post-capture analysis on Multi-ChannelEstimation measurement data.
 
@@ -277,9 +262,9 @@ class MultiDsChanEstRouter(AbstractService):
 
             elif output_type == OutputType.ARCHIVE:
                 try:
-                    rpt = engine.build_report()
+                    rpt = engine.build_report(archive=False)
                     self.logger.info(f"[analysis] Built archive report for group {capture_group_id}")
-                    return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                    return PnmFileService().stream_archive(engine.get_archive_members(), rpt.name)
 
                 except Exception as e:
                     msg = f"Archive build failed: {e}"
@@ -3,14 +3,12 @@
 
 from __future__ import annotations
 
-import io
 import logging
 import os
-import zipfile
 from typing import cast
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import FileResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 
 from pypnm.api.routes.advance.analysis.signal_analysis.multi_rxmer_signal_analysis import (
     MultiRxMerAnalysisResult,
@@ -39,6 +37,9 @@ from pypnm.api.routes.advance.multi_rxmer.service import (
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -52,7 +53,7 @@ from pypnm.api.routes.common.extended.common_measure_schema import (
     DownstreamOfdmParameters,
 )
 from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
-from pypnm.api.routes.docs.pnm.files.service import FileType, PnmFileService
+from pypnm.api.routes.docs.pnm.files.service import PnmFileService
 from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.lib.fastapi_constants import FAST_API_RESPONSE
@@ -90,7 +91,8 @@ class MultiRxMerRouter(AbstractService):
         self.logger = logging.getLogger(self.__class__.__name__)
         self.router = APIRouter(
             prefix="/advance/multiRxMer",
-            tags=["PNM Operations - Multi-Downstream OFDM RxMER"],)
+            tags=["PNM Operations - Multi-Downstream OFDM RxMER"],
+            route_class=CompactArrayRoute,)
         self._add_routes()
 
     def _add_routes(self) -> None:
@@ -272,22 +274,8 @@ class MultiRxMerRouter(AbstractService):
             pnm_dir = str(SystemConfigSettings.pnm_dir())
             mac = svc.cm.get_mac_address.mac_address
 
-            buf = io.BytesIO()
-            with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zipf:
-                for sample in samples:
-                    file_path = os.path.join(pnm_dir, sample.filename)
-                    arcname = os.path.basename(sample.filename)
-                    try:
-                        zipf.write(file_path, arcname=arcname)
-                    except FileNotFoundError:
-                        self.logger.warning(f"File not found, skipping: {file_path}")
-                    except Exception as e:
-                        self.logger.warning(f"Skipping {file_path}: {e}")
-
-            buf.seek(0)
-
-            headers = {"Content-Disposition": f"attachment; filename=multiRxMer_{mac}_{operation_id}.zip"}
-            return StreamingResponse(buf, media_type="application/zip", headers=headers)
+            files = [os.path.join(pnm_dir, sample.filename) for sample in samples]
+            return PnmFileService().stream_archive(files, f"multiRxMer_{mac}_{operation_id}.zip")
 
         @self.router.delete("/stop/{operation_id}",
             response_model=MultiRxMerStatusResponse,
@@ -342,7 +330,7 @@ class MultiRxMerRouter(AbstractService):
             response_model=MultiRxMerAnalysisResponse,
             summary="Perform signal analysis on a previously executed Multi-RxMER captures",
             responses=FAST_API_RESPONSE,)
-        def analysis(request: MultiRxMerAnalysisRequest) -> MultiRxMerAnalysisResponse | FileResponse:
+        def analysis(request: MultiRxMerAnalysisRequest) -> MultiRxMerAnalysisResponse | StreamingResponse:
             """
             Multi-RxMER Analysis
 
@@ -367,7 +355,7 @@ class MultiRxMerRouter(AbstractService):
             Returns
             -------
             • `MultiRxMerAnalysisResponse` (JSON output)
-            • `FileResponse` (archive report)
+            • `StreamingResponse` (archive report)
 
             Errors
             ------
@@ -454,7 +442,7 @@ class MultiRxMerRouter(AbstractService):
             mac_address = multi_analysis.mac_address
 
             if output_type == OutputType.JSON:
-                data = multi_analysis.model_dump().get("data", {})
+                data = engine.to_dict(request.analysis.downsample).get("data", {})
                 return MultiRxMerAnalysisResponse(
                     mac_address =   mac_address,
                     status      =   ServiceStatusCode.SUCCESS,
@@ -462,8 +450,8 @@ class MultiRxMerRouter(AbstractService):
                     data        =   data,)
 
             elif output_type == OutputType.ARCHIVE:
-                rpt = engine.build_report()
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt = engine.build_report(archive=False)
+                return PnmFileService().stream_archive(engine.get_archive_members(), rpt.name)
 
             else:
 
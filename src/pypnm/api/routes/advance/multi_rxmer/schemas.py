@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -19,6 +19,7 @@ from pypnm.api.routes.common.classes.common_endpoint_classes.common_req_resp imp
     CommonMatPlotConfigRequest,
     CommonOutput,
     CommonResponse,
+    DownsampleParameters,
 )
 from pypnm.lib.types import OperationId
 
@@ -174,6 +175,7 @@ class MultiRxMerAnalysisConfig(BaseModel):
     type: MultiRxMerAnalysisType    = Field(default=MultiRxMerAnalysisType.MIN_AVG_MAX, description="Analysis type to perform, implementation-specific integer value")
     output: CommonOutput            = Field(description="Output type control: json or archive")
     plot: CommonMatPlotConfigRequest = Field(description="Plot configuration for multi-RxMER analysis")
+    downsample: DownsampleParameters = Field(default=DownsampleParameters(), description="Optional decimation of per-subcarrier series in JSON output")
 
 __all__ = [
     "MultiRxMerMeasureModes",
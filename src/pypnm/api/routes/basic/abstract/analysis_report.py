@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -21,6 +21,11 @@ from pypnm.lib.csv.manager import CSVManager
 from pypnm.lib.db.json_transaction import JsonTransactionDb
 from pypnm.lib.mac_address import MacAddress
 from pypnm.lib.matplot.manager import MatplotManager, ThemeType
+from pypnm.lib.matplot.render_pool import (
+    PLOT_RENDER_CACHE_DIR,
+    MatplotRenderPool,
+    PlotRenderCache,
+)
 from pypnm.lib.types import (
     ChannelId,
     FileNameStr,
@@ -59,6 +64,7 @@ class AnalysisRptMatplotConfig(BaseModel):
     Extend this model in subclasses to add specific plot configuration options.
     """
     theme: ThemeType = Field(default="light", description="Plot theme: 'light' or 'dark'")
+    preview: bool    = Field(default=False, description="Render plots at reduced preview DPI for faster report turnaround")
 
 class AnalysisReport(ABC):
     '''
@@ -82,6 +88,7 @@ class AnalysisReport(ABC):
         self.csv_files: list[PathLike]  = []
         self.plot_files: list[PathLike] = []
         self.json_files: list[PathLike] = []
+        self._archive_members: list[Path] = []
 
     def getAnalysisRptMatplotConfig(self) -> AnalysisRptMatplotConfig:
         return self._armc
@@ -276,12 +283,17 @@ class AnalysisReport(ABC):
         """
         return list(self._common_analysis_model.keys())
 
-    def build_report(self) -> Path:
+    def build_report(self, archive: bool = True) -> Path:
         """
         Run the full report pipeline: `_process()` → CSV generation → plot rendering → ZIP.
 
+        Args:
+            archive: When False, skip writing the ZIP to `archive_dir`; the members
+                remain available via `get_archive_members()` for a streamed download.
+
         Returns:
-            The path to the created ZIP archive.
+            The path to the created ZIP archive (the planned archive path when
+            `archive` is False).
 
         Typical use:
             archive = report.build_report()
@@ -301,15 +313,27 @@ class AnalysisReport(ABC):
             self.csv_files.append(csv_mgr.get_path_fname())
             f.append(csv_mgr.get_path_fname())
 
-        for matplot_mgr in self.create_matplot():
-            for fn in matplot_mgr.get_png_files():
-                self.logger.debug(f'Wrote Matplotlib Figure: {fn}')
-                self.plot_files.append(fn)
-                f.append(fn)
+        with MatplotManager.deferred_rendering() as jobs:
+            self.create_matplot()
+
+        rendered = MatplotRenderPool.render(
+            jobs,
+            cache   = PlotRenderCache(Path(self._png_dir) / PLOT_RENDER_CACHE_DIR),
+            preview = self._armc.preview,
+        )
+        for fn in rendered:
+            self.logger.debug(f'Wrote Matplotlib Figure: {fn}')
+            self.plot_files.append(fn)
+            f.append(fn)
 
         # Add JSON files if any
         f.extend(self.json_files)
 
+        self._archive_members = [Path(p) for p in f[1:]]
+        if not archive:
+            self.archive_file = self.create_archive_fname()
+            return Path(self.archive_file)
+
         try:
             self.archive_file = ArchiveManager().zip_files(files=f, archive_path=self.create_archive_fname())
 
@@ -318,6 +342,16 @@ class AnalysisReport(ABC):
 
         return self.archive_file
 
+    def get_archive_members(self) -> list[Path]:
+        """
+        Return the files (CSVs, plots, JSON) that make up the report archive, in archive order.
+
+        Example:
+            report.build_report(archive=False)
+            stream = ArchiveManager.stream_zip(report.get_archive_members())
+        """
+        return self._archive_members
+
     def get_all_generated_files(self, include_archive:bool=False) -> list[PathLike]:
         """
         Return a flat list of generated file paths (CSVs, plots, and JSON files).
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -97,9 +97,10 @@ class ChanEstimationReport(AnalysisReport):
                     "ChannelID", "Frequency(Hz)",
                     "Magnitude(Linear)", "Magnitude(dB)", "Regression(Linear)", "Group Delay", "Real", "Imaginary"])
 
-                for rx, ry, reg, cdb, _rl_v, gd_v, cmp in zip(freq, magnitude, rl, db, rl, gd, ca, strict=False):
-                    real, img = cmp
-                    csv_mgr.insert_row([chan, rx, ry, cdb, reg, gd_v, real, img])
+                iq = np.asarray(ca, dtype=np.float64).reshape(-1, 2)
+                n = min(len(freq), len(magnitude), len(rl), len(db), len(gd), len(iq))
+                csv_mgr.insert_columns([np.full(n, chan), freq[:n], magnitude[:n], db[:n], rl[:n], gd[:n],
+                                        iq[:n, 0], iq[:n, 1]])
 
                 self.logger.info("CSV created for channel %s: %s (rows=%d)", chan, csv_fname, len(freq))
                 csv_mgr_list.append(csv_mgr)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -234,8 +234,9 @@ class SingleOfdmSpecAnalyzerReport(AnalysisReport):
                 csv_mgr.set_header(["Frequency", "Magnitude(dBmV)", "MovingAverage"])
 
                 # Rows aligned by index
-                for f_hz, mag_dbmv, ma in zip(sig.frequencies, sig.amplitude, sig.window.windows_average, strict=False):
-                    csv_mgr.insert_row ([f_hz, mag_dbmv, ma])
+                freq, amp, avg = sig.frequencies, sig.amplitude, sig.window.windows_average
+                n = min(len(freq), len(amp), len(avg))
+                csv_mgr.insert_columns([freq[:n], amp[:n], avg[:n]])
 
                 csv_fname = self.create_csv_fname(tags=[str(channel_id), self.FNAME_TAG])
                 csv_mgr.set_path_fname(csv_fname)
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -10,6 +10,7 @@ import re
 from collections.abc import Mapping
 from typing import cast
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 
 from pypnm.api.routes.basic.abstract.analysis_report import (
@@ -84,8 +85,8 @@ class RxMerAnalysisReport(AnalysisReport):
                 csv_mgr.set_path_fname(csv_fname)
 
                 csv_mgr.set_header(["ChannelID", "Frequency(Hz)", "Magnitude(dB)", "Shannon Limit(dB)", "Regression Line(dB)"])
-                for rx, ry, s, r in zip(x, y, sh, rl, strict=False):
-                    csv_mgr.insert_row([chan, rx, ry, s, r])
+                n = min(len(x), len(y), len(sh), len(rl))
+                csv_mgr.insert_columns([np.full(n, chan), x[:n], y[:n], sh[:n], rl[:n]])
 
                 self.logger.debug("CSV created for channel %s: %s (rows=%d)", chan, csv_fname, len(x))
                 csv_mgr_list.append(csv_mgr)
@@ -105,8 +106,8 @@ class RxMerAnalysisReport(AnalysisReport):
                 csv_mgr.set_header(["Frequency(Hz)", "Magnitude(dB)"])
 
                 x_agg, y_agg = self._sig_cap_agg.get_series()
-                for rx, ry in zip(x_agg, y_agg, strict=False):
-                    csv_mgr.insert_row([rx, ry])
+                n = min(len(x_agg), len(y_agg))
+                csv_mgr.insert_columns([x_agg[:n], y_agg[:n]])
 
                 self.logger.debug(f"CSV created: {csv_fname} (rows={len(x_agg)})")
                 csv_mgr_list.append(csv_mgr)
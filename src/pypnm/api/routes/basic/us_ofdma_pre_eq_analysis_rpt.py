@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -107,9 +107,9 @@ class CmUsOfdmaPreEqReport(AnalysisReport):
                 csv_mgr.set_path_fname(csv_fname)
 
                 csv_mgr.set_header(["ChannelID", "Frequency(Hz)", "Magnitude(dB)", "Regression(dB)", "Real(Linear)", "Imaginary(Linear)"])
-                for rx, ry, reg, cmp in zip(x, y, rl, ca, strict=False):
-                    real, img = cmp
-                    csv_mgr.insert_row([channel_id, rx, ry, reg, real, img])
+                iq = np.asarray(ca, dtype=np.float64).reshape(-1, 2)
+                n = min(len(x), len(y), len(rl), len(iq))
+                csv_mgr.insert_columns([np.full(n, int(channel_id)), x[:n], y[:n], rl[:n], iq[:n, 0], iq[:n, 1]])
 
                 self.logger.debug(f"CSV created for OFDMA US Pre-EQ channel {channel_id}: {csv_fname} (rows={len(x)})")
                 csv_mgr_list.append(csv_mgr)
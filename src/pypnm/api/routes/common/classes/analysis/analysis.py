@@ -52,6 +52,9 @@ from pypnm.api.routes.common.classes.analysis.model.spectrum_analyzer_schema imp
     SpectrumAnalyzerAnalysisModel,
     WindowAverage,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.common_req_resp import (
+    DownsampleParameters,
+)
 from pypnm.api.routes.common.extended.common_messaging_service import MessageResponse
 from pypnm.api.routes.common.extended.types import (
     CommonMessagingServiceExtension as CMSE,
@@ -83,6 +86,9 @@ from pypnm.lib.signal_processing.complex_array_ops import ComplexArrayOps
 from pypnm.lib.signal_processing.group_delay import GroupDelay
 from pypnm.lib.signal_processing.linear_regression import LinearRegression1D
 from pypnm.lib.signal_processing.shan.series import Shannon, ShannonSeries
+from pypnm.lib.signal_processing.spectrum_stitch import SpectrumSegmentStitcher
+from pypnm.lib.telemetry.metrics import REGISTRY
+from pypnm.lib.telemetry.tracing import trace_span
 from pypnm.lib.types import (
     ArrayLike,
     ChannelId,
@@ -92,6 +98,8 @@ from pypnm.lib.types import (
     FrequencySeriesHz,
     IntSeries,
     MacAddressStr,
+    NDArrayF64,
+    NDArrayI64,
     ProfileId,
     SpectrumAnalysisSnmpCaptureParameters,
 )
@@ -141,6 +149,12 @@ RXMER_CLIPPED_HIGH = 63.5
 # Constants for Signal Processing
 CHAN_EST_BW_CUTOFF_FRACTION: float = 0.25
 
+PNM_ANALYSIS_SECONDS = REGISTRY.histogram(
+    "pypnm_pnm_analysis_duration_seconds",
+    "Time spent in basic analysis of one measurement, by PNM file type.",
+    ("file_type",),
+)
+
 class AnalysisType(Enum):
     """
     Analysis mode selector.
@@ -246,7 +260,7 @@ class Analysis:
                 pnm_file_type = PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA.value
                 if self.analysis_type == AnalysisType.BASIC:
                     self.logger.debug('Performing Basic Analysis on SNMP Spectrum Analysis Data')
-                    self._basic_analysis(pnm_file_type, measurement, analysis_para)
+                    self._timed_basic_analysis(pnm_file_type, measurement, analysis_para)
 
                 continue
 
@@ -266,12 +280,23 @@ class Analysis:
 
             if self.analysis_type == AnalysisType.BASIC:
                 self.logger.debug(f'Performing Basic Analysis on PNM: {pnm_file_type} on Channel: {channel_id}')
-                self._basic_analysis(pnm_file_type, measurement, analysis_para)
+                self._timed_basic_analysis(pnm_file_type, measurement, analysis_para)
 
             else:
                 self.logger.error(f'Unknown AnalysisType: {self.analysis_type}')
                 raise
 
+    def _timed_basic_analysis(self, pnm_file_type: str,
+                              measurement: dict[str, Any],
+                              analysis_para: AnalysisProcessParameters) -> None:
+        """Run :meth:`_basic_analysis` under an ``analysis.basic`` span, timed by file type."""
+        try:
+            label = PnmFileType(pnm_file_type).name
+        except ValueError:
+            label = "UNKNOWN"
+        with trace_span("analysis.basic", file_type=label), PNM_ANALYSIS_SECONDS.time(file_type=label):
+            self._basic_analysis(pnm_file_type, measurement, analysis_para)
+
     def _basic_analysis(self, pnm_file_type: str,
                         measurement: dict[str, Any],
                         analysis_para: AnalysisProcessParameters) -> None:
@@ -304,7 +329,9 @@ class Analysis:
             self.logger.debug("Processing: OFDM_CHANNEL_ESTIMATE_COEFFICIENT")
             model = self.basic_analysis_ds_chan_est(measurement)
             self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
+            self.__update_result_dict(self.downsample_result(
+                model.model_dump(), analysis_para.downsample,
+                ("carrier_values",), "frequency", "magnitudes"))
             self.__add_pnmType(PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT)
 
         elif pnm_file_type == PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY.value:
@@ -321,7 +348,9 @@ class Analysis:
             self.logger.debug("Processing: RECEIVE_MODULATION_ERROR_RATIO")
             model = self.basic_analysis_rxmer(measurement)
             self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
+            self.__update_result_dict(self.downsample_result(
+                model.model_dump(), analysis_para.downsample,
+                ("carrier_values", "regression", "modulation_statistics"), "frequency", "magnitude"))
             self.__add_pnmType(PnmFileType.RECEIVE_MODULATION_ERROR_RATIO)
 
         elif pnm_file_type == PnmFileType.DOWNSTREAM_HISTOGRAM.value:
@@ -356,7 +385,9 @@ class Analysis:
             self.logger.debug("Processing: SPECTRUM_ANALYSIS")
             model = self.basic_analysis_spectrum_analyzer(measurement, analysis_para)
             self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
+            self.__update_result_dict(self.downsample_result(
+                model.model_dump(), analysis_para.downsample,
+                ("signal_analysis",), "frequencies", "magnitudes"))
             self.__add_pnmType(PnmFileType.SPECTRUM_ANALYSIS)
 
         elif pnm_file_type == PnmFileType.OFDM_MODULATION_PROFILE.value:
@@ -376,12 +407,52 @@ class Analysis:
             capture_parameters_update = self._msg_rsp_extension
             model = self.basic_analysis_spectrum_analyzer_snmp(measurement, capture_parameters_update, analysis_para)
             self.__update_result_model(model)
-            self.__update_result_dict(model.model_dump())
+            self.__update_result_dict(self.downsample_result(
+                model.model_dump(), analysis_para.downsample,
+                ("signal_analysis",), "frequencies", "magnitudes"))
             self.__add_pnmType(PnmFileType.CM_SPECTRUM_ANALYSIS_SNMP_AMP_DATA)
 
         else:
             self.logger.error(f"Unknown PNM file type: ({pnm_file_type})")
 
+    @staticmethod
+    def downsample_result(result: dict[str, Any],
+                          params: DownsampleParameters | None,
+                          sections: tuple[str, ...],
+                          x_key: str, y_key: str) -> dict[str, Any]:
+        """
+        Decimate the per-point series of a dumped analysis model.
+
+        The indices are chosen from ``sections[0][x_key]`` / ``[y_key]`` and
+        applied to every list of the same length under ``sections``, so all
+        per-subcarrier (or per-bin) series stay aligned. A ``downsample`` entry
+        records the method and the original point count. The result model
+        itself is left at full resolution for reports and CSV output.
+
+        Returns ``result`` unchanged when no method is selected or the series
+        already fits ``params.points``.
+        """
+        sampler = params.downsampler() if params is not None else None
+        primary = result.get(sections[0]) if sections else None
+        if sampler is None or not isinstance(primary, dict):
+            return result
+
+        y = primary.get(y_key) or []
+        if len(y) <= sampler.points:
+            return result
+
+        idx = sampler.indices(y, primary.get(x_key) or None)
+        out = dict(result)
+        for section in sections:
+            if section in out:
+                out[section] = sampler.take_aligned(out[section], idx, len(y))
+        out["downsample"] = {
+            "method":        sampler.method.value,
+            "points":        int(idx.size),
+            "source_points": len(y),
+        }
+        return out
+
     def get_pnm_type(self) -> list[PnmFileType]:
         return self._processed_pnm_type
 
@@ -565,7 +636,13 @@ class Analysis:
         Raises
         ------
         ValueError
-            If required parameters are missing/negative, or lengths mismatch.
+            If required parameters are missing/negative, or any RxMER value is
+            negative or non-finite.
+
+        Notes
+        -----
+        Frequency axis, carrier status, Shannon statistics and regression are all
+        computed on ndarrays; Python lists are only materialized for the returned model.
         """
         out: DsRxMerAnalysisModel
 
@@ -586,33 +663,18 @@ class Analysis:
         if not values:
             raise ValueError("No RxMER values provided in measurement.")
 
-        base_freq = (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency
-        freqs:FloatSeries = [base_freq + (i * subcarrier_spacing) for i in range(len(values))]
-        magnitudes:FloatSeries = values
-
-        def classify(v: int) -> int:
-            if v == RXMER_EXCLUSION:
-                return int(RxMerCarrierType.EXCLUSION.value)
-            elif v in (RXMER_CLIPPED_LOW, RXMER_CLIPPED_HIGH):
-                return int(RxMerCarrierType.CLIPPED.value)
-            else:
-                return int(RxMerCarrierType.NORMAL.value)
+        mags_arr: NDArrayF64    = np.asarray(values, dtype=np.float64)
+        freqs_arr: NDArrayI64   = cls._rxmer_frequency_axis(subcarrier_spacing, first_active_subcarrier_index,
+                                                            subcarrier_zero_frequency, mags_arr.size)
+        status_arr: NDArrayI64  = cls._rxmer_carrier_status(mags_arr)
 
-        # carrier_status will be List[int]
-        carrier_status: list[int] = [classify(v) for v in values]
+        ss = ShannonSeries.build_model(mags_arr)
 
-        if not (len(freqs) == len(magnitudes) == len(carrier_status)):
-            raise ValueError(
-                f"Length mismatch detected: frequencies({len(freqs)}), "
-                f"magnitudes({len(magnitudes)}), carrier_status({len(carrier_status)})"
-            )
+        regession_model = cls._rxmer_regression(mags_arr, freqs_arr)
 
-        ss = ShannonSeries(magnitudes)
-
-        regession_model = RegressionModel(
-            slope   = cast(FloatSeries, LinearRegression1D(cast(ArrayLike,magnitudes),
-                                                           cast(ArrayLike,freqs)).regression_line())
-        )
+        freqs: FrequencySeriesHz    = freqs_arr.tolist()
+        magnitudes: FloatSeries     = mags_arr.tolist()
+        carrier_status: IntSeries   = status_arr.tolist()
 
         csm:dict[str, Any] = {
             RxMerCarrierType.EXCLUSION.name.lower(): RxMerCarrierType.EXCLUSION.value,
@@ -637,7 +699,7 @@ class Analysis:
             subcarrier_zero_frequency       = subcarrier_zero_frequency,
             carrier_values                  = cv,
             regression                      = regession_model,
-            modulation_statistics           = ss.to_model()
+            modulation_statistics           = ss
         )
 
         return out
@@ -1193,28 +1255,13 @@ class Analysis:
         None
             This method now returns None instead of raising for empty samples.
         """
-        # DEBUG: Log incoming measurement structure
-        print(f"=== CONSTELLATION DISPLAY DEBUG ===", flush=True)
-        print(f"measurement keys: {measurement.keys()}", flush=True)
-        print(f"measurement has 'samples': {'samples' in measurement}", flush=True)
         raw_samples = measurement.get("samples")
-        print(f"raw_samples type: {type(raw_samples)}", flush=True)
-        print(f"raw_samples is None: {raw_samples is None}", flush=True)
-        if raw_samples is not None:
-            print(f"raw_samples length: {len(raw_samples) if hasattr(raw_samples, '__len__') else 'N/A'}", flush=True)
-            if len(raw_samples) > 0:
-                print(f"first sample type: {type(raw_samples[0])}, value: {raw_samples[0]}", flush=True)
-        print(f"=== END CONSTELLATION DISPLAY DEBUG ===", flush=True)
-        
-        # Convert samples from list of lists to list of tuples if needed
-        samples: ComplexArray = []
-        if raw_samples:
-            samples = [(float(s[0]), float(s[1])) if isinstance(s, (list, tuple)) else s for s in raw_samples]
-        
-        if not samples:
+        samples: NDArrayF64 = np.asarray(raw_samples if raw_samples is not None else [], dtype=np.float64).reshape(-1, 2)
+
+        if not samples.size:
             # Return None for empty samples instead of raising - this allows other channels to succeed
-            channel_id = measurement.get("channel_id", "unknown")
-            print(f"WARNING: Channel {channel_id} has no constellation samples, skipping", flush=True)
+            logging.getLogger(cls.__name__).warning(
+                "Channel %s has no constellation samples, skipping", measurement.get("channel_id", "unknown"))
             return None
 
         # Map actual modulation order → QamModulation
@@ -1222,10 +1269,12 @@ class Analysis:
         qm: QamModulation = QamModulation.from_DsOfdmModulationType(amo)
 
         # Hard points come from LUT (already normalized)
-        hard = QamLutManager().get_hard_decisions(qm)
+        lut = QamLutManager()
+        hard = lut.get_hard_decisions(qm)
 
         # IMPORTANT: Do NOT rescale the CM soft decisions; they are already unit-power normalized (s2.13).
-        soft = samples
+        mer_db, evm_percent = cls._constellation_error_stats(lut, qm, samples)
+        soft: ComplexArray = list(zip(samples[:, 0].tolist(), samples[:, 1].tolist(), strict=True))
 
         return ConstellationDisplayAnalysisModel(
             device_details      = measurement.get("device_details", SystemDescriptor.empty()),
@@ -1235,9 +1284,28 @@ class Analysis:
             num_sample_symbols  = measurement.get("num_sample_symbols", len(samples)),
             modulation_order    = qm,       # QamModulation
             hard                = hard,     # LUT hard points (normalized)
-            soft                = soft      # CM soft decisions (already normalized) ← changed
+            soft                = soft,     # CM soft decisions (already normalized) ← changed
+            mer_db              = mer_db,
+            evm_percent         = evm_percent,
         )
 
+    @staticmethod
+    def _constellation_error_stats(lut: QamLutManager, qm: QamModulation,
+                                   samples: NDArrayF64 | ComplexArray) -> tuple[float | None, float | None]:
+        """
+        Slice soft decisions against the LUT and return (MER dB, EVM %).
+
+        Both are None when the modulation has no LUT entry; MER is None (not
+        ``inf``) for an error-free capture so the payload stays JSON-safe.
+        """
+        try:
+            result = lut.slice_soft_decisions(qm, samples)
+        except (KeyError, ValueError):
+            return None, None
+        mer = result.mer_db if np.isfinite(result.mer_db) else None
+        evm = result.evm_percent if np.isfinite(result.evm_percent) else None
+        return mer, evm
+
     @classmethod
     def basic_analysis_ds_histogram(cls, measurement: dict[str, Any]) -> DsHistogramAnalysisModel:
         """
@@ -1403,48 +1471,6 @@ class Analysis:
         except Exception:
             wf_enum = WindowFunction.HANN
 
-        bin_bw = int(measurement.get("bin_frequency_spacing", 0))
-        if bin_bw <= 0 and seg_span_hz > 0 and bins_per_seg > 0:
-            bin_bw = max(1, seg_span_hz // bins_per_seg)
-
-        # --- segments & magnitudes ---
-        segments = measurement.get("amplitude_bin_segments_float", [])
-        num_segments = len(segments)
-        if bins_per_seg <= 0 and num_segments:
-            bins_per_seg = len(segments[0])
-
-        # Normalize each segment length to bins_per_seg (clip/pad NaN)
-        norm_segments: list[list[float]] = []
-        for s in segments:
-            if len(s) >= bins_per_seg:
-                norm_segments.append([float(x) for x in s[:bins_per_seg]])
-            else:
-                pad = [float("nan")] * (bins_per_seg - len(s))
-                norm_segments.append([float(x) for x in s] + pad)
-
-        magnitudes: MagnitudeSeries = [x for seg in norm_segments for x in seg]
-
-        # --- compute frequency axis across segments ---
-        frequencies: FrequencySeriesHz = []
-        if num_segments > 0 and bins_per_seg > 0 and seg_span_hz > 0 and bin_bw > 0 and first_seg_cf > 0:
-            seg_step_hz = (last_seg_cf - first_seg_cf) // (num_segments - 1) if num_segments > 1 else 0
-            # start at center - span/2, align to bin center with +bin_bw/2
-            seg0_start = first_seg_cf - (seg_span_hz // 2) + (bin_bw // 2)
-
-            freqs: FrequencySeriesHz = []
-            for s_idx in range(num_segments):
-                start_hz = seg0_start + s_idx * seg_step_hz
-                freqs.extend(int(start_hz + i * bin_bw) for i in range(bins_per_seg))
-            frequencies = freqs
-
-        # --- align lengths (trim to shortest) ---
-        if frequencies and magnitudes and len(frequencies) != len(magnitudes):
-            n = min(len(frequencies), len(magnitudes))
-            frequencies = frequencies[:n]
-            magnitudes  = magnitudes[:n]
-        if not frequencies or not magnitudes:
-            frequencies, magnitudes = [], []
-
         # --- windowed average (same length) ---
         # TODO: Need to clean this up, need to move the DEFAULT to the Model in a better way
         if analysis_parameters:
@@ -1454,22 +1480,25 @@ class Analysis:
             log.warning("Spectrum Analyzer: applying DEFAULT moving average: %s", DEFAULT_POINT_AVG)
             window_points = DEFAULT_POINT_AVG
 
-        try:
-            ma = MovingAverage(max(1, window_points), mode="reflect")
-            smoothed = ma.apply(magnitudes) if magnitudes else []
-        except Exception:
-            smoothed = list(magnitudes)
-
-        if len(smoothed) != len(frequencies):
-            smoothed = smoothed[:len(frequencies)]
+        # --- stitch segments, frequency axis and moving average on arrays ---
+        stitcher = SpectrumSegmentStitcher(
+            first_segment_center_hz = first_seg_cf,
+            last_segment_center_hz  = last_seg_cf,
+            segment_span_hz         = seg_span_hz,
+            bin_bandwidth_hz        = int(measurement.get("bin_frequency_spacing", 0)),
+            bins_per_segment        = bins_per_seg,
+        )
+        spectrum = stitcher.stitch(measurement.get("amplitude_bin_segments_float", []), max(1, window_points))
+        bin_bw, bins_per_seg = spectrum.bin_bandwidth, spectrum.segment_length
 
-        window_avg = WindowAverage(points=max(1, window_points), magnitudes=smoothed)
+        # lists are produced only here, at the API model edge
+        window_avg = WindowAverage(points=max(1, window_points), magnitudes=spectrum.smoothed.tolist())
 
         results = SpecAnaAnalysisResults(
             bin_bandwidth  = bin_bw,
             segment_length = bins_per_seg,
-            frequencies    = frequencies,
-            magnitudes     = magnitudes,
+            frequencies    = spectrum.frequencies.tolist(),
+            magnitudes     = spectrum.magnitudes.tolist(),
             window_average = window_avg,
         )
 
@@ -1609,28 +1638,15 @@ class Analysis:
         if not magnitudes:
             raise ValueError("No RxMER values provided in model.")
 
-        base_freq: FrequencyHz   = FrequencyHz((subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency)
-        freqs: FrequencySeriesHz = [FrequencyHz(base_freq + (i * subcarrier_spacing)) for i in range(len(magnitudes))]
+        mags_arr: NDArrayF64    = np.asarray(magnitudes, dtype=np.float64)
+        freqs_arr: NDArrayI64   = cls._rxmer_frequency_axis(subcarrier_spacing, first_active_subcarrier_index,
+                                                            subcarrier_zero_frequency, mags_arr.size)
+        status_arr: NDArrayI64  = cls._rxmer_carrier_status(mags_arr)
 
-        def classify(v: float) -> int:
-            if v == RXMER_EXCLUSION:
-                return int(RxMerCarrierType.EXCLUSION.value)
-            if v in (RXMER_CLIPPED_LOW, RXMER_CLIPPED_HIGH):
-                return int(RxMerCarrierType.CLIPPED.value)
-            return int(RxMerCarrierType.NORMAL.value)
+        regession_model = cls._rxmer_regression(mags_arr, freqs_arr)
 
-        carrier_status: IntSeries = [classify(v) for v in magnitudes]
-
-        if not (len(freqs) == len(magnitudes) == len(carrier_status)):
-            raise ValueError(
-                f"Length mismatch detected: frequencies({len(freqs)}), "
-                f"magnitudes({len(magnitudes)}), carrier_status({len(carrier_status)})"
-            )
-
-        regession_model = RegressionModel(
-            slope   = cast(FloatSeries, LinearRegression1D(cast(ArrayLike, magnitudes),
-                                                           cast(ArrayLike, freqs)).regression_line())
-        )
+        freqs: FrequencySeriesHz    = freqs_arr.tolist()
+        carrier_status: IntSeries   = status_arr.tolist()
 
         csm: dict[str, Any] = {
             RxMerCarrierType.EXCLUSION.name.lower(): RxMerCarrierType.EXCLUSION.value,
@@ -1659,6 +1675,28 @@ class Analysis:
             modulation_statistics           = model.modulation_statistics,
         )
 
+    @staticmethod
+    def _rxmer_frequency_axis(subcarrier_spacing: int, first_active_subcarrier_index: int,
+                              subcarrier_zero_frequency: int, count: int) -> NDArrayI64:
+        """Build the per-subcarrier frequency axis (Hz) with a single ``np.arange``."""
+        base_freq = (subcarrier_spacing * first_active_subcarrier_index) + subcarrier_zero_frequency
+        return base_freq + np.arange(count, dtype=np.int64) * subcarrier_spacing
+
+    @staticmethod
+    def _rxmer_carrier_status(values: NDArrayF64) -> NDArrayI64:
+        """Classify every RxMER value as EXCLUSION, CLIPPED or NORMAL in one pass."""
+        status: NDArrayI64 = np.full(values.shape, int(RxMerCarrierType.NORMAL.value), dtype=np.int64)
+        status[(values == RXMER_CLIPPED_LOW) | (values == RXMER_CLIPPED_HIGH)] = int(RxMerCarrierType.CLIPPED.value)
+        status[values == RXMER_EXCLUSION] = int(RxMerCarrierType.EXCLUSION.value)
+        return status
+
+    @staticmethod
+    def _rxmer_regression(magnitudes: NDArrayF64, freqs: NDArrayI64) -> RegressionModel:
+        """Fit the RxMER-vs-frequency trend line directly on the ndarrays."""
+        line = cast(NDArrayF64, LinearRegression1D(cast(ArrayLike, magnitudes),
+                                                   cast(ArrayLike, freqs)).regression_line())
+        return RegressionModel(slope=line.tolist())
+
     @classmethod
     def basic_analysis_ds_chan_est_from_model(cls, model: CmDsOfdmChanEstimateCoefModel,
                                               cable_type: CableType = CableType.RG6,) -> DsChannelEstAnalysisModel:
@@ -1960,8 +1998,10 @@ class Analysis:
         amo: int = int(getattr(model, "actual_modulation_order", 0))
         qm: QamModulation = QamModulation.from_DsOfdmModulationType(amo)
 
-        hard: ComplexArray = QamLutManager().get_hard_decisions(qm)
+        lut = QamLutManager()
+        hard: ComplexArray = lut.get_hard_decisions(qm)
         soft: ComplexArray = samples
+        mer_db, evm_percent = cls._constellation_error_stats(lut, qm, soft)
 
         return ConstellationDisplayAnalysisModel(
             device_details      = getattr(model, "device_details", SystemDescriptor.empty().to_dict()),
@@ -1972,6 +2012,8 @@ class Analysis:
             modulation_order    = qm,
             hard                = hard,
             soft                = soft,
+            mer_db              = mer_db,
+            evm_percent         = evm_percent,
         )
 
     @classmethod
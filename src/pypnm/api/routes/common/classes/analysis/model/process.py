@@ -2,7 +2,12 @@
 from __future__ import annotations
 
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
+from pydantic import Field
+
+from pypnm.api.routes.common.classes.common_endpoint_classes.common_req_resp import (
+    DownsampleParameters,
+)
 from pypnm.api.routes.docs.pnm.spectrumAnalyzer.schemas import SpectrumAnalysisExtention
 
 
@@ -14,4 +19,4 @@ class AnalysisProcessParameters(SpectrumAnalysisProcess):
         Extend the differnt types of processing of Analysis
         Use Models that are defined in the FastAPI request/response schemas
     '''
-    pass
+    downsample: DownsampleParameters = Field(default=DownsampleParameters(), description="")
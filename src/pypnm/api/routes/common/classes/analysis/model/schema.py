@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -83,6 +83,8 @@ class ConstellationDisplayAnalysisModel(BaseAnalysisModel):
     complex_unit: Literal["[Real, Imaginary]"]  = Field(default="[Real, Imaginary]", description="Units for the complex pairs (I=Real, Q=Imaginary).")
     soft: ComplexArray                          = Field(default=[(0,0)], description="IQ soft decisions as (real, imag) float pairs.")
     hard: ComplexArray                          = Field(default=[(0,0)], description="IQ hard decisions as (real, imag) float pairs.")
+    mer_db: float | None                        = Field(default=None, description="Capture MER in dB from slicing the soft decisions against the LUT; None if unavailable or error-free.")
+    evm_percent: float | None                   = Field(default=None, description="Capture RMS EVM in percent of the average constellation amplitude; None if unavailable.")
 
 class DsHistogramAnalysisModel(BaseAnalysisModel):
     """Canonical payload for a **Downstream Histogram** measurement in PyPNM.
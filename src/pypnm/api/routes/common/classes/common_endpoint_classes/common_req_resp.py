@@ -20,6 +20,12 @@ from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
 from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.lib.mac_address import MacAddress, MacAddressFormat
 from pypnm.lib.matplot.manager import ThemeType
+from pypnm.lib.signal_processing.downsample import (
+    DEFAULT_DOWNSAMPLE_POINTS,
+    MIN_DOWNSAMPLE_POINTS,
+    DownsampleMethod,
+    SeriesDownsampler,
+)
 from pypnm.lib.types import ChannelId, InetAddressStr, IPv4Str, IPv6Str, MacAddressStr
 
 default_mac: MacAddressStr = SystemConfigSettings.default_mac_address()
@@ -106,10 +112,22 @@ class CommonAnalysisRequest(BaseModel):
     output: CommonOutput             = Field(description="Output type control: JSON or archive")
 
 
+class DownsampleParameters(BaseModel):
+    method: DownsampleMethod = Field(default=DownsampleMethod.NONE, description="Point reduction of per-subcarrier/per-bin series: none | lttb | min_max (spectrum envelope)")
+    points: int              = Field(default=DEFAULT_DOWNSAMPLE_POINTS, ge=MIN_DOWNSAMPLE_POINTS, description="Target points per series, typically the display width in pixels")
+
+    def downsampler(self) -> SeriesDownsampler | None:
+        """Configured downsampler, or None when every point is kept."""
+        if self.method == DownsampleMethod.NONE:
+            return None
+        return SeriesDownsampler(points=self.points, method=self.method)
+
+
 class CommonSingleCaptureAnalysisType(BaseModel):
     type: AnalysisType              = Field(default=AnalysisType.BASIC, description="Analysis type to perform")
     output: CommonOutput            = Field(description="Output format selection for single capture analysis")
     plot: CommonMatPlotConfigRequest = Field(description="Plot configuration for single capture analysis")
+    downsample: DownsampleParameters = Field(default=DownsampleParameters(), description="Optional decimation of per-point series in JSON output")
 
 
 class CommonSingleCaptureAnalysisRequest(BaseModel):
@@ -0,0 +1,292 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import base64
+import functools
+import inspect
+import json
+import logging
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from contextvars import ContextVar
+from typing import Any, ClassVar
+
+import numpy as np
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, Field
+
+from pypnm.lib.types import StringEnum
+
+
+class CompactPrecision(StringEnum):
+    """Floating-point width used when packing real and complex arrays."""
+    F32 = "32"
+    F64 = "64"
+
+
+class CompactEncodingOptions(BaseModel):
+    """Options negotiated from the ``Accept`` header for a compact response."""
+    precision: CompactPrecision = Field(default=CompactPrecision.F32, description="Float width: 32 packs float32/complex64, 64 packs float64/complex128.")
+    min_length: int             = Field(default=16, ge=1, description="Arrays shorter than this many elements stay as plain JSON lists.")
+
+
+class PackedArrayModel(BaseModel):
+    """Wire form of one packed array inside a compact response."""
+    ndarray: bool       = Field(default=True, alias="__ndarray__", description="Marker identifying a packed array object.")
+    dtype: str          = Field(..., description="NumPy dtype string, always little-endian (e.g. '<f4', '<c8', '<i8').")
+    shape: list[int]    = Field(..., description="Array shape in C order.")
+    data: str           = Field(..., description="Base64 of the raw little-endian array bytes.")
+
+
+_compact_options: ContextVar[CompactEncodingOptions | None] = ContextVar("pypnm_compact_options", default=None)
+
+
+class CompactArrayEncoder:
+    """
+    Columnar encoder for large per-subcarrier payloads.
+
+    The response body stays a JSON document, but every numeric list of at least
+    ``min_length`` elements is replaced by a :class:`PackedArrayModel` object
+    holding base64 little-endian bytes plus dtype/shape metadata:
+
+    - lists of numbers (1-D) and lists of equal-length number lists (2-D, e.g.
+      ``ChannelHeatMapModel.values``) pack as ``<f4``/``<f8`` (``<i8`` for integers);
+    - lists of ``(re, im)`` tuples (``ComplexArray``) pack as ``<c8``/``<c16``.
+
+    Clients negotiate the format with ``Accept: application/vnd.pypnm.compact+json``;
+    optional media-type parameters ``precision=32|64`` and ``min_length=<n>`` tune it.
+    """
+    MEDIA_TYPE: ClassVar[str] = "application/vnd.pypnm.compact+json"
+    MARKER: ClassVar[str]     = "__ndarray__"
+
+    @classmethod
+    def negotiate(cls, accept: str | None) -> CompactEncodingOptions | None:
+        """
+        Parse an ``Accept`` header and return compact options when requested.
+
+        Parameters
+        ----------
+        accept : str | None
+            Raw ``Accept`` header value.
+
+        Returns
+        -------
+        CompactEncodingOptions | None
+            Options when the compact media type is listed with a non-zero quality; otherwise None.
+        """
+        if not accept:
+            return None
+
+        for media_range in accept.split(","):
+            media_type, *raw_params = (p.strip() for p in media_range.split(";"))
+            if media_type.lower() != cls.MEDIA_TYPE:
+                continue
+
+            params: dict[str, str] = {}
+            for raw in raw_params:
+                key, _, value = raw.partition("=")
+                params[key.strip().lower()] = value.strip().strip('"')
+
+            try:
+                if float(params.pop("q", "1")) <= 0:
+                    return None
+                return CompactEncodingOptions.model_validate(params)
+            except ValueError:
+                return CompactEncodingOptions()
+
+        return None
+
+    @classmethod
+    def encode(cls, content: BaseModel | Mapping[str, Any] | Sequence[Any],
+               options: CompactEncodingOptions | None = None) -> bytes:
+        """
+        Serialize ``content`` to compact JSON bytes.
+
+        Parameters
+        ----------
+        content : BaseModel | Mapping | Sequence
+            Endpoint result. Pydantic models are dumped in Python mode so complex
+            pairs keep their tuple form and can be told apart from 2-D real data.
+        options : CompactEncodingOptions | None
+            Packing options; defaults to float32 with a 16-element threshold.
+
+        Returns
+        -------
+        bytes
+            UTF-8 JSON document with large numeric arrays packed.
+        """
+        opts = options or CompactEncodingOptions()
+        raw = content.model_dump(by_alias=True) if isinstance(content, BaseModel) else content
+        skeleton = jsonable_encoder(cls._pack(raw, opts))
+        return json.dumps(skeleton, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    @classmethod
+    def decode(cls, body: bytes | str) -> Any:  # noqa: ANN401 - arbitrary JSON document
+        """
+        Inverse of :meth:`encode`: parse JSON and restore packed arrays as ndarrays.
+
+        Parameters
+        ----------
+        body : bytes | str
+            Compact response body.
+
+        Returns
+        -------
+        Any
+            JSON document where every packed array object is an ``np.ndarray``.
+        """
+        return json.loads(body, object_hook=cls._unpack_hook)
+
+    @classmethod
+    def _pack(cls, node: Any, opts: CompactEncodingOptions) -> Any:  # noqa: ANN401 - arbitrary JSON node
+        if isinstance(node, np.ndarray):
+            return cls._pack_array(node, opts)
+
+        if isinstance(node, Mapping):
+            return {k: cls._pack(v, opts) for k, v in node.items()}
+
+        if isinstance(node, (list, tuple)):
+            packed = cls._try_pack_sequence(node, opts)
+            if packed is not None:
+                return packed
+            return [cls._pack(v, opts) for v in node]
+
+        return node
+
+    @classmethod
+    def _try_pack_sequence(cls, seq: list[Any] | tuple[Any, ...], opts: CompactEncodingOptions) -> dict[str, Any] | list[Any] | None:
+        if not seq:
+            return None
+
+        head = seq[0]
+        is_complex_pairs = isinstance(head, tuple) and len(head) == 2
+        is_rows = isinstance(head, list)
+        if not (cls._is_number(head) or is_complex_pairs or is_rows):
+            return None
+        if not is_rows and len(seq) < opts.min_length:
+            return None
+
+        try:
+            arr = np.asarray(seq)
+        except ValueError:
+            return None
+
+        if arr.dtype.kind not in "iuf" or arr.ndim > 2 or arr.size < opts.min_length:
+            return None
+
+        if is_complex_pairs and arr.ndim == 2 and arr.shape[1] == 2:
+            arr = arr[:, 0] + 1j * arr[:, 1]
+
+        return cls._pack_array(arr, opts)
+
+    @classmethod
+    def _pack_array(cls, arr: np.ndarray, opts: CompactEncodingOptions) -> dict[str, Any] | list[Any]:
+        wide = opts.precision == CompactPrecision.F64
+        match arr.dtype.kind:
+            case "c":
+                out = arr.astype("<c16" if wide else "<c8", copy=False)
+            case "f":
+                out = arr.astype("<f8" if wide else "<f4", copy=False)
+            case "i" | "u":
+                out = arr.astype("<i8", copy=False)
+            case _:
+                return jsonable_encoder(arr.tolist())
+
+        return PackedArrayModel(
+            dtype=out.dtype.str,
+            shape=list(out.shape),
+            data=base64.b64encode(np.ascontiguousarray(out).tobytes()).decode("ascii"),
+        ).model_dump(by_alias=True)
+
+    @classmethod
+    def _unpack_hook(cls, obj: dict[str, Any]) -> Any:  # noqa: ANN401 - arbitrary JSON node
+        if obj.get(cls.MARKER) is not True:
+            return obj
+        flat = np.frombuffer(base64.b64decode(obj["data"]), dtype=np.dtype(obj["dtype"]))
+        return flat.reshape(obj["shape"])
+
+    @staticmethod
+    def _is_number(value: object) -> bool:
+        return isinstance(value, (int, float, np.number)) and not isinstance(value, bool)
+
+
+class CompactArrayResponse(Response):
+    """Starlette response carrying a compact-encoded body."""
+    media_type = CompactArrayEncoder.MEDIA_TYPE
+
+    def __init__(self, content: BaseModel | Mapping[str, Any] | Sequence[Any],
+                 options: CompactEncodingOptions | None = None, status_code: int = 200) -> None:
+        super().__init__(content=CompactArrayEncoder.encode(content, options),
+                         status_code=status_code, headers={"Vary": "Accept"})
+
+
+class CompactArrayRoute(APIRoute):
+    """
+    ``APIRoute`` that honours ``Accept: application/vnd.pypnm.compact+json``.
+
+    Routers opt in with ``APIRouter(..., route_class=CompactArrayRoute)``. When the
+    compact media type is negotiated, model/dict results of the endpoint are returned
+    as :class:`CompactArrayResponse`; ``Response`` results (archives, files) and
+    requests without the media type are left untouched.
+    """
+
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any) -> None:  # noqa: ANN401 - APIRoute passthrough
+        super().__init__(path, self._wrap_endpoint(endpoint), **kwargs)
+
+    def get_route_handler(self) -> Callable[[Request], Awaitable[Response]]:
+        handler = super().get_route_handler()
+
+        async def compact_route_handler(request: Request) -> Response:
+            token = _compact_options.set(CompactArrayEncoder.negotiate(request.headers.get("accept")))
+            try:
+                return await handler(request)
+            finally:
+                _compact_options.reset(token)
+
+        return compact_route_handler
+
+    @staticmethod
+    def _wrap_endpoint(endpoint: Callable[..., Any]) -> Callable[..., Any]:
+        logger = logging.getLogger("CompactArrayRoute")
+
+        def to_compact(result: Any) -> Any:  # noqa: ANN401 - endpoint result passthrough
+            options = _compact_options.get()
+            if options is None or isinstance(result, Response):
+                return result
+            if isinstance(result, (BaseModel, Mapping, list)):
+                return CompactArrayResponse(result, options)
+            logger.debug("Compact encoding skipped for result type %s", type(result).__name__)
+            return result
+
+        wrapped: Callable[..., Any]
+        if inspect.iscoroutinefunction(endpoint):
+            @functools.wraps(endpoint)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401 - endpoint passthrough
+                return to_compact(await endpoint(*args, **kwargs))
+            wrapped = async_endpoint
+        else:
+            @functools.wraps(endpoint)
+            def sync_endpoint(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401 - endpoint passthrough
+                return to_compact(endpoint(*args, **kwargs))
+            wrapped = sync_endpoint
+
+        # FastAPI resolves string annotations against ``call.__globals__``, which would be
+        # this module for the wrapper; hand it the endpoint's signature already evaluated.
+        try:
+            wrapped.__signature__ = inspect.signature(endpoint, eval_str=True)  # type: ignore[attr-defined]
+        except (NameError, TypeError):
+            logger.debug("Unable to pre-evaluate annotations for %s", getattr(endpoint, "__name__", endpoint))
+        return wrapped
+
+
+__all__ = [
+    "CompactArrayEncoder",
+    "CompactArrayResponse",
+    "CompactArrayRoute",
+    "CompactEncodingOptions",
+    "CompactPrecision",
+    "PackedArrayModel",
+]
@@ -12,7 +12,7 @@ from pathlib import Path
 from typing import Any
 
 from pypnm.config.system_config_settings import SystemConfigSettings
-from pypnm.lib.db.json_file_lock import JsonFileLock
+from pypnm.lib.db.json_file_lock import JSON_DB_WRITE_SECONDS, JsonFileLock
 from pypnm.lib.types import GroupId, TransactionId
 
 
@@ -96,9 +96,10 @@ class CaptureGroup:
         Atomically write the given data dict to the JSON DB file.
         """
         temp_path = self.db_path.with_suffix('.tmp')
-        with temp_path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-        temp_path.replace(self.db_path)
+        with JSON_DB_WRITE_SECONDS.time(db=self.db_path.name):
+            with temp_path.open('w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+            temp_path.replace(self.db_path)
 
     def _save_db(self) -> None:
         """
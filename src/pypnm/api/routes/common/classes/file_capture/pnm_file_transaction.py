@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -16,6 +16,7 @@ from pypnm.api.routes.common.classes.file_capture.types import TransactionRecord
 from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.docsis.data_type.sysDescr import SystemDescriptor
+from pypnm.lib.db.json_file_lock import JSON_DB_WRITE_SECONDS
 from pypnm.lib.mac_address import MacAddress
 from pypnm.lib.types import FileName, TransactionId, TransactionRecord
 from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
@@ -390,5 +391,6 @@ class PnmFileTransaction:
             Fully realized transaction database dictionary to be serialized and
             written to the configured JSON file.
         """
-        with self.transaction_db_path.open("w") as f:
+        with JSON_DB_WRITE_SECONDS.time(db=self.transaction_db_path.name), \
+                self.transaction_db_path.open("w") as f:
             json.dump(db, f, indent=4)
@@ -235,17 +235,17 @@ class CableModemServicePreCheck:
             self.logger.debug("Skipping ping check for agent transport (will check SNMP instead)")
             status = ServiceStatusCode.SUCCESS
         else:
-            status = self._ping_local()
+            status = await self._ping_local()
         
         # Update cache
         snmp_status = cache_entry[2] if cache_entry else None
         _REACHABILITY_CACHE[self._ip_address] = (time.time(), status, snmp_status)
         return status
 
-    def _ping_local(self) -> ServiceStatusCode:
-        """Local ping (direct network access)."""
+    async def _ping_local(self) -> ServiceStatusCode:
+        """Local ping (direct network access), probed without blocking the event loop."""
         try:
-            if self.cm.is_ping_reachable():
+            if (await self.cm.ping_probe()).reachable:
                 self.logger.debug("Ping check passed (local)")
                 return ServiceStatusCode.SUCCESS
             self.logger.debug("Ping check failed (local)")
@@ -260,7 +260,7 @@ class CableModemServicePreCheck:
             mgr, agent = self._get_snmp_agent()
             if not mgr or not agent:
                 self.logger.warning("No agent available for ping – falling back to local")
-                return self._ping_local()
+                return await self._ping_local()
 
             task_id = await mgr.send_task(
                 agent.agent_id,
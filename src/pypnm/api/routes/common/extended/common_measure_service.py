@@ -4,11 +4,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import math
 import os
 import shutil
 import time
+from collections.abc import Awaitable, Callable
 from enum import Enum, auto
 from pathlib import Path
 from typing import TypeAlias, cast
@@ -61,9 +63,15 @@ from pypnm.lib.host_endpoint import HostEndpoint
 from pypnm.lib.inet import Inet
 from pypnm.lib.ping import Ping
 from pypnm.lib.ssh.ssh_connector import SSHConnector
+from pypnm.lib.telemetry.tracing import trace_span
 from pypnm.lib.tftp.tftp_connector import TFTPConnector
 from pypnm.lib.types import ChannelId, FileNameStr, InterfaceIndex, TransactionId, HostNameStr
 from pypnm.lib.utils import Generate
+from pypnm.lib.vendor_capabilities import (
+    _VENDOR_CAPABILITIES,
+    VendorCapabilities,
+    get_vendor_from_sysdescr,
+)
 from pypnm.pnm.data_type.DocsIf3CmSpectrumAnalysisCtrlCmd import (
     DocsIf3CmSpectrumAnalysisCtrlCmd,
     SpectrumRetrievalType,
@@ -98,6 +106,9 @@ class CommonMeasureService(CommonMessagingService):
         tftp_servers (Inet,Inet): (IPv4,IPv6)
         tftp_path (str, optional): The path on the TFTP server where test result files are stored. Default is an empty string.
         snmp_write_community (str, optional): The SNMP community string for write access. Default is "private".
+        capture_gate (asyncio.Lock, optional): Lock shared by services that drive the same modem. It is held from
+            the test trigger until SAMPLE_READY (or for the whole SNMP amplitude-data read), so the next capture
+            can be configured while this one's file upload and fetch are still running. Default is None.
         **extra_options (dict, optional): Additional keyword arguments specific to the test type, such as:
             - fec_summary_type (FecSummaryType): Required for tests involving FEC summary metrics.
             - Other parameters based on the test type.
@@ -117,6 +128,7 @@ class CommonMeasureService(CommonMessagingService):
                  tftp_servers: tuple[Inet,Inet],
                  tftp_path: str = "",
                  snmp_write_community: str = "private",
+                 capture_gate: asyncio.Lock | None = None,
                  **extra_options) -> None:
         super().__init__()
         self.logger = logging.getLogger(self.__class__.__name__)
@@ -130,6 +142,9 @@ class CommonMeasureService(CommonMessagingService):
         self.tftp_servers:tuple[Inet,Inet]          = tftp_servers
         self.tftp_path:str                          = tftp_path
         self.snmp_write_community:str               = snmp_write_community
+        self.capture_gate:asyncio.Lock | None       = capture_gate
+        self._sample_ready_hook:Callable[[], Awaitable[object]] | None = None
+        self._vendor_capabilities:VendorCapabilities | None = None
         self.extra_options                          = extra_options
         self.config_mgr:ConfigManager               = ConfigManager()
         self.log_prefix:str                         = f"MAC: {self.cm.get_mac_address} - INET: {self.cm.get_inet_address}"
@@ -181,6 +196,49 @@ class CommonMeasureService(CommonMessagingService):
         """
         return self._capture_parameter
 
+    def setSampleReadyHook(self, hook: Callable[[], Awaitable[object]] | None) -> None:
+        """
+        Set a coroutine to await once each capture is ready, while the capture gate is still held.
+
+        Args:
+            hook (Callable[[], Awaitable[object]] | None): Reads state of the capture that the next
+                trigger would overwrite, such as the analyzer control row. None removes the hook.
+        """
+        self._sample_ready_hook = hook
+
+    def setVendorCapabilities(self, capabilities: VendorCapabilities | None) -> None:
+        """
+        Set the vendor capabilities already resolved for this cable modem.
+
+        Args:
+            capabilities (VendorCapabilities | None): Capabilities used to adjust the spectrum
+                segment span. None makes the service look them up from sysDescr on its own.
+        """
+        self._vendor_capabilities = capabilities
+
+    async def _get_vendor_capabilities(self) -> VendorCapabilities:
+        """
+        Return the capabilities set by :meth:`setVendorCapabilities`, or look them up from sysDescr.
+        """
+        if self._vendor_capabilities is None:
+            sys_descr = await self.cm.getSysDescr()
+            vendor = get_vendor_from_sysdescr(str(sys_descr))
+            self._vendor_capabilities = _VENDOR_CAPABILITIES.get(vendor, _VENDOR_CAPABILITIES['Unknown'])
+        return self._vendor_capabilities
+
+    async def _run_sample_ready_hook(self) -> None:
+        """
+        Await the hook set by :meth:`setSampleReadyHook`, if any.
+        """
+        if self._sample_ready_hook is not None:
+            await self._sample_ready_hook()
+
+    def _hold_capture_gate(self) -> contextlib.AbstractAsyncContextManager[object]:
+        """
+        Return :attr:`capture_gate` when one was given, otherwise a no-op async context.
+        """
+        return self.capture_gate if self.capture_gate is not None else contextlib.nullcontext()
+
     async def set_and_go(self, interface_parameters: DownstreamOfdmParameters | UpstreamOfdmaParameters | None = None ,
                          max_wait_count: int = 5,) -> MessageResponse:
         """
@@ -199,12 +257,20 @@ class CommonMeasureService(CommonMessagingService):
         Returns:
             MessageResponse: Result indicating success or failure of the operation.
         """
+        with trace_span("measure.set_and_go",
+                        test=self.pnm_test_type.name,
+                        mac=str(self.cm.get_mac_address)):
+            return await self._set_and_go(interface_parameters, max_wait_count)
+
+    async def _set_and_go(self, interface_parameters: DownstreamOfdmParameters | UpstreamOfdmaParameters | None,
+                          max_wait_count: int) -> MessageResponse:
+        """Body of :meth:`set_and_go`, run inside its trace span."""
 
         ##########################################################
         # Verify that we can connect to the CM via Ping and SNMP
         ##########################################################
 
-        if not self.is_ping_reachable():
+        if not await self.is_ping_reachable():
             self.logger.error(f"{self.log_prefix} - Unreachable via PING")
             return self.build_send_msg(ServiceStatusCode.UNREACHABLE_PING)
 
@@ -218,43 +284,44 @@ class CommonMeasureService(CommonMessagingService):
 
         if self.getSpectrumCaptureParameters().spectrum_retrieval_type == SpectrumRetrievalType.SNMP:
             self.logger.debug(f"{self.log_prefix} - Performing Spectrum Analysis SNMP Amplitude Data")
-
-            #Set Spectrum Analyzer
-            __status = await self._generic_spectrum_analyzer_operation()
-
-            if __status[0] != ServiceStatusCode.SUCCESS:
-               self.logger.error(f"{self.log_prefix} - Unable to set Spectrum Analyzer Settings")
-               return self.build_send_msg(ServiceStatusCode.SPEC_ANALYZER_SET_CONFIG_ERROR)
-
-            # This is a blocking method, it will return SUCCESS or wait till timeout to return an ERROR
-            status = await self._check_spectrum_amplitude_data_status()
-
-            if status == ServiceStatusCode.SUCCESS:
-                self.logger.info(f"{self.log_prefix} - Spectrum Amplitude Data is READY, collecting amplitude data, may take a while...")
-                amp_data: bytes = await self.cm.getSpectrumAmplitudeData()
-                self.logger.info(f"{self.log_prefix} - Spectrum Amplitude Data collection COMPLETE, total bytes: {len(amp_data)}.")
-                #################################################################################################
-                # Build binary filename and save file - START
-                #################################################################################################
-                filename = await self._pnm_file_generator(DocsPnmCmCtlTest.SPECTRUM_ANALYZER_SNMP_AMP_DATA)
-                tx_id = self._get_transaction_id_by_filename(filename)
-                if not tx_id:
-                    self.logger.error(f"{self.log_prefix} - Unable to find Transaction ID for PNM filename: {filename}")
-                    return self.build_send_msg(ServiceStatusCode.PNM_FILE_TRANSACTION_ID_NOT_FOUND)
-
-                pnm_dir = SystemConfigSettings.pnm_dir()
-                fpath = f"{pnm_dir}/{filename}"
-                self.logger.debug(f'SpectrumAmplitudeData: - FNAME: {filename} - Length:{len(amp_data)} - TransactionID: {tx_id}')
-
-                FileProcessor(fpath).write_file(amp_data)
+            async with self._hold_capture_gate():
+                #Set Spectrum Analyzer
+                __status = await self._generic_spectrum_analyzer_operation()
+
+                if __status[0] != ServiceStatusCode.SUCCESS:
+                   self.logger.error(f"{self.log_prefix} - Unable to set Spectrum Analyzer Settings")
+                   return self.build_send_msg(ServiceStatusCode.SPEC_ANALYZER_SET_CONFIG_ERROR)
+
+                # This is a blocking method, it will return SUCCESS or wait till timeout to return an ERROR
+                status = await self._check_spectrum_amplitude_data_status()
+
+                if status == ServiceStatusCode.SUCCESS:
+                    self.logger.info(f"{self.log_prefix} - Spectrum Amplitude Data is READY, collecting amplitude data, may take a while...")
+                    amp_data: bytes = await self.cm.getSpectrumAmplitudeData()
+                    await self._run_sample_ready_hook()
+                    self.logger.info(f"{self.log_prefix} - Spectrum Amplitude Data collection COMPLETE, total bytes: {len(amp_data)}.")
+                    #################################################################################################
+                    # Build binary filename and save file - START
+                    #################################################################################################
+                    filename = await self._pnm_file_generator(DocsPnmCmCtlTest.SPECTRUM_ANALYZER_SNMP_AMP_DATA)
+                    tx_id = self._get_transaction_id_by_filename(filename)
+                    if not tx_id:
+                        self.logger.error(f"{self.log_prefix} - Unable to find Transaction ID for PNM filename: {filename}")
+                        return self.build_send_msg(ServiceStatusCode.PNM_FILE_TRANSACTION_ID_NOT_FOUND)
+
+                    pnm_dir = SystemConfigSettings.pnm_dir()
+                    fpath = f"{pnm_dir}/{filename}"
+                    self.logger.debug(f'SpectrumAmplitudeData: - FNAME: {filename} - Length:{len(amp_data)} - TransactionID: {tx_id}')
+
+                    FileProcessor(fpath).write_file(amp_data)
                 
-                #################################################################################################
-                # Build binary filename and save file - END
-                #################################################################################################
-                capture_para:SpecAnCapturePara = self.getSpectrumCaptureParameters()
-                self.build_transaction_msg_extension(tx_id, 
-                                                     filename, 
-                                                     extension={f'{CMSE.SPECTRUM_ANALYSIS_SNMP_CAPTURE_PARAMETER}': capture_para.model_dump()})
+                    #################################################################################################
+                    # Build binary filename and save file - END
+                    #################################################################################################
+                    capture_para:SpecAnCapturePara = self.getSpectrumCaptureParameters()
+                    self.build_transaction_msg_extension(tx_id, 
+                                                         filename, 
+                                                         extension={f'{CMSE.SPECTRUM_ANALYSIS_SNMP_CAPTURE_PARAMETER}': capture_para.model_dump()})
 
             return self.build_send_msg(status)
 
@@ -292,10 +359,8 @@ class CommonMeasureService(CommonMessagingService):
         ##############################################################################################
 
         status_index_channelId = await self._get_indexes_via_pnm_test_type(interface_parameters)
-        print(f'=== Index/ChannelID List: {status_index_channelId[1]} ===', flush=True)
         self.logger.info(f'{self.log_prefix} - Index/ChannelID List: {status_index_channelId[1]}')
         if status_index_channelId[0] != ServiceStatusCode.SUCCESS or status_index_channelId[1] is None:
-            print(f'=== ERROR: Unable to acquire index from ChannelID, reason: {status_index_channelId[0]} ===', flush=True)
             self.logger.error(f'{self.log_prefix} - Unable to aquire index from ChannelID, reason: {status_index_channelId[0]}')
             return self.build_send_msg(status_index_channelId[0])
 
@@ -303,9 +368,9 @@ class CommonMeasureService(CommonMessagingService):
         # This section runs through all the indexes, build PNM file, run measurement and check status
         ##############################################################################################
         index_channelId: list[tuple[InterfaceIndex, ChannelId]] = status_index_channelId[1]
-        print(f'=== Calling _pnm_measure_status_and_pnm_file_transfer with {len(index_channelId)} indexes ===', flush=True)
+        self.logger.debug(f'{self.log_prefix} - Measuring {len(index_channelId)} index(es)')
         result = await self._pnm_measure_status_and_pnm_file_transfer(index_channelId, max_wait_count)
-        print(f'=== _pnm_measure_status_and_pnm_file_transfer result: {result} ===', flush=True)
+        self.logger.debug(f'{self.log_prefix} - Measurement and file transfer result: {result}')
         return self.build_send_msg(result)
 
     def getInterfaceParameters(self,
@@ -336,9 +401,9 @@ class CommonMeasureService(CommonMessagingService):
             "Expected docsOfdmDownstream or docsOfdmaUpstream."
         )
 
-    def is_ping_reachable(self) -> bool:
+    async def is_ping_reachable(self) -> bool:
         """
-        Check if the cable modem is reachable via ICMP ping.
+        Check if the cable modem is reachable via ICMP ping, without blocking the event loop.
         When agent SNMP transport is active, skip the ping check since
         the Docker container lacks L3 access to the modem network.
         SNMP reachability (checked next) is a more reliable indicator.
@@ -350,7 +415,7 @@ class CommonMeasureService(CommonMessagingService):
         if os.environ.get('PYPNM_USE_AGENT_SNMP', '').lower() == 'true':
             self.logger.debug(f"{self.log_prefix} - Skipping ping check (agent transport)")
             return True
-        return self.cm.is_ping_reachable()
+        return (await self.cm.ping_probe()).reachable
 
     async def is_snmp_ready(self) -> bool:
         """
@@ -525,8 +590,6 @@ class CommonMeasureService(CommonMessagingService):
             bool: True if the file was successfully retrieved and moved; False otherwise.
         """
         method = SystemConfigSettings.retrieval_method()
-        print(f"=== Retrieval method: {method} ===", flush=True)
-        print(f"=== Config path: {SystemConfigSettings._cfg.get_config_path()} ===", flush=True)
         self.logger.info(f"{self.log_prefix} - Retrieval method: {method}")
 
         try:
@@ -656,71 +719,77 @@ class CommonMeasureService(CommonMessagingService):
                 or the measurement status did not become SAMPLE_READY).
         """
         for interface_index, channel_id in idx_channelId:
-            print(f'=== Processing interface_index={interface_index}, channel_id={channel_id} ===', flush=True)
-
-            #######################################################################
-            # This sets the Measurement Table/Row for the specific PNM Measurement
-            #######################################################################
-            ctl_measure_status:tuple[ServiceStatusCode, list[FileNameStr]] = \
-                await self._setDocsPnmCmMeasureTest(self.pnm_test_type, interface_index, channel_id)
-            
-            print(f'=== _setDocsPnmCmMeasureTest result: status={ctl_measure_status[0]}, files={ctl_measure_status[1]} ===', flush=True)
-            if ctl_measure_status[0] != ServiceStatusCode.SUCCESS:
-                print(f'=== ERROR: _setDocsPnmCmMeasureTest failed: {ctl_measure_status[0]} ===', flush=True)
-                return ctl_measure_status[0]
-
-            pnm_filenames = ctl_measure_status[1]
-            self.logger.info(f'{self.log_prefix} - PNM File(s) -> {pnm_filenames}')
-
-            count=1
-            while True:
-                cm_ctl_status:DocsPnmCmCtlStatus = await self.cm.getDocsPnmCmCtlStatus()
-                print(f"=== PNM status: {str(cm_ctl_status).upper()} - count: {count} ===", flush=True)
-                self.logger.info(f"{self.log_prefix} - PNM status: {str(cm_ctl_status).upper()} - count: {count}")
-                if cm_ctl_status == DocsPnmCmCtlStatus.TEST_IN_PROGRESS:
-                    count += 1
-                    await asyncio.sleep(1)
-                    continue
-
-                if cm_ctl_status == DocsPnmCmCtlStatus.READY:
-                    break
-
-                if cm_ctl_status == DocsPnmCmCtlStatus.TEMP_REJECT:
-                    break
-
-                if cm_ctl_status == DocsPnmCmCtlStatus.SNMP_ERROR:
-                    break
-
-            self.logger.debug(f"{self.log_prefix} - Checking Measurement Status for {self.pnm_test_type} @ IDX: {interface_index}")
-
-            wait_count = 0
-            def extract_idx(idx):
-                return idx[0] if isinstance(idx, list) and idx else idx
-
-            while wait_count < max_wait_count:
-                meas_status = await self.cm.getPnmMeasurementStatus(self.pnm_test_type, extract_idx(interface_index))
-                print(f"=== MeasureStatus: {meas_status.name} (wait_count={wait_count}) ===", flush=True)
-                self.logger.info(f"{self.log_prefix} - MeasureStatus: {meas_status.name}")
-                if meas_status == MeasStatusType.SAMPLE_READY:
-                    break
-                await asyncio.sleep(1)
-                wait_count += 1
-
-            else:
-                self.logger.error(f"{self.log_prefix} - SAMPLE_READY not reached for ChannelID {channel_id}")
-                return ServiceStatusCode.NOT_READY_AFTER_FILE_CAPTURE
+            self.logger.debug(f'{self.log_prefix} - Processing interface_index={interface_index}, channel_id={channel_id}')
+
+            # The modem runs one test at a time: hold the gate until the sample is ready,
+            # so the upload and fetch below can overlap the next capture.
+            async with self._hold_capture_gate():
+                #######################################################################
+                # This sets the Measurement Table/Row for the specific PNM Measurement
+                #######################################################################
+                with trace_span("measure.set_test", channel_id=channel_id):
+                    ctl_measure_status:tuple[ServiceStatusCode, list[FileNameStr]] = \
+                        await self._setDocsPnmCmMeasureTest(self.pnm_test_type, interface_index, channel_id)
+
+                if ctl_measure_status[0] != ServiceStatusCode.SUCCESS:
+                    self.logger.error(f'{self.log_prefix} - Unable to set PNM measure test: {ctl_measure_status[0]}')
+                    return ctl_measure_status[0]
+
+                pnm_filenames = ctl_measure_status[1]
+                self.logger.info(f'{self.log_prefix} - PNM File(s) -> {pnm_filenames}')
+
+                with trace_span("measure.wait_ready", channel_id=channel_id):
+                    count=1
+                    while True:
+                        cm_ctl_status:DocsPnmCmCtlStatus = await self.cm.getDocsPnmCmCtlStatus()
+                        self.logger.info(f"{self.log_prefix} - PNM status: {str(cm_ctl_status).upper()} - count: {count}")
+                        if cm_ctl_status == DocsPnmCmCtlStatus.TEST_IN_PROGRESS:
+                            count += 1
+                            await asyncio.sleep(1)
+                            continue
+
+                        if cm_ctl_status == DocsPnmCmCtlStatus.READY:
+                            break
+
+                        if cm_ctl_status == DocsPnmCmCtlStatus.TEMP_REJECT:
+                            break
+
+                        if cm_ctl_status == DocsPnmCmCtlStatus.SNMP_ERROR:
+                            break
+
+                    self.logger.debug(f"{self.log_prefix} - Checking Measurement Status for {self.pnm_test_type} @ IDX: {interface_index}")
+
+                    wait_count = 0
+                    def extract_idx(idx):
+                        return idx[0] if isinstance(idx, list) and idx else idx
+
+                    while wait_count < max_wait_count:
+                        meas_status = await self.cm.getPnmMeasurementStatus(self.pnm_test_type, extract_idx(interface_index))
+                        self.logger.info(f"{self.log_prefix} - MeasureStatus: {meas_status.name}")
+                        if meas_status == MeasStatusType.SAMPLE_READY:
+                            break
+                        await asyncio.sleep(1)
+                        wait_count += 1
+
+                    else:
+                        self.logger.error(f"{self.log_prefix} - SAMPLE_READY not reached for ChannelID {channel_id}")
+                        return ServiceStatusCode.NOT_READY_AFTER_FILE_CAPTURE
+
+                await self._run_sample_ready_hook()
 
             #Multiple PNM files for special cases
             for pnm_fname in pnm_filenames:
 
-                status:ServiceStatusCode = await self._check_and_wait_for_tftp_upload(FileNameStr(pnm_fname))
+                with trace_span("measure.wait_upload", filename=pnm_fname):
+                    status:ServiceStatusCode = await self._check_and_wait_for_tftp_upload(FileNameStr(pnm_fname))
 
                 if status != ServiceStatusCode.SUCCESS:
                     self.logger.error(f"{self.log_prefix} - Unable to Upload PNM File to TFTP({status})")
                     return status
 
                 # Get and copy PNM file to local data directory
-                retrieval_status = await self._get_and_move_pnm_file(FileNameStr(pnm_fname))
+                with trace_span("measure.fetch_file", filename=pnm_fname):
+                    retrieval_status = await self._get_and_move_pnm_file(FileNameStr(pnm_fname))
                 if retrieval_status != ServiceStatusCode.SUCCESS:
                     self.logger.error(
                         f"{self.log_prefix} - Unable to copy PNM file to local {self.pnm_dir} dir "
@@ -1262,17 +1331,10 @@ class CommonMeasureService(CommonMessagingService):
 
         # Vendor-aware span adjustment: Some modems (e.g., Ubee) fail with 1 MHz span
         # (919 segments) but work with 2 MHz span (460 segments).
-        # Use sysDescr SNMP call for reliable vendor detection.
+        # Use sysDescr SNMP call for reliable vendor detection, unless the caller already resolved it.
         try:
-            from pypnm.lib.vendor_capabilities import (
-                get_vendor_from_sysdescr,
-                _VENDOR_CAPABILITIES,
-            )
-            
-            sys_descr = await self.cm.getSysDescr()
-            vendor = get_vendor_from_sysdescr(str(sys_descr))
-            caps = _VENDOR_CAPABILITIES.get(vendor, _VENDOR_CAPABILITIES['Unknown'])
-            
+            caps = await self._get_vendor_capabilities()
+
             # Calculate recommended span based on vendor capabilities
             total_span = capture_parameter.last_segment_center_freq - capture_parameter.first_segment_center_freq
             recommended_span = caps.min_spectrum_span_hz
@@ -1286,7 +1348,7 @@ class CommonMeasureService(CommonMessagingService):
             
             if recommended_span > capture_parameter.segment_freq_span:
                 self.logger.info(
-                    f"{self.log_prefix} - {vendor} modem detected (sysDescr), adjusting span from "
+                    f"{self.log_prefix} - {caps.vendor} modem detected (sysDescr), adjusting span from "
                     f"{capture_parameter.segment_freq_span / 1_000_000:.1f} MHz to {recommended_span / 1_000_000:.1f} MHz"
                 )
                 capture_parameter = capture_parameter.model_copy(
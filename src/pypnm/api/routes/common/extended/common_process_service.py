@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Any
 
 from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
     PnmFileTransaction,
@@ -13,6 +14,9 @@ from pypnm.api.routes.common.extended.common_messaging_service import (
     MessageResponse,
     MessageResponseType,
 )
+from pypnm.api.routes.common.extended.types import (
+    CommonMessagingServiceExtension as CMSE,
+)
 from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
 from pypnm.config.system_config_settings import SystemConfigSettings
 from pypnm.lib.file_processor import FileProcessor
@@ -155,6 +159,11 @@ class CommonProcessService(CommonMessagingService):
         elif pnm_test_type == DocsPnmCmCtlTest.SPECTRUM_ANALYZER.name:
             self.logger.debug("Processing DS_SPECTRUM_ANALYZER PNM data")
             pnm_dict = self._add_device_details(CmSpectrumAnalysis(pnm_data).to_dict(), device_details)
+            window = self._get_message_response_extension(transaction_record).get(CMSE.SPECTRUM_ANALYSIS_CHANNEL_WINDOW.value)
+            if isinstance(window, dict):
+                # Merged multi-channel capture: keep only this channel's segments
+                self.logger.debug(f"Slicing spectrum capture to channel window: {window}")
+                pnm_dict = CmSpectrumAnalysis.slice_measurement(pnm_dict, int(window["start_hz"]), int(window["end_hz"]))
             self.build_msg(ServiceStatusCode.SUCCESS, pnm_dict)
 
         elif pnm_test_type == DocsPnmCmCtlTest.US_PRE_EQUALIZER_COEF.name:
@@ -215,22 +224,29 @@ class CommonProcessService(CommonMessagingService):
             self.logger.warning("Message response payload is empty.")
             return pnm_data
 
-        for payload in self._msg_rsp.payload:
-            _status, _message_type, message = MessageResponse.get_payload_msg(payload)
-            if not isinstance(message, dict):
-                continue
+        extension_data = self._get_message_response_extension(transaction_record)
+        if not extension_data:
+            self.logger.warning("No extension data found in message response for transaction record.")
+            return pnm_data
 
-            if message.get("transaction_id") != transaction_id:
-                continue
+        self.logger.debug(f"Extension-Data: {extension_data}")
+        pnm_data.update(extension_data)
+        return pnm_data
 
-            extension_data = message.get(PnmFileTransaction.EXTENSION)
-            if not isinstance(extension_data, dict):
-                self.logger.warning("No extension data found in message response.")
-                return pnm_data
+    def _get_message_response_extension(self, transaction_record: TransactionRecord) -> dict[str, Any]:
+        """
+        Return the extension data attached to the transaction's message, or an empty dict.
 
-            self.logger.debug(f"Extension-Data: {extension_data}")
-            pnm_data.update(extension_data)
-            return pnm_data
+        Args:
+            transaction_record (TransactionRecord): The transaction record containing the transaction ID.
 
-        self.logger.warning("No message found for transaction record.")
-        return pnm_data
+        Returns:
+            dict: Extension data of the matching PNM file transaction message.
+        """
+        transaction_id = transaction_record.get("transaction_id")
+        for payload in self._msg_rsp.payload or []:
+            _status, _message_type, message = MessageResponse.get_payload_msg(payload)
+            if isinstance(message, dict) and transaction_id and message.get("transaction_id") == transaction_id:
+                extension_data = message.get(PnmFileTransaction.EXTENSION)
+                return extension_data if isinstance(extension_data, dict) else {}
+        return {}
@@ -11,6 +11,7 @@ from pypnm.lib.types import StringEnum
 
 class CommonMessagingServiceExtension(StringEnum):
     SPECTRUM_ANALYSIS_SNMP_CAPTURE_PARAMETER = "spectrum_analysis_snmp_capture_parameters"
+    SPECTRUM_ANALYSIS_CHANNEL_WINDOW = "spectrum_analysis_channel_window"
 
 class CommonMsgServiceExtParams(BaseModel):
     spectrum_analysis_snmp_capture_parameters: SpecAnCapturePara
@@ -89,7 +89,7 @@ class CmDocsDevService:
 
     async def ping_cable_modem(self) -> PnmResponse:
         try:
-            if not self._cm.is_ping_reachable():
+            if not (await self._cm.ping_probe()).reachable:
                 return PnmResponse(
                     mac_address =   self._mac.mac_address,
                     status      =   ServiceStatusCode.PING_FAILED,
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.abstract.analysis_report import AnalysisRptMatplotConfig
 from pypnm.api.routes.basic.histrogram_analysis_rpt import DsHistrogramReport
@@ -16,6 +16,9 @@ from pypnm.api.routes.common.classes.analysis.analysis import Analysis, Analysis
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -35,7 +38,7 @@ from pypnm.api.routes.docs.pnm.ds.histogram.schemas import (
     PnmHistogramSingleCaptureRequest,
 )
 from pypnm.api.routes.docs.pnm.ds.histogram.service import CmDsHistogramService
-from pypnm.api.routes.docs.pnm.files.service import FileType, PnmFileService
+from pypnm.api.routes.docs.pnm.files.service import PnmFileService
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.docsis.data_type.pnm.DocsPnmCmDsHistEntry import DocsPnmCmDsHistEntry
 from pypnm.lib.dict_utils import DictGenerate
@@ -56,7 +59,7 @@ class DsHistogramRouter:
     def __init__(self) -> None:
         prefix = "/docs/pnm/ds"
         self.base_endpoint = "/histogram"
-        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream Histogram"])
+        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream Histogram"], route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f'DsHistogramRouter.{self.base_endpoint.strip("/")}')
         self.__routes()
 
@@ -67,7 +70,7 @@ class DsHistogramRouter:
             response_model=None,
             responses=FAST_API_RESPONSE,)
 
-        async def get_capture(request: PnmHistogramSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmHistogramSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture DOCSIS Downstream Histogram and return results as JSON or archive.
 
@@ -131,8 +134,8 @@ class DsHistogramRouter:
                 theme = request.analysis.plot.ui.theme
                 plot_config = AnalysisRptMatplotConfig(theme = theme)
                 analysis_rpt = DsHistrogramReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return PnmAnalysisResponse(
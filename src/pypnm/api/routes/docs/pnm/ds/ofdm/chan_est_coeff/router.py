@@ -8,14 +8,20 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.channel_estimation_analysis_rpt import ChanEstimationReport
 from pypnm.api.routes.basic.rxmer_analysis_rpt import AnalysisRptMatplotConfig
 from pypnm.api.routes.common.classes.analysis.analysis import Analysis, AnalysisType
+from pypnm.api.routes.common.classes.analysis.model.process import (
+    AnalysisProcessParameters,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -26,7 +32,6 @@ from pypnm.api.routes.common.classes.common_endpoint_classes.schemas import (
 from pypnm.api.routes.common.classes.common_endpoint_classes.snmp.schemas import (
     SnmpResponse,
 )
-from pypnm.api.routes.common.classes.file_capture.file_type import FileType
 from pypnm.api.routes.common.classes.operation.cable_modem_precheck import (
     CableModemServicePreCheck,
 )
@@ -56,7 +61,7 @@ class ChannelEstimationCoefficientRouter:
         prefix = "/docs/pnm/ds/ofdm"
         self.base_endpoint = "/channelEstCoeff"
         self.router = APIRouter(
-            prefix=prefix, tags=["PNM Operations - Downstream OFDM Channel Estimation Coefficients"])
+            prefix=prefix, tags=["PNM Operations - Downstream OFDM Channel Estimation Coefficients"], route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f'ChannelEstimationCoefficientRouter.{self.base_endpoint.strip("/")}')
         self.__routes()
 
@@ -66,7 +71,7 @@ class ChannelEstimationCoefficientRouter:
             summary="Get Channel Estimation Coefficients PNM Capture File",
             response_model=None,
             responses=FAST_API_RESPONSE,)
-        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture Downstream OFDM Channel Estimation Coefficients.
 
@@ -110,7 +115,8 @@ class ChannelEstimationCoefficientRouter:
             cps = CommonProcessService(msg_rsp)
             msg_rsp = cps.process()
 
-            analysis =  Analysis(AnalysisType.BASIC, msg_rsp)
+            analysis = Analysis(AnalysisType.BASIC, msg_rsp, skip_automatic_process=True)
+            analysis.process(AnalysisProcessParameters(downsample=request.analysis.downsample))
 
             if request.analysis.output.type == OutputType.JSON:
                 payload: dict[str, Any] = cast(dict[str, Any], analysis.get_results())
@@ -131,8 +137,8 @@ class ChannelEstimationCoefficientRouter:
                 theme = request.analysis.plot.ui.theme
                 plot_config = AnalysisRptMatplotConfig(theme = theme)
                 analysis_rpt = ChanEstimationReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return PnmAnalysisResponse(
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.abstract.analysis_report import Analysis
 from pypnm.api.routes.basic.constellation_display_analysis_rpt import (
@@ -19,6 +19,9 @@ from pypnm.api.routes.common.classes.analysis.analysis import AnalysisType
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -43,7 +46,7 @@ from pypnm.api.routes.docs.pnm.ds.ofdm.const_display.schemas import (
 from pypnm.api.routes.docs.pnm.ds.ofdm.const_display.service import (
     CmDsOfdmConstDisplayService,
 )
-from pypnm.api.routes.docs.pnm.files.service import FileType, PnmFileService
+from pypnm.api.routes.docs.pnm.files.service import PnmFileService
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.docsis.data_type.pnm.DocsPnmCmDsConstDispMeasEntry import (
     DocsPnmCmDsConstDispMeasEntry,
@@ -69,7 +72,7 @@ class ConstellationDisplayRouter:
         """
         prefix: str = "/docs/pnm/ds/ofdm"
         self.base_endpoint: str = "/constellationDisplay"
-        self.router: APIRouter = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream OFDM Constellation Display"])
+        self.router: APIRouter = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream OFDM Constellation Display"], route_class=CompactArrayRoute)
         self.logger: logging.Logger = logging.getLogger(f'ConstellationDisplayRouter.{self.base_endpoint.strip("/")}')
         self.__routes()
 
@@ -84,7 +87,7 @@ class ConstellationDisplayRouter:
             responses=FAST_API_RESPONSE,
         )
 
-        async def get_capture(request: PnmConstellationDisplayAnalysisRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmConstellationDisplayAnalysisRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture Downstream OFDM Constellation Display Samples And Return Analysis Results.
 
@@ -163,8 +166,8 @@ class ConstellationDisplayRouter:
                 crosshair = request.analysis.plot.options.display_cross_hair
                 plot_config = ConstDisplayAnalysisRptMatplotConfig(theme = theme, display_crosshair=crosshair)
                 analysis_rpt = ConstellationDisplayReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return PnmAnalysisResponse(
@@ -8,7 +8,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.abstract.analysis_report import AnalysisRptMatplotConfig
 from pypnm.api.routes.basic.fec_summary_analysis_rpt import FecSummaryAnalysisReport
@@ -16,6 +16,9 @@ from pypnm.api.routes.common.classes.analysis.analysis import Analysis, Analysis
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -25,7 +28,6 @@ from pypnm.api.routes.common.classes.common_endpoint_classes.schemas import (
 from pypnm.api.routes.common.classes.common_endpoint_classes.snmp.schemas import (
     SnmpResponse,
 )
-from pypnm.api.routes.common.classes.file_capture.file_type import FileType
 from pypnm.api.routes.common.classes.operation.cable_modem_precheck import (
     CableModemServicePreCheck,
 )
@@ -56,7 +58,7 @@ class FecSummaryRouter:
     def __init__(self) -> None:
         prefix = "/docs/pnm/ds/ofdm"
         self.base_endpoint = "/fecSummary"
-        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream OFDM FEC Summary"])
+        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream OFDM FEC Summary"], route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f'FecSummaryRouter.{self.base_endpoint.strip("/")}')
         self.__routes()
 
@@ -66,7 +68,7 @@ class FecSummaryRouter:
             summary="Get FEC Summary PNM Capture",
             response_model=None,
             responses=FAST_API_RESPONSE,)
-        async def get_capture(request: PnmFecSummaryAnalysisRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmFecSummaryAnalysisRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture Downstream OFDM FEC Summary Statistics.
 
@@ -134,8 +136,8 @@ class FecSummaryRouter:
                 theme = request.analysis.plot.ui.theme
                 plot_config = AnalysisRptMatplotConfig(theme = theme)
                 analysis_rpt = FecSummaryAnalysisReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return PnmAnalysisResponse(
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -7,6 +7,9 @@ import logging
 
 from fastapi import APIRouter
 
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.schemas import (
     PnmAnalysisResponse,
     PnmRequest,
@@ -43,7 +46,7 @@ class RxMerMarginRouter:
         prefix = "/docs/pnm/ds/ofdm"
         tags = ["PNM Operations - Downstream OFDM MER Margin"]
         self.base_endpoint = "merMargin"
-        self.router = APIRouter(prefix=prefix, tags=tags)
+        self.router = APIRouter(prefix=prefix, tags=tags, route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f"RxMerMarginRouter.{self.base_endpoint}")
 
         self._add_routes()
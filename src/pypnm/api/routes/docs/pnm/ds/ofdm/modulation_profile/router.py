@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.abstract.analysis_report import AnalysisRptMatplotConfig
 from pypnm.api.routes.basic.modulation_profile_analysis_rpt import (
@@ -16,6 +17,9 @@ from pypnm.api.routes.common.classes.analysis.analysis import Analysis, Analysis
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -38,11 +42,7 @@ from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
 from pypnm.api.routes.docs.pnm.ds.ofdm.modulation_profile.service import (
     CmDsOfdmModProfileService,
 )
-from pypnm.api.routes.docs.pnm.files.service import (
-    FileResponse,
-    FileType,
-    PnmFileService,
-)
+from pypnm.api.routes.docs.pnm.files.service import PnmFileService
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.docsis.data_type.pnm.DocsPnmCmDsOfdmModProfEntry import (
     DocsPnmCmDsOfdmModProfEntry,
@@ -58,7 +58,7 @@ class ModulationProfileRouter:
     def __init__(self) -> None:
         prefix = "/docs/pnm/ds/ofdm"
         self.base_endpoint = "/modulationProfile"
-        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream OFDM Modulation Profile"])
+        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Downstream OFDM Modulation Profile"], route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f'ModulationProfileRouter.{self.base_endpoint.strip("/")}')
         self.__routes()
 
@@ -69,7 +69,7 @@ class ModulationProfileRouter:
             summary="Get Modulation Profile PNM Capture File",
             responses=FAST_API_RESPONSE,
         )
-        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture Downstream OFDM Modulation Profile.
 
@@ -128,8 +128,8 @@ class ModulationProfileRouter:
                 theme = request.analysis.plot.ui.theme
                 plot_config = AnalysisRptMatplotConfig(theme = theme)
                 analysis_rpt = ModulationProfileReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return SnmpResponse(
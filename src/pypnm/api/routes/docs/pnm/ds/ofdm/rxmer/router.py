@@ -8,16 +8,22 @@ from pathlib import Path
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.rxmer_analysis_rpt import (
     AnalysisRptMatplotConfig,
     RxMerAnalysisReport,
 )
 from pypnm.api.routes.common.classes.analysis.analysis import Analysis, AnalysisType
+from pypnm.api.routes.common.classes.analysis.model.process import (
+    AnalysisProcessParameters,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -28,7 +34,6 @@ from pypnm.api.routes.common.classes.common_endpoint_classes.schemas import (
 from pypnm.api.routes.common.classes.common_endpoint_classes.snmp.schemas import (
     SnmpResponse,
 )
-from pypnm.api.routes.common.classes.file_capture.file_type import FileType
 from pypnm.api.routes.common.classes.operation.cable_modem_precheck import (
     CableModemServicePreCheck,
 )
@@ -54,7 +59,7 @@ class RxMerRouter:
         prefix = "/docs/pnm/ds/ofdm"
         self.base_endpoint = "/rxMer"
         self.router = APIRouter(
-            prefix=prefix, tags=["PNM Operations - Downstream OFDM RxMER"])
+            prefix=prefix, tags=["PNM Operations - Downstream OFDM RxMER"], route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f'RxMerRouter.{self.base_endpoint.strip("/")}')
         self.__routes()
 
@@ -64,7 +69,7 @@ class RxMerRouter:
             summary="Get RxMER PNM Capture File",
             response_model=None,
             responses=FAST_API_RESPONSE,)
-        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture Downstream OFDM RxMER Per-Subcarrier Values.
 
@@ -103,7 +108,8 @@ class RxMerRouter:
             cps = CommonProcessService(msg_rsp)
             msg_rsp = cps.process()
 
-            analysis = Analysis(AnalysisType.BASIC, msg_rsp)
+            analysis = Analysis(AnalysisType.BASIC, msg_rsp, skip_automatic_process=True)
+            analysis.process(AnalysisProcessParameters(downsample=request.analysis.downsample))
 
             if request.analysis.output.type == OutputType.JSON:
                 payload: dict[str, Any] = cast(dict[str, Any], analysis.get_results())
@@ -124,8 +130,8 @@ class RxMerRouter:
                 theme = request.analysis.plot.ui.theme
                 plot_config = AnalysisRptMatplotConfig(theme = theme)
                 analysis_rpt = RxMerAnalysisReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return PnmAnalysisResponse(
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -7,7 +7,7 @@ import logging
 from typing import cast
 
 from fastapi import APIRouter, File, Path, Query, UploadFile
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
@@ -106,6 +106,7 @@ class PnmFileManager:
 
             Retrieves the raw binary file generated during a telemetry capture session.
             Used for offline inspection, reprocessing, or historical archiving.
+            HTTP `Range` requests are honored (206 Partial Content) for partial reads.
 
             Note:
             Depending on your browser and SwaggerUI behavior, the file may either download
@@ -117,11 +118,11 @@ class PnmFileManager:
 
         @self.router.get(
             "/download/macAddress/{mac_address}",
-            response_class=FileResponse,
+            response_class=StreamingResponse,
             summary="Download A PNM File By MAC Address",
             responses=FAST_API_RESPONSE
         )
-        def download_file_via_mac_address(mac_address: MacAddressStr = Path(..., description="MAC address of the file to download")) -> FileResponse:  # noqa: B008
+        def download_file_via_mac_address(mac_address: MacAddressStr = Path(..., description="MAC address of the file to download")) -> StreamingResponse:  # noqa: B008
             """
             **Download PNM Measurement File By Transaction ID**
 
@@ -138,11 +139,11 @@ class PnmFileManager:
 
         @self.router.get(
             "/download/operationID/{operation_id}",
-            response_class=FileResponse,
+            response_class=StreamingResponse,
             summary="Download A PNM File By Operation ID",
             responses=FAST_API_RESPONSE
         )
-        def download_file_via_operationID(operation_id: OperationId = Path(..., description="Operation ID of the file to download")) -> FileResponse:  # noqa: B008
+        def download_file_via_operationID(operation_id: OperationId = Path(..., description="Operation ID of the file to download")) -> StreamingResponse:  # noqa: B008
             """
             **Download PNM Measurement File By Operation ID**
 
@@ -192,7 +193,7 @@ class PnmFileManager:
             summary="Analyze a PNM File Via Transaction ID",
             responses=FAST_API_RESPONSE,
         )
-        def get_analysis_via_transaction_id(request: FileAnalysisRequest) -> AnalysisJsonResponse | FileResponse | JSONResponse:
+        def get_analysis_via_transaction_id(request: FileAnalysisRequest) -> AnalysisJsonResponse | StreamingResponse | JSONResponse:
             """
             **Analysis Of A PNM File**
 
@@ -241,6 +242,12 @@ class PnmFileManager:
                 default=None,
                 description="Optional bytes-per-line for hexdump; if omitted, the service default is used.",
             ),
+            offset: int                   = Query(default=0, ge=0, description="File offset of the first byte to render."),
+            length: int | None            = Query(
+                default=None,
+                ge=1,
+                description="Optional number of bytes to render from offset; if omitted, dumps to end of file.",
+            ),
         ) -> HexDumpResponse:
             """
             **Hexdump Of A PNM File**
@@ -249,13 +256,16 @@ class PnmFileManager:
             associated with the specified transactionID.
 
             This is useful for low-level inspection, debugging, or forensic analysis
-            of the file structure and data.
+            of the file structure and data. Use `offset` and `length` to page
+            through large captures; only the requested window is read.
 
             [API Guide](https://github.com/PyPNMApps/PyPNM/blob/main/docs/api/fast-api/file-manager/file-manager-api.md#7-hexdump-of-a-pnm-file-via-transaction-id)
             """
             hexdump_result = PnmFileService().get_hexdump_by_transaction_id(
                 transaction_id = transaction_id,
                 bytes_per_line = bytes_per_line if bytes_per_line is not None else 0,
+                offset         = offset,
+                length         = length,
             )
             return hexdump_result
 
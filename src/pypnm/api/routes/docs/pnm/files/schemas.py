@@ -1,6 +1,6 @@
 
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -55,6 +55,9 @@ class HexDumpResponse(BaseModel):
     transaction_id: TransactionId = Field(..., description="Transaction ID associated with the PNM file.")
     bytes_per_line: int           = Field(..., description="Number of bytes rendered per hexdump output line.")
     lines: list[str]              = Field(default_factory=list, description="Hexdump lines with offset, hex bytes, and ASCII text.")
+    offset: int                   = Field(default=0, description="File offset of the first rendered byte.")
+    length: int | None            = Field(default=None, description="Requested window length in bytes; null renders to end of file.")
+    file_size: int | None         = Field(default=None, description="Total size of the PNM file in bytes.")
 
 class MacAddressSystemDescriptorEntry(BaseModel):
     mac_address         : MacAddressStr                                  = Field(..., description="Cable modem MAC address.")
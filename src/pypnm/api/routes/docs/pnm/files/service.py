@@ -5,11 +5,12 @@ from __future__ import annotations
 
 import logging
 import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import cast
 
 from fastapi import HTTPException
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 
 from pypnm.api.routes.basic.abstract.analysis_report import AnalysisRptMatplotConfig
 from pypnm.api.routes.basic.channel_estimation_analysis_rpt import ChanEstimationReport
@@ -82,11 +83,12 @@ class PnmFileService:
     Methods:
         - search_files: List available files by MAC.
         - get_file_by_transaction_id: Download raw PNM file by transaction ID.
-        - get_file_by_operation_id: Download all files for an operation as a ZIP.
-        - get_file_by_mac_address: Download all files for a MAC as a ZIP.
+        - get_file_by_operation_id: Stream all files for an operation as a ZIP.
+        - get_file_by_mac_address: Stream all files for a MAC as a ZIP.
         - upload_file: Accepts uploaded files, saves, and registers.
         - get_analysis: Produces analysis for a stored file.
         - get_file: Serve generated CSV/JSON/ARCHIVE files.
+        - stream_archive: Stream a ZIP of files without writing it to disk.
     """
 
     def __init__(self) -> None:
@@ -137,6 +139,9 @@ class PnmFileService:
     def get_file_by_transaction_id(self, transaction_id: TransactionId) -> FileResponse:
         """
         Retrieves and serves the binary file associated with the given transaction ID.
+
+        The file is streamed from disk; ``Range: bytes=...`` requests are
+        answered with 206 Partial Content so clients can fetch only a window.
         """
         txn_data = PnmFileTransaction().get_record(transaction_id)
 
@@ -157,14 +162,14 @@ class PnmFileService:
             media_type  =   MediaType.APPLICATION_OCTET_STREAM,
         )
 
-    def get_file_by_operation_id(self, operation_id: OperationId) -> FileResponse:
+    def get_file_by_operation_id(self, operation_id: OperationId) -> StreamingResponse:
         """
         Retrieve All PNM Files For An Operation ID As A ZIP Archive.
 
         Resolves the capture group associated with the supplied operation ID,
         then collects all transaction records in that group, locates their
-        corresponding PNM files on disk, and packages them into a single ZIP
-        archive for download.
+        corresponding PNM files on disk, and streams them as a single ZIP
+        archive (no archive file is written to disk).
         """
         resolver    = OperationCaptureGroupResolver()
         txn_models  = resolver.get_transaction_models_for_operation(operation_id)
@@ -187,39 +192,18 @@ class PnmFileService:
         if not files_to_archive:
             raise HTTPException(status_code=404, detail="No files on disk for Operation ID.")
 
-        archive_dir = Path(SystemConfigSettings.archive_dir())
-        archive_dir.mkdir(parents=True, exist_ok=True)
-
         archive_name = f"pnm_operation_{operation_id}_{Generate.time_stamp()}.zip"
-        archive_path = archive_dir / archive_name
-
-        ArchiveManager.zip_files(
-            files         = files_to_archive,
-            archive_path  = archive_path,
-            mode          = "w",
-            compression   = "zipdeflated",
-            preserve_tree = False,
-        )
-
-        if not archive_path.is_file():
-            self.logger.error("Archive creation failed for Operation ID %s at %s", operation_id, archive_path)
-            raise HTTPException(status_code=500, detail="Failed to create archive for Operation ID.")
+        self.logger.info("Streaming ZIP archive for Operation ID %s: %s", operation_id, archive_name)
 
-        self.logger.info("Returning ZIP archive for Operation ID %s: %s", operation_id, archive_path)
-
-        return FileResponse(
-            path        = str(archive_path),
-            filename    = archive_name,
-            media_type  = MediaType.APPLICATION_ZIP,
-        )
+        return self.stream_archive(files_to_archive, archive_name)
 
-    def get_file_by_mac_address(self, mac_address: MacAddressStr) -> FileResponse:
+    def get_file_by_mac_address(self, mac_address: MacAddressStr) -> StreamingResponse:
         """
         Retrieve All PNM Files For A MAC Address As A ZIP Archive.
 
         Looks up all transaction records bound to the provided cable modem
         MAC address, collects their associated PNM files from the PNM
-        directory, and packages them into a single ZIP archive for download.
+        directory, and streams them as a single ZIP archive for download.
 
         If no records are found, or none of the files exist on disk, a 404 is raised.
         """
@@ -243,32 +227,11 @@ class PnmFileService:
         if not files_to_archive:
             raise HTTPException(status_code=404, detail="No files on disk for MAC address.")
 
-        archive_dir = Path(SystemConfigSettings.archive_dir())
-        archive_dir.mkdir(parents=True, exist_ok=True)
-
         safe_mac = str(MacAddress(mac_address).to_mac_format())
         archive_name = f"pnm_files_{safe_mac}_{Generate.time_stamp()}.zip"
-        archive_path = archive_dir / archive_name
-
-        ArchiveManager.zip_files(
-            files           = files_to_archive,
-            archive_path    = archive_path,
-            mode            = "w",
-            compression     = "zipdeflated",
-            preserve_tree   = False,
-        )
-
-        if not archive_path.is_file():
-            self.logger.error("Archive creation failed for MAC %s at %s", mac_address, archive_path)
-            raise HTTPException(status_code=500, detail="Failed to create archive for MAC address.")
-
-        self.logger.info("Returning ZIP archive for MAC %s: %s", mac_address, archive_path)
+        self.logger.info("Streaming ZIP archive for MAC %s: %s", mac_address, archive_name)
 
-        return FileResponse(
-            path        =   str(archive_path),
-            filename    =   archive_name,
-            media_type  =   MediaType.APPLICATION_ZIP,
-        )
+        return self.stream_archive(files_to_archive, archive_name)
 
     def upload_file(self, filename: FileName, data: bytes) -> UploadFileResponse:
         """
@@ -345,6 +308,21 @@ class PnmFileService:
             media_type  =   media_type,
         )
 
+    def stream_archive(self, files: Iterable[PathLike], filename: PathLike) -> StreamingResponse:
+        """
+        Stream a ZIP archive of ``files`` as an ``application/zip`` attachment.
+
+        Members are generated while the response is sent: PNGs are stored,
+        CSV/JSON/PNM members are deflated in parallel, and nothing is written
+        to ``archive_dir``. Missing files are logged and skipped.
+        """
+        safe_name = Path(filename).name
+        return StreamingResponse(
+            ArchiveManager.stream_zip(files),
+            media_type  =   MediaType.APPLICATION_ZIP,
+            headers     =   {"Content-Disposition": f'attachment; filename="{safe_name}"'},
+        )
+
     def get_analysis(self, req: FileAnalysisRequest) -> tuple[ParserAnalysisModelReturn, PnmFileType]:
         """
         Returns basic analysis result for a stored PNM file identified by transaction ID.
@@ -425,7 +403,8 @@ class PnmFileService:
 
         return full_path
 
-    def get_hexdump_by_transaction_id(self, transaction_id: TransactionId, bytes_per_line: int) -> HexDumpResponse:
+    def get_hexdump_by_transaction_id(self, transaction_id: TransactionId, bytes_per_line: int,
+                                      offset: int = 0, length: int | None = None) -> HexDumpResponse:
         """
         Generate A Structured Hexdump For A PNM File Identified By Transaction ID.
 
@@ -437,22 +416,36 @@ class PnmFileService:
             Number of bytes per output line in the hexdump view. Typical values
             are 8, 16, or 32. Non-positive values are coerced to the default
             configured via DEFAULT_HEXDUMP_BYTES_PER_LINE.
+        offset:
+            First byte of the window to render. Negative values are treated as 0.
+        length:
+            Number of bytes to render from ``offset``; None or non-positive
+            renders to the end of the file. Only the window is read from disk.
 
         Returns
         -------
         HexDumpResponse
             Structured hexdump payload including the transaction ID, the
-            effective bytes-per-line setting, and formatted hexdump lines
-            containing offset, hex bytes, and ASCII representation.
+            effective bytes-per-line setting, the rendered window, and
+            formatted hexdump lines containing offset, hex bytes, and ASCII
+            representation.
         """
         DEFAULT_HEXDUMP_BYTES_PER_LINE = 16
 
         if bytes_per_line <= 0:
             bytes_per_line = DEFAULT_HEXDUMP_BYTES_PER_LINE
 
+        offset     = max(0, offset)
+        length     = length if length is not None and length > 0 else None
+
         file_path  = self.get_pnm_path_for_transaction(transaction_id)
         processor  = FileProcessor(file_path)
-        lines      = processor.hexdump(bytes_per_line=bytes_per_line)
+        file_size  = processor.file_size()
+
+        if file_size and offset >= file_size:
+            raise HTTPException(status_code=416, detail=f"Offset {offset} is beyond end of file ({file_size} bytes).")
+
+        lines      = processor.hexdump(bytes_per_line=bytes_per_line, limit_bytes=length, offset=offset)
 
         if not lines:
             self.logger.error(
@@ -466,6 +459,9 @@ class PnmFileService:
             transaction_id = transaction_id,
             bytes_per_line = bytes_per_line,
             lines          = lines,
+            offset         = offset,
+            length         = length,
+            file_size      = file_size,
         )
 
     def __get_analysis(self, parser: PnmParsers, model:PnmParserParametersModel) -> tuple[ParserAnalysisModelReturn, PnmFileType]:
@@ -499,9 +495,7 @@ class PnmFileService:
             detail=f"Analysis not implemented for file type: {model.file_type.name}"
         )
 
-    def get_archive(self, request: FileAnalysisRequest) -> FileResponse:
-        rpt: Path = Path()
-
+    def get_archive(self, request: FileAnalysisRequest) -> StreamingResponse:
         theme = request.analysis.plot.ui.theme
         plot_config = AnalysisRptMatplotConfig(theme = theme)
         analysis_model, pnm_ftype = self.get_analysis(request)
@@ -512,32 +506,30 @@ class PnmFileService:
 
         if pnm_ftype == PnmFileType.RECEIVE_MODULATION_ERROR_RATIO:
             analysis_rpt = RxMerAnalysisReport(analysis, plot_config)
-            rpt: Path = cast(Path, analysis_rpt.build_report())
 
         elif pnm_ftype == PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT:
             analysis_rpt = ChanEstimationReport(analysis, plot_config)
-            rpt: Path = cast(Path, analysis_rpt.build_report())
 
         elif pnm_ftype == PnmFileType.OFDM_MODULATION_PROFILE:
             analysis_rpt = ModulationProfileReport(analysis, plot_config)
-            rpt: Path = cast(Path, analysis_rpt.build_report())
 
         elif pnm_ftype == PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY:
             plot_config = ConstDisplayAnalysisRptMatplotConfig(theme = theme)
             analysis_rpt = ConstellationDisplayReport(analysis, plot_config)
-            rpt: Path = cast(Path, analysis_rpt.build_report())
 
         elif pnm_ftype == PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS or pnm_ftype == PnmFileType.UPSTREAM_PRE_EQUALIZER_COEFFICIENTS_LAST_UPDATE:
             plot_config = ConstDisplayAnalysisRptMatplotConfig(theme = theme)
             analysis_rpt = CmUsOfdmaPreEqReport(analysis)
-            rpt: Path = cast(Path, analysis_rpt.build_report())
 
         elif pnm_ftype == PnmFileType.OFDM_FEC_SUMMARY:
             plot_config = ConstDisplayAnalysisRptMatplotConfig(theme = theme)
             analysis_rpt = FecSummaryAnalysisReport(analysis, plot_config)
-            rpt: Path = cast(Path, analysis_rpt.build_report())
 
-        return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+        else:
+            raise HTTPException(status_code=400, detail=f"Archive not implemented for file type: {pnm_ftype.name}")
+
+        rpt: Path = analysis_rpt.build_report(archive=False)
+        return self.stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
     def get_mac_addresses(self) -> MacAddressSystemDescriptorResponse:
         """
@@ -1,19 +1,32 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
+from pypnm.api.routes.common.extended.common_measure_service import CommonMeasureService
 from pypnm.api.routes.common.extended.common_messaging_service import MessageResponse
 from pypnm.api.routes.common.extended.common_process_service import DocsPnmCmCtlTest
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.capture_planner import (
+    SpectrumCapturePlan,
+)
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.schemas import SpecAnCapturePara
 from pypnm.docsis.cable_modem import CableModem
 from pypnm.docsis.data_type.pnm.DocsIf3CmSpectrumAnalysisEntry import (
     DocsIf3CmSpectrumAnalysisEntry,
 )
 from pypnm.lib.types import ChannelId, FrequencyHz
+from pypnm.lib.vendor_capabilities import (
+    _VENDOR_CAPABILITIES,
+    VendorCapabilities,
+    get_vendor_from_sysdescr,
+)
 
 StartFrequency      = FrequencyHz
 PlcFrequency        = FrequencyHz
@@ -34,6 +47,7 @@ class CommonSpectrumChannelAnalyzer(ABC):
         self.log_prefix = f"[{self.__class__.__name__}]"
         self._pnm_test_type = DocsPnmCmCtlTest.SPECTRUM_ANALYZER
         self._measurement_stat: dict[ChannelId, list[DocsIf3CmSpectrumAnalysisEntry]] = {}
+        self._vendor_capabilities: VendorCapabilities | None = None
 
     @abstractmethod
     async def start(self, capture_per_channel: bool = False) -> list[tuple[ChannelId, MessageResponse]]:
@@ -123,6 +137,108 @@ class CommonSpectrumChannelAnalyzer(ABC):
 
         return True
 
+    async def updateCaptureMeasurementStatistics(self, plan: SpectrumCapturePlan) -> bool:
+        """
+        Retrieve the PNM measurement entries of one capture and store them per channel.
+
+        Parameters
+        ----------
+        plan : SpectrumCapturePlan
+            Capture whose trigger the analyzer control row currently reflects.
+
+        Returns
+        -------
+        bool
+            Result of :meth:`updatePnmMeasurementStatistics`.
+
+        Notes
+        -----
+        - The entries are read once, under the first channel of the plan, and
+          shared by the other channels of the same capture.
+        """
+        first_channel = plan.channels[0].channel_id
+        updated = await self.updatePnmMeasurementStatistics(first_channel)
+        for chan in plan.channels[1:]:
+            self._measurement_stat[chan.channel_id] = self._measurement_stat.get(first_channel, [])
+        return updated
+
+    async def run_capture_plans(self,
+                                captures: list[tuple[SpectrumCapturePlan, SpecAnCapturePara]],
+                                service_factory: Callable[[asyncio.Lock], CommonMeasureService],
+                                ) -> list[tuple[ChannelId, MessageResponse]]:
+        """
+        Run one spectrum capture per plan and split the results per channel.
+
+        Parameters
+        ----------
+        captures : list[tuple[SpectrumCapturePlan, SpecAnCapturePara]]
+            Capture plans with the parameters each trigger is configured with.
+        service_factory : Callable[[asyncio.Lock], CommonMeasureService]
+            Builds the measurement service of one capture around the shared
+            capture gate.
+
+        Returns
+        -------
+        List[Tuple[ChannelId, MessageResponse]]
+            One response per planned channel, in plan order.
+
+        Notes
+        -----
+        - All services share one capture gate, so triggers reach the modem one
+          at a time while the TFTP upload and fetch of a finished capture
+          overlap the SNMP configuration of the next one.
+        - The analyzer control row only reflects the latest trigger, so the
+          measurement statistics of each capture are read inside the gate,
+          once that capture is ready, and stored under every channel of its
+          plan.
+        - The vendor capabilities resolved by :meth:`getVendorCapabilities`
+          are handed to every service, so the modem's sysDescr is read once
+          per sweep rather than once per capture.
+        """
+        gate = asyncio.Lock()
+        capabilities = await self.getVendorCapabilities()
+        services: list[CommonMeasureService] = []
+        for plan, capture_parameter in captures:
+            service = service_factory(gate)
+            service.setSpectrumCaptureParameters(capture_parameter)
+            service.setVendorCapabilities(capabilities)
+            service.setSampleReadyHook(functools.partial(self.updateCaptureMeasurementStatistics, plan))
+            services.append(service)
+
+        responses = await asyncio.gather(*(service.set_and_go() for service in services))
+
+        out: list[tuple[ChannelId, MessageResponse]] = []
+        for (plan, _capture_parameter), response in zip(captures, responses, strict=True):
+            out.extend(plan.channel_responses(response))
+
+        return out
+
+    async def getVendorCapabilities(self) -> VendorCapabilities:
+        """
+        Look up the registered spectrum-analyzer capabilities of the cable modem.
+
+        Returns
+        -------
+        VendorCapabilities
+            Capabilities of the vendor named in the modem's sysDescr, or those
+            registered for ``Unknown`` when the vendor is not recognized or
+            sysDescr cannot be read. The first lookup is kept for the
+            lifetime of the analyzer.
+        """
+        if self._vendor_capabilities is not None:
+            return self._vendor_capabilities
+
+        unknown = _VENDOR_CAPABILITIES['Unknown']
+        try:
+            sys_descr = await self._cm.getSysDescr()
+        except Exception as e:
+            self.logger.warning(f"{self.log_prefix} - Could not read sysDescr for vendor capabilities: {e}")
+            return unknown
+
+        vendor = get_vendor_from_sysdescr(str(sys_descr))
+        self._vendor_capabilities = _VENDOR_CAPABILITIES.get(vendor, unknown)
+        return self._vendor_capabilities
+
     async def is_snmp_ready(self) -> bool:
         """
         Asynchronously check if the cable modem is accessible via SNMP.
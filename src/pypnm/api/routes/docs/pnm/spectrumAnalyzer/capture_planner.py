@@ -0,0 +1,148 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
+    PnmFileTransaction,
+)
+from pypnm.api.routes.common.extended.common_messaging_service import (
+    MessageResponse,
+    MessageResponseType,
+)
+from pypnm.api.routes.common.extended.types import (
+    CommonMessagingServiceExtension as CMSE,
+)
+from pypnm.lib.types import ChannelId, FrequencyHz
+from pypnm.lib.vendor_capabilities import _VENDOR_CAPABILITIES
+
+__all__ = ["ChannelSpan", "SpectrumCapturePlan", "SpectrumCapturePlanner"]
+
+DEFAULT_MAX_SEGMENTS = _VENDOR_CAPABILITIES["Unknown"].max_spectrum_segments
+
+
+@dataclass(frozen=True)
+class ChannelSpan:
+    """Occupied spectrum of one channel, in Hz."""
+    channel_id: ChannelId
+    start_hz: FrequencyHz
+    end_hz: FrequencyHz
+
+
+@dataclass(frozen=True)
+class SpectrumCapturePlan:
+    """
+    One spectrum-analyzer trigger covering one or more adjacent channels.
+
+    Attributes
+    ----------
+    first_segment_center_freq, last_segment_center_freq : FrequencyHz
+        Capture bounds: the lowest channel start and the highest channel end.
+    channels : tuple[ChannelSpan, ...]
+        Channels served by this capture, in frequency order.
+    """
+    first_segment_center_freq: FrequencyHz
+    last_segment_center_freq: FrequencyHz
+    channels: tuple[ChannelSpan, ...]
+
+    def segment_count(self, segment_freq_span: int) -> int:
+        """Number of analyzer segments the capture needs at ``segment_freq_span``."""
+        span = self.last_segment_center_freq - self.first_segment_center_freq
+        return span // max(1, segment_freq_span) + 1
+
+    def channel_responses(self, response: MessageResponse) -> list[tuple[ChannelId, MessageResponse]]:
+        """
+        Split the capture's response into one response per channel.
+
+        A single-channel plan returns ``response`` unchanged. Otherwise every
+        channel gets a copy whose PNM file transactions carry the channel's
+        window under the ``spectrum_analysis_channel_window`` extension, which
+        :class:`CommonProcessService` uses to cut that channel's segments out
+        of the shared capture file.
+        """
+        if len(self.channels) == 1 or not response.payload:
+            return [(chan.channel_id, response) for chan in self.channels]
+
+        out: list[tuple[ChannelId, MessageResponse]] = []
+        for chan in self.channels:
+            window = {
+                "channel_id": chan.channel_id,
+                "start_hz": chan.start_hz,
+                "end_hz": chan.end_hz,
+            }
+            payload: list[Any] = []
+            for entry in response.payload:
+                if isinstance(entry, dict) and entry.get("message_type") == MessageResponseType.PNM_FILE_TRANSACTION.name:
+                    message = dict(entry.get("message") or {})
+                    extension = dict(message.get(PnmFileTransaction.EXTENSION) or {})
+                    extension[CMSE.SPECTRUM_ANALYSIS_CHANNEL_WINDOW.value] = window
+                    message[PnmFileTransaction.EXTENSION] = extension
+                    entry = {**entry, "message": message}
+                payload.append(entry)
+            out.append((chan.channel_id, MessageResponse(response.status, payload)))
+        return out
+
+
+class SpectrumCapturePlanner:
+    """
+    Merge per-channel spectrum windows into the fewest analyzer triggers.
+
+    Channels are sorted by start frequency and folded into the current
+    capture while the gap to it is at most ``max_gap_hz`` and the merged
+    capture stays within ``max_segments`` segments of ``segment_freq_span``,
+    so the vendor span adjustment in the measurement service does not widen
+    the segments of a merged capture.
+
+    Parameters
+    ----------
+    segment_freq_span : int
+        Segment span the captures will be configured with, in Hz.
+    max_segments : int
+        Most segments one trigger may request; defaults to the
+        ``max_spectrum_segments`` registered for the ``Unknown`` vendor.
+    max_gap_hz : int | None
+        Largest unoccupied gap bridged by a merge; defaults to one segment span.
+    """
+
+    def __init__(self, segment_freq_span: int,
+                 max_segments: int = DEFAULT_MAX_SEGMENTS,
+                 max_gap_hz: int | None = None) -> None:
+        if segment_freq_span <= 0:
+            raise ValueError(f"segment_freq_span must be > 0, got {segment_freq_span}")
+        self.segment_freq_span = int(segment_freq_span)
+        self.max_segments = max(1, int(max_segments))
+        self.max_gap_hz = self.segment_freq_span if max_gap_hz is None else max(0, int(max_gap_hz))
+
+    def plan(self, bw_by_channel: Mapping[ChannelId, tuple[FrequencyHz, FrequencyHz, FrequencyHz]],
+             merge: bool = True) -> list[SpectrumCapturePlan]:
+        """
+        Build the capture plan for ``ChannelId -> (start_hz, center_hz, end_hz)``.
+
+        With ``merge=False`` every channel gets its own capture, in input order.
+        """
+        spans = [ChannelSpan(chan_id, FrequencyHz(start), FrequencyHz(end))
+                 for chan_id, (start, _center, end) in bw_by_channel.items()]
+        if not merge:
+            return [SpectrumCapturePlan(s.start_hz, s.end_hz, (s,)) for s in spans]
+
+        plans: list[SpectrumCapturePlan] = []
+        group: list[ChannelSpan] = []
+        first = last = 0
+        for span in sorted(spans, key=lambda s: (s.start_hz, s.end_hz)):
+            if group:
+                merged_last = max(last, span.end_hz)
+                if (span.start_hz - last <= self.max_gap_hz and
+                        (merged_last - first) // self.segment_freq_span + 1 <= self.max_segments):
+                    group.append(span)
+                    last = merged_last
+                    continue
+                plans.append(SpectrumCapturePlan(FrequencyHz(first), FrequencyHz(last), tuple(group)))
+            group, first, last = [span], span.start_hz, span.end_hz
+
+        if group:
+            plans.append(SpectrumCapturePlan(FrequencyHz(first), FrequencyHz(last), tuple(group)))
+        return plans
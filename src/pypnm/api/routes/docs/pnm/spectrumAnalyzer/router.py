@@ -7,7 +7,7 @@ import logging
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import FileResponse, StreamingResponse
 
 from pypnm.api.routes.basic.abstract.analysis_report import AnalysisRptMatplotConfig
 from pypnm.api.routes.basic.ofdm_spec_analyzer_rpt import OfdmSpecAnalyzerAnalysisReport
@@ -23,6 +23,9 @@ from pypnm.api.routes.common.classes.analysis.multi_analysis import MultiAnalysi
 from pypnm.api.routes.common.classes.common_endpoint_classes.common.enum import (
     OutputType,
 )
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayRoute,
+)
 from pypnm.api.routes.common.classes.common_endpoint_classes.request_defaults import (
     RequestDefaultsResolver,
 )
@@ -67,7 +70,7 @@ class SpectrumAnalyzerRouter:
     def __init__(self) -> None:
         prefix = "/docs/pnm/ds"
         self.base_endpoint = "/spectrumAnalyzer"
-        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Spectrum Analyzer"])
+        self.router = APIRouter(prefix=prefix, tags=["PNM Operations - Spectrum Analyzer"], route_class=CompactArrayRoute)
         self.logger = logging.getLogger(f"{self.__class__.__name__}")
         self.__routes()
 
@@ -78,7 +81,7 @@ class SpectrumAnalyzerRouter:
             response_model=None,
             responses=FAST_API_RESPONSE,
         )
-        async def get_capture(request: SingleCaptureSpectrumAnalyzerRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: SingleCaptureSpectrumAnalyzerRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Perform Spectrum Analyzer Capture And Return Analysis Results.
 
@@ -135,7 +138,9 @@ class SpectrumAnalyzerRouter:
             msg_rsp = cps.process()
 
             analysis = Analysis(AnalysisType.BASIC, msg_rsp, skip_automatic_process=True)
-            analysis.process(cast(AnalysisProcessParameters, request.analysis.spectrum_analysis))
+            analysis.process(AnalysisProcessParameters(
+                moving_average = request.analysis.spectrum_analysis.moving_average,
+                downsample     = request.analysis.downsample,))
 
             if request.analysis.output.type == OutputType.JSON:
                 payload: dict[str, Any] = cast(dict[str, Any], analysis.get_results())
@@ -164,8 +169,8 @@ class SpectrumAnalyzerRouter:
                 theme = request.analysis.plot.ui.theme
                 plot_config = AnalysisRptMatplotConfig(theme=theme)
                 analysis_rpt = SpectrumAnalyzerReport(analysis, plot_config)
-                rpt: Path = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             return PnmAnalysisResponse(
                 mac_address=mac,
@@ -235,7 +240,9 @@ class SpectrumAnalyzerRouter:
                 cps_msg_rsp = CommonProcessService(msg_rsp).process()
 
                 analysis = Analysis(AnalysisType.BASIC, cps_msg_rsp, skip_automatic_process=True,)
-                analysis.process(cast(AnalysisProcessParameters, request.analysis.spectrum_analysis))
+                analysis.process(AnalysisProcessParameters(
+                    moving_average = request.analysis.spectrum_analysis.moving_average,
+                    downsample     = request.analysis.downsample,))
                 multi_analysis.add(chan_id, analysis)
 
                 primative_entry = cps_msg_rsp.payload_to_dict(idx)
@@ -335,7 +342,9 @@ class SpectrumAnalyzerRouter:
                 cps_msg_rsp = CommonProcessService(msg_rsp).process()
 
                 analysis = Analysis(AnalysisType.BASIC, cps_msg_rsp, skip_automatic_process=True,)
-                analysis.process(cast(AnalysisProcessParameters, request.analysis.spectrum_analysis))
+                analysis.process(AnalysisProcessParameters(
+                    moving_average = request.analysis.spectrum_analysis.moving_average,
+                    downsample     = request.analysis.downsample,))
                 multi_analysis.add(chan_id, analysis)
 
                 primative_entry = cps_msg_rsp.payload_to_dict(idx)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import cast
 
@@ -22,6 +23,10 @@ from pypnm.api.routes.docs.pnm.spectrumAnalyzer.abstract.com_spec_chan_ana impor
     OfdmSpectrumBwLut,
     ScQamSpectrumBwLut,
 )
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.capture_planner import (
+    SpectrumCapturePlan,
+    SpectrumCapturePlanner,
+)
 from pypnm.api.routes.docs.pnm.spectrumAnalyzer.schemas import (
     SpecAnCapturePara,  # type: ignore[import-untyped]
 )
@@ -127,6 +132,9 @@ class OfdmChanSpecAnalyzerService(CommonMeasureService):
     tftp_path : str, optional
         Remote TFTP directory where capture files are written.
         Defaults to :func:`PnmConfigManager.get_tftp_path`.
+    capture_gate : asyncio.Lock, optional
+        Gate shared with the other captures of the same modem; see
+        :class:`CommonMeasureService`.
 
     Usage
     -----
@@ -140,6 +148,7 @@ class OfdmChanSpecAnalyzerService(CommonMeasureService):
         cable_modem: CableModem,
         tftp_servers: tuple[Inet, Inet] = PnmConfigManager.get_tftp_servers(),
         tftp_path: str = PnmConfigManager.get_tftp_path(),
+        capture_gate: asyncio.Lock | None = None,
     ) -> None:
         self.logger = logging.getLogger(self.__class__.__name__)
         super().__init__(
@@ -148,6 +157,7 @@ class OfdmChanSpecAnalyzerService(CommonMeasureService):
             tftp_servers,
             tftp_path,
             cable_modem.getWriteCommunity(),
+            capture_gate=capture_gate,
         )
 
 class DsOfdmChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
@@ -199,22 +209,27 @@ class DsOfdmChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
         --------
         - Retrieves per-channel (start/plc/end) frequency tuples via
           :meth:`calculate_channel_spectrum_bandwidth`.
-        - Builds a :class:`SpecAnCapturePara` for each channel using:
-            * first_segment_center_freq = start_hz
-            * last_segment_center_freq  = end_hz
+        - Plans the captures with :class:`SpectrumCapturePlanner`: adjacent
+          channels share one trigger unless ``capture_per_channel`` is set.
+        - Builds a :class:`SpecAnCapturePara` for each capture using:
+            * first_segment_center_freq = lowest channel start_hz
+            * last_segment_center_freq  = highest channel end_hz
             * segment_freq_span         = 1_000_000 Hz (default here)
             * num_bins_per_segment      = 256 (default here)
             * window_function           = HANN
             * num_averages              = instance default
             * spectrum_retrieval_type   = instance default
-        - Executes :meth:`set_and_go` for each channel via
-          :class:`OfdmChanSpecAnalyzerService`.
+        - Executes :meth:`set_and_go` for each capture via
+          :class:`OfdmChanSpecAnalyzerService`, pipelined by
+          :meth:`run_capture_plans`, and splits merged captures back into
+          per-channel responses.
 
         Parameters
         ----------
         capture_per_channel : bool, optional
-            Reserved flag for future modes; current implementation always
-            iterates all channels. Default False.
+            If True, trigger one capture per channel instead of merging
+            adjacent channels. SNMP amplitude-data retrieval always captures
+            per channel. Default False.
 
         Returns
         -------
@@ -227,8 +242,7 @@ class DsOfdmChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
           capture here; the capture aligns to the *first* and *last* frequencies
           (start/end) as provided by the OFDM channel range.
         """
-        channel_specCapture:list[tuple[ChannelId, SpecAnCapturePara]] = []
-        out:list[tuple[ChannelId, MessageResponse]] = []
+        channel_specCapture:list[tuple[SpectrumCapturePlan, SpecAnCapturePara]] = []
 
         # Compute the bandwidth mapping for all OFDM channels
         bw_by_channel: OfdmSpectrumBwLut = await self.calculate_channel_spectrum_bandwidth()
@@ -250,10 +264,14 @@ class DsOfdmChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
                 f"Channel Settings: {chan_id}, {start_hz}, {plc_hz}, {end_hz}"
             )
 
+        merge = not capture_per_channel and spectrum_retrieval_type != SpectrumRetrievalType.SNMP
+        capabilities = await self.getVendorCapabilities()
+        planner = SpectrumCapturePlanner(segment_freq_span, max_segments=capabilities.max_spectrum_segments)
+        for plan in planner.plan(bw_by_channel, merge=merge):
             capture_parameter = SpecAnCapturePara(
                 inactivity_timeout          = inactivity_timeout,
-                first_segment_center_freq   = FrequencyHz(start_hz),
-                last_segment_center_freq    = FrequencyHz(end_hz),
+                first_segment_center_freq   = plan.first_segment_center_freq,
+                last_segment_center_freq    = plan.last_segment_center_freq,
                 segment_freq_span           = FrequencyHz(segment_freq_span),
                 num_bins_per_segment        = num_bins_per_segment,
                 noise_bw                    = noise_bw,
@@ -267,15 +285,11 @@ class DsOfdmChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
                 f"Capture Parameters: {capture_parameter.model_dump()}"
             )
 
-            channel_specCapture.append((chan_id, capture_parameter))
-
-        for chan_id, capture_parameter in channel_specCapture:
-            service = OfdmChanSpecAnalyzerService(self._cm, tftp_servers=self._tftp_servers)
-            service.setSpectrumCaptureParameters(capture_parameter)
-            out.append((chan_id, await service.set_and_go()))
-            await self.updatePnmMeasurementStatistics(chan_id)
+            channel_specCapture.append((plan, capture_parameter))
 
-        return out
+        return await self.run_capture_plans(
+            channel_specCapture,
+            lambda gate: OfdmChanSpecAnalyzerService(self._cm, tftp_servers=self._tftp_servers, capture_gate=gate))
 
     async def calculate_channel_spectrum_bandwidth(self) -> CommonChannelSpectumBwLut:
         """
@@ -375,6 +389,9 @@ class ScQamChanSpecAnalyzerService(CommonMeasureService):
     tftp_path : str, optional
         Remote TFTP directory for capture output.
         Defaults to :func:`PnmConfigManager.get_tftp_path`.
+    capture_gate : asyncio.Lock, optional
+        Gate shared with the other captures of the same modem; see
+        :class:`CommonMeasureService`.
 
     Usage
     -----
@@ -388,6 +405,7 @@ class ScQamChanSpecAnalyzerService(CommonMeasureService):
         cable_modem: CableModem,
         tftp_servers: tuple[Inet, Inet] = PnmConfigManager.get_tftp_servers(),
         tftp_path: str = PnmConfigManager.get_tftp_path(),
+        capture_gate: asyncio.Lock | None = None,
     ) -> None:
         """
         Initialize The SC-QAM Spectrum Analyzer Service
@@ -403,7 +421,8 @@ class ScQamChanSpecAnalyzerService(CommonMeasureService):
             cable_modem,
             tftp_servers,
             tftp_path,
-            cable_modem.getWriteCommunity(),)
+            cable_modem.getWriteCommunity(),
+            capture_gate=capture_gate,)
 
 class DsScQamChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
     """
@@ -452,29 +471,34 @@ class DsScQamChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
         --------
         - Computes per-channel (start/center/end) tuples via
           :meth:`calculate_channel_spectrum_bandwidth`.
-        - Configures :class:`SpecAnCapturePara` per channel using:
-            * first_segment_center_freq = start_hz
-            * last_segment_center_freq  = end_hz
+        - Plans the captures with :class:`SpectrumCapturePlanner`: adjacent
+          channels share one trigger unless ``capture_per_channel`` is set.
+        - Configures :class:`SpecAnCapturePara` per capture using:
+            * first_segment_center_freq = lowest channel start_hz
+            * last_segment_center_freq  = highest channel end_hz
             * segment_freq_span         = 1_000_000 Hz (default here)
             * num_bins_per_segment      = 256 (default here)
             * window_function           = HANN
             * num_averages              = instance default
             * spectrum_retrieval_type   = instance default
-        - Executes :meth:`set_and_go` for each channel.
+        - Executes :meth:`set_and_go` for each capture, pipelined by
+          :meth:`run_capture_plans`, and splits merged captures back into
+          per-channel responses.
 
         Parameters
         ----------
         capture_per_channel : bool, optional
-            Reserved for future modes; current implementation iterates all
-            channels. Default False.
+            If True, trigger one capture per channel instead of merging
+            adjacent channels. SNMP amplitude-data retrieval always captures
+            per channel. Default False.
 
         Returns
         -------
         list[tuple[ChannelId, MessageResponse]]
             Per-channel results from the spectrum analyzer run.
         """
-        channel_spec_capture: list[tuple[ChannelId, SpecAnCapturePara]] = []
-        out: list[tuple[ChannelId, MessageResponse]] = []
+        channel_spec_capture: list[tuple[SpectrumCapturePlan, SpecAnCapturePara]] = []
+        selected: CommonChannelSpectumBwLut = {}
 
         bw_by_channel: ScQamSpectrumBwLut = await self.calculate_channel_spectrum_bandwidth()
         rbw_settings:ResolutionBwSettings = RBWConversion.getSpectrumRbwSetttings(self._resolution_bandwidth)
@@ -486,16 +510,22 @@ class DsScQamChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
         noise_bw = 150
         segment_freq_span = rbw_settings[2]
 
-        for count, (chan_id, (start_hz, _center_hz, end_hz)) in enumerate(bw_by_channel.items()):
+        for count, (chan_id, channel_bw) in enumerate(bw_by_channel.items()):
 
             if self._test_mode and count > 1:
                 self.logger.warning("Test mode active: processing only first 2 channels.")
                 break
 
+            selected[chan_id] = channel_bw
+
+        merge = not capture_per_channel and spectrum_retrieval_type != SpectrumRetrievalType.SNMP
+        capabilities = await self.getVendorCapabilities()
+        planner = SpectrumCapturePlanner(segment_freq_span, max_segments=capabilities.max_spectrum_segments)
+        for plan in planner.plan(selected, merge=merge):
             capture_parameter = SpecAnCapturePara(
                 inactivity_timeout        = inactivity_timeout,
-                first_segment_center_freq = FrequencyHz(start_hz),
-                last_segment_center_freq  = FrequencyHz(end_hz),
+                first_segment_center_freq = plan.first_segment_center_freq,
+                last_segment_center_freq  = plan.last_segment_center_freq,
                 segment_freq_span         = FrequencyHz(segment_freq_span),
                 num_bins_per_segment      = num_bins_per_segment,
                 noise_bw                  = noise_bw,
@@ -504,15 +534,13 @@ class DsScQamChannelSpectrumAnalyzer(CommonSpectrumChannelAnalyzer):
                 spectrum_retrieval_type   = spectrum_retrieval_type,
             )
 
-            channel_spec_capture.append((chan_id, capture_parameter))
+            channel_spec_capture.append((plan, capture_parameter))
 
-        for chan_id, capture_parameter in channel_spec_capture:
-            service = ScQamChanSpecAnalyzerService(self._cm, tftp_servers=self._tftp_servers)
-            service.setSpectrumCaptureParameters(capture_parameter)
-            out.append((chan_id, await service.set_and_go()))
-            await self.updatePnmMeasurementStatistics(chan_id)
+        self.logger.info(f"{self.log_prefix} - {len(selected)} channel(s) in {len(channel_spec_capture)} capture(s)")
 
-        return out
+        return await self.run_capture_plans(
+            channel_spec_capture,
+            lambda gate: ScQamChanSpecAnalyzerService(self._cm, tftp_servers=self._tftp_servers, capture_gate=gate))
 
     async def calculate_channel_spectrum_bandwidth(self) -> CommonChannelSpectumBwLut:
         """
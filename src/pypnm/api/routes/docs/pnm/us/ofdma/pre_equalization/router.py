@@ -10,7 +10,7 @@ import logging
 from typing import Any, cast
 
 from fastapi import APIRouter
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from pypnm.api.routes.basic.us_ofdma_pre_eq_analysis_rpt import CmUsOfdmaPreEqReport
 from pypnm.api.routes.common.classes.analysis.analysis import Analysis, AnalysisType
@@ -27,7 +27,6 @@ from pypnm.api.routes.common.classes.common_endpoint_classes.schemas import (
 from pypnm.api.routes.common.classes.common_endpoint_classes.snmp.schemas import (
     SnmpResponse,
 )
-from pypnm.api.routes.common.classes.file_capture.file_type import FileType
 from pypnm.api.routes.common.classes.operation.cable_modem_precheck import (
     CableModemServicePreCheck,
 )
@@ -62,7 +61,7 @@ class UsOfdmaPreEqualizationRouter:
             summary="Get Upstream OFDMA Pre-Equalization Capture",
             response_model=None,
             responses=FAST_API_RESPONSE,)
-        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | FileResponse:
+        async def get_capture(request: PnmSingleCaptureRequest) -> SnmpResponse | PnmAnalysisResponse | StreamingResponse:
             """
             Capture Upstream OFDMA Pre-Equalization Coefficients.
 
@@ -121,8 +120,8 @@ class UsOfdmaPreEqualizationRouter:
 
             elif request.analysis.output.type == OutputType.ARCHIVE:
                 analysis_rpt = CmUsOfdmaPreEqReport(analysis)
-                rpt: Path    = cast(Path, analysis_rpt.build_report())
-                return PnmFileService().get_file(FileType.ARCHIVE, rpt.name)
+                rpt: Path    = analysis_rpt.build_report(archive=False)
+                return PnmFileService().stream_archive(analysis_rpt.get_archive_members(), rpt.name)
 
             else:
                 return PnmAnalysisResponse(
@@ -2,14 +2,14 @@
 from __future__ import annotations
 
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 import logging
 
 from pypnm.config.pnm_config_manager import PnmConfigManager
 from pypnm.docsis.cm_snmp_operation import CmSnmpOperation
 from pypnm.lib.inet import Inet, InetAddressStr
 from pypnm.lib.mac_address import MacAddress
-from pypnm.lib.ping import Ping
+from pypnm.lib.ping import AsyncPinger, Ping, PingResult
 
 
 class CableModem(CmSnmpOperation):
@@ -66,6 +66,15 @@ class CableModem(CmSnmpOperation):
         """
         return Ping.is_reachable(self.get_inet_address)
 
+    async def ping_probe(self, timeout: float = 1.0, count: int = 1) -> PingResult:
+        """
+        Probes the cable modem with ICMP echo without blocking the event loop.
+
+        Returns:
+            PingResult: Replies received, loss and round-trip times.
+        """
+        return await AsyncPinger(timeout=timeout, count=count).probe(self.get_inet_address)
+
     async def is_snmp_reachable(self) -> bool:
         """
         Checks whether the cable modem is reachable via SNMP by requesting sysDescr.
@@ -62,6 +62,7 @@ from pypnm.docsis.data_type.pnm.DocsPnmCmOfdmChanEstCoefEntry import (
 )
 from pypnm.docsis.data_type.pnm.DocsPnmCmUsPreEqEntry import DocsPnmCmUsPreEqEntry
 from pypnm.docsis.data_type.sysDescr import SystemDescriptor
+from pypnm.docsis.lib.counter_sampler import COUNTER_SAMPLER, SIGNAL_QUALITY_CODEWORDS
 from pypnm.docsis.lib.pnm_bulk_data import DocsPnmBulkDataGroup
 from pypnm.lib.constants import DEFAULT_SPECTRUM_ANALYZER_INDICES
 from pypnm.lib.inet import Inet
@@ -206,22 +207,22 @@ class CmSnmpOperation:
         # Check if agent transport is available
         import os
         agent_enabled = os.environ.get('PYPNM_USE_AGENT_SNMP', '').lower() == 'true'
-        print(f"DEBUG: PYPNM_USE_AGENT_SNMP={agent_enabled}")
-        
+        self.logger.debug(f"PYPNM_USE_AGENT_SNMP={agent_enabled}")
+
         if agent_enabled:
             try:
                 from pypnm.snmp.agent_transport import AgentSnmpTransport
                 from pypnm.api.agent.manager import get_agent_manager
                 
                 agent_manager = get_agent_manager()
-                print(f"DEBUG: Agent manager: {agent_manager}")
+                self.logger.debug(f"Agent manager: {agent_manager}")
                 
                 if agent_manager:
                     agent = agent_manager.get_agent_for_capability('snmp_get')
-                    print(f"DEBUG: Agent for snmp_get: {agent}")
+                    self.logger.debug(f"Agent for snmp_get: {agent}")
                     
                     if agent:
-                        print("DEBUG: Using agent SNMP transport")
+                        self.logger.debug("Using agent SNMP transport")
                         return AgentSnmpTransport(
                             host=self._inet,
                             community=self._community,
@@ -230,14 +231,13 @@ class CmSnmpOperation:
                             retries=3
                         )
                     else:
-                        print("DEBUG: No agent with snmp_get capability")
+                        self.logger.debug("No agent with snmp_get capability")
                 else:
-                    print("DEBUG: No agent manager available")
+                    self.logger.debug("No agent manager available")
             except Exception as e:
-                print(f"DEBUG: Agent transport exception: {e}")
                 self.logger.warning(f"Agent transport unavailable, falling back to direct SNMP: {e}")
 
-        print("DEBUG: Using direct Snmp_v2c transport")
+        self.logger.debug("Using direct SNMP transport")
 
         if SystemConfigSettings.snmp_v3_enable():
             '''
@@ -748,11 +748,11 @@ class CmSnmpOperation:
                 self.logger.warning("No downstream SC-QAM channel indices found.")
                 return []
             
-            print(f"DEBUG: Found {len(indices)} SC-QAM channel indices: {indices}")
+            self.logger.debug(f"Found {len(indices)} SC-QAM channel indices: {indices}")
 
             entries = await DocsIfDownstreamChannelEntry.get(snmp=self._snmp, indices=indices)
             
-            print(f"DEBUG: Got {len(entries)} SC-QAM channel entries")
+            self.logger.debug(f"Got {len(entries)} SC-QAM channel entries")
 
             return entries
 
@@ -765,10 +765,14 @@ class CmSnmpOperation:
         """
         Retrieves codeword error rate for all downstream SC-QAM channels.
 
-        1. Fetch initial SNMP snapshot for all channels.
-        2. Wait asynchronously for `sample_time_elapsed` seconds.
-        3. Fetch second SNMP snapshot.
-        4. Compute per-channel & aggregate CW error metrics.
+        The ``docsIfSigQExt*`` codeword columns of this modem are tracked by
+        the shared :data:`COUNTER_SAMPLER`, which keeps polling them in the
+        background between requests.
+
+        1. Discover the (index, channel_id) stack of the SC-QAM channels.
+        2. If the sample buffer already spans `sample_time_elapsed`, use it as is.
+        3. Otherwise sample now and wait only for the part of the interval not yet buffered.
+        4. Compute per-channel & aggregate CW error metrics from the wrap-corrected deltas.
         """
         try:
             # 1) Discover all downstream SC-QAM (index, channel_id) indices
@@ -779,32 +783,42 @@ class CmSnmpOperation:
                 return {"entries": [], "aggregate_error_rate": 0.0}
 
             self.logger.debug(f"Found {len(idx_chanid_indices)} downstream SC-QAM channel indices: {idx_chanid_indices}")
-            # Extract only the first element of each tuple
-            idx_indices:list[int] = [index[0] for index in idx_chanid_indices]
 
-            # 2) First snapshot
-            initial_entry = await DocsIfDownstreamChannelEntry.get(snmp=self._snmp, indices=idx_indices)
-            self.logger.debug(f"Initial snapshot: {len(initial_entry)} channels")
+            key = self._counter_sampler_key()
+            COUNTER_SAMPLER.track(key, self._snmp, SIGNAL_QUALITY_CODEWORDS)
+
+            # 2) Answer from the buffer when it already covers the interval
+            delta = COUNTER_SAMPLER.delta(key, sample_time_elapsed)
 
-            # 3) Wait the sample interval
-            await asyncio.sleep(sample_time_elapsed)
+            if delta is None:
+                # 3) Fill the buffer up to the requested interval
+                samples = COUNTER_SAMPLER.samples(key) or [await COUNTER_SAMPLER.sample(key)]
+                if samples[0] is None:
+                    self.logger.warning("No codeword counters returned by the cable modem.")
+                    return {"entries": [], "aggregate_error_rate": 0.0}
 
-            # 4) Second snapshot
-            later_entry = await DocsIfDownstreamChannelEntry.get(snmp=self._snmp, indices=idx_indices)
-            self.logger.debug(f"Second snapshot after {sample_time_elapsed}s: {len(later_entry)} channels")
+                remaining = sample_time_elapsed - (time.monotonic() - samples[0].timestamp)
+                await asyncio.sleep(max(0.0, remaining))
+                await COUNTER_SAMPLER.sample(key)
+                delta = COUNTER_SAMPLER.delta(key, sample_time_elapsed)
 
-            # 5) Calculate error rates
-            calculator = DocsIfDownstreamChannelCwErrorRate(
-                            entries_1=initial_entry,
-                            entries_2=later_entry,
-                            channel_id_index_stack=idx_chanid_indices,
-                            time_elapsed=sample_time_elapsed)
-            return calculator.get()
+            if delta is None:
+                self.logger.warning("Codeword counter history was reset during sampling (cable modem restart?)")
+                return {"entries": [], "aggregate_error_rate": 0.0}
+
+            self.logger.debug(f"Codeword counter delta over {delta.elapsed_s:.3f}s")
+
+            # 4) Calculate error rates
+            return DocsIfDownstreamChannelCwErrorRate.from_counter_delta(delta, idx_chanid_indices).get()
 
         except Exception:
             self.logger.exception("Failed to retrieve downstream SC-QAM codeword error rates")
             return {"entries": [], "aggregate_error_rate": 0.0}
 
+    def _counter_sampler_key(self) -> str:
+        """Key of this cable modem in the shared counter sampler."""
+        return f"{self._inet}:{self._port}"
+
     async def getEventEntryIndex(self) -> list[EntryIndex]:
         """
         Retrieves the list of index values for the docsDevEventEntry table.
@@ -1321,10 +1335,10 @@ class CmSnmpOperation:
         # Process all interface types in parallel
         async def fetch_type(if_type):
             type_start = time.time()
-            print(f"DEBUG: getInterfaceStatistics processing {if_type.name}...")
+            self.logger.debug(f"getInterfaceStatistics processing {if_type.name}...")
             interfaces = await InterfaceStats.from_snmp(self._snmp, if_type)
             type_elapsed = time.time() - type_start
-            print(f"DEBUG: {if_type.name} took {type_elapsed:.3f}s, got {len(interfaces) if interfaces else 0} interfaces")
+            self.logger.debug(f"{if_type.name} took {type_elapsed:.3f}s, got {len(interfaces) if interfaces else 0} interfaces")
             return (if_type.name, interfaces)
         
         # Gather all interface types in parallel
@@ -1333,14 +1347,14 @@ class CmSnmpOperation:
         stats: dict[str, list[dict]] = {}
         for result in results:
             if isinstance(result, Exception):
-                print(f"DEBUG: Interface type fetch failed: {result}")
+                self.logger.warning(f"Interface type fetch failed: {result}")
                 continue
             type_name, interfaces = result
             if interfaces:
                 stats[type_name] = [iface.model_dump() for iface in interfaces]
 
         total_elapsed = time.time() - start_time
-        print(f"DEBUG: getInterfaceStatistics TOTAL time: {total_elapsed:.3f}s, found {len(stats)} interface types")
+        self.logger.debug(f"getInterfaceStatistics TOTAL time: {total_elapsed:.3f}s, found {len(stats)} interface types")
         return stats
 
     async def getDocsIf31CmUsOfdmaChanChannelIdIndex(self) -> list[InterfaceIndex]:
@@ -1586,9 +1600,7 @@ class CmSnmpOperation:
         try:
             indices = await self.getDocsIf31CmDsOfdmChannelIdIndex()
             
-            print(f"=== OFDM CHANNEL INDEX DEBUG ===", flush=True)
-            print(f"Found {len(indices)} OFDM channel indices: {indices}", flush=True)
-            print(f"=== END INDEX DEBUG ===", flush=True)
+            self.logger.debug(f"Found {len(indices)} OFDM channel indices: {indices}")
 
             if not indices:
                 self.logger.warning("No DocsIf31CmDsOfdmChanChannelIdIndex indices found.")
@@ -2007,7 +2019,6 @@ class CmSnmpOperation:
             cscs.to_dict()[0]
             self.logger.info('Diplexer configuration read successfully')
         except Exception as e:
-            print(f'=== FAILED to read diplexer configuration: {e} ===', flush=True)
             self.logger.error(f'Failed to read diplexer configuration: {e}')
             return False
 
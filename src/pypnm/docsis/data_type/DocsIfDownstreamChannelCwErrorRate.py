@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 import logging
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from pypnm.docsis.cm_snmp_operation import DocsIfDownstreamChannelEntry
+from pypnm.docsis.lib.counter_sampler import CounterDelta
 
 
 class CodewordTotals(BaseModel):
@@ -111,21 +112,7 @@ class DocsIfDownstreamChannelCwErrorRate:
                     f"corrected={delta_corrected}, uncorrected={delta_uncorrected}"
                 )
 
-                total_codewords = delta_unerrored + delta_corrected + delta_uncorrected
-                total_errors = delta_uncorrected
-                error_rate = total_errors / total_codewords if total_codewords > 0 else 0.0
-
-                codewords_per_sec = total_codewords / self.time_elapsed if self.time_elapsed > 0 else 0.0
-                errors_per_sec = total_errors / self.time_elapsed if self.time_elapsed > 0 else 0.0
-
-                totals = CodewordTotals(
-                    total_codewords=total_codewords,
-                    total_errors=total_errors,
-                    time_elapsed=self.time_elapsed,
-                    error_rate=error_rate,
-                    codewords_per_second=codewords_per_sec,
-                    errors_per_second=errors_per_sec,
-                )
+                totals = self._codeword_totals(delta_unerrored, delta_corrected, delta_uncorrected)
 
                 self.logger.debug(f"Channel {chan_id}: {totals.total_codewords} codewords, {totals.total_errors} errors, rate={totals.error_rate:.6f}")
 
@@ -143,6 +130,57 @@ class DocsIfDownstreamChannelCwErrorRate:
 
         return cw_entries
 
+    @classmethod
+    def from_counter_delta(
+        cls,
+        delta: CounterDelta,
+        channel_id_index_stack: list[tuple[int, int]],
+    ) -> DocsIfDownstreamChannelCwErrorRate:
+        """
+        Build the error rate entries from a :class:`CounterDelta` of the
+        ``docsIfSigQExt*`` codeword columns (see ``SIGNAL_QUALITY_CODEWORDS``).
+
+        The delta is already wrap-corrected, so no SNMP snapshots are needed.
+        """
+        self = cls.__new__(cls)
+        self.logger = logging.getLogger(cls.__name__)
+        self.time_elapsed = delta.elapsed_s
+
+        unerrored = delta.deltas.get("docsIfSigQExtUnerroreds", {})
+        corrected = delta.deltas.get("docsIfSigQExtCorrecteds", {})
+        uncorrected = delta.deltas.get("docsIfSigQExtUncorrectables", {})
+
+        self.entries = []
+        for idx, chan_id in channel_id_index_stack:
+            if idx not in unerrored or idx not in corrected or idx not in uncorrected:
+                self.logger.warning(f"Channel ID {chan_id} (index {idx}) missing from counter delta; skipping.")
+                continue
+            totals = self._codeword_totals(unerrored[idx], corrected[idx], uncorrected[idx])
+            self.entries.append(DocsIfDownstreamCwErrorRateEntry(index=idx, channel_id=chan_id, codeword_totals=totals))
+
+        self.aggregate_error_rate = self._compute_aggregate_rate()
+        return self
+
+    def _codeword_totals(self, delta_unerrored: int, delta_corrected: int, delta_uncorrected: int) -> CodewordTotals:
+        """
+        Codeword totals and rates of one channel over ``time_elapsed``.
+        """
+        total_codewords = delta_unerrored + delta_corrected + delta_uncorrected
+        total_errors = delta_uncorrected
+        error_rate = total_errors / total_codewords if total_codewords > 0 else 0.0
+
+        codewords_per_sec = total_codewords / self.time_elapsed if self.time_elapsed > 0 else 0.0
+        errors_per_sec = total_errors / self.time_elapsed if self.time_elapsed > 0 else 0.0
+
+        return CodewordTotals(
+            total_codewords=total_codewords,
+            total_errors=total_errors,
+            time_elapsed=self.time_elapsed,
+            error_rate=error_rate,
+            codewords_per_second=codewords_per_sec,
+            errors_per_second=errors_per_sec,
+        )
+
     def _compute_aggregate_rate(self) -> float:
         """
         Compute weighted aggregate error rate across all channels.
@@ -0,0 +1,328 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.snmp.snmp_v3 import Snmp_v3
+
+__all__ = [
+    "COUNTER_SAMPLER",
+    "CounterColumn",
+    "CounterDelta",
+    "CounterSample",
+    "CounterSampler",
+    "IF_TABLE_COUNTERS",
+    "IF_X_TABLE_COUNTERS",
+    "SIGNAL_QUALITY_CODEWORDS",
+]
+
+DEFAULT_SAMPLE_INTERVAL_S: float = 5.0
+DEFAULT_RING_CAPACITY: int = 120
+DEFAULT_IDLE_TIMEOUT_S: float = 300.0
+DEFAULT_MAX_REPETITIONS: int = 25
+
+UPTIME_COLUMN = "sysUpTime"
+
+ColumnValues = dict[int, int]
+
+
+@dataclass(frozen=True)
+class CounterColumn:
+    """
+    One counter column of an SNMP table, walked as a whole on every sample.
+
+    Attributes
+    ----------
+    name : str
+        MIB column symbol, e.g. ``ifHCInOctets``.
+    bits : int
+        Counter width (32 or 64); a decrease between two samples is read as a
+        single wrap modulo ``2**bits``.
+    """
+    name: str
+    bits: int = 32
+
+
+IF_TABLE_COUNTERS: tuple[CounterColumn, ...] = tuple(CounterColumn(name) for name in (
+    "ifInOctets", "ifInUcastPkts", "ifInDiscards", "ifInErrors",
+    "ifOutOctets", "ifOutUcastPkts", "ifOutDiscards", "ifOutErrors",
+))
+
+IF_X_TABLE_COUNTERS: tuple[CounterColumn, ...] = tuple(CounterColumn(name, 64) for name in (
+    "ifHCInOctets", "ifHCInUcastPkts", "ifHCInMulticastPkts", "ifHCInBroadcastPkts",
+    "ifHCOutOctets", "ifHCOutUcastPkts", "ifHCOutMulticastPkts", "ifHCOutBroadcastPkts",
+))
+
+SIGNAL_QUALITY_CODEWORDS: tuple[CounterColumn, ...] = (
+    CounterColumn("docsIfSigQExtUnerroreds", 64),
+    CounterColumn("docsIfSigQExtCorrecteds", 64),
+    CounterColumn("docsIfSigQExtUncorrectables", 64),
+)
+
+
+@dataclass(frozen=True)
+class CounterSample:
+    """
+    Counter columns of one target at one instant.
+
+    ``timestamp`` is :func:`time.monotonic`; ``values`` maps column name to
+    ``{row index: counter value}``.
+    """
+    timestamp: float
+    uptime: int | None
+    values: Mapping[str, ColumnValues]
+
+
+@dataclass(frozen=True)
+class CounterDelta:
+    """
+    Wrap-corrected counter increase between two samples.
+
+    Attributes
+    ----------
+    elapsed_s : float
+        Time between the two samples.
+    deltas : Mapping[str, Mapping[int, int]]
+        Increase per column and row; rows missing from either sample are left out.
+    """
+    elapsed_s: float
+    deltas: Mapping[str, Mapping[int, int]]
+
+    def rates(self) -> dict[str, dict[int, float]]:
+        """Per-second rate of every column and row."""
+        if self.elapsed_s <= 0:
+            return {col: dict.fromkeys(rows, 0.0) for col, rows in self.deltas.items()}
+        return {col: {idx: d / self.elapsed_s for idx, d in rows.items()} for col, rows in self.deltas.items()}
+
+
+@dataclass
+class _Target:
+    snmp: Snmp_v2c | Snmp_v3
+    columns: dict[str, CounterColumn]
+    ring: deque[CounterSample]
+    last_access: float = field(default_factory=time.monotonic)
+    task: asyncio.Task[None] | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class CounterSampler:
+    """
+    Background poller keeping a ring buffer of counter samples per target.
+
+    Every tracked target (a cable modem or CMTS) is polled each
+    ``interval_s`` with one GETBULK walk per counter column plus
+    ``sysUpTime.0``, and the last ``capacity`` samples are kept. Rates are
+    computed on demand from two buffered samples, so rate requests do not have
+    to hold an SNMP session open for the whole sampling interval.
+
+    A ``sysUpTime`` that goes backwards means the agent restarted and its
+    counters were reset, so the ring is cleared before the new sample is
+    stored. Targets not read for ``idle_timeout_s`` stop being polled.
+
+    Parameters
+    ----------
+    interval_s : float
+        Polling period of each target.
+    capacity : int
+        Samples kept per target.
+    idle_timeout_s : float
+        Idle time after which a target's polling task ends.
+    max_repetitions : int
+        GETBULK ``max-repetitions`` of each page of the column walks; tables
+        with more rows are read over several pages.
+    """
+
+    def __init__(self, interval_s: float = DEFAULT_SAMPLE_INTERVAL_S,
+                 capacity: int = DEFAULT_RING_CAPACITY,
+                 idle_timeout_s: float = DEFAULT_IDLE_TIMEOUT_S,
+                 max_repetitions: int = DEFAULT_MAX_REPETITIONS) -> None:
+        if interval_s <= 0:
+            raise ValueError(f"interval_s must be > 0, got {interval_s}")
+        if capacity < 2:
+            raise ValueError(f"capacity must be >= 2, got {capacity}")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.interval_s = float(interval_s)
+        self.capacity = int(capacity)
+        self.idle_timeout_s = float(idle_timeout_s)
+        self.max_repetitions = int(max_repetitions)
+        self._targets: dict[str, _Target] = {}
+
+    # ------------------------------------------------------------------
+    # Tracking
+    # ------------------------------------------------------------------
+
+    def track(self, key: str, snmp: Snmp_v2c | Snmp_v3, columns: Iterable[CounterColumn], start: bool = True) -> None:
+        """
+        Poll ``columns`` of ``key`` from now on; columns add to those already tracked.
+
+        With ``start=False`` only :meth:`sample` adds samples (no background task).
+        """
+        target = self._targets.get(key)
+        if target is None:
+            target = _Target(snmp=snmp, columns={}, ring=deque(maxlen=self.capacity))
+            self._targets[key] = target
+        target.snmp = snmp
+        target.last_access = time.monotonic()
+
+        added = False
+        for column in columns:
+            if column.name not in target.columns:
+                target.columns[column.name] = column
+                added = True
+        if added and target.ring:
+            # older samples lack the new columns; start a consistent history
+            target.ring.clear()
+
+        if start and (target.task is None or target.task.done()):
+            target.task = asyncio.get_running_loop().create_task(self._poll(key), name=f"counter-sampler:{key}")
+
+    def is_tracked(self, key: str) -> bool:
+        return key in self._targets
+
+    async def stop(self, key: str | None = None) -> None:
+        """Stop polling ``key`` (or every target) and drop its samples."""
+        keys = [key] if key is not None else list(self._targets)
+        for k in keys:
+            target = self._targets.pop(k, None)
+            if target is None or target.task is None:
+                continue
+            target.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await target.task
+
+    async def _poll(self, key: str) -> None:
+        while True:
+            target = self._targets.get(key)
+            if target is None:
+                return
+            if time.monotonic() - target.last_access > self.idle_timeout_s:
+                self.logger.debug(f"{key} - idle for {self.idle_timeout_s:.0f}s, sampling stopped")
+                self._targets.pop(key, None)
+                return
+            try:
+                await self.sample(key)
+            except Exception as e:
+                self.logger.warning(f"{key} - counter sample failed: {e}")
+            await asyncio.sleep(self.interval_s)
+
+    # ------------------------------------------------------------------
+    # Sampling
+    # ------------------------------------------------------------------
+
+    async def sample(self, key: str) -> CounterSample | None:
+        """Take one sample of ``key`` now and store it; None when the target is unknown or silent."""
+        target = self._targets.get(key)
+        if target is None:
+            return None
+
+        async with target.lock:
+            columns = list(target.columns.values())
+            walks = await asyncio.gather(
+                target.snmp.get(f"{UPTIME_COLUMN}.0"),
+                *(target.snmp.bulk_walk(col.name, max_repetitions=self.max_repetitions) for col in columns),
+                return_exceptions=True)
+            timestamp = time.monotonic()
+
+            uptime_raw = walks[0]
+            uptime_text = None if isinstance(uptime_raw, BaseException) else Snmp_v2c.get_result_value(uptime_raw)
+            uptime = int(uptime_text) if uptime_text and uptime_text.isdigit() else None
+
+            values: dict[str, ColumnValues] = {}
+            for col, rows in zip(columns, walks[1:], strict=True):
+                if isinstance(rows, BaseException):
+                    self.logger.debug(f"{key} - walk of {col.name} failed: {rows}")
+                    continue
+                values[col.name] = self._column_values(rows or [])
+
+            if not values:
+                return None
+
+            sample = CounterSample(timestamp=timestamp, uptime=uptime, values=values)
+            if target.ring and self._restarted(target.ring[-1], sample):
+                self.logger.info(f"{key} - agent restart detected (sysUpTime went backwards), counter history reset")
+                target.ring.clear()
+            target.ring.append(sample)
+            return sample
+
+    @staticmethod
+    def _column_values(rows: Iterable[object]) -> ColumnValues:
+        out: ColumnValues = {}
+        for row in rows:
+            index = Snmp_v2c.get_oid_index(str(row[0]))  # type: ignore[index]
+            if index is None:
+                continue
+            try:
+                out[int(index)] = int(row[1])  # type: ignore[index]
+            except (TypeError, ValueError):
+                continue
+        return out
+
+    @staticmethod
+    def _restarted(previous: CounterSample, current: CounterSample) -> bool:
+        return previous.uptime is not None and current.uptime is not None and current.uptime < previous.uptime
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def samples(self, key: str) -> list[CounterSample]:
+        """Buffered samples of ``key``, oldest first."""
+        target = self._targets.get(key)
+        if target is None:
+            return []
+        target.last_access = time.monotonic()
+        return list(target.ring)
+
+    def history_s(self, key: str) -> float:
+        """Time covered by the buffered samples of ``key``."""
+        ring = self.samples(key)
+        return ring[-1].timestamp - ring[0].timestamp if len(ring) > 1 else 0.0
+
+    def delta(self, key: str, min_elapsed_s: float = 0.0) -> CounterDelta | None:
+        """
+        Counter increase from the newest sample at least ``min_elapsed_s`` older
+        than the latest one, up to the latest one.
+
+        Returns None when fewer than two samples are buffered or the buffer
+        does not yet span ``min_elapsed_s``.
+        """
+        ring = self.samples(key)
+        if len(ring) < 2:
+            return None
+        latest = ring[-1]
+        base = None
+        for candidate in reversed(ring[:-1]):
+            if latest.timestamp - candidate.timestamp >= min_elapsed_s:
+                base = candidate
+                break
+        if base is None:
+            return None
+
+        target = self._targets[key]
+        deltas: dict[str, dict[int, int]] = {}
+        for name, new_rows in latest.values.items():
+            old_rows = base.values.get(name)
+            if old_rows is None:
+                continue
+            modulus = 1 << target.columns[name].bits if name in target.columns else 1 << 64
+            deltas[name] = {idx: (new - old_rows[idx]) % modulus
+                            for idx, new in new_rows.items() if idx in old_rows}
+        return CounterDelta(elapsed_s=latest.timestamp - base.timestamp, deltas=deltas)
+
+    def rates(self, key: str, min_elapsed_s: float = 0.0) -> dict[str, dict[int, float]] | None:
+        """Per-second rates over :meth:`delta`, or None when not enough history is buffered."""
+        delta = self.delta(key, min_elapsed_s)
+        return delta.rates() if delta is not None else None
+
+
+COUNTER_SAMPLER = CounterSampler()
+"""Process-wide sampler shared by the rate endpoints."""
@@ -1,15 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import logging
 import tarfile
 import zipfile
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Literal
 
+from pypnm.lib.archive.stream import STORED_SUFFIXES, ZipStreamWriter
 from pypnm.lib.types import PathLike
 
 __all__ = ["ArchiveManager"]
@@ -30,7 +31,9 @@ class ArchiveManager:
 
     Supported formats
     -----------------
-    - zip  : appendable (modes "w" or "a"), compression = deflate/bzip2/lzma/store
+    - zip  : appendable (modes "w" or "a"), compression = deflate/bzip2/lzma/store;
+             already-compressed members (PNG, nested archives) are always stored
+    - zip stream : stream_zip() yields archive bytes without touching disk
     - tar  : fresh write each call (modes: tar, gztar=.tar.gz, bztar=.tar.bz2, xztar=.tar.xz)
 
     Security
@@ -129,6 +132,7 @@ class ArchiveManager:
         arcname_map: dict[PathLike, str] | None = None,
         skip_missing: bool = True,
         remove_duplicate_files: bool = True,
+        store_compressed: bool = True,
     ) -> Path:
         """
         Write (or append) files to a ZIP archive.
@@ -155,6 +159,9 @@ class ArchiveManager:
             FileNotFoundError is raised.
         remove_duplicate_files : bool, default True
             When True, duplicate real paths are de-duplicated before archiving.
+        store_compressed : bool, default True
+            When True, already-compressed files (PNG, JPEG, archives) are
+            STORED instead of re-compressed.
 
         Returns
         -------
@@ -187,10 +194,63 @@ class ArchiveManager:
                 else:
                     arcname = src.name
 
+                member_comp = comp
+                if store_compressed and src.suffix.lower() in STORED_SUFFIXES:
+                    member_comp = zipfile.ZIP_STORED
+
                 logging.debug("Archiving: %s to %s", f, arcname)
-                zf.write(src, arcname)
+                zf.write(src, arcname, compress_type=member_comp)
         return ap
 
+    @staticmethod
+    def stream_zip(
+        files: Iterable[PathLike],
+        *,
+        arcname_map: dict[PathLike, str] | None = None,
+        remove_duplicate_files: bool = True,
+        compresslevel: int = 6,
+    ) -> Iterator[bytes]:
+        """
+        Stream a ZIP archive of ``files`` as byte chunks (no archive file on disk).
+
+        PNG and other already-compressed members are STORED; the remaining
+        members are deflated in parallel a few files ahead of the consumer.
+        Suitable as the body of a ``StreamingResponse``.
+
+        Parameters
+        ----------
+        files : Iterable[PathLike]
+            Collection of paths to add to the archive (basenames are used as
+            member names unless ``arcname_map`` overrides them).
+        arcname_map : Optional[Dict[PathLike, str]]
+            Optional explicit mapping from source path to archive name.
+        remove_duplicate_files : bool, default True
+            When True, duplicate real paths are de-duplicated; missing files
+            are skipped with a warning.
+        compresslevel : int, default 6
+            zlib level used for deflated members.
+
+        Returns
+        -------
+        Iterator[bytes]
+            Archive bytes in order; the central directory is the last chunk.
+        """
+        if remove_duplicate_files:
+            seen: set[Path] = set()
+            unique: list[PathLike] = []
+            for f in files:
+                p = Path(f)
+                if not p.is_file():
+                    ArchiveManager._LOG.warning("stream_zip: missing: %s (skipped)", p)
+                    continue
+                rp = p.resolve()
+                if rp not in seen:
+                    seen.add(rp)
+                    unique.append(f)
+            files = unique
+
+        return ZipStreamWriter(compresslevel=compresslevel).iter_files(files, arcname_map=arcname_map)
+
     @staticmethod
     def tar_files(
         files: Iterable[PathLike],
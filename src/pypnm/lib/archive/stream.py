@@ -0,0 +1,187 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import time
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from pypnm.lib.types import PathLike
+
+__all__ = ["STORED_SUFFIXES", "ZipStreamWriter"]
+
+
+STORED_SUFFIXES: frozenset[str] = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".zip", ".gz", ".tgz", ".bz2", ".xz",
+})
+
+_ZIP_STORED: int        = 0
+_ZIP_DEFLATED: int      = 8
+_ZIP_VERSION: int       = 20
+_ZIP_UTF8_FLAG: int     = 0x0800
+_ZIP_UNIX_HOST: int     = 3 << 8
+_ZIP32_LIMIT: int       = 0xFFFFFFFF
+_ZIP32_MAX_ENTRIES: int = 0xFFFF
+
+_LOCAL_HEADER   = struct.Struct("<IHHHHHIIIHH")
+_CENTRAL_HEADER = struct.Struct("<IHHHHHHIIIHHHHHII")
+_END_OF_CD      = struct.Struct("<IHHHHIIH")
+
+
+@dataclass(frozen=True)
+class _ZipMember:
+    arcname: bytes
+    method: int
+    crc: int
+    size: int
+    payload: bytes
+    dos_time: int
+    dos_date: int
+    mode: int
+
+
+class ZipStreamWriter:
+    """
+    Generate a ZIP archive as a stream of byte chunks, without a temp file.
+
+    Members are read and compressed on a small thread pool (``zlib`` releases
+    the GIL) a few files ahead of the consumer, then emitted in input order as
+    ``local header + data``; the central directory follows the last member.
+    Sizes and CRCs are known before each header is written, so no data
+    descriptors are needed and any ZIP reader can open the result.
+
+    Compression policy
+    ------------------
+    - Already-compressed formats (PNG, JPEG, nested archives) are STORED.
+    - Everything else (CSV, JSON, PNM binaries) is DEFLATED, falling back to
+      STORED when deflate would not shrink the member.
+
+    Limits
+    ------
+    ZIP64 is not emitted: members, archive offsets above 4 GiB, or more than
+    65535 entries raise ``ValueError``.
+
+    Example:
+        writer = ZipStreamWriter()
+        return StreamingResponse(writer.iter_files(paths), media_type="application/zip")
+    """
+
+    def __init__(self, *, compresslevel: int = 6, workers: int | None = None,
+                 stored_suffixes: Iterable[str] | None = None) -> None:
+        self.compresslevel   = compresslevel
+        self.workers         = workers or max(1, min(4, os.cpu_count() or 1))
+        self.stored_suffixes = frozenset(s.lower() for s in stored_suffixes) if stored_suffixes is not None else STORED_SUFFIXES
+        self.logger          = logging.getLogger(self.__class__.__name__)
+
+    def iter_files(self, files: Iterable[PathLike], *,
+                   arcname_map: dict[PathLike, str] | None = None) -> Iterator[bytes]:
+        """
+        Yield the archive bytes for ``files`` (missing files are logged and skipped).
+
+        Parameters
+        ----------
+        files : Iterable[PathLike]
+            Files to add, in archive order. Each is stored under its basename
+            unless ``arcname_map`` provides a name.
+        arcname_map : Optional[Dict[PathLike, str]]
+            Optional explicit mapping from source path to archive name.
+        """
+        central: list[bytes] = []
+        offset = 0
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="zip-stream") as pool:
+            window: deque[Future[_ZipMember | None]] = deque()
+            pending = iter(files)
+
+            def refill() -> None:
+                while len(window) < self.workers * 2:
+                    f = next(pending, None)
+                    if f is None:
+                        return
+                    arcname = arcname_map[f] if arcname_map and f in arcname_map else Path(f).name
+                    window.append(pool.submit(self._prepare, Path(f), arcname))
+
+            refill()
+            while window:
+                member = window.popleft().result()
+                refill()
+                if member is None:
+                    continue
+
+                header = self._local_header(member)
+                central.append(self._central_header(member, offset))
+                offset += len(header) + len(member.payload)
+                if offset > _ZIP32_LIMIT:
+                    raise ValueError("Archive exceeds 4 GiB; ZIP64 streaming is not supported")
+                yield header
+                yield member.payload
+
+        if len(central) > _ZIP32_MAX_ENTRIES:
+            raise ValueError(f"Archive has {len(central)} entries; ZIP64 streaming is not supported")
+
+        directory = b"".join(central)
+        yield directory
+        yield _END_OF_CD.pack(0x06054B50, 0, 0, len(central), len(central), len(directory), offset, 0)
+
+    def _prepare(self, src: Path, arcname: str) -> _ZipMember | None:
+        try:
+            data = src.read_bytes()
+            st = src.stat()
+        except OSError as e:
+            self.logger.warning("iter_files: unreadable: %s (%s, skipped)", src, e)
+            return None
+
+        if len(data) > _ZIP32_LIMIT:
+            raise ValueError(f"{src} exceeds 4 GiB; ZIP64 streaming is not supported")
+
+        method, payload = _ZIP_STORED, data
+        if src.suffix.lower() not in self.stored_suffixes:
+            co = zlib.compressobj(self.compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+            deflated = co.compress(data) + co.flush()
+            if len(deflated) < len(data):
+                method, payload = _ZIP_DEFLATED, deflated
+
+        dos_time, dos_date = self._dos_timestamp(st.st_mtime)
+        return _ZipMember(
+            arcname     = arcname.encode("utf-8"),
+            method      = method,
+            crc         = zlib.crc32(data),
+            size        = len(data),
+            payload     = payload,
+            dos_time    = dos_time,
+            dos_date    = dos_date,
+            mode        = st.st_mode & 0xFFFF,
+        )
+
+    @staticmethod
+    def _dos_timestamp(mtime: float) -> tuple[int, int]:
+        t = time.localtime(mtime)
+        if t.tm_year < 1980:
+            return 0, (1 << 5) | 1
+        return (
+            (t.tm_hour << 11) | (t.tm_min << 5) | (t.tm_sec // 2),
+            ((t.tm_year - 1980) << 9) | (t.tm_mon << 5) | t.tm_mday,
+        )
+
+    @staticmethod
+    def _local_header(m: _ZipMember) -> bytes:
+        return _LOCAL_HEADER.pack(
+            0x04034B50, _ZIP_VERSION, _ZIP_UTF8_FLAG, m.method, m.dos_time, m.dos_date,
+            m.crc, len(m.payload), m.size, len(m.arcname), 0,
+        ) + m.arcname
+
+    @staticmethod
+    def _central_header(m: _ZipMember, offset: int) -> bytes:
+        return _CENTRAL_HEADER.pack(
+            0x02014B50, _ZIP_UNIX_HOST | _ZIP_VERSION, _ZIP_VERSION, _ZIP_UTF8_FLAG, m.method,
+            m.dos_time, m.dos_date, m.crc, len(m.payload), m.size, len(m.arcname),
+            0, 0, 0, 0, m.mode << 16, offset,
+        ) + m.arcname
@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
+import numpy as np
+from numpy.typing import NDArray
+
 from pypnm.lib.qam.types import CodeWordArray, QamModulation
-from pypnm.lib.types import ByteArray, Number
+from pypnm.lib.types import ByteArray, NDArrayI64, Number
 
 
 class CodeWordGenerator:
@@ -17,6 +20,12 @@ class CodeWordGenerator:
       **LSB-first per symbol** (i.e., the first generated bit is bit 0 of the symbol).
     - `prbs(byte_length)` returns a ByteArray of pseudo-random bytes generated
       by an 8-bit LFSR with polynomial taps x^8 + x^6 + x^5 + x^4 + 1.
+    - `generate_array()` / `prbs_array()` return the same sequences as NumPy arrays.
+
+    The 8-bit LFSR visits at most 256 states, so its output bit sequence is a
+    short (possibly empty) lead-in followed by a cycle of at most 255 bits. Both
+    are computed once per generator; every stream is then built by tiling that
+    table and reshaping, with no per-bit Python loop.
     """
 
     PRBS = list[Number]
@@ -29,6 +38,7 @@ class CodeWordGenerator:
         """
         self._seed = seed & 0xFF or 0xA5  # avoid zero state
         self._taps = taps & 0xFF
+        self._lead_in, self._cycle = self._bit_table()
 
     # ──────────────────────────── public API ────────────────────────────
     def generate(self, qam_mod: QamModulation, num_of_symbols: int) -> CodeWordArray:
@@ -45,39 +55,22 @@ class CodeWordGenerator:
         Returns:
             CodeWordArray: list of integers in [0, (1<<bps)-1] of length num_of_symbols.
         """
-        if num_of_symbols <= 0:
-            return []
-
-        bps: int = int(qam_mod.get_bit_per_symbol())
-        if bps <= 0:
-            return []
+        return self.generate_array(qam_mod, num_of_symbols).tolist()
 
-        max_codeword = (1 << bps) - 1
+    def generate_array(self, qam_mod: QamModulation, num_of_symbols: int) -> NDArrayI64:
+        """
+        Array form of :meth:`generate`.
 
-        # Local LFSR state so multiple calls to generate() are deterministic and independent
-        state = self._seed
+        Returns:
+            NDArrayI64: shape (num_of_symbols,), empty for a non-positive count or bps.
+        """
+        bps: int = int(qam_mod.get_bit_per_symbol())
+        if num_of_symbols <= 0 or bps <= 0:
+            return np.empty(0, dtype=np.int64)
 
-        def lfsr_step(s: int) -> tuple[int, int]:
-            """One 8-bit LFSR step (right-shift). Returns (new_state, output_bit)."""
-            out = s & 0x01  # LSB as the generated bit
-            s >>= 1
-            if out:
-                s ^= self._taps
-            return s & 0xFF, out
-
-        code_words: CodeWordArray = []
-        for _ in range(num_of_symbols):
-            sym = 0
-            # LSB-first fill
-            for bit_pos in range(bps):
-                state, bit = lfsr_step(state)
-                if bit:
-                    sym |= (1 << bit_pos)
-            # (Optional) mask to be safe, although sym is already bounded by construction
-            sym &= max_codeword
-            code_words.append(sym)
-
-        return code_words
+        bits = self.bits(num_of_symbols * bps).reshape(num_of_symbols, bps).astype(np.int64)
+        weights = np.left_shift(np.int64(1), np.arange(bps, dtype=np.int64))
+        return bits @ weights
 
     def prbs(self, byte_length: int = 1) -> ByteArray:
         """
@@ -89,23 +82,33 @@ class CodeWordGenerator:
         Returns:
             ByteArray: list of integers (0..255) of length `byte_length`.
         """
+        return self.prbs_array(byte_length).tolist()
+
+    def prbs_array(self, byte_length: int = 1) -> NDArray[np.uint8]:
+        """
+        Array form of :meth:`prbs`; bits are packed MSB-first in each byte.
+
+        Returns:
+            NDArray[np.uint8]: shape (byte_length,).
+        """
         if byte_length <= 0:
-            return []
+            return np.empty(0, dtype=np.uint8)
+        return np.packbits(self.bits(byte_length * 8))
 
-        state = self._seed
-        out: ByteArray = []
+    def bits(self, bit_length: int) -> NDArray[np.uint8]:
+        """
+        Return the first `bit_length` LFSR output bits (0/1) starting from the seed.
+        """
+        if bit_length <= 0:
+            return np.empty(0, dtype=np.uint8)
 
-        for _ in range(byte_length):
-            b = 0
-            # Produce 8 bits per byte; pack MSB-first in the byte for conventional display
-            for bit_idx in range(8):
-                state, bit = self._lfsr_step(state)
-                # Place newest bit at position (7 - bit_idx) to yield MSB-first in the byte
-                if bit:
-                    b |= (1 << (7 - bit_idx))
-            out.append(b & 0xFF)
+        lead_in, cycle = self._lead_in, self._cycle
+        if bit_length <= lead_in.size:
+            return lead_in[:bit_length].copy()
 
-        return out
+        remaining = bit_length - lead_in.size
+        reps = -(-remaining // cycle.size)
+        return np.concatenate((lead_in, np.tile(cycle, reps)[:remaining]))
 
     # ──────────────────────────── internals ────────────────────────────
     def _lfsr_step(self, s: int) -> tuple[int, int]:
@@ -118,3 +121,24 @@ class CodeWordGenerator:
         if bit:
             s ^= self._taps
         return s & 0xFF, bit
+
+    def _bit_table(self) -> tuple[NDArray[np.uint8], NDArray[np.uint8]]:
+        """
+        Step the LFSR from the seed until a state repeats.
+
+        Returns (lead_in, cycle): the output bits before the first repeated
+        state and the bits of the cycle it then repeats forever. With the
+        default taps (bit 7 set) the step is a permutation, so the lead-in is
+        empty and the cycle starts at the seed.
+        """
+        first_seen: dict[int, int] = {}
+        out: list[int] = []
+        state = self._seed
+        while state not in first_seen:
+            first_seen[state] = len(out)
+            state, bit = self._lfsr_step(state)
+            out.append(bit)
+
+        bits = np.asarray(out, dtype=np.uint8)
+        start = first_seen[state]
+        return bits[:start], bits[start:]
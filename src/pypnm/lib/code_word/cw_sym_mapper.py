@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -8,8 +8,12 @@ from typing import Literal
 
 import numpy as np
 
-from pypnm.lib.qam.types import CodeWordLut
-from pypnm.lib.types import Complex
+from pypnm.lib.qam.lut_mgr import QamLutManager
+from pypnm.lib.qam.types import CodeWordLut, QamModulation
+from pypnm.lib.types import Complex, NDArrayC128, NDArrayI64
+
+# Largest codeword width for which the dense symbol table is built (2^k entries)
+MAX_TABLE_BITS_PER_SYMBOL: int = 24
 
 
 class QamByteToSymbolMapper:
@@ -44,6 +48,9 @@ class QamByteToSymbolMapper:
     -----
     - Use `iter_symbols()` for streaming; `map_bytes()` returns a list.
     - `map_bytes_array()` returns a NumPy array: (N,2) float64 or 1-D complex128.
+      It unpacks the payload with `np.unpackbits`, weights bps-wide bit rows
+      into codewords and indexes a dense 2^bps symbol table built once per
+      mapper, so no Python code runs per symbol.
     """
 
     __slots__ = (
@@ -55,6 +62,8 @@ class QamByteToSymbolMapper:
         "bit_order",
         "on_unknown",
         "_mask",
+        "_table",
+        "_valid",
     )
 
     def __init__(
@@ -99,6 +108,35 @@ class QamByteToSymbolMapper:
                 "Pass require_dense=False or adjust bits_per_symbol."
             )
 
+        self._table: NDArrayC128 | None = None
+        self._valid: np.ndarray | None = None
+        if (self.bits_per_symbol <= MAX_TABLE_BITS_PER_SYMBOL
+                and self._keys_sorted[0] >= 0 and self._keys_sorted[-1] <= self._mask):
+            self._table, self._valid = self._build_table()
+
+    @classmethod
+    def from_lut_manager(
+        cls,
+        qam_mod: QamModulation,
+        lut_mgr: QamLutManager | None = None,
+        *,
+        pad: Literal["drop", "zero"] = "drop",
+        bit_order: Literal["msb", "lsb"] = "msb",
+    ) -> QamByteToSymbolMapper:
+        """
+        Build a mapper from the ``code_words`` LUT of a :class:`QamLutManager`.
+
+        Raises
+        ------
+        ValueError
+            If the manager has no ``code_words`` entry for ``qam_mod``.
+        """
+        mgr = lut_mgr or QamLutManager()
+        entry = mgr.qam_lut.get(qam_mod.name)
+        if not entry or not entry.get("code_words"):
+            raise ValueError(f"Missing 'code_words' LUT for {qam_mod.name}")
+        return cls(entry["code_words"], pad=pad, bit_order=bit_order)  # type: ignore[arg-type]
+
     # -------------------------------------------------------------------------
     # Public API
     # -------------------------------------------------------------------------
@@ -175,32 +213,47 @@ class QamByteToSymbolMapper:
         -------
         numpy.ndarray
             Array of symbols as specified by `as_complex`.
+
+        Raises
+        ------
+        KeyError
+            If a parsed codeword is not in the LUT and `on_unknown="error"`
+            (or the LUT is dense and `bits_per_symbol` exceeds it).
         """
+        if self._table is None or self._valid is None:
+            symbols = np.fromiter((complex(i, q) for i, q in self.iter_symbols(data)), dtype=np.complex128)
+        else:
+            symbols = self._table[self._resolve_codewords(self.codewords_array(data))]
+
+        if as_complex:
+            return symbols
+        return np.column_stack((symbols.real, symbols.imag)) if symbols.size else np.empty((0, 2), dtype=np.float64)
+
+    def codewords_array(self, data: bytes) -> NDArrayI64:
+        """
+        Split a byte stream into codewords, honoring `bit_order` and `pad`.
+
+        Returns the same sequence as the internal chunkers used by
+        `iter_symbols()`, as an int64 array.
+        """
+        bps = self.bits_per_symbol
         n_syms = self._symbol_count(len(data))
         if n_syms == 0:
-            return np.empty((0, 2), dtype=np.float64) if not as_complex else np.empty((0,), dtype=np.complex128)
-
-        if not as_complex:
-            out = np.empty((n_syms, 2), dtype=np.float64)
-            i = 0
-            for (I, Q) in self.iter_symbols(data):  # noqa: E741
-                out[i, 0] = I
-                out[i, 1] = Q
-                i += 1
-            # If on_unknown="skip", i may be < n_syms; trim
-            if i != n_syms:
-                out = out[:i, :]
-            return out
+            return np.empty(0, dtype=np.int64)
+
+        raw = np.frombuffer(data, dtype=np.uint8)
+        if self.bit_order == "msb":
+            bits = np.unpackbits(raw)
+            weights = np.left_shift(np.int64(1), np.arange(bps - 1, -1, -1, dtype=np.int64))
+        else:
+            bits = np.unpackbits(raw, bitorder="little")
+            weights = np.left_shift(np.int64(1), np.arange(bps, dtype=np.int64))
 
-        # complex128
-        outc = np.empty((n_syms,), dtype=np.complex128)
-        i = 0
-        for (I, Q) in self.iter_symbols(data):  # noqa: E741
-            outc[i] = complex(I, Q)
-            i += 1
-        if i != n_syms:
-            outc = outc[:i]
-        return outc
+        need = n_syms * bps
+        if need > bits.size:
+            # pad="zero": trailing zeros complete the last symbol (low side for MSB, high side for LSB)
+            bits = np.concatenate((bits, np.zeros(need - bits.size, dtype=np.uint8)))
+        return bits[:need].reshape(n_syms, bps).astype(np.int64) @ weights
 
     # -------------------------------------------------------------------------
     # Internal: bit chunkers
@@ -246,6 +299,39 @@ class QamByteToSymbolMapper:
     # -------------------------------------------------------------------------
     # Helpers
     # -------------------------------------------------------------------------
+    def _build_table(self) -> tuple[NDArrayC128, np.ndarray]:
+        """
+        Dense codeword→symbol table over [0 .. 2^bps - 1] and its validity mask.
+        """
+        size = 1 << self.bits_per_symbol
+        table = np.zeros(size, dtype=np.complex128)
+        valid = np.zeros(size, dtype=bool)
+        for cw, (i, q) in self._lut.items():
+            table[cw] = complex(i, q)
+            valid[cw] = True
+        return table, valid
+
+    def _resolve_codewords(self, codewords: NDArrayI64) -> NDArrayI64:
+        """
+        Apply the unknown-codeword policy to an array of codewords.
+        """
+        assert self._valid is not None
+        unknown = ~self._valid[codewords]
+        if not unknown.any():
+            return codewords
+
+        if self.require_dense:
+            cw = int(codewords[np.argmax(unknown)])
+            raise KeyError(f"Codeword {cw} not found in LUT (require_dense=True).")
+        if self.on_unknown == "skip":
+            return codewords[~unknown]
+        if self.on_unknown == "mod":
+            keys = np.asarray(self._keys_sorted, dtype=np.int64)
+            out = codewords.copy()
+            out[unknown] = keys[out[unknown] % keys.size]
+            return out
+        raise KeyError(f"Codeword {int(codewords[np.argmax(unknown)])} not found in LUT.")
+
     def _symbol_count(self, nbytes: int) -> int:
         """
         Number of full symbols produced from `nbytes` under current pad policy.
@@ -1,14 +1,23 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import csv
+import io
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+import numpy as np
 import pandas as pd
 
+# Rows rendered per formatting pass when streaming; bounds peak memory of write()
+DEFAULT_CHUNK_ROWS: int = 8192
+LINE_TERMINATOR: str = "\r\n"
+
 
 class CSVOrientation(Enum):
     """CSV data orientation"""
@@ -19,12 +28,32 @@ class CSVValidationError(Exception):
     """Custom exception for CSV validation errors"""
     pass
 
+@dataclass(frozen=True)
+class _ColumnBlock:
+    """
+    Rows added by :meth:`CSVManager.insert_columns`, kept column-wise.
+
+    Numeric columns stay NumPy arrays (referenced, not copied) and are
+    rendered with one printf-style format per column; text columns are
+    stored stringified and quoted for the output delimiter when rendered.
+    """
+    columns: tuple[np.ndarray, ...]
+    formats: tuple[str, ...]
+    rows: int
+
+
 class CSVManager:
     """
     A class to manage CSV creation and data insertion with validation.
 
     Supports both vertical (traditional) and horizontal orientations with
     strict validation to ensure data integrity.
+
+    Rows can be added one at a time (:meth:`insert_row`) or as whole columns
+    (:meth:`insert_columns`). Column blocks are validated once, formatted in
+    bulk and streamed in ``chunk_rows`` slices by :meth:`write` /
+    :meth:`write_stream`, so large reports never hold one Python string per
+    cell.
     """
 
     def __init__(self, orientation: CSVOrientation = CSVOrientation.VERTICAL) -> None:
@@ -37,6 +66,7 @@ class CSVManager:
         self.orientation = orientation
         self.headers: list[str] = []
         self.data: list[list[Any]] = []
+        self._blocks: list[tuple[int, _ColumnBlock]] = []
         self._header_set = False
         self._file_path: Path
 
@@ -118,9 +148,54 @@ class CSVManager:
             except CSVValidationError as e:
                 raise CSVValidationError(f"Error in row {i}: {str(e)}") from e
 
+    def insert_columns(self, columns: Mapping[str, Sequence[Any] | np.ndarray] | Sequence[Sequence[Any] | np.ndarray],
+                       *, float_precision: int | None = None) -> None:
+        """
+        Insert a block of rows given column-wise.
+
+        Args:
+            columns: One array or sequence per header, either in header order
+                or as a mapping keyed by header name. All must have the same length.
+            float_precision: Fixed decimals for float columns; None keeps the
+                shortest round-trip form, matching ``str(float)`` in insert_row().
+
+        Raises:
+            CSVValidationError: If headers are not set, the column names or
+                count do not match the headers, or the lengths differ.
+        """
+        if not self._header_set:
+            raise CSVValidationError("Headers must be set before inserting data. Call add_header() first.")
+
+        if isinstance(columns, Mapping):
+            if set(columns) != set(self.headers) or len(columns) != len(self.headers):
+                raise CSVValidationError(
+                    f"Column names {list(columns)} do not match headers {self.headers}")
+            ordered = [columns[h] for h in self.headers]
+        else:
+            ordered = list(columns)
+            if len(ordered) != len(self.headers):
+                raise CSVValidationError(
+                    f"Column count ({len(ordered)}) does not match header count ({len(self.headers)})")
+
+        lengths = {len(col) for col in ordered}
+        if len(lengths) > 1:
+            raise CSVValidationError(f"Column lengths differ: {[len(col) for col in ordered]}")
+        rows = lengths.pop() if lengths else 0
+        if rows == 0:
+            return
+
+        arrays: list[np.ndarray] = []
+        formats: list[str] = []
+        for col in ordered:
+            arr, fmt = self._column_format(col, float_precision)
+            arrays.append(arr)
+            formats.append(fmt)
+
+        self._blocks.append((len(self.data), _ColumnBlock(tuple(arrays), tuple(formats), rows)))
+
     def get_row_count(self) -> int:
         """Get the number of data rows (excluding header)"""
-        return len(self.data)
+        return len(self.data) + sum(block.rows for _, block in self._blocks)
 
     def get_column_count(self) -> int:
         """Get the number of columns"""
@@ -131,13 +206,23 @@ class CSVManager:
         return self.headers.copy()
 
     def get_data(self) -> list[list[str]]:
-        """Get a copy of all data rows"""
-        return [row.copy() for row in self.data]
+        """Get a copy of all data rows (column blocks are rendered to strings)"""
+        if not self._blocks:
+            return [row.copy() for row in self.data]
+        rows: list[list[str]] = []
+        for segment in self._segments():
+            if isinstance(segment, _ColumnBlock):
+                text = "".join(self._render_vertical(segment, 0, segment.rows, ",", None))
+                rows.extend(csv.reader(io.StringIO(text)))
+            else:
+                rows.extend(row.copy() for row in segment)
+        return rows
 
     def clear(self) -> None:
         """Clear all headers and data"""
         self.headers = []
         self.data = []
+        self._blocks = []
         self._header_set = False
 
     def set_path_fname(self, file_path: str | Path) -> None:
@@ -160,17 +245,18 @@ class CSVManager:
 
         return self._file_path
 
-    def write(self, include_index: bool = False, delimiter: str = ',') -> bool:
+    def write(self, include_index: bool = False, delimiter: str = ',',
+              chunk_rows: int = DEFAULT_CHUNK_ROWS) -> bool:
         """
         Write CSV data to file based on orientation.
 
         Args:
-            file_path: Path where CSV file will be created
             include_index: Whether to include row indices (only for vertical orientation)
             delimiter: CSV delimiter character
+            chunk_rows: Rows formatted per pass when streaming column blocks
 
         Returns:
-            Path object of the created file
+            True once the file is written
 
         Raises:
             CSVValidationError: If no headers are set
@@ -180,43 +266,157 @@ class CSVManager:
 
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self._file_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile, delimiter=delimiter)
-
-            if self.orientation == CSVOrientation.VERTICAL:
-                self._write_vertical_csv(writer, include_index)
-            else:
-                self._write_horizontal_csv(writer)
+        with open(self._file_path, 'wb') as fp:
+            self.write_stream(fp, include_index=include_index, delimiter=delimiter, chunk_rows=chunk_rows)
 
         return True
 
-    def _write_vertical_csv(self, writer: csv.writer, include_index: bool = False) -> None:
-        """Write CSV in vertical orientation (traditional format)"""
-        # Write headers
+    def write_stream(self, fp: BinaryIO, include_index: bool = False, delimiter: str = ',',
+                     chunk_rows: int = DEFAULT_CHUNK_ROWS) -> int:
+        """
+        Stream the CSV as UTF-8 bytes to an open binary file or buffer.
+
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        for chunk in self.iter_chunks(include_index=include_index, delimiter=delimiter, chunk_rows=chunk_rows):
+            data = chunk.encode("utf-8")
+            fp.write(data)
+            written += len(data)
+        return written
+
+    def iter_chunks(self, include_index: bool = False, delimiter: str = ',',
+                    chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[str]:
+        """
+        Yield the CSV text in pieces of at most ``chunk_rows`` rows (or row values).
+
+        Raises:
+            CSVValidationError: If no headers are set
+        """
+        if not self._header_set:
+            raise CSVValidationError("Cannot create CSV: no headers have been set")
+        chunk_rows = max(1, int(chunk_rows))
+
+        if self.orientation == CSVOrientation.VERTICAL:
+            yield from self._iter_vertical(include_index, delimiter, chunk_rows)
+        else:
+            yield from self._iter_horizontal(delimiter, chunk_rows)
+
+    def _iter_vertical(self, include_index: bool, delimiter: str, chunk_rows: int) -> Iterator[str]:
+        """Vertical orientation (traditional format): header row, then data rows"""
         headers = self.headers.copy()
         if include_index:
             headers.insert(0, "Index")
-        writer.writerow(headers)
-
-        # Write data rows
-        for i, row in enumerate(self.data):
-            data_row = row.copy()
-            if include_index:
-                data_row.insert(0, str(i))
-            writer.writerow(data_row)
-
-    def _write_horizontal_csv(self, writer: csv.writer) -> None:
-        """Write CSV in horizontal orientation (headers as first column)"""
-        # Transpose the data: each header becomes a row with its corresponding data
+        yield self._csv_rows([headers], delimiter)
+
+        offset = 0
+        for segment in self._segments():
+            if isinstance(segment, _ColumnBlock):
+                index_start = offset if include_index else None
+                yield from self._render_vertical(segment, 0, segment.rows, delimiter, index_start, chunk_rows)
+                offset += segment.rows
+                continue
+            for start in range(0, len(segment), chunk_rows):
+                rows = segment[start:start + chunk_rows]
+                if include_index:
+                    rows = [[str(offset + start + i), *row] for i, row in enumerate(rows)]
+                yield self._csv_rows(rows, delimiter)
+            offset += len(segment)
+
+    def _iter_horizontal(self, delimiter: str, chunk_rows: int) -> Iterator[str]:
+        """Horizontal orientation: one line per header, its values across all data rows"""
         for i, header in enumerate(self.headers):
-            row = [header]  # Start with header name
-            # Add all values for this column across all data rows
-            for data_row in self.data:
-                if i < len(data_row):
-                    row.append(data_row[i])
-                else:
-                    row.append("")  # Fill missing values with empty string
-            writer.writerow(row)
+            yield self._quote(header, delimiter)
+            for segment in self._segments():
+                if isinstance(segment, _ColumnBlock):
+                    col, fmt = segment.columns[i], segment.formats[i]
+                    for start in range(0, segment.rows, chunk_rows):
+                        values = self._chunk_values(col, start, start + chunk_rows, delimiter)
+                        yield ((delimiter + fmt) * len(values)) % tuple(values)
+                    continue
+                for start in range(0, len(segment), chunk_rows):
+                    values = [row[i] if i < len(row) else "" for row in segment[start:start + chunk_rows]]
+                    yield "".join(delimiter + self._quote(v, delimiter) for v in values)
+            yield LINE_TERMINATOR
+
+    def _segments(self) -> Iterator[list[list[str]] | _ColumnBlock]:
+        """Row sources in insertion order: slices of ``self.data`` and column blocks"""
+        pos = 0
+        for at, block in self._blocks:
+            if at > pos:
+                yield self.data[pos:at]
+                pos = at
+            yield block
+        if pos < len(self.data):
+            yield self.data[pos:]
+
+    def _render_vertical(self, block: _ColumnBlock, start: int, stop: int, delimiter: str,
+                         index_start: int | None, chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[str]:
+        """
+        Render rows [start, stop) of a column block, ``chunk_rows`` at a time.
+
+        Each chunk is interleaved into one flat object array and formatted with a
+        single ``%`` over a repeated row template, so there is no per-row Python loop.
+        """
+        formats = list(block.formats)
+        if index_start is not None:
+            formats.insert(0, "%d")
+        row_fmt = delimiter.join(formats) + LINE_TERMINATOR
+        width = len(formats)
+
+        for lo in range(start, stop, chunk_rows):
+            hi = min(lo + chunk_rows, stop)
+            grid = np.empty((hi - lo, width), dtype=object)
+            col0 = 0
+            if index_start is not None:
+                grid[:, 0] = np.arange(index_start + lo, index_start + hi)
+                col0 = 1
+            for j, col in enumerate(block.columns):
+                grid[:, col0 + j] = self._chunk_values(col, lo, hi, delimiter)
+            yield (row_fmt * (hi - lo)) % tuple(grid.ravel().tolist())
+
+    @classmethod
+    def _chunk_values(cls, col: np.ndarray, lo: int, hi: int, delimiter: str) -> list[Any]:
+        """Python values of col[lo:hi]; text cells are CSV-quoted for ``delimiter``"""
+        values = col[lo:hi].tolist()
+        if col.dtype == object:
+            return [cls._quote(v, delimiter) for v in values]
+        return values
+
+    @staticmethod
+    def _column_format(col: Sequence[Any] | np.ndarray, float_precision: int | None) -> tuple[np.ndarray, str]:
+        """Return (array, printf format) for one inserted column"""
+        arr = np.asarray(col)
+        if arr.ndim != 1:
+            raise CSVValidationError(f"Columns must be one-dimensional, got shape {arr.shape}")
+        kind = arr.dtype.kind
+        if kind == "f":
+            return arr, (f"%.{int(float_precision)}f" if float_precision is not None else "%r")
+        if kind in "iu":
+            return arr, "%d"
+        if kind == "b":
+            return arr, "%s"
+        # text/object/complex: stringify like insert_row(); datetime/timedelta
+        # go through pandas so cells read "2025-01-01 00:00:00", not epoch ns
+        values = pd.Series(arr).astype(object).tolist() if kind in "Mm" else arr.tolist()
+        text = np.empty(arr.shape[0], dtype=object)
+        text[:] = ["" if v is None else str(v) for v in values]
+        return text, "%s"
+
+    @staticmethod
+    def _quote(value: str, delimiter: str) -> str:
+        """Minimal CSV quoting, as done by ``csv.writer`` with QUOTE_MINIMAL"""
+        value = str(value)
+        if any(c in value for c in (delimiter, '"', "\r", "\n")):
+            return '"' + value.replace('"', '""') + '"'
+        return value
+
+    @staticmethod
+    def _csv_rows(rows: list[list[str]], delimiter: str) -> str:
+        buf = io.StringIO()
+        csv.writer(buf, delimiter=delimiter, lineterminator=LINE_TERMINATOR).writerows(rows)
+        return buf.getvalue()
 
     def to_dataframe(self) -> pd.DataFrame:
         """
@@ -231,11 +431,12 @@ class CSVManager:
         if not self._header_set:
             raise CSVValidationError("Cannot create DataFrame: no headers have been set")
 
-        if not self.data:
+        data = self.get_data()
+        if not data:
             # Return empty DataFrame with just headers
             return pd.DataFrame(columns=self.headers)
 
-        return pd.DataFrame(self.data, columns=self.headers)
+        return pd.DataFrame(data, columns=self.headers)
 
     def from_dataframe(self, df: pd.DataFrame) -> None:
         """
@@ -249,9 +450,8 @@ class CSVManager:
         # Set headers
         self.set_header(list(df.columns))
 
-        # Add data rows
-        for _, row in df.iterrows():
-            self.insert_row(row.tolist())
+        # Add data column-wise; each column keeps its own dtype
+        self.insert_columns([df[c].to_numpy() for c in df.columns])
 
     def preview(self, max_rows: int = 5) -> str:
         """
@@ -271,10 +471,11 @@ class CSVManager:
         # Add header info
         preview_lines.append(f"CSV Preview ({self.orientation.value} orientation)")
         preview_lines.append(f"Headers ({len(self.headers)}): {', '.join(self.headers)}")
-        preview_lines.append(f"Data rows: {len(self.data)}")
+        total_rows = self.get_row_count()
+        preview_lines.append(f"Data rows: {total_rows}")
         preview_lines.append("")
 
-        if not self.data:
+        if not total_rows:
             preview_lines.append("No data rows")
             return "\n".join(preview_lines)
 
@@ -283,14 +484,13 @@ class CSVManager:
         preview_lines.append(" | ".join(f"{h:>10}" for h in self.headers))
         preview_lines.append("-" * (13 * len(self.headers)))
 
-        rows_to_show = min(max_rows, len(self.data))
-        for i in range(rows_to_show):
-            row = self.data[i]
+        sample = self.data[:max_rows] if not self._blocks else self.get_data()[:max_rows]
+        for row in sample:
             formatted_row = " | ".join(f"{str(val):>10}" for val in row)
             preview_lines.append(formatted_row)
 
-        if len(self.data) > max_rows:
-            preview_lines.append(f"... and {len(self.data) - max_rows} more rows")
+        if total_rows > max_rows:
+            preview_lines.append(f"... and {total_rows - max_rows} more rows")
 
         return "\n".join(preview_lines)
 
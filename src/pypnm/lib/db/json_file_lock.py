@@ -9,6 +9,20 @@ import time
 from pathlib import Path
 from typing import TextIO
 
+from pypnm.lib.telemetry.metrics import REGISTRY
+
+JSON_DB_LOCK_WAIT_SECONDS = REGISTRY.histogram(
+    "pypnm_json_db_lock_wait_seconds",
+    "Time spent waiting to acquire a JSON DB file lock, by DB file.",
+    ("db",),
+)
+
+JSON_DB_WRITE_SECONDS = REGISTRY.histogram(
+    "pypnm_json_db_write_duration_seconds",
+    "Time spent serializing and writing a JSON DB file, by DB file.",
+    ("db",),
+)
+
 
 class JsonFileLock:
     """
@@ -24,6 +38,7 @@ class JsonFileLock:
         poll_interval: float = DEFAULT_POLL_INTERVAL,
     ) -> None:
         self._lock_path = target_path.with_suffix(f"{target_path.suffix}.lock")
+        self._db_name = target_path.name
         self._timeout = timeout
         self._poll_interval = poll_interval
         self._handle: TextIO | None = None
@@ -36,8 +51,10 @@ class JsonFileLock:
 
         while True:
             if self._try_lock():
+                JSON_DB_LOCK_WAIT_SECONDS.observe(time.monotonic() - start, db=self._db_name)
                 return None
             if time.monotonic() - start >= self._timeout:
+                JSON_DB_LOCK_WAIT_SECONDS.observe(time.monotonic() - start, db=self._db_name)
                 raise TimeoutError(f"Timed out acquiring lock for {self._lock_path}") from None
             time.sleep(self._poll_interval)
 
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -14,6 +14,7 @@ from typing import Any, cast
 from pydantic import ValidationError
 
 from pypnm.config.pnm_config_manager import SystemConfigSettings
+from pypnm.lib.db.json_file_lock import JSON_DB_WRITE_SECONDS
 from pypnm.lib.db.model.json_trans_model import (
     JsonReturnModel,
     JsonTransactionDbModel,
@@ -390,6 +391,7 @@ class JsonTransactionDb:
             for tx_id, record in model.records.items()
         }
 
-        success = processor.write_file(payload, append=False)
+        with JSON_DB_WRITE_SECONDS.time(db=db_path.name):
+            success = processor.write_file(payload, append=False)
         if not success:
             raise RuntimeError(f"Failed to write JSON DB to {db_path}")
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -12,6 +12,7 @@ FAST_API_RESPONSE: dict[int | str, dict[str, Any]] = {
         "description": "JSON payload, downloadable archive, or raw binary content, depending on endpoint and request.output.type",
         "content": {
             "application/json": {},
+            "application/vnd.pypnm.compact+json": {},
             "application/zip": {},
             "application/octet-stream": {},
         },
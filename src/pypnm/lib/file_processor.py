@@ -1,13 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import csv
 import json
 import logging
+import os
 import tarfile
 import zipfile
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from types import TracebackType
 from typing import Any, Literal
@@ -15,6 +18,18 @@ from typing import Any, Literal
 from pypnm.lib.types import PathLike
 
 DEFAULT_HEXDUMP_BYTES_PER_LINE: int = 16
+DEFAULT_PEEK_BYTES: int = 512
+READ_CHUNK_BYTES: int = 64 * 1024
+
+# bytes -> printable ASCII, everything else '.'
+_HEXDUMP_ASCII = bytes(b if 32 <= b <= 126 else ord(".") for b in range(256))
+
+
+@lru_cache(maxsize=256)
+def _peek_cached(path: str, mtime_ns: int, size: int, nbytes: int) -> bytes:
+    """Leading bytes of ``path``; the (mtime, size) arguments invalidate stale entries."""
+    with open(path, "rb") as file:
+        return file.read(nbytes)
 
 
 class FileProcessor:
@@ -36,6 +51,48 @@ class FileProcessor:
         """Checks if the file exists."""
         return self.filepath.exists()
 
+    def file_size(self) -> int:
+        """Size of the file in bytes, or 0 if it cannot be stat'ed."""
+        try:
+            return self.filepath.stat().st_size
+        except OSError as e:
+            self.logger.error(f"Error reading size of {self.filepath}: {e}")
+            return 0
+
+    def read_range(self, offset: int = 0, length: int | None = None) -> bytes:
+        """
+        Read ``length`` bytes starting at ``offset`` (to end of file when None).
+
+        Only the requested window is read. Returns empty bytes on error or
+        when the window lies past the end of the file.
+        """
+        offset = max(0, int(offset))
+        if length is not None and length <= 0:
+            return b""
+        try:
+            with open(self.filepath, "rb") as file:
+                file.seek(offset)
+                return file.read() if length is None else file.read(length)
+        except FileNotFoundError:
+            self.logger.error(f"File not found: {self.filepath}")
+        except OSError as e:
+            self.logger.error(f"Error reading file {self.filepath}: {e}")
+        return b""
+
+    def peek_header(self, nbytes: int = DEFAULT_PEEK_BYTES) -> bytes:
+        """
+        Return the first ``nbytes`` of the file.
+
+        Results are cached per (path, mtime, size), so repeated header
+        inspection of an unchanged capture does not touch the disk again.
+        """
+        try:
+            st = os.stat(self.filepath)
+        except OSError as e:
+            self.logger.error(f"Error reading file {self.filepath}: {e}")
+            return b""
+        return _peek_cached(str(self.filepath.resolve()), st.st_mtime_ns, st.st_size, max(0, int(nbytes)))
+
     def read_file(self) -> bytes:
         """Reads binary data from the file. Returns empty bytes on error."""
         try:
@@ -234,9 +291,12 @@ class FileProcessor:
     # ──────────────────────────────────────────────────────────────────────
     # Hex helpers
     # ──────────────────────────────────────────────────────────────────────
-    def to_hex(self) -> str:
-        """Converts binary file contents to a hex string. Returns empty on failure."""
-        data = self.read_file()
+    def to_hex(self, offset: int = 0, length: int | None = None) -> str:
+        """
+        Converts binary file contents (or the ``offset``/``length`` window) to a
+        hex string. Returns empty on failure.
+        """
+        data = self.read_file() if offset == 0 and length is None else self.read_range(offset, length)
         if data:
             hex_data = data.hex()
             self.logger.debug(f"Hex conversion complete: {len(hex_data)} chars")
@@ -259,6 +319,7 @@ class FileProcessor:
         *,
         bytes_per_line: int = DEFAULT_HEXDUMP_BYTES_PER_LINE,
         limit_bytes: int | None = None,
+        offset: int = 0,
     ) -> list[str]:
         """
         Generate a hexdump view of the file contents as text lines.
@@ -270,8 +331,10 @@ class FileProcessor:
             are 8, 16, or 32. Non-positive values are coerced to
             DEFAULT_HEXDUMP_BYTES_PER_LINE.
         limit_bytes:
-            Optional maximum number of bytes to render from the start of the
-            file. If None, the entire file is dumped.
+            Optional maximum number of bytes to render from ``offset``. If
+            None, everything to the end of the file is dumped.
+        offset:
+            First byte to render; line offsets stay absolute file offsets.
 
         Returns
         -------
@@ -280,36 +343,57 @@ class FileProcessor:
             ASCII representation. Returns an empty list when the file cannot
             be read or is empty.
         """
-        if bytes_per_line <= 0:
-            bytes_per_line = DEFAULT_HEXDUMP_BYTES_PER_LINE
-
-        data = self.read_file()
-        if not data:
-            self.logger.warning("No data available for hexdump.")
-            return []
-
-        if limit_bytes is not None and limit_bytes > 0:
-            data = data[:limit_bytes]
-
-        lines: list[str] = []
-        offset: int      = 0
-        total_len: int   = len(data)
-
-        while offset < total_len:
-            chunk = data[offset : offset + bytes_per_line]
-
-            hex_bytes    = " ".join(f"{b:02x}" for b in chunk)
-            ascii_repr   = "".join(chr(b) if 32 <= b <= 126 else "." for b in chunk)
-            padding_size = bytes_per_line - len(chunk)
+        length = limit_bytes if limit_bytes is not None and limit_bytes > 0 else None
+        return list(self.iter_hexdump(offset=offset, length=length, bytes_per_line=bytes_per_line))
 
-            if padding_size > 0:
-                hex_bytes = f"{hex_bytes}{'   ' * padding_size}"
+    def iter_hexdump(
+        self,
+        *,
+        offset: int = 0,
+        length: int | None = None,
+        bytes_per_line: int = DEFAULT_HEXDUMP_BYTES_PER_LINE,
+    ) -> Iterator[str]:
+        """
+        Yield hexdump lines for the ``[offset, offset + length)`` window.
 
-            line = f"{offset:08x}  {hex_bytes}  |{ascii_repr}|"
-            lines.append(line)
-            offset += len(chunk)
+        The file is read in READ_CHUNK_BYTES pieces (rounded to whole lines),
+        so only the requested window is read and formatted.
+        """
+        if bytes_per_line <= 0:
+            bytes_per_line = DEFAULT_HEXDUMP_BYTES_PER_LINE
+        offset = max(0, int(offset))
+        remaining = None if length is None else max(0, int(length))
+        chunk_size = max(1, READ_CHUNK_BYTES // bytes_per_line) * bytes_per_line
 
-        return lines
+        try:
+            file = open(self.filepath, "rb")  # noqa: SIM115 - closed in finally across yields
+        except OSError as e:
+            self.logger.error(f"Error reading file {self.filepath}: {e}")
+            return
+        try:
+            file.seek(offset)
+            pos = offset
+            while remaining is None or remaining > 0:
+                want = chunk_size if remaining is None else min(chunk_size, remaining)
+                data = file.read(want)
+                if not data:
+                    break
+                yield from self._hexdump_lines(data, pos, bytes_per_line)
+                pos += len(data)
+                if remaining is not None:
+                    remaining -= len(data)
+        finally:
+            file.close()
+
+    @staticmethod
+    def _hexdump_lines(data: bytes, base_offset: int, bytes_per_line: int) -> Iterator[str]:
+        """Format ``data`` as hexdump lines whose offsets start at ``base_offset``."""
+        width = bytes_per_line * 3 - 1
+        for start in range(0, len(data), bytes_per_line):
+            chunk = data[start : start + bytes_per_line]
+            hex_bytes = chunk.hex(" ").ljust(width)
+            ascii_repr = chunk.translate(_HEXDUMP_ASCII).decode("ascii")
+            yield f"{base_offset + start:08x}  {hex_bytes}  |{ascii_repr}|"
 
     def print_hex(self, limit: int = 64) -> None:
         """Prints the first N characters of the hex file content."""
@@ -1,17 +1,23 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 
+import functools
+import hashlib
+import inspect
 import logging
-from collections.abc import Iterable, Sequence
-from contextlib import nullcontext
-from dataclasses import dataclass, replace
+import pickle
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from itertools import cycle
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal, TypeVar
 
 import matplotlib
 from matplotlib.axes import Axes
@@ -29,6 +35,7 @@ from matplotlib.ticker import (
 )
 
 from pypnm.lib.code_word.cw_generator import QamModulation
+from pypnm.lib.signal_processing.downsample import DownsampleMethod, SeriesDownsampler
 from pypnm.lib.types import ArrayLike, ComplexArray, Number
 
 ThemeType = Literal["dark", "light", True, False]
@@ -73,6 +80,9 @@ class PlotConfig:
         * y_ticks sets explicit Y tick positions.
         * y_tick_labels optionally sets custom labels for those positions (len must match y_ticks).
           Useful for plotting log₂(M) positions while showing labels like ["64","256","1024"].
+    - Downsampling (line plots):
+        * downsample="lttb" or "min_max" reduces each series to downsample_points before drawing;
+          plot time then scales with the figure width instead of the capture size.
     """
     # Data
     x: ArrayLike | None = None
@@ -128,11 +138,108 @@ class PlotConfig:
     y_ticks: list[Number] | None = None
     y_tick_labels: list[str] | None = None
 
+    # Line series downsampling
+    downsample: DownsampleMethod | None = None
+    downsample_points: int | None = None
+
     def update(self, **kwargs: object) -> PlotConfig:
         """Create a new PlotConfig with fields replaced by kwargs."""
         return replace(self, **kwargs)
 
 
+@dataclass(frozen=True)
+class PlotRenderJob:
+    """
+    Deferred call to one MatplotManager plot method.
+
+    Captured while :meth:`MatplotManager.deferred_rendering` is active so the
+    figure can be rendered later, in bulk, on another process (see
+    :class:`pypnm.lib.matplot.render_pool.MatplotRenderPool`).
+
+    Notes
+    -----
+    - `arguments` holds the bound call arguments (excluding `self`), all of which
+      can be passed by keyword.
+    - `output` is the resolved PNG path the eager call would have returned.
+    """
+    method: str
+    arguments: dict[str, Any]
+    output: Path
+    output_dir: Path
+    dpi: int
+    figsize: tuple[float, float]
+    tight_layout: bool
+    default_cfg: PlotConfig = field(default_factory=PlotConfig)
+
+    def cache_key(self) -> str:
+        """
+        Content hash of everything that affects the rendered PNG.
+
+        The target filename is excluded so identical plots written under a new
+        timestamped name still hit the render cache.
+        """
+        content = {k: v for k, v in self.arguments.items() if k != "filename"}
+        digest = hashlib.sha256()
+        digest.update(matplotlib.__version__.encode("ascii"))
+        digest.update(pickle.dumps(
+            (self.method, content, self.dpi, self.figsize, self.tight_layout, self.default_cfg),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        ))
+        return digest.hexdigest()
+
+    def render(self, *, reuse_figures: bool = False) -> Path:
+        """Run the captured plot call eagerly and return the written PNG path."""
+        mgr = MatplotManager(
+            self.output_dir,
+            dpi             = self.dpi,
+            figsize         = self.figsize,
+            tight_layout    = self.tight_layout,
+            default_cfg     = self.default_cfg,
+            reuse_figures   = reuse_figures,
+        )
+        token = _deferred_jobs.set(None)
+        try:
+            return getattr(mgr, self.method)(**self.arguments)
+        finally:
+            _deferred_jobs.reset(token)
+
+
+_deferred_jobs: ContextVar[list[PlotRenderJob] | None] = ContextVar("pypnm_matplot_deferred_jobs", default=None)
+
+_PlotMethod = TypeVar("_PlotMethod", bound=Callable[..., Path])
+
+
+def _deferrable(method: _PlotMethod) -> _PlotMethod:
+    """
+    Let a plot method record a :class:`PlotRenderJob` instead of drawing when
+    :meth:`MatplotManager.deferred_rendering` is active in the current context.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self: MatplotManager, *args: Any, **kwargs: Any) -> Path:  # noqa: ANN401 - plot passthrough
+        jobs = _deferred_jobs.get()
+        if jobs is None:
+            return method(self, *args, **kwargs)
+
+        bound = signature.bind(self, *args, **kwargs)
+        arguments = {k: v for k, v in bound.arguments.items() if k != "self"}
+        out = self._resolve_path(arguments["filename"]).with_suffix(".png")
+        jobs.append(PlotRenderJob(
+            method          = method.__name__,
+            arguments       = arguments,
+            output          = out,
+            output_dir      = self.output_dir,
+            dpi             = self.dpi,
+            figsize         = self.figsize,
+            tight_layout    = self.tight_layout,
+            default_cfg     = self.default_cfg,
+        ))
+        return self._update_png_file(out)
+
+    return wrapper  # type: ignore[return-value]
+
+
 class MatplotManager:
     """
     Lightweight Matplotlib wrapper for saving common plot types as PNG files.
@@ -151,8 +258,13 @@ class MatplotManager:
         Default configuration applied to all plots (can be overridden per call).
     logger : Optional[logging.Logger]
         Logger instance; defaults to module logger.
+    reuse_figures : bool
+        Line plots draw on a per-thread cached figure (cleared between plots)
+        instead of creating and closing a new one each call.
     """
 
+    _figure_pool = threading.local()
+
     def __init__(
         self,
         output_dir: str | Path = ".",
@@ -162,6 +274,7 @@ class MatplotManager:
         tight_layout: bool = True,
         default_cfg: PlotConfig | None = None,
         logger: logging.Logger | None = None,
+        reuse_figures: bool = False,
     ) -> None:
         self.output_dir = Path(output_dir).resolve()
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -170,15 +283,58 @@ class MatplotManager:
         self.tight_layout = tight_layout
         self.default_cfg = default_cfg or PlotConfig()
         self.logger = logger or logging.getLogger(__name__)
+        self.reuse_figures = reuse_figures
         self._png_files: list[Path] = []
 
+    @classmethod
+    @contextmanager
+    def deferred_rendering(cls) -> Iterator[list[PlotRenderJob]]:
+        """
+        Collect plot calls made in this context as :class:`PlotRenderJob` items.
+
+        While active, plot methods return (and register) their PNG path without
+        drawing anything; the caller renders the yielded jobs afterwards.
+
+        Example:
+            with MatplotManager.deferred_rendering() as jobs:
+                managers = report.create_matplot()
+            MatplotRenderPool.render(jobs)
+        """
+        jobs: list[PlotRenderJob] = []
+        token = _deferred_jobs.set(jobs)
+        try:
+            yield jobs
+        finally:
+            _deferred_jobs.reset(token)
+
     # ───────────────────────── internals ─────────────────────────
 
-    def _new_fig(self, projection: str | None = None) -> tuple[Figure, Axes]:
+    def _new_fig(self, projection: str | None = None, *, reusable: bool = False) -> tuple[Figure, Axes]:
+        if reusable and self.reuse_figures:
+            return self._pooled_fig()
         fig = plt.figure(figsize=self.figsize, dpi=self.dpi)
         ax = fig.add_subplot(111, projection=projection) if projection else fig.add_subplot(111)
         return fig, ax
 
+    def _pooled_fig(self) -> tuple[Figure, Axes]:
+        """Return a cleared cached figure matching size, dpi and the active style."""
+        pool: dict[tuple[Any, ...], Figure] = getattr(self._figure_pool, "figures", None) or {}
+        self._figure_pool.figures = pool
+        rc = plt.rcParams
+        key = (self.figsize, self.dpi, rc["figure.facecolor"], rc["figure.edgecolor"], rc["axes.facecolor"])
+        fig = pool.get(key)
+        if fig is None:
+            fig = Figure(figsize=self.figsize, dpi=self.dpi)
+            pool[key] = fig
+        else:
+            fig.clear()
+            fig.subplotpars.update(**{k: rc[f"figure.subplot.{k}"] for k in ("left", "right", "bottom", "top", "wspace", "hspace")})
+        return fig, fig.add_subplot(111)
+
+    def _is_pooled(self, fig: Figure) -> bool:
+        pool: dict[tuple[Any, ...], Figure] = getattr(self._figure_pool, "figures", None) or {}
+        return any(f is fig for f in pool.values())
+
     def _resolve_path(self, filename: str | Path) -> Path:
         p = Path(filename)
         return p if p.is_absolute() else (self.output_dir / p)
@@ -230,6 +386,8 @@ class MatplotManager:
             x_time_format       = pick(user_cfg.x_time_format       if user_cfg else None, base.x_time_format,      method_defaults.x_time_format),
             y_ticks             = pick(user_cfg.y_ticks             if user_cfg else None, base.y_ticks,            method_defaults.y_ticks),
             y_tick_labels       = pick(user_cfg.y_tick_labels       if user_cfg else None, base.y_tick_labels,      method_defaults.y_tick_labels),
+            downsample          = pick(user_cfg.downsample          if user_cfg else None, base.downsample,         method_defaults.downsample),
+            downsample_points   = pick(user_cfg.downsample_points   if user_cfg else None, base.downsample_points,  method_defaults.downsample_points),
         )
 
     def _theme_context(self, cfg: PlotConfig | None):
@@ -364,7 +522,8 @@ class MatplotManager:
         out = path.with_suffix(".png")
         out.parent.mkdir(parents=True, exist_ok=True)
         fig.savefig(out, dpi=self.dpi, bbox_inches="tight", transparent=bool(cfg.transparent))
-        plt.close(fig)
+        if not self._is_pooled(fig):
+            plt.close(fig)
 
         self._update_png_file(out)
         self.logger.debug("Saved plot: %s", out)
@@ -394,6 +553,21 @@ class MatplotManager:
             xa, ya = xa[:n], ya[:n]
         return xa, ya
 
+    def _downsample_index(self, x: np.ndarray, y: np.ndarray, cfg: PlotConfig) -> np.ndarray | None:
+        """Indices keeping cfg.downsample_points of aligned X/Y with cfg.downsample (None when unset)."""
+        if cfg.downsample in (None, DownsampleMethod.NONE) or not cfg.downsample_points:
+            return None
+        if y.size <= cfg.downsample_points:
+            return None
+        return SeriesDownsampler(points=int(cfg.downsample_points), method=DownsampleMethod(cfg.downsample)).indices(y, x)
+
+    def _downsample_xy(self, x: np.ndarray, y: np.ndarray, cfg: PlotConfig) -> tuple[np.ndarray, np.ndarray]:
+        """Reduce aligned X/Y to cfg.downsample_points with cfg.downsample (unchanged when unset)."""
+        idx = self._downsample_index(x, y, cfg)
+        if idx is None:
+            return x, y
+        return x[idx], y[idx]
+
     def _split_complex_array(self, arr: ComplexArray | None) -> tuple[np.ndarray, np.ndarray]:
         """Split ComplexArray into (I, Q) float arrays, accepting [N,2] or flat [2N] inputs."""
         if not arr:
@@ -417,6 +591,7 @@ class MatplotManager:
 
     # ───────────────────────── plots ─────────────────────────
 
+    @_deferrable
     def plot_line(
         self,
         filename: str | Path,
@@ -439,14 +614,15 @@ class MatplotManager:
         """
         defaults = PlotConfig(grid=True, legend=None, transparent=False)
         cfg = self._merge_cfg(cfg, defaults)
-        x, y = self._coerce_xy(x if x is not None else cfg.x, y if y is not None else cfg.y)
+        xa, ya = self._downsample_xy(*self._coerce_xy(x if x is not None else cfg.x, y if y is not None else cfg.y), cfg)
         resolved_color = color if color is not None else cfg.line_color
         with self._theme_context(cfg):
-            fig, ax = self._new_fig()
-            ax.plot(x, y, label=label, linewidth=linewidth, marker=marker, color=resolved_color)
+            fig, ax = self._new_fig(reusable=True)
+            ax.plot(xa, ya, label=label, linewidth=linewidth, marker=marker, color=resolved_color)
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_multi_line(
         self,
         filename: str | Path,
@@ -472,7 +648,7 @@ class MatplotManager:
         defaults = PlotConfig(grid=True, legend=None, transparent=False)
         cfg = self._merge_cfg(cfg, defaults)
         with self._theme_context(cfg):
-            fig, ax = self._new_fig()
+            fig, ax = self._new_fig(reusable=True)
 
             if cfg and cfg.y_multi:
                 X = self._to_1d(cfg.x)
@@ -484,7 +660,7 @@ class MatplotManager:
                     labels = labels[:len(ys)]
                 colors = self._resolve_colors(len(ys), cfg)
                 for Y, lab, col in zip(ys, labels, colors, strict=False):
-                    x_i, y_i = self._coerce_xy(X, Y)
+                    x_i, y_i = self._downsample_xy(*self._coerce_xy(X, Y), cfg)
                     ax.plot(x_i, y_i, label=lab, linewidth=linewidth, marker=marker, color=col)
                 self._apply_x_ticks(ax, cfg)
                 return self._finish(fig, ax, self._resolve_path(filename), cfg)
@@ -498,7 +674,7 @@ class MatplotManager:
                 for idx, ((sx, sy, slabel), col) in enumerate(zip(ser, colors, strict=False)):
                     label = cfg_labels[idx] if idx < len(cfg_labels) else slabel
                     x_src = X_override if override_x else sx
-                    x_i, y_i = self._coerce_xy(x_src, sy)
+                    x_i, y_i = self._downsample_xy(*self._coerce_xy(x_src, sy), cfg)
                     ax.plot(x_i, y_i, label=label, linewidth=linewidth, marker=marker, color=col)
                 self._apply_x_ticks(ax, cfg)
                 return self._finish(fig, ax, self._resolve_path(filename), cfg)
@@ -507,6 +683,7 @@ class MatplotManager:
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_multi_line_from_cfg(self, filename: str | Path, *, cfg: PlotConfig | None = None) -> Path:
         """
         Plot multiple line series using only the provided PlotConfig.
@@ -528,13 +705,14 @@ class MatplotManager:
         colors = self._resolve_colors(len(ys), cfg)
 
         with self._theme_context(cfg):
-            fig, ax = self._new_fig()
+            fig, ax = self._new_fig(reusable=True)
             for Y, lab, col in zip(ys, labels, colors, strict=False):
-                x_i, y_i = self._coerce_xy(X, Y)
+                x_i, y_i = self._downsample_xy(*self._coerce_xy(X, Y), cfg)
                 ax.plot(x_i, y_i, label=lab, color=col)
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_constellation(
         self,
         filename: str | Path,
@@ -685,6 +863,7 @@ class MatplotManager:
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_scatter(
         self,
         filename: str | Path,
@@ -741,6 +920,7 @@ class MatplotManager:
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_bar(
         self,
         categories: Sequence[str | Number],
@@ -782,6 +962,7 @@ class MatplotManager:
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_histogram(
         self,
         data: ArrayLike,
@@ -847,6 +1028,7 @@ class MatplotManager:
                 pass
         return out_path
 
+    @_deferrable
     def plot_step(
         self,
         x: ArrayLike | None,
@@ -866,13 +1048,14 @@ class MatplotManager:
         """
         defaults = PlotConfig(grid=True, legend=None, transparent=False)
         cfg = self._merge_cfg(cfg, defaults)
-        x, y = self._coerce_xy(x if x is not None else cfg.x, y if y is not None else cfg.y)
+        xa, ya = self._downsample_xy(*self._coerce_xy(x if x is not None else cfg.x, y if y is not None else cfg.y), cfg)
         with self._theme_context(cfg):
             fig, ax = self._new_fig()
-        ax.step(x, y, where=where)
+        ax.step(xa, ya, where=where)
         self._apply_x_ticks(ax, cfg)
         return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_stem(
         self,
         x: ArrayLike | None,
@@ -899,6 +1082,7 @@ class MatplotManager:
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_errorbar(
         self,
         x: ArrayLike | None,
@@ -927,6 +1111,7 @@ class MatplotManager:
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def plot_area(
         self,
         x: ArrayLike | None,
@@ -947,18 +1132,24 @@ class MatplotManager:
         """
         defaults = PlotConfig(grid=True, legend=None, transparent=False)
         cfg = self._merge_cfg(cfg, defaults)
-        x, y = self._coerce_xy(x if x is not None else cfg.x, y if y is not None else cfg.y)
+        xa, ya = self._coerce_xy(x if x is not None else cfg.x, y if y is not None else cfg.y)
+        y2a = np.asarray(y2, dtype=float).ravel()[:ya.size] if y2 is not None else None
+        n = min(xa.size, ya.size, y2a.size) if y2a is not None else ya.size
+        xa, ya = xa[:n], ya[:n]
+        idx = self._downsample_index(xa, ya, cfg)
+        if idx is not None:
+            xa, ya = xa[idx], ya[idx]
+            y2a = y2a[idx] if y2a is not None else None
         with self._theme_context(cfg):
             fig, ax = self._new_fig()
-            if y2 is not None:
-                y2a = np.asarray(y2, dtype=float).ravel()[:len(y)]
-                n = min(len(x), len(y), len(y2a))
-                ax.fill_between(x[:n], y[:n], y2a[:n], alpha=0.3)
+            if y2a is not None:
+                ax.fill_between(xa, ya, y2a, alpha=0.3)
             else:
-                ax.fill_between(x, baseline, y, alpha=0.3)
+                ax.fill_between(xa, baseline, ya, alpha=0.3)
             self._apply_x_ticks(ax, cfg)
             return self._finish(fig, ax, self._resolve_path(filename), cfg)
 
+    @_deferrable
     def heatmap2d(
         self,
         Z: ArrayLike,
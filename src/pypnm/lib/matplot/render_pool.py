@@ -0,0 +1,204 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import shutil
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import replace
+from pathlib import Path
+from typing import ClassVar
+
+from pypnm.lib.matplot.manager import PlotRenderJob
+from pypnm.lib.types import PathLike
+
+__all__ = ["PLOT_RENDER_CACHE_DIR", "MatplotRenderPool", "PlotRenderCache"]
+
+PLOT_RENDER_CACHE_DIR: str = ".render-cache"
+
+
+def _render_job(job: PlotRenderJob) -> Path:
+    """Worker entry point: render one job, reusing line-plot figures across calls."""
+    return job.render(reuse_figures=True)
+
+
+class PlotRenderCache:
+    """
+    Content-addressed PNG cache keyed by :meth:`PlotRenderJob.cache_key`.
+
+    Parameters
+    ----------
+    cache_dir : PathLike
+        Directory holding cached ``<sha256>.png`` files.
+    max_entries : int
+        Oldest entries (by mtime) are evicted once this many PNGs are cached.
+    """
+
+    def __init__(self, cache_dir: PathLike, max_entries: int = 512) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.png"
+
+    def fetch(self, key: str, dest: Path) -> bool:
+        """Copy the cached PNG for ``key`` to ``dest``; return False on a miss."""
+        entry = self._entry(key)
+        if not entry.is_file():
+            return False
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(entry, dest)
+        entry.touch()
+        return True
+
+    def store(self, key: str, src: Path) -> None:
+        """Add a freshly rendered PNG to the cache and evict the oldest entries."""
+        try:
+            tmp = self._entry(key).with_suffix(f".{os.getpid()}.tmp")
+            shutil.copyfile(src, tmp)
+            tmp.replace(self._entry(key))
+        except OSError as e:
+            self.logger.warning("Unable to cache %s: %s", src, e)
+            return
+
+        entries = sorted(self.cache_dir.glob("*.png"), key=lambda p: p.stat().st_mtime)
+        for stale in entries[: max(0, len(entries) - self.max_entries)]:
+            stale.unlink(missing_ok=True)
+
+
+class MatplotRenderPool:
+    """
+    Render deferred :class:`PlotRenderJob` batches on a shared process pool.
+
+    Jobs whose content hash is already cached are copied instead of rendered;
+    the remainder fan out over a lazily created, process-wide
+    ``ProcessPoolExecutor`` (``forkserver`` start method where available so
+    server threads are never forked). Single jobs, ``max_workers=1`` or a
+    broken pool fall back to rendering inline.
+
+    Example:
+        with MatplotManager.deferred_rendering() as jobs:
+            report.create_matplot()
+        written = MatplotRenderPool.render(jobs, cache=PlotRenderCache(cache_dir))
+    """
+    PREVIEW_DPI: ClassVar[int]  = 72
+    MAX_WORKERS: ClassVar[int]  = max(1, min(4, os.cpu_count() or 1))
+
+    _executor: ClassVar[ProcessPoolExecutor | None] = None
+    _lock: ClassVar[threading.Lock]                 = threading.Lock()
+    _logger: ClassVar[logging.Logger]               = logging.getLogger("MatplotRenderPool")
+
+    @classmethod
+    def render(cls, jobs: Sequence[PlotRenderJob], *,
+               cache: PlotRenderCache | None = None,
+               preview: bool = False,
+               max_workers: int | None = None) -> list[Path]:
+        """
+        Render ``jobs`` and return the PNG paths that were written, in job order.
+
+        Parameters
+        ----------
+        jobs : Sequence[PlotRenderJob]
+            Jobs collected by :meth:`MatplotManager.deferred_rendering`.
+        cache : PlotRenderCache | None
+            Optional content-hash cache consulted before rendering.
+        preview : bool
+            Render at :attr:`PREVIEW_DPI` instead of each job's own dpi.
+        max_workers : int | None
+            Pool size; defaults to :attr:`MAX_WORKERS`. ``1`` renders inline.
+
+        Returns
+        -------
+        list[Path]
+            Paths of PNGs that exist after rendering; failed jobs are logged and omitted.
+        """
+        if preview:
+            jobs = [replace(job, dpi=min(job.dpi, cls.PREVIEW_DPI)) for job in jobs]
+
+        keys: list[str | None] = [job.cache_key() if cache else None for job in jobs]
+        done: dict[int, Path] = {}
+        pending: list[int] = []
+        for idx, (job, key) in enumerate(zip(jobs, keys, strict=True)):
+            if cache and key and cache.fetch(key, job.output):
+                cls._logger.debug("Plot cache hit: %s", job.output)
+                done[idx] = job.output
+            else:
+                pending.append(idx)
+
+        workers = max_workers or cls.MAX_WORKERS
+        if len(pending) > 1 and workers > 1:
+            rendered = cls._render_pooled([jobs[i] for i in pending], workers)
+        else:
+            rendered = [cls._render_inline(jobs[i]) for i in pending]
+
+        for idx, out in zip(pending, rendered, strict=True):
+            if out is None:
+                continue
+            done[idx] = out
+            key = keys[idx]
+            if cache and key:
+                cache.store(key, out)
+
+        return [done[i] for i in sorted(done)]
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """Stop the shared worker pool (a new one is created on next use)."""
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=True, cancel_futures=True)
+                cls._executor = None
+
+    @classmethod
+    def _render_inline(cls, job: PlotRenderJob) -> Path | None:
+        try:
+            return job.render(reuse_figures=True)
+        except Exception as e:
+            cls._logger.error("Failed to render %s (%s): %s", job.output, job.method, e)
+            return None
+
+    @classmethod
+    def _render_pooled(cls, jobs: list[PlotRenderJob], workers: int) -> list[Path | None]:
+        try:
+            executor = cls._get_executor(workers)
+            futures: list[Future[Path]] = [executor.submit(_render_job, job) for job in jobs]
+        except (BrokenProcessPool, OSError, RuntimeError) as e:
+            cls._logger.warning("Render pool unavailable, rendering inline: %s", e)
+            cls._discard_executor()
+            return [cls._render_inline(job) for job in jobs]
+
+        results: list[Path | None] = []
+        for job, fut in zip(jobs, futures, strict=True):
+            try:
+                results.append(fut.result())
+            except BrokenProcessPool:  # noqa: PERF203 - per-job fallback
+                cls._discard_executor()
+                results.append(cls._render_inline(job))
+            except Exception as e:
+                cls._logger.error("Failed to render %s (%s): %s", job.output, job.method, e)
+                results.append(None)
+        return results
+
+    @classmethod
+    def _get_executor(cls, workers: int) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                methods = multiprocessing.get_all_start_methods()
+                ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                cls._executor = ProcessPoolExecutor(max_workers=workers, mp_context=ctx)
+            return cls._executor
+
+    @classmethod
+    def _discard_executor(cls) -> None:
+        with cls._lock:
+            if cls._executor is not None:
+                cls._executor.shutdown(wait=False, cancel_futures=True)
+                cls._executor = None
@@ -1,12 +1,31 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
 import platform
+import re
 import socket
+import struct
 import subprocess
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Literal
+
+ProbeMethod = Literal["icmp", "subprocess", "none"]
+
+DEFAULT_PROBE_CONCURRENCY: int = 64
+
+ICMP_ECHO_REQUEST: int   = 8
+ICMP_ECHO_REPLY: int     = 0
+ICMPV6_ECHO_REQUEST: int = 128
+ICMPV6_ECHO_REPLY: int   = 129
+
+_RTT_PATTERN = re.compile(rb"time[=<]\s*([0-9]+(?:\.[0-9]+)?)\s*ms", re.IGNORECASE)
 
 
 class Ping:
@@ -36,12 +55,7 @@ class Ping:
         Returns:
         - bool: True if the host is reachable, False otherwise.
         """
-        system = platform.system().lower()
-
-        if system == "windows":
-            base_cmd = ["ping", "-n", str(count), "-w", str(timeout * 1000)]
-        else:
-            base_cmd = ["ping", "-c", str(count), "-W", str(timeout)]
+        base_cmd = Ping._command(timeout, count)
 
         targets: list[str] = []
 
@@ -80,6 +94,23 @@ class Ping:
 
         return False
 
+    @staticmethod
+    async def is_reachable_async(host: str, timeout: float = 1, count: int = 1) -> bool:
+        """
+        Non-blocking variant of :meth:`is_reachable` built on :class:`AsyncPinger`.
+        """
+        result = await AsyncPinger(timeout=timeout, count=count).probe(host)
+        return result.reachable
+
+    @staticmethod
+    def _command(timeout: float, count: int) -> list[str]:
+        """
+        Platform-specific ping argv prefix (the target address is appended).
+        """
+        if platform.system().lower() == "windows":
+            return ["ping", "-n", str(count), "-w", str(int(timeout * 1000))]
+        return ["ping", "-c", str(count), "-W", f"{timeout:g}"]
+
     @staticmethod
     def _is_ip_literal(value: str) -> bool:
         """
@@ -96,3 +127,257 @@ class Ping:
             return True
         except OSError:
             return False
+
+
+@dataclass(frozen=True)
+class PingResult:
+    """
+    Outcome of probing one host.
+
+    Attributes
+    ----------
+    host : str
+        Host as requested (IP literal or hostname).
+    address : str | None
+        Resolved address that was probed, or None when resolution failed.
+    sent, received : int
+        Echo requests sent and replies received.
+    rtts_ms : tuple[float, ...]
+        Round-trip time of each reply in milliseconds.
+    method : ProbeMethod
+        ``"icmp"`` for unprivileged ICMP sockets, ``"subprocess"`` for the
+        system ping binary, ``"none"`` when no probe could be made.
+    """
+    host: str
+    address: str | None
+    sent: int
+    received: int
+    rtts_ms: tuple[float, ...] = field(default_factory=tuple)
+    method: ProbeMethod = "none"
+
+    @property
+    def reachable(self) -> bool:
+        return self.received > 0
+
+    @property
+    def loss(self) -> float:
+        """Fraction of echo requests that went unanswered (1.0 if none were sent)."""
+        return 1.0 if self.sent <= 0 else 1.0 - min(self.received, self.sent) / self.sent
+
+    @property
+    def rtt_min_ms(self) -> float | None:
+        return min(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def rtt_avg_ms(self) -> float | None:
+        return sum(self.rtts_ms) / len(self.rtts_ms) if self.rtts_ms else None
+
+    @property
+    def rtt_max_ms(self) -> float | None:
+        return max(self.rtts_ms) if self.rtts_ms else None
+
+
+class _EchoProtocol(asyncio.DatagramProtocol):
+    """Collects ICMP datagrams of one probe socket into a queue."""
+
+    def __init__(self) -> None:
+        self.logger = logging.getLogger(f"{self.__class__.__name__}")
+        self.replies: asyncio.Queue[bytes] = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: tuple[str | int, ...]) -> None:
+        self.replies.put_nowait(data)
+
+    def error_received(self, exc: Exception) -> None:
+        self.logger.debug("[Ping] ICMP socket error: %s", exc)
+
+
+class AsyncPinger:
+    """
+    Asyncio reachability prober for many hosts at once.
+
+    Each address is probed over an unprivileged ICMP datagram socket
+    (``SOCK_DGRAM``/``IPPROTO_ICMP``) when the kernel permits it (Linux
+    ``net.ipv4.ping_group_range``, macOS). Otherwise the system ping binary
+    is run as an asyncio subprocess. Either way the event loop is never
+    blocked, and :meth:`probe_many` bounds the number of concurrent probes.
+
+    Parameters
+    ----------
+    timeout : float
+        Seconds to wait for each echo reply.
+    count : int
+        Echo requests per address.
+    interval : float
+        Pause between echo requests to the same address.
+    concurrency : int
+        Maximum hosts probed at once by :meth:`probe_many`.
+    use_icmp_socket : bool
+        Set False to always use the ping subprocess.
+    """
+
+    # address families whose ICMP datagram sockets were refused by the kernel
+    _icmp_denied: set[int] = set()
+
+    def __init__(self, *, timeout: float = 1.0, count: int = 1, interval: float = 0.0,
+                 concurrency: int = DEFAULT_PROBE_CONCURRENCY, use_icmp_socket: bool = True) -> None:
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.timeout = max(0.001, float(timeout))
+        self.count = max(1, int(count))
+        self.interval = max(0.0, float(interval))
+        self.concurrency = max(1, int(concurrency))
+        self.use_icmp_socket = use_icmp_socket
+
+    async def probe_many(self, hosts: Iterable[str]) -> dict[str, PingResult]:
+        """
+        Probe every host concurrently (at most ``concurrency`` at a time).
+
+        Returns results keyed by host, in first-seen order; duplicates are probed once.
+        """
+        unique = list(dict.fromkeys(hosts))
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def bounded(host: str) -> PingResult:
+            async with gate:
+                return await self.probe(host)
+
+        results = await asyncio.gather(*(bounded(h) for h in unique))
+        return dict(zip(unique, results, strict=True))
+
+    async def probe(self, host: str) -> PingResult:
+        """
+        Probe one host, trying each resolved address until one answers.
+        """
+        addresses = await self._resolve(host)
+        if not addresses:
+            return PingResult(host=host, address=None, sent=0, received=0)
+
+        result = PingResult(host=host, address=None, sent=0, received=0)
+        for family, address in addresses:
+            result = await self._probe_address(host, family, address)
+            if result.reachable:
+                break
+        return result
+
+    async def _resolve(self, host: str) -> list[tuple[int, str]]:
+        if Ping._is_ip_literal(host):
+            return [(socket.AF_INET6 if ":" in host else socket.AF_INET, host)]
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, None)
+        except OSError as exc:
+            self.logger.error("[Ping Error] DNS lookup failed for %s: %s", host, exc)
+            return []
+        out: list[tuple[int, str]] = []
+        for family, _socktype, _proto, _canonname, sockaddr in infos:
+            entry = (int(family), str(sockaddr[0]))
+            if family in (socket.AF_INET, socket.AF_INET6) and entry not in out:
+                out.append(entry)
+        return out
+
+    async def _probe_address(self, host: str, family: int, address: str) -> PingResult:
+        if self.use_icmp_socket and family not in self._icmp_denied:
+            sock = self._open_icmp_socket(family)
+            if sock is not None:
+                return await self._probe_icmp(host, family, address, sock)
+        return await self._probe_subprocess(host, address)
+
+    def _open_icmp_socket(self, family: int) -> socket.socket | None:
+        proto = socket.IPPROTO_ICMPV6 if family == socket.AF_INET6 else socket.IPPROTO_ICMP
+        try:
+            sock = socket.socket(family, socket.SOCK_DGRAM, proto)
+        except OSError as exc:
+            self.logger.debug("ICMP datagram sockets unavailable (family %s): %s; using ping subprocess", family, exc)
+            self._icmp_denied.add(family)
+            return None
+        sock.setblocking(False)
+        return sock
+
+    async def _probe_icmp(self, host: str, family: int, address: str, sock: socket.socket) -> PingResult:
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(_EchoProtocol, sock=sock)
+        token = os.urandom(8)
+        rtts: list[float] = []
+        try:
+            for seq in range(1, self.count + 1):
+                start = time.perf_counter()
+                try:
+                    transport.sendto(_echo_request(family, seq, token), (address, 0))
+                except OSError as exc:
+                    self.logger.debug("[Ping] send to %s failed: %s", address, exc)
+                else:
+                    rtt = await self._await_reply(protocol, family, seq, token, start)
+                    if rtt is not None:
+                        rtts.append(rtt)
+                if self.interval and seq < self.count:
+                    await asyncio.sleep(self.interval)
+        finally:
+            transport.close()
+        return PingResult(host=host, address=address, sent=self.count, received=len(rtts),
+                          rtts_ms=tuple(rtts), method="icmp")
+
+    async def _await_reply(self, protocol: _EchoProtocol, family: int, seq: int, token: bytes,
+                           start: float) -> float | None:
+        deadline = start + self.timeout
+        while (remaining := deadline - time.perf_counter()) > 0:
+            try:
+                data = await asyncio.wait_for(protocol.replies.get(), remaining)
+            except asyncio.TimeoutError:
+                return None
+            if _is_echo_reply(family, data, seq, token):
+                return (time.perf_counter() - start) * 1000.0
+        return None
+
+    async def _probe_subprocess(self, host: str, address: str) -> PingResult:
+        cmd = Ping._command(self.timeout, self.count) + [address]
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL)
+        except FileNotFoundError as exc:
+            self.logger.error("[Ping Error] ping command not found: %s", exc)
+            return PingResult(host=host, address=address, sent=0, received=0)
+        except OSError as exc:
+            self.logger.error("[Ping Error] %s", exc)
+            return PingResult(host=host, address=address, sent=0, received=0)
+
+        budget = self.count * (self.timeout + self.interval) + 1.0
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), budget)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            stdout = b""
+
+        rtts = tuple(float(m) for m in _RTT_PATTERN.findall(stdout or b""))
+        received = len(rtts) if rtts else (self.count if proc.returncode == 0 else 0)
+        return PingResult(host=host, address=address, sent=self.count, received=min(received, self.count),
+                          rtts_ms=rtts, method="subprocess")
+
+
+def _checksum(data: bytes) -> int:
+    if len(data) % 2:
+        data += b"\x00"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(family: int, seq: int, token: bytes) -> bytes:
+    """
+    Build an echo request. The identifier is left 0 because ping sockets
+    replace it with the socket's port; IPv6 checksums are filled in by the kernel.
+    """
+    if family == socket.AF_INET6:
+        return struct.pack("!BBHHH", ICMPV6_ECHO_REQUEST, 0, 0, 0, seq) + token
+    header = struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, 0, 0, seq)
+    return struct.pack("!BBHHH", ICMP_ECHO_REQUEST, 0, _checksum(header + token), 0, seq) + token
+
+
+def _is_echo_reply(family: int, data: bytes, seq: int, token: bytes) -> bool:
+    if family == socket.AF_INET and data and data[0] >> 4 == 4:
+        # BSD/macOS ping sockets deliver the IPv4 header too
+        data = data[(data[0] & 0x0F) * 4:]
+    if len(data) < 8 + len(token):
+        return False
+    icmp_type, _code, _csum, _ident, reply_seq = struct.unpack("!BBHHH", data[:8])
+    expected = ICMPV6_ECHO_REPLY if family == socket.AF_INET6 else ICMP_ECHO_REPLY
+    return icmp_type == expected and reply_seq == seq and data[8:8 + len(token)] == token
@@ -1,14 +1,17 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from typing import Literal, cast
 
 import numpy as np
 
 from pypnm.lib.qam.code_generator.auto_gen_qam_lut import QamScale
+from pypnm.lib.qam.order_classifier import QamOrderClassifier, QamOrderEstimate
 from pypnm.lib.qam.qam_lut import QAM_SYMBOL_CODEWORD_LUT
+from pypnm.lib.qam.slicer import QamSlicer, QamSliceResult, SoftDecisionInput
 from pypnm.lib.qam.types import (
     CodeWord,
     HardDecisionArray,
@@ -28,6 +31,7 @@ class QamLutManager:
       - Codeword→symbol and symbol→codeword mappings.
       - A per-modulation normalization scale factor.
       - Soft-decision scaling helpers.
+      - Array-native slicing with per-capture MER/EVM (:meth:`slice_soft_decisions`).
       - A simple heuristic to infer the likely modulation order from samples.
 
     Attributes
@@ -50,6 +54,7 @@ class QamLutManager:
         copy or mutate the LUT.
         """
         self.qam_lut: LutDict = QAM_SYMBOL_CODEWORD_LUT
+        self._slicers: dict[str, tuple[object, QamSlicer]] = {}
 
     def _lut_key(self, qam_mod: QamModulation) -> str:
         """
@@ -202,13 +207,47 @@ class QamLutManager:
         """
         if not soft:
             return []
-        raw_scale = float(self.get_scale_factor(qam_mod))
-        scale = (1.0 / raw_scale) if raw_scale > 1.0 else raw_scale
         a = np.asarray(soft, dtype=np.float64)
         if a.ndim != 2 or a.shape[1] != 2:
             raise ValueError(f"soft must be a sequence of (I, Q) pairs; got shape {a.shape}")
-        a = a * scale
-        return [(float(re), float(im)) for re, im in a]
+        a = a * self._soft_scale(qam_mod)
+        return list(zip(a[:, 0].tolist(), a[:, 1].tolist(), strict=True))
+
+    def slice_soft_decisions(
+        self,
+        qam_mod: QamModulation,
+        soft: SoftDecisionInput,
+        *,
+        rescale: bool = False,
+    ) -> QamSliceResult:
+        """
+        Slice a capture of soft decisions against the modulation's constellation.
+
+        Parameters
+        ----------
+        qam_mod : QamModulation
+            Modulation order enum.
+        soft : SoftDecisionInput
+            ``(N, 2)`` I/Q array/sequence or complex vector.
+        rescale : bool, default False
+            Apply the LUT scale factor first (same convention as
+            :meth:`scale_soft_decisions`) when samples are not yet normalized.
+
+        Returns
+        -------
+        QamSliceResult
+            Per-sample point indices, codewords, hard decisions and error
+            vectors, plus aggregate MER (dB) and EVM (%).
+
+        Raises
+        ------
+        ValueError
+            If the LUT entry is missing/malformed or ``soft`` has the wrong shape.
+        """
+        z = QamSlicer.as_complex(soft)
+        if rescale and z.size:
+            z = z * self._soft_scale(qam_mod)
+        return self._slicer(qam_mod).slice(z)
 
     def get_symbol_codeword(
         self, qam_mod: QamModulation, symbol: tuple[float, float]
@@ -235,40 +274,28 @@ class QamLutManager:
 
         Notes
         -----
-        The method first tries an exact match. If none is found, it searches the
-        nearest neighbor in Euclidean distance and accepts it when within a small
-        tolerance derived from the mean step between unique axis levels.
+        The nearest LUT point is found with the cached :class:`QamSlicer` and
+        accepted when within a small tolerance derived from the mean step between
+        unique axis levels (exact hits have distance zero).
         """
         key = self._lut_key(qam_mod)
         entry = self.qam_lut.get(key)
         if not entry or "code_words" not in entry:
             raise ValueError(f"No LUT 'code_words' found for {qam_mod.name}")
 
-        lut = entry["code_words"]
-        if not lut:
+        if not entry["code_words"]:
             return None
 
-        i_in, q_in = float(symbol[0]), float(symbol[1])
-        for codeword, (i_ref, q_ref) in lut.items():
-            if i_in == i_ref and q_in == q_ref:
-                return codeword
-
-        ref_points = np.array(list(lut.values()), dtype=np.float64)
-        code_keys = np.array(list(lut.keys()), dtype=np.int32)
-        deltas = ref_points - np.array([i_in, q_in])
-        dist_sq = np.sum(deltas**2, axis=1)
-        nearest_idx = int(np.argmin(dist_sq))
-        min_dist = float(np.sqrt(dist_sq[nearest_idx]))
-
-        flat = np.unique(ref_points.flatten())
-        if flat.size >= 2:
-            spacing = np.mean(np.diff(flat))
-            tol = spacing * 0.05
-        else:
-            tol = 0.0
+        slicer = self._slicer(qam_mod)
+        z = complex(float(symbol[0]), float(symbol[1]))
+        nearest_idx = int(slicer.nearest(np.array([z]))[0])
+        min_dist = abs(z - slicer.points[nearest_idx])
+
+        flat = np.unique(np.concatenate((slicer.points.real, slicer.points.imag)))
+        tol = float(np.mean(np.diff(flat))) * 0.05 if flat.size >= 2 else 0.0
 
         if min_dist <= tol:
-            return int(code_keys[nearest_idx])
+            return int(slicer.codewords[nearest_idx])
         return None
 
     def infer_modulation_order(
@@ -297,54 +324,68 @@ class QamLutManager:
         This is a coarse heuristic:
           1) Normalize samples by mean radius.
           2) Snap to a coarse grid (`threshold` step).
-          3) Count unique positions as clusters.
+          3) Count occupied grid cells as clusters.
           4) Choose the order with cluster count nearest to a known size.
 
-        If the relative error exceeds 25%, the method returns UNKNOWN.
+        If the relative error exceeds 25%, the method returns UNKNOWN. See
+        :meth:`infer_modulation_orders` for the batch form with confidences.
         """
-        if not samples:
+        if not len(samples):
             return QamModulation.UNKNOWN
+        return self.infer_modulation_orders([samples], threshold=threshold)[0].modulation
 
-        pts = np.asarray(samples, dtype=np.float64)
-        if pts.ndim != 2 or pts.shape[1] != 2:
-            return QamModulation.UNKNOWN
+    def infer_modulation_orders(
+        self,
+        captures: Sequence[SoftDecisionInput],
+        threshold: float = 0.15,
+        *,
+        early_exit: bool = True,
+    ) -> list[QamOrderEstimate]:
+        """
+        Infer the QAM order of many captures in one occupancy-histogram pass.
 
-        norms = np.sqrt(np.sum(pts**2, axis=1))
-        m = float(np.mean(norms)) if norms.size else 0.0
-        if not np.isfinite(m) or m <= 0.0:
-            return QamModulation.UNKNOWN
-        pts = pts / m
-
-        grid = np.round(pts / threshold) * threshold
-        unique_clusters = int(len(np.unique(grid, axis=0)))
-
-        mapping = {
-            2:      QamModulation.QAM_2,
-            4:      QamModulation.QAM_4,
-            8:      QamModulation.QAM_8,
-            16:     QamModulation.QAM_16,
-            32:     QamModulation.QAM_32,
-            64:     QamModulation.QAM_64,
-            128:    QamModulation.QAM_128,
-            256:    QamModulation.QAM_256,
-            512:    QamModulation.QAM_512,
-            1024:   QamModulation.QAM_1024,
-            2048:   QamModulation.QAM_2048,
-            4096:   QamModulation.QAM_4096,
-            8192:   QamModulation.QAM_8192,
-            16384:  QamModulation.QAM_16384,
-            32768:  QamModulation.QAM_32768,
-            65536:  QamModulation.QAM_65536,
-        }
-
-        closest_order, est_mod = min(
-            mapping.items(), key=lambda kv: abs(unique_clusters - kv[0])
-        )
-
-        diff_ratio = abs(unique_clusters - closest_order) / float(closest_order)
-        if diff_ratio > 0.25:
-            return QamModulation.UNKNOWN
-        return est_mod
+        Parameters
+        ----------
+        captures : Sequence[SoftDecisionInput]
+            One entry per capture: ``(N, 2)`` I/Q pairs or a complex vector.
+        threshold : float, default 0.15
+            Grid step, as in :meth:`infer_modulation_order`.
+        early_exit : bool, default True
+            Stop consuming a capture once its cluster count saturates on a
+            clear winner (see :class:`QamOrderClassifier`).
+
+        Returns
+        -------
+        list[QamOrderEstimate]
+            Order, confidence, cluster count and samples used per capture.
+        """
+        return QamOrderClassifier(threshold, early_exit=early_exit).classify(captures)
+
+    def _soft_scale(self, qam_mod: QamModulation) -> float:
+        raw_scale = float(self.get_scale_factor(qam_mod))
+        return (1.0 / raw_scale) if raw_scale > 1.0 else raw_scale
+
+    def _slicer(self, qam_mod: QamModulation) -> QamSlicer:
+        """
+        Return the array-form slicer for a modulation, built once per LUT entry.
+
+        The cache is keyed by the identity of the ``code_words`` mapping so a
+        replaced ``qam_lut`` (or entry) is picked up on the next call.
+        """
+        key = self._lut_key(qam_mod)
+        entry = self.qam_lut.get(key)
+        if not entry or not entry.get("code_words"):
+            raise ValueError(f"Missing 'code_words' LUT for {qam_mod.name}")
+
+        lut = entry["code_words"]
+        cached = self._slicers.get(key)
+        if cached is not None and cached[0] is lut:
+            return cached[1]
+
+        ref = np.asarray(list(lut.values()), dtype=np.float64).reshape(-1, 2)
+        slicer = QamSlicer(ref[:, 0] + 1j * ref[:, 1], np.fromiter(lut.keys(), dtype=np.int64, count=len(lut)))
+        self._slicers[key] = (lut, slicer)
+        return slicer
 
     @staticmethod
     def _infer_bits_per_symbol(keys_sorted: list[int]) -> int:
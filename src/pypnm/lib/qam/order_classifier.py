@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import ClassVar
+
+import numpy as np
+
+from pypnm.lib.qam.slicer import SoftDecisionInput
+from pypnm.lib.qam.types import QamModulation
+from pypnm.lib.types import NDArrayF64, NDArrayI64
+
+__all__ = ["QamOrderClassifier", "QamOrderEstimate"]
+
+
+@dataclass(frozen=True)
+class QamOrderEstimate:
+    """
+    Modulation-order estimate for one constellation capture.
+
+    Attributes
+    ----------
+    modulation : QamModulation
+        Closest standard order, or UNKNOWN when no order is within tolerance.
+    confidence : float
+        ``1 - relative_error / max_relative_error`` for the winning order,
+        clamped to ``[0, 1]``; 0.0 for UNKNOWN.
+    clusters : int
+        Occupied grid cells counted when the decision was made.
+    samples_used : int
+        Samples consumed before the decision (less than the capture length on early exit).
+    """
+    modulation: QamModulation
+    confidence: float
+    clusters: int
+    samples_used: int
+
+
+class QamOrderClassifier:
+    """
+    Occupancy-histogram QAM order classifier for batches of captures.
+
+    Each capture is normalized by its mean radius and snapped to a square grid
+    of ``threshold`` pitch; the number of occupied cells is the cluster count,
+    scored against every standard order at once. All captures of a batch
+    share one flat occupancy array (each capture owns a contiguous block of
+    cells), so a sweep over many channels is a handful of array passes rather
+    than a sort per capture.
+
+    Samples are consumed in doubling rounds starting at :attr:`FIRST_ROUND`.
+    A capture stops early once :attr:`QUIET_ROUNDS` consecutive rounds add no
+    new cells and its best order is within :attr:`EARLY_EXIT_ERROR` relative
+    error, i.e. the constellation has saturated and one candidate clearly wins.
+    Rare boundary-straddling samples later in the capture are then not
+    counted; pass ``early_exit=False`` for the exact full-capture count.
+
+    Parameters
+    ----------
+    threshold : float
+        Grid step in normalized units (same meaning as in
+        :meth:`QamLutManager.infer_modulation_order`).
+    max_relative_error : float
+        Estimates whose cluster count is further than this from the nearest
+        order are reported as UNKNOWN.
+    early_exit : bool
+        Disable to always consume every sample.
+    """
+    ORDERS: ClassVar[NDArrayI64] = np.array(
+        [m.value for m in QamModulation if m is not QamModulation.UNKNOWN], dtype=np.int64)
+    FIRST_ROUND: ClassVar[int]          = 1024
+    EARLY_EXIT_ERROR: ClassVar[float]   = 0.05
+    QUIET_ROUNDS: ClassVar[int]         = 2
+    MAX_CELLS_PER_SAMPLE: ClassVar[int] = 16
+
+    def __init__(self, threshold: float = 0.15, *, max_relative_error: float = 0.25,
+                 early_exit: bool = True) -> None:
+        if threshold <= 0.0:
+            raise ValueError("threshold must be positive")
+        self.threshold = float(threshold)
+        self.max_relative_error = float(max_relative_error)
+        self.early_exit = early_exit
+
+    def classify(self, captures: Sequence[SoftDecisionInput]) -> list[QamOrderEstimate]:
+        """
+        Estimate the modulation order of each capture.
+
+        Parameters
+        ----------
+        captures : Sequence[SoftDecisionInput]
+            Captures as ``(N, 2)`` I/Q arrays/sequences or complex vectors.
+
+        Returns
+        -------
+        list[QamOrderEstimate]
+            One estimate per capture, in input order. Empty, malformed or
+            zero-power captures yield UNKNOWN with zero confidence.
+        """
+        unknown = QamOrderEstimate(QamModulation.UNKNOWN, 0.0, 0, 0)
+        estimates: list[QamOrderEstimate] = [unknown] * len(captures)
+
+        grids: list[tuple[int, NDArrayI64]] = []
+        for i, capture in enumerate(captures):
+            cells = self._grid_cells(capture)
+            if cells is not None:
+                grids.append((i, cells))
+        if not grids:
+            return estimates
+
+        owners = np.array([i for i, _ in grids], dtype=np.int64)
+        lengths = np.array([c.size for _, c in grids], dtype=np.int64)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        spans = np.array([int(c.max()) + 1 for _, c in grids], dtype=np.int64)
+        cell_base = np.concatenate(([0], np.cumsum(spans)[:-1]))
+        codes = np.concatenate([c + base for (_, c), base in zip(grids, cell_base, strict=True)])
+
+        n_cells = int(spans.sum())
+        if n_cells > self.MAX_CELLS_PER_SAMPLE * codes.size:
+            clusters, used = self._count_sorted(codes, cell_base, n_cells), lengths
+        else:
+            clusters, used = self._count_rounds(codes, lengths, starts, cell_base, n_cells)
+
+        for owner, count, n in zip(owners.tolist(), clusters.tolist(), used.tolist(), strict=True):
+            estimates[owner] = self._score(int(count), int(n))
+        return estimates
+
+    def _grid_cells(self, capture: SoftDecisionInput) -> NDArrayI64 | None:
+        """Return per-sample flat cell indices (0-based, capture-local), or None if unusable."""
+        pts = np.asarray(capture)
+        if pts.size == 0:
+            return None
+        if np.iscomplexobj(pts):
+            pts = np.column_stack((pts.real.ravel(), pts.imag.ravel()))
+        pts = pts.astype(np.float64, copy=False)
+        if pts.ndim != 2 or pts.shape[1] != 2:
+            return None
+
+        m = float(np.mean(np.hypot(pts[:, 0], pts[:, 1])))
+        if not np.isfinite(m) or m <= 0.0:
+            return None
+
+        grid: NDArrayF64 = np.rint(pts / (m * self.threshold))
+        ix = grid[:, 0].astype(np.int64)
+        iy = grid[:, 1].astype(np.int64)
+        ix -= ix.min()
+        iy -= iy.min()
+        return ix * (int(iy.max()) + 1) + iy
+
+    def _count_rounds(self, codes: NDArrayI64, lengths: NDArrayI64, starts: NDArrayI64,
+                      cell_base: NDArrayI64, n_cells: int) -> tuple[NDArrayI64, NDArrayI64]:
+        occupied = np.zeros(n_cells, dtype=bool)
+        n_caps = lengths.size
+        clusters = np.zeros(n_caps, dtype=np.int64)
+        used = np.zeros(n_caps, dtype=np.int64)
+        active = np.ones(n_caps, dtype=bool)
+        quiet = np.zeros(n_caps, dtype=np.int64)
+
+        # Each capture's cells occupy [cell_base[c], cell_base[c+1]); searchsorted recovers the owner.
+        lo, hi = 0, self.FIRST_ROUND if self.early_exit else int(lengths.max())
+        while active.any():
+            caps = np.flatnonzero(active & (lengths > lo))
+            if caps.size == 0:
+                break
+            take = np.minimum(lengths[caps], hi) - lo
+            idx = np.repeat(starts[caps] + lo - np.cumsum(np.concatenate(([0], take[:-1]))), take) + np.arange(int(take.sum()))
+            round_codes = codes[idx]
+
+            fresh = np.unique(round_codes[~occupied[round_codes]])
+            occupied[fresh] = True
+            added = np.bincount(np.searchsorted(cell_base, fresh, side="right") - 1, minlength=n_caps)
+            clusters += added
+            used[caps] += take
+
+            if self.early_exit:
+                quiet[caps] = np.where(added[caps] == 0, quiet[caps] + 1, 0)
+                err = self._relative_error(clusters[caps])
+                settled = (quiet[caps] >= self.QUIET_ROUNDS) & (err <= self.EARLY_EXIT_ERROR)
+                active[caps[settled]] = False
+            active[caps[lengths[caps] <= hi]] = False
+            lo, hi = hi, hi * 2
+
+        return clusters, used
+
+    @staticmethod
+    def _count_sorted(codes: NDArrayI64, cell_base: NDArrayI64, n_cells: int) -> NDArrayI64:
+        """Sparse fallback for captures with far outliers: count distinct codes per capture block."""
+        distinct = np.unique(codes)
+        return np.diff(np.searchsorted(distinct, np.append(cell_base, n_cells)))
+
+    def _relative_error(self, clusters: NDArrayI64) -> NDArrayF64:
+        best = self.ORDERS[np.argmin(np.abs(clusters[:, None] - self.ORDERS[None, :]), axis=1)]
+        return np.abs(clusters - best) / best
+
+    def _score(self, clusters: int, samples_used: int) -> QamOrderEstimate:
+        diff = np.abs(clusters - self.ORDERS)
+        best = int(self.ORDERS[int(np.argmin(diff))])
+        ratio = abs(clusters - best) / float(best)
+        if ratio > self.max_relative_error:
+            return QamOrderEstimate(QamModulation.UNKNOWN, 0.0, clusters, samples_used)
+        confidence = 1.0 - ratio / self.max_relative_error if self.max_relative_error > 0 else 1.0
+        return QamOrderEstimate(QamModulation(best), float(confidence), clusters, samples_used)
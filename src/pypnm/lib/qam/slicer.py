@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from pypnm.lib.types import NDArrayC128, NDArrayF64, NDArrayI64
+
+__all__ = ["QamSliceResult", "QamSlicer"]
+
+SoftDecisionInput = NDArrayF64 | NDArrayC128 | Sequence[tuple[float, float]] | Sequence[complex]
+
+
+@dataclass(frozen=True)
+class QamSliceResult:
+    """
+    Hard decisions and error statistics for one batch of soft decisions.
+
+    Attributes
+    ----------
+    indices : NDArrayI64
+        Index of the decided constellation point per sample (into the slicer's point array).
+    codewords : NDArrayI64
+        Codeword of the decided point per sample.
+    hard : NDArrayC128
+        Decided constellation point per sample.
+    error : NDArrayC128
+        Error vector ``soft - hard`` per sample.
+    mer_db : float
+        Modulation error ratio, ``10·log10(Es / mean|e|²)`` with ``Es`` the average
+        constellation energy; ``inf`` for error-free input, ``nan`` for no samples.
+    evm_percent : float
+        RMS error vector magnitude relative to ``sqrt(Es)``, in percent.
+    """
+    indices: NDArrayI64
+    codewords: NDArrayI64
+    hard: NDArrayC128
+    error: NDArrayC128
+    mer_db: float
+    evm_percent: float
+
+
+class QamSlicer:
+    """
+    O(N) nearest-point slicer for a QAM constellation.
+
+    Every QAM constellation in the LUT (square and cross/rectangular orders)
+    sits on a rectangular lattice, so slicing is grid quantization: each soft
+    sample is rounded to its lattice cell, which maps through a precomputed
+    ``(rows, cols)`` table to a constellation index. For square QAM every cell
+    is populated and the result is exact nearest-point; for cross QAM the few
+    samples that land on unpopulated corner cells are resolved exactly against
+    the constellation's edge points. Point sets that are not on a lattice fall
+    back to a chunked brute-force search.
+
+    Parameters
+    ----------
+    points : NDArrayC128
+        Constellation points (complex), one per codeword.
+    codewords : NDArrayI64
+        Codeword for each entry of ``points``.
+    """
+    CHUNK: int = 4096
+
+    def __init__(self, points: NDArrayC128, codewords: NDArrayI64) -> None:
+        self.points: NDArrayC128    = np.asarray(points, dtype=np.complex128).ravel()
+        self.codewords: NDArrayI64  = np.asarray(codewords, dtype=np.int64).ravel()
+        if self.points.size == 0 or self.points.size != self.codewords.size:
+            raise ValueError("points and codewords must be non-empty and of equal length")
+
+        self.energy: float = float(np.mean(np.abs(self.points) ** 2))
+        self._lattice = self._build_lattice(self.points)
+
+    @classmethod
+    def as_complex(cls, soft: SoftDecisionInput) -> NDArrayC128:
+        """
+        Coerce ``(N, 2)`` I/Q pairs or a complex sequence into a complex128 vector.
+
+        Raises
+        ------
+        ValueError
+            If the input is neither complex nor shaped ``(N, 2)``.
+        """
+        a = np.asarray(soft)
+        if a.size == 0:
+            return np.empty(0, dtype=np.complex128)
+        if np.iscomplexobj(a):
+            return a.astype(np.complex128, copy=False).ravel()
+        a = a.astype(np.float64, copy=False)
+        if a.ndim != 2 or a.shape[1] != 2:
+            raise ValueError(f"soft must be complex or a sequence of (I, Q) pairs; got shape {a.shape}")
+        return a[:, 0] + 1j * a[:, 1]
+
+    def nearest(self, soft: SoftDecisionInput) -> NDArrayI64:
+        """Return the index of the nearest constellation point for each sample."""
+        z = self.as_complex(soft)
+        if z.size == 0:
+            return np.empty(0, dtype=np.int64)
+        if self._lattice is None:
+            return self._nearest_brute(z, np.arange(self.points.size))
+
+        origin, step, table, edge = self._lattice
+        rows, cols = table.shape
+        ci = np.clip(np.rint((z.real - origin.real) / step.real), 0, cols - 1).astype(np.intp)
+        ri = np.clip(np.rint((z.imag - origin.imag) / step.imag), 0, rows - 1).astype(np.intp)
+        idx = table[ri, ci].astype(np.int64)
+
+        holes = idx < 0
+        if holes.any():
+            idx[holes] = self._nearest_brute(z[holes], edge)
+        return idx
+
+    def slice(self, soft: SoftDecisionInput) -> QamSliceResult:
+        """Slice ``soft`` and compute error vectors plus aggregate MER/EVM."""
+        z = self.as_complex(soft)
+        idx = self.nearest(z)
+        hard = self.points[idx]
+        err = z - hard
+
+        if z.size == 0:
+            mer_db, evm = math.nan, math.nan
+        else:
+            err_power = float(np.mean(err.real ** 2 + err.imag ** 2))
+            mer_db = math.inf if err_power == 0.0 else 10.0 * math.log10(self.energy / err_power)
+            evm = 100.0 * math.sqrt(err_power / self.energy)
+
+        return QamSliceResult(
+            indices     = idx,
+            codewords   = self.codewords[idx],
+            hard        = hard,
+            error       = err,
+            mer_db      = mer_db,
+            evm_percent = evm,
+        )
+
+    def _nearest_brute(self, z: NDArrayC128, candidates: NDArrayI64) -> NDArrayI64:
+        ref = self.points[candidates]
+        out = np.empty(z.size, dtype=np.int64)
+        for start in range(0, z.size, self.CHUNK):
+            block = z[start:start + self.CHUNK]
+            d = np.abs(block[:, None] - ref[None, :])
+            out[start:start + self.CHUNK] = candidates[np.argmin(d, axis=1)]
+        return out
+
+    @staticmethod
+    def _axis_lattice(values: NDArrayF64) -> tuple[float, float, NDArrayI64] | None:
+        """Return (origin, step, integer cell per value) when values lie on a uniform grid."""
+        levels = np.unique(values)
+        if levels.size == 1:
+            return float(levels[0]), 1.0, np.zeros(values.size, dtype=np.int64)
+
+        step = float(np.min(np.diff(levels)))
+        origin = float(levels[0])
+        k = (values - origin) / step
+        cells = np.rint(k)
+        if step <= 0.0 or not np.allclose(k, cells, rtol=0.0, atol=1e-6):
+            return None
+        return origin, step, cells.astype(np.int64)
+
+    @classmethod
+    def _build_lattice(cls, points: NDArrayC128) -> tuple[complex, complex, NDArrayI64, NDArrayI64] | None:
+        re_axis = cls._axis_lattice(points.real)
+        im_axis = cls._axis_lattice(points.imag)
+        if re_axis is None or im_axis is None:
+            return None
+
+        re0, re_step, cols_of = re_axis
+        im0, im_step, rows_of = im_axis
+        table = np.full((int(rows_of.max()) + 1, int(cols_of.max()) + 1), -1, dtype=np.int64)
+        if table.size > 64 * points.size:
+            return None
+        table[rows_of, cols_of] = np.arange(points.size)
+
+        # Unpopulated cells (cross-QAM corners, sparse orders) resolve against the
+        # points bordering a hole or the lattice edge; only those can be nearest there.
+        padded = np.pad(table >= 0, 1, constant_values=False)
+        interior = padded[:-2, 1:-1] & padded[2:, 1:-1] & padded[1:-1, :-2] & padded[1:-1, 2:]
+        edge = table[(table >= 0) & ~interior]
+
+        return complex(re0, im0), complex(re_step, im_step), table, edge
@@ -1,11 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import numpy as np
 
-from pypnm.lib.types import FloatSeries
+from pypnm.lib.types import ArrayLikeF64, FloatSeries
 
 Number = int | float
 class MovingAverage:
@@ -92,10 +92,29 @@ class MovingAverage:
         # Handle empty quickly
         if not values:
             return []
+        return self.apply_array(values).tolist()
 
-        arr = np.asarray(values, dtype=self.dtype)
-        finite_mask = np.isfinite(arr).astype(self.dtype)
-        vals = np.where(np.isfinite(arr), arr, 0.0).astype(self.dtype)
+    def apply_array(self, values: ArrayLikeF64) -> np.ndarray:
+        """
+        Apply the moving average to an array without converting to a list.
+
+        Parameters
+        ----------
+        values : ArrayLikeF64
+            1-D input; converted to ``self.dtype`` (no copy if it already matches).
+
+        Returns
+        -------
+        np.ndarray
+            Smoothed values in ``self.dtype``, same length as input.
+        """
+        arr = np.asarray(values, dtype=self.dtype).ravel()
+        if arr.size == 0:
+            return arr
+
+        finite = np.isfinite(arr)
+        finite_mask = finite.astype(self.dtype)
+        vals = np.where(finite, arr, 0.0).astype(self.dtype, copy=False)
 
         if self.mode == "reflect":
             # Reflect-pad values and mask, then 'valid' convolution to return same length
@@ -111,8 +130,7 @@ class MovingAverage:
             den = np.convolve(finite_mask, self._kernel, mode="same")
 
         # Avoid division by zero; where den==0, output 0.0
-        out = np.divide(num, den, out=np.zeros_like(num), where=den > 0)
-        return out.tolist()
+        return np.divide(num, den, out=np.zeros_like(num), where=den > 0)
 
     def __call__(self, values: FloatSeries) -> FloatSeries:
         """Alias for :meth:`apply`."""
@@ -0,0 +1,171 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Final
+
+import numpy as np
+
+from pypnm.lib.types import NDArrayF64, NDArrayI64, StringEnum
+
+__all__: Final = [
+    "DEFAULT_DOWNSAMPLE_POINTS",
+    "MIN_DOWNSAMPLE_POINTS",
+    "DownsampleMethod",
+    "SeriesDownsampler",
+    "lttb_indices",
+    "min_max_indices",
+]
+
+DEFAULT_DOWNSAMPLE_POINTS: Final[int] = 1000
+MIN_DOWNSAMPLE_POINTS: Final[int] = 4
+
+SeriesInput = Sequence[float] | NDArrayF64
+
+
+class DownsampleMethod(StringEnum):
+    """Point-reduction algorithm for frequency/value series."""
+    NONE    = "none"
+    LTTB    = "lttb"
+    MIN_MAX = "min_max"
+
+
+def lttb_indices(x: SeriesInput, y: SeriesInput, n_out: int) -> NDArrayI64:
+    """
+    Indices of the points kept by Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept; the interior is split into
+    ``n_out - 2`` equal buckets and each bucket keeps the point forming the
+    largest triangle with the point kept in the previous bucket and the mean
+    of the next bucket, which preserves peaks and notches of the shape.
+
+    Bucket bounds and next-bucket means are computed in one pass from
+    cumulative sums; only the dependency on the previously kept point is
+    iterated, once per output point, with the area of the whole bucket
+    evaluated as an array operation. NaN samples never win a bucket unless
+    the whole bucket is NaN.
+
+    Returns every index when ``n_out`` is not smaller than the series or is
+    below 3.
+    """
+    xa = np.asarray(x, dtype=np.float64).ravel()
+    ya = np.asarray(y, dtype=np.float64).ravel()
+    n = min(xa.size, ya.size)
+    if n_out >= n or n_out < 3:
+        return np.arange(n, dtype=np.int64)
+    xa, ya = xa[:n], ya[:n]
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    lo, hi = edges[:-1], edges[1:]
+
+    valid = ~np.isnan(ya)
+    cum_x = np.concatenate(([0.0], np.cumsum(xa)))
+    cum_y = np.concatenate(([0.0], np.cumsum(np.where(valid, ya, 0.0))))
+    cum_n = np.concatenate(([0], np.cumsum(valid)))
+
+    count = cum_n[hi] - cum_n[lo]
+    mean_x = (cum_x[hi] - cum_x[lo]) / (hi - lo)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_y = np.where(count > 0, (cum_y[hi] - cum_y[lo]) / count, np.nan)
+    next_x = np.append(mean_x[1:], xa[-1])
+    next_y = np.append(mean_y[1:], ya[-1])
+
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        bx, by = xa[lo[b]:hi[b]], ya[lo[b]:hi[b]]
+        area = np.abs((xa[a] - next_x[b]) * (by - ya[a]) - (xa[a] - bx) * (next_y[b] - ya[a]))
+        a = int(lo[b] + np.argmax(np.where(np.isnan(area), -1.0, area)))
+        out[b + 1] = a
+    return out
+
+
+def min_max_indices(y: SeriesInput, n_out: int) -> NDArrayI64:
+    """
+    Indices of a per-bucket min/max envelope of at most ``n_out`` points.
+
+    The series is cut into ``(n_out - 2) // 2`` buckets of equal width (the
+    last one NaN-padded) and the minimum and maximum of each bucket are kept,
+    together with the first and last points, so every spike and notch of a
+    spectrum survives the reduction. Fully vectorized: the buckets are rows
+    of one reshaped matrix.
+
+    Returns every index when ``n_out`` is not smaller than the series.
+    """
+    ya = np.asarray(y, dtype=np.float64).ravel()
+    n = ya.size
+    if n_out >= n or n < 3:
+        return np.arange(n, dtype=np.int64)
+
+    buckets = max(1, (n_out - 2) // 2)
+    width = -(-n // buckets)
+    matrix = np.concatenate((ya, np.full(buckets * width - n, np.nan))).reshape(buckets, width)
+    missing = np.isnan(matrix)
+
+    base = np.arange(buckets, dtype=np.int64) * width
+    lows = base + np.where(missing, np.inf, matrix).argmin(axis=1)
+    highs = base + np.where(missing, -np.inf, matrix).argmax(axis=1)
+
+    idx = np.unique(np.concatenate(([0, n - 1], lows, highs)))
+    return idx[idx < n]
+
+
+@dataclass(frozen=True)
+class SeriesDownsampler:
+    """
+    Reduce frequency/value series to about ``points`` samples.
+
+    The indices are chosen once from a primary series (:meth:`indices`) and
+    then applied to every series aligned with it (:meth:`take_aligned`), so
+    frequencies, magnitudes, status codes and derived per-point values stay
+    consistent with each other.
+
+    Attributes
+    ----------
+    points : int
+        Target number of points, typically the plot width in pixels.
+    method : DownsampleMethod
+        ``LTTB`` for line shapes, ``MIN_MAX`` for spectrum envelopes;
+        ``NONE`` keeps every point.
+    """
+    points: int = DEFAULT_DOWNSAMPLE_POINTS
+    method: DownsampleMethod = DownsampleMethod.LTTB
+
+    def indices(self, y: SeriesInput, x: SeriesInput | None = None) -> NDArrayI64:
+        """Indices to keep from ``y`` (and ``x``; the sample number when None)."""
+        ya = np.asarray(y, dtype=np.float64).ravel()
+        if self.method == DownsampleMethod.MIN_MAX:
+            return min_max_indices(ya, self.points)
+        if self.method == DownsampleMethod.LTTB:
+            xa = np.arange(ya.size, dtype=np.float64) if x is None or len(x) == 0 else x
+            return lttb_indices(xa, ya, self.points)
+        return np.arange(ya.size, dtype=np.int64)
+
+    def apply(self, x: SeriesInput, y: SeriesInput) -> tuple[NDArrayF64, NDArrayF64]:
+        """Downsampled copies of ``x`` and ``y`` as float64 arrays."""
+        xa = np.asarray(x, dtype=np.float64).ravel()
+        ya = np.asarray(y, dtype=np.float64).ravel()
+        n = min(xa.size, ya.size)
+        idx = self.indices(ya[:n], xa[:n])
+        return xa[idx], ya[idx]
+
+    @classmethod
+    def take_aligned(cls, data: object, indices: NDArrayI64, length: int) -> object:
+        """
+        Apply ``indices`` to every list of exactly ``length`` items in ``data``.
+
+        ``data`` is a nested structure of dicts and lists, such as a
+        ``model_dump()``; lists of another length are descended into, so
+        per-row series of a matrix and per-profile series are reduced too.
+        """
+        if isinstance(data, dict):
+            return {k: cls.take_aligned(v, indices, length) for k, v in data.items()}
+        if isinstance(data, list):
+            if len(data) == length:
+                return [data[i] for i in indices.tolist()]
+            return [cls.take_aligned(v, indices, length) for v in data]
+        return data
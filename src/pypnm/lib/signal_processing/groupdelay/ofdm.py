@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import math
+from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from pydantic import BaseModel, Field, PrivateAttr, field_validator
 
 from pypnm.lib.types import (
@@ -14,6 +17,8 @@ from pypnm.lib.types import (
     FrequencyHz,
     FrequencySeriesHz,
     IntSeries,
+    NDArrayF64,
+    NDArrayI64,
 )
 
 
@@ -69,6 +74,179 @@ class GroupDelayFull(BaseModel):
     mean_group_delay_us: float   = Field(default=math.nan, description="Mean τ over valid bins (microseconds).")
 
 
+@dataclass(frozen=True)
+class GroupDelayBatch:
+    """
+    Array result of :meth:`OFDMGroupDelayKernel.compute` for ``M`` captures of ``N`` bins.
+
+    All per-bin arrays are ``(M, N)``; invalid bins hold NaN (0 in ``valid_mask``).
+    ``tau_s``/``tau_us`` are the final series after the optional smoothing and
+    nonnegative clamp; ``dphi_df`` is the raw phase slope.
+    """
+    freq_hz: NDArrayI64
+    work_mask: NDArray[np.bool_]
+    wrapped_phase: NDArrayF64
+    unwrapped_phase: NDArrayF64
+    dphi_df: NDArrayF64
+    tau_s: NDArrayF64
+    tau_us: NDArrayF64
+    valid_mask: NDArray[np.bool_]
+    mean_group_delay_us: NDArrayF64
+
+
+class OFDMGroupDelayKernel:
+    """
+    Vectorized group-delay pipeline over a stack of channel-estimate captures.
+
+    Same steps and edge semantics as :class:`OFDMGroupDelay` (which delegates
+    here with ``M = 1``), expressed as whole-array operations:
+
+    - unwrap: per-bin 2π corrections accumulated with ``cumsum`` and re-based at
+      the start of every contiguous active run, so gaps are never stitched;
+    - gradient: central differences where both neighbours are valid, one-sided
+      only at the array edges;
+    - smoothing: centered masked moving average from cumulative sums, O(N)
+      regardless of window size.
+    """
+
+    @classmethod
+    def compute(cls, H: ArrayLike, axis: SpacedFrequencyAxisHz,
+                options: GroupDelayOptions | None = None,
+                active_mask: ArrayLike | None = None) -> GroupDelayBatch:
+        """
+        Compute group delay for every capture in ``H``.
+
+        Parameters
+        ----------
+        H : ArrayLike
+            Complex channel estimates, shape ``(N,)`` or ``(M, N)``.
+        axis : SpacedFrequencyAxisHz
+            Frequency origin and spacing shared by all captures.
+        options : GroupDelayOptions | None
+            Sign convention, smoothing window, clamp; defaults if None.
+        active_mask : ArrayLike | None
+            Active bins, shape ``(N,)`` (shared) or ``(M, N)``; all active if None.
+
+        Returns
+        -------
+        GroupDelayBatch
+            Per-capture series, validity masks and mean τ(µs).
+
+        Raises
+        ------
+        ValueError
+            If there are fewer than 2 bins or ``active_mask`` does not match.
+        """
+        opts = options or GroupDelayOptions()
+        h = np.atleast_2d(np.asarray(H, dtype=np.complex128))
+        if h.ndim != 2 or h.shape[1] < 2:
+            raise ValueError("H must contain ≥ 2 complex bins.")
+        n_bins = h.shape[1]
+
+        df_hz = float(axis.df_hz)
+        if not math.isfinite(df_hz) or df_hz <= 0.0:
+            raise ValueError("axis.df_hz must be finite and > 0.")
+        freq_hz = np.rint(int(axis.f0_hz) + np.arange(n_bins) * df_hz).astype(np.int64)
+
+        work = np.isfinite(h.real) & np.isfinite(h.imag)
+        if active_mask is not None:
+            active = np.asarray(active_mask).astype(bool)
+            if active.shape[-1] != n_bins or active.ndim > 2:
+                raise ValueError("active_mask length must match H length.")
+            work &= np.broadcast_to(active, h.shape)
+
+        wrapped = np.where(work, np.angle(h), np.nan)
+        unwrapped = cls._unwrap_on_mask(wrapped, work)
+        dphi_df = cls._masked_gradient(unwrapped, work, df_hz)
+
+        sign = 1.0 if opts.sign is SignConvention.PLUS else -1.0
+        tau_s = sign * dphi_df / (2.0 * math.pi)
+        if opts.smooth_win is not None:
+            tau_s = cls._moving_average_masked(tau_s, work, opts.smooth_win)
+        if opts.enforce_nonnegative:
+            tau_s = np.where(np.isfinite(tau_s), np.maximum(tau_s, 0.0), np.nan)
+        tau_us = tau_s * 1e6
+
+        valid = work & np.isfinite(tau_s)
+        counts = valid.sum(axis=1)
+        sums = np.where(valid, tau_us, 0.0).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean_us = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+        return GroupDelayBatch(
+            freq_hz             = freq_hz,
+            work_mask           = work,
+            wrapped_phase       = wrapped,
+            unwrapped_phase     = unwrapped,
+            dphi_df             = dphi_df,
+            tau_s               = tau_s,
+            tau_us              = tau_us,
+            valid_mask          = valid,
+            mean_group_delay_us = mean_us,
+        )
+
+    @staticmethod
+    def _unwrap_on_mask(wrapped: NDArrayF64, mask: NDArray[np.bool_]) -> NDArrayF64:
+        """
+        Unwrap phase only within contiguous runs of ``mask`` (per row).
+        Each step is folded into (-π, π]; gaps stay NaN and every run restarts
+        from its own wrapped value.
+        """
+        n = wrapped.shape[1]
+        pair_ok = mask[:, 1:] & mask[:, :-1]
+        step = np.diff(wrapped, axis=1)
+        folded = math.pi - np.mod(math.pi - step, 2.0 * math.pi)
+        corr = np.zeros_like(wrapped)
+        corr[:, 1:] = np.where(pair_ok, folded - step, 0.0)
+        total = np.cumsum(corr, axis=1)
+
+        run_start = mask.copy()
+        run_start[:, 1:] &= ~mask[:, :-1]
+        start_idx = np.maximum.accumulate(np.where(run_start, np.arange(n), 0), axis=1)
+        base = np.take_along_axis(total, start_idx, axis=1)
+        return np.where(mask, wrapped + (total - base), np.nan)
+
+    @staticmethod
+    def _masked_gradient(phase: NDArrayF64, mask: NDArray[np.bool_], df_hz: float) -> NDArrayF64:
+        """
+        dφ/df (rad/Hz): central differences where both neighbours are valid,
+        one-sided at the first/last bin; NaN elsewhere to prevent spikes.
+        """
+        ok = mask & np.isfinite(phase)
+        out = np.full_like(phase, np.nan)
+
+        center = ok[:, 1:-1] & ok[:, :-2] & ok[:, 2:]
+        out[:, 1:-1] = np.where(center, (phase[:, 2:] - phase[:, :-2]) / (2.0 * df_hz), np.nan)
+
+        edge = ok[:, 0] & ok[:, 1]
+        out[:, 0] = np.where(edge, (phase[:, 1] - phase[:, 0]) / df_hz, np.nan)
+        edge = ok[:, -1] & ok[:, -2]
+        out[:, -1] = np.where(edge, (phase[:, -1] - phase[:, -2]) / df_hz, np.nan)
+        return out
+
+    @staticmethod
+    def _moving_average_masked(series: NDArrayF64, mask: NDArray[np.bool_], window: int) -> NDArrayF64:
+        """
+        Centered moving average over valid contributors only, via cumulative sums.
+        NaN where the center is invalid.
+        """
+        valid = mask & np.isfinite(series)
+        n = series.shape[1]
+        half = window // 2
+
+        csum = np.zeros((series.shape[0], n + 1))
+        ccnt = np.zeros((series.shape[0], n + 1))
+        np.cumsum(np.where(valid, series, 0.0), axis=1, out=csum[:, 1:])
+        np.cumsum(valid, axis=1, out=ccnt[:, 1:])
+
+        lo = np.maximum(np.arange(n) - half, 0)
+        hi = np.minimum(np.arange(n) + half + 1, n)
+        acc = csum[:, hi] - csum[:, lo]
+        cnt = ccnt[:, hi] - ccnt[:, lo]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(valid & (cnt > 0), acc / np.maximum(cnt, 1), np.nan)
+
+
 class OFDMGroupDelay(BaseModel):
     """
     Per-subcarrier group delay for a DOCSIS-style OFDM channel using complex
@@ -138,177 +316,28 @@ class OFDMGroupDelay(BaseModel):
             mean_group_delay_us =   self._mean_us,
         )
 
-    # ── Internal helpers ──────────────────────────────────────────────────────
-
-    @staticmethod
-    def _unwrap_on_mask(wrapped_phase: FloatSeries, mask: IntSeries) -> FloatSeries:
-        """
-        Unwrap phase only within contiguous regions where mask==1.
-        Gaps (mask==0) remain NaN to avoid stitching across null/guard bands.
-        """
-        w, m, n = wrapped_phase, mask, len(wrapped_phase)
-        out: FloatSeries = [float("nan")] * n
-        i = 0
-        while i < n:
-            if m[i] == 1:
-                j = i
-                while j < n and m[j] == 1:
-                    j += 1
-                out[i:j] = OFDMGroupDelay._unwrap_segment(w[i:j])
-                i = j
-            else:
-                i += 1
-        return out
-
-    @staticmethod
-    def _unwrap_segment(segment: FloatSeries) -> FloatSeries:
-        """
-        Remove ±π jumps from a contiguous wrapped phase segment (radians).
-        Keeps phase continuous by adding/subtracting 2π where needed.
-        """
-        if not segment:
-            return []
-        out: FloatSeries = [segment[0]]
-        for k in range(1, len(segment)):
-            prev = out[-1]
-            cur  = segment[k]
-            diff = cur - prev
-            while diff <= -math.pi:
-                cur  += 2.0 * math.pi
-                diff  = cur - prev
-            while diff > math.pi:
-                cur  -= 2.0 * math.pi
-                diff  = cur - prev
-            out.append(cur)
-        return out
-
-    @staticmethod
-    def _central_gradient(phase_unwrapped: FloatSeries, df_hz: float, mask: IntSeries) -> FloatSeries:
-        """
-        Compute dφ/df (rad/Hz) using finite differences:
-          • interior bins → central difference
-          • edges → one-sided difference
-        Invalid centers or neighbors yield NaN to prevent spikes.
-        """
-        p, m, n = phase_unwrapped, mask, len(phase_unwrapped)
-        out: FloatSeries = [float("nan")] * n
-
-        def ok(idx: int) -> bool:
-            return (m[idx] == 1) and math.isfinite(p[idx])
-
-        for k in range(n):
-            if not ok(k):
-                continue
-            if k == 0:
-                if n > 1 and ok(1):
-                    out[k] = (p[1] - p[0]) / df_hz
-            elif k == n - 1:
-                if ok(n - 2):
-                    out[k] = (p[n - 1] - p[n - 2]) / df_hz
-            else:
-                if ok(k - 1) and ok(k + 1):
-                    out[k] = (p[k + 1] - p[k - 1]) / (2.0 * df_hz)
-        return out
-
-    @staticmethod
-    def _moving_average_masked(series_s: FloatSeries, mask: IntSeries, window: int) -> FloatSeries:
-        """
-        Centered moving average of τ(s) over valid contributors only.
-        Preserves NaN when the center is invalid or the window has no valid data.
-        """
-        n = len(series_s)
-        out: FloatSeries = [float("nan")] * n
-        half = window // 2
-        for i in range(n):
-            if mask[i] != 1 or not math.isfinite(series_s[i]):
-                continue
-            lo = max(0, i - half)
-            hi = min(n, i + half + 1)
-            acc = 0.0
-            cnt = 0
-            for j in range(lo, hi):
-                if mask[j] == 1 and math.isfinite(series_s[j]):
-                    acc += series_s[j]
-                    cnt += 1
-            if cnt > 0:
-                out[i] = acc / cnt
-        return out
-
-    @staticmethod
-    def _masked_mean_us(series_us: FloatSeries, mask: IntSeries) -> float:
-        """
-        Mean of τ(µs) across bins where mask==1 and values are finite.
-        Returns NaN when there are no valid contributors.
-        """
-        acc = 0.0
-        cnt = 0
-        for v, ok in zip(series_us, mask, strict=False):
-            if ok == 1 and math.isfinite(v):
-                acc += v
-                cnt += 1
-        return (acc / cnt) if cnt > 0 else float("nan")
-
     # ── Pipeline ───────────────────────────────────────────────────────────────
 
     def _compute(self) -> None:
         """
         Build axis → mask → phase (wrap/unwrap) → dφ/df → τ(s)/τ(µs),
         then smooth/clip as requested and summarize validity + mean.
+
+        The work is done by :class:`OFDMGroupDelayKernel` on a single-row batch.
         """
-        H_vals: ComplexSeries = self.H
-        n_bins = len(H_vals)
-        if n_bins < 2:
+        if len(self.H) < 2:
             raise ValueError("H must contain ≥ 2 complex bins.")
-
-        df_hz = float(self.axis.df_hz)
-        if not math.isfinite(df_hz) or df_hz <= 0.0:
-            raise ValueError("axis.df_hz must be finite and > 0.")
-
-        # Frequency axis (Hz) stored as integers by design
-        f0 = int(self.axis.f0_hz)
-        self._freq_hz = [FrequencyHz(int(round(f0 + k * df_hz))) for k in range(n_bins)]
-
-        # Valid where both the complex sample is finite and bin is active
-        finite_mask: IntSeries = [1 if (math.isfinite(h.real) and math.isfinite(h.imag)) else 0 for h in H_vals]
-        if self.active_mask is None:
-            active_mask: IntSeries = [1] * n_bins
-        else:
-            if len(self.active_mask) != n_bins:
-                raise ValueError("active_mask length must match H length.")
-            active_mask = [1 if bool(v) else 0 for v in self.active_mask]
-
-        self._work_mask = [1 if (finite_mask[i] == 1 and active_mask[i] == 1) else 0 for i in range(n_bins)]
-
-        # Wrapped phase; NaN for inactive/invalid bins maintains gaps
-        self._wrapped_phase = [
-            math.atan2(h.imag, h.real) if self._work_mask[i] == 1 else float("nan")
-            for i, h in enumerate(H_vals)
-        ]
-
-        # Unwrap only within contiguous active runs
-        self._unwrapped_phase = self._unwrap_on_mask(self._wrapped_phase, self._work_mask)
-
-        # Phase slope dφ/df (rad/Hz)
-        self._dphi_df = self._central_gradient(self._unwrapped_phase, df_hz, self._work_mask)
-
-        # τ(s) = sign · (1 / 2π) · dφ/df
-        sign   = 1.0 if self.options.sign is SignConvention.PLUS else -1.0
-        two_pi = 2.0 * math.pi
-        tau_s: FloatSeries = [(sign * v / two_pi) if math.isfinite(v) else float("nan") for v in self._dphi_df]
-
-        # Optional smoothing
-        if self.options.smooth_win is not None:
-            tau_s = self._moving_average_masked(tau_s, self._work_mask, self.options.smooth_win)
-
-        # Optional clamp (domain preference: no negative “time”)
-        if self.options.enforce_nonnegative:
-            tau_s = [max(v, 0.0) if math.isfinite(v) else float("nan") for v in tau_s]
-
-        self._tau_s  = tau_s
-        self._tau_us = [(v * 1e6) if math.isfinite(v) else float("nan") for v in tau_s]
-
-        # Valid where both work_mask is 1 and τ(s) is finite
-        self._valid_mask = [1 if (self._work_mask[i] == 1 and math.isfinite(self._tau_s[i])) else 0 for i in range(n_bins)]
-
-        # Summary statistic
-        self._mean_us = self._masked_mean_us(self._tau_us, self._valid_mask)
+        if self.active_mask is not None and len(self.active_mask) != len(self.H):
+            raise ValueError("active_mask length must match H length.")
+
+        batch = OFDMGroupDelayKernel.compute(self.H, self.axis, self.options, self.active_mask)
+
+        self._freq_hz         = batch.freq_hz.tolist()
+        self._work_mask       = batch.work_mask[0].astype(np.int64).tolist()
+        self._wrapped_phase   = batch.wrapped_phase[0].tolist()
+        self._unwrapped_phase = batch.unwrapped_phase[0].tolist()
+        self._dphi_df         = batch.dphi_df[0].tolist()
+        self._tau_s           = batch.tau_s[0].tolist()
+        self._tau_us          = batch.tau_us[0].tolist()
+        self._valid_mask      = batch.valid_mask[0].astype(np.int64).tolist()
+        self._mean_us         = float(batch.mean_group_delay_us[0])
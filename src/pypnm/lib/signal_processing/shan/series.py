@@ -1,16 +1,21 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
-from typing import Any, cast
+from functools import lru_cache
+from typing import Any, ClassVar, cast
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from pypnm.lib.types import (
+    ArrayLikeF64,
     BitsPerSymbol,
     BitsPerSymbolSeries,
     FloatSequence,
+    NDArrayF64,
+    NDArrayI64,
     SNRdB,
     StringArray,
 )
@@ -28,41 +33,49 @@ class ShannonSeriesModel(BaseModel):
 
 class ShannonSeries:
     """
-    Wrapper around the Shannon estimator to process a series of SNR (dB) values.
+    Array-backed Shannon estimator for a series of SNR (dB) values.
+
+    Bits per symbol, modulation names and Shannon-limit thresholds are computed
+    in bulk on NumPy arrays; per-bit modulation names and thresholds come from
+    lookup tables that are built once and cached for the process.
 
     Attributes:
         snr_db_values    : List of input SNR values in dB.
         bits_list        : Supported bits per symbol for each SNR.
         modulations      : Recommended QAM modulation names per SNR.
+        snr_db_limit     : Shannon-limit SNR (dB) of the supported modulation per SNR.
     """
-    def __init__(self, snr_db_values: FloatSequence) -> None:
+    LUT_MIN_SIZE: ClassVar[int] = 64
+
+    def __init__(self, snr_db_values: FloatSequence | NDArrayF64) -> None:
         """
         Initialize the series calculator.
 
         Parameters
         ----------
-        snr_db_values : Sequence[float]
-            A list of SNR values in dB. Each must be non-negative and finite.
+        snr_db_values : Sequence[float] | NDArrayF64
+            SNR values in dB, as a sequence or ndarray. Each must be non-negative and finite.
 
         Raises
         ------
         ValueError
             If any SNR value is negative or non-finite.
         """
-        # Validate inputs
-        self.snr_db_values: list[SNRdB] = []
-        for db in snr_db_values:
-            if not isinstance(db, (int, float)) or db < 0 or db != db or db == float('inf'):
-                raise ValueError(f"Invalid SNR dB value: {db}")
-            self.snr_db_values.append(SNRdB(db))
+        snr: NDArrayF64 = np.asarray(snr_db_values, dtype=np.float64).ravel()
+
+        invalid = ~np.isfinite(snr) | (snr < 0)
+        if invalid.any():
+            raise ValueError(f"Invalid SNR dB value: {snr[int(np.argmax(invalid))]}")
 
-        # Compute Shannon instances per entry
-        self._instances: list[Shannon] = [Shannon(db) for db in self.snr_db_values]
+        self._snr: NDArrayF64   = snr
+        self._bits: NDArrayI64  = self._bits_from_snr(snr)
 
-        # Extract bits and modulations
-        self.bits_list: list[BitsPerSymbol] = cast(list[BitsPerSymbol], [inst.bits for inst in self._instances])
-        self.modulations: list[str]         = [inst.get_modulation() for inst in self._instances]
-        self.snr_db_limit: list[SNRdB]      = self.limit()
+        mod_lut, limit_lut = self._bit_lookup_tables(max(self.LUT_MIN_SIZE, int(self._bits.max(initial=0)) + 1))
+
+        self.snr_db_values: list[SNRdB]     = cast(list[SNRdB], snr.tolist())
+        self.bits_list: list[BitsPerSymbol] = cast(list[BitsPerSymbol], self._bits.tolist())
+        self.modulations: list[str]         = mod_lut[self._bits].tolist()
+        self.snr_db_limit: list[SNRdB]      = cast(list[SNRdB], limit_lut[self._bits].tolist())
 
         self._model:ShannonSeriesModel = self.__build_model()
 
@@ -73,31 +86,64 @@ class ShannonSeries:
             modulations                 =   self.modulations,
             snr_db_values               =   self.snr_db_values,
             supported_modulation_counts =   self.supported_modulation_counts(),
-            snr_db_min                  =   self.limit()
+            snr_db_min                  =   self.snr_db_limit
         )
 
         return _
 
+    @staticmethod
+    def build_model(snr_db_values: ArrayLikeF64) -> ShannonSeriesModel:
+        """
+        Build a :class:`ShannonSeriesModel` directly from an SNR (dB) array.
+
+        Parameters
+        ----------
+        snr_db_values : ArrayLikeF64
+            SNR values in dB. Each must be non-negative and finite.
+
+        Returns
+        -------
+        ShannonSeriesModel
+            Same model as ``ShannonSeries(values).to_model()``.
+
+        Raises
+        ------
+        ValueError
+            If any SNR value is negative or non-finite.
+        """
+        return ShannonSeries(snr_db_values).to_model()
+
+    @staticmethod
+    def _bits_from_snr(snr: NDArrayF64) -> NDArrayI64:
+        return np.floor(np.log2(np.power(10.0, snr / 10.0) + 1.0)).astype(np.int64)
+
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _bit_lookup_tables(size: int) -> tuple[np.ndarray, NDArrayF64]:
+        levels = range(size)
+        mod_lut = np.array([Shannon.QAM_MODULATIONS.get(b, "unknown") for b in levels], dtype=object)
+        limit_lut = np.array([Shannon.bits_to_snr(b) if b > 0 else float("nan") for b in levels], dtype=np.float64)
+        mod_lut.flags.writeable = False
+        limit_lut.flags.writeable = False
+        return mod_lut, limit_lut
+
     def supported_modulation_counts(self) -> dict[str, int]:
         """
         Count how many input SNR values support each modulation up to Shannon limit.
 
+        Computed from a histogram of bit levels: the count for a modulation of
+        ``b`` bits is the reverse cumulative sum of the histogram at ``b``.
+
         Returns
         -------
         Dict[str, int]
             Mapping from modulation name to count of SNR values where
             bits_per_symbol >= modulation_bits.
         """
-        # Initialize counts for all known modulations
-        counts: dict[str, int] = {mod: 0 for mod in Shannon.QAM_MODULATIONS.values()}
-
-        # For each sample, increment all modulations it supports
-        for inst in self._instances:
-            max_bits = inst.bits
-            for bits, mod in Shannon.QAM_MODULATIONS.items():
-                if bits <= max_bits:
-                    counts[mod] += 1
-        return counts
+        max_mod_bits = max(Shannon.QAM_MODULATIONS)
+        hist = np.bincount(np.minimum(self._bits, max_mod_bits + 1), minlength=max_mod_bits + 2)
+        at_least = np.cumsum(hist[::-1])[::-1]
+        return {mod: int(at_least[bits]) for bits, mod in Shannon.QAM_MODULATIONS.items()}
 
     def to_model(self) -> ShannonSeriesModel:
         return self._model
@@ -128,7 +174,7 @@ class ShannonSeries:
         float
             Arithmetic mean of bits_list.
         """
-        return sum(self.bits_list) / len(self.bits_list) if self.bits_list else 0.0
+        return float(self._bits.mean()) if self._bits.size else 0.0
 
     def max_modulation(self) -> str:
         """
@@ -139,24 +185,20 @@ class ShannonSeries:
         str
             The modulation string corresponding to the maximum bits.
         """
-        if not self._instances:
+        if not self._bits.size:
             return "UNKNOWN"
-        max_bits = max(self.bits_list)
-        for inst in self._instances:
-            if inst.bits == max_bits:
-                return inst.get_modulation()
-        return "UNKNOWN"
+        return self.modulations[int(np.argmax(self._bits))]
 
     def limit(self) -> list[SNRdB]:
         """
-        Compute the Shannon limit for each SNR value in the series.
+        Return the Shannon limit for each SNR value in the series.
 
         Returns
         -------
         List[SNRdB]
             List of Shannon limits corresponding to each SNR in dB.
         """
-        return Shannon.snr_to_snr_limit(self.snr_db_values)
+        return self.snr_db_limit
 
     def __repr__(self) -> str:
         return f"ShannonSeries(snr_db_values={self.snr_db_values})"
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import chain
+from typing import Final
+
+import numpy as np
+
+from pypnm.lib.signal_processing.averager import MovingAverage
+from pypnm.lib.types import NDArrayF64, NDArrayI64
+
+__all__: Final = ["SpectrumSegmentStitcher", "StitchedSpectrum"]
+
+SegmentInput = NDArrayF64 | Sequence[Sequence[float]]
+
+
+@dataclass(frozen=True)
+class StitchedSpectrum:
+    """
+    Full-band spectrum assembled from spectrum-analyzer segments.
+
+    All series are NumPy arrays of equal length; convert with ``.tolist()``
+    only where the result leaves the process (API models, JSON).
+
+    Attributes
+    ----------
+    frequencies : NDArrayI64
+        Bin-center frequency of every stitched bin, in Hz.
+    magnitudes : NDArrayF64
+        Amplitude per bin in dB; NaN where a short segment was padded.
+    smoothed : NDArrayF64
+        Moving average of ``magnitudes`` (NaN-aware, same length and dtype).
+    bin_bandwidth : int
+        Bin spacing in Hz.
+    segment_length : int
+        Bins per segment after clipping/padding.
+    """
+    frequencies: NDArrayI64
+    magnitudes: NDArrayF64
+    smoothed: NDArrayF64
+    bin_bandwidth: int
+    segment_length: int
+
+
+class SpectrumSegmentStitcher:
+    """
+    Array-native stitching of CM spectrum-analyzer amplitude segments.
+
+    Segments are normalised to a ``(num_segments, bins_per_segment)`` matrix
+    (NaN-padded or clipped in one step), the frequency axis is built by
+    broadcasting segment starts against bin offsets, and the moving average
+    runs on the flattened float64 array without a list round-trip.
+
+    Parameters
+    ----------
+    first_segment_center_hz, last_segment_center_hz : int
+        Center frequencies of the first and last segment.
+    segment_span_hz : int
+        Frequency span of one segment.
+    bin_bandwidth_hz : int
+        Bin spacing; derived from ``segment_span_hz / bins_per_segment`` when <= 0.
+    bins_per_segment : int
+        Target bins per segment; taken from the first segment when <= 0.
+    """
+
+    def __init__(self, first_segment_center_hz: int, last_segment_center_hz: int, segment_span_hz: int,
+                 bin_bandwidth_hz: int = 0, bins_per_segment: int = 0) -> None:
+        self.first_segment_center_hz = int(first_segment_center_hz)
+        self.last_segment_center_hz  = int(last_segment_center_hz)
+        self.segment_span_hz         = int(segment_span_hz)
+        self.bin_bandwidth_hz        = int(bin_bandwidth_hz)
+        self.bins_per_segment        = int(bins_per_segment)
+
+    def stitch(self, segments: SegmentInput, window_points: int) -> StitchedSpectrum:
+        """
+        Stitch ``segments`` into one spectrum and smooth it with a
+        ``window_points`` moving average (reflect edges).
+
+        If the frequency axis cannot be derived (missing span, bin spacing
+        or first center frequency) every series is empty, matching the
+        list-based analysis this replaces.
+        """
+        bin_bw = self.bin_bandwidth_hz
+        if bin_bw <= 0 and self.segment_span_hz > 0 and self.bins_per_segment > 0:
+            bin_bw = max(1, self.segment_span_hz // self.bins_per_segment)
+
+        num_segments = len(segments)
+        bins = self.bins_per_segment
+        if bins <= 0 and num_segments:
+            bins = len(segments[0])
+
+        magnitudes = self.segment_matrix(segments, bins).ravel()
+        frequencies = self.frequency_axis(num_segments, bins, bin_bw)
+
+        n = min(frequencies.size, magnitudes.size)
+        if n == 0:
+            return StitchedSpectrum(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float64),
+                                    np.empty(0, dtype=np.float64), bin_bw, bins)
+        frequencies, magnitudes = frequencies[:n], magnitudes[:n]
+
+        smoothed = MovingAverage(max(1, int(window_points)), mode="reflect", dtype=np.float64).apply_array(magnitudes)
+        return StitchedSpectrum(frequencies, magnitudes, smoothed, bin_bw, bins)
+
+    def frequency_axis(self, num_segments: int, bins: int, bin_bw: int) -> NDArrayI64:
+        """
+        Bin-center frequencies of every segment, flattened.
+
+        Segment ``s`` starts at ``first_center - span/2 + bin_bw/2 + s * step``
+        where ``step`` is the even spacing between first and last centers.
+        """
+        if (num_segments <= 0 or bins <= 0 or self.segment_span_hz <= 0 or bin_bw <= 0
+                or self.first_segment_center_hz <= 0):
+            return np.empty(0, dtype=np.int64)
+
+        step = (self.last_segment_center_hz - self.first_segment_center_hz) // (num_segments - 1) \
+            if num_segments > 1 else 0
+        seg0_start = self.first_segment_center_hz - (self.segment_span_hz // 2) + (bin_bw // 2)
+
+        starts = seg0_start + np.arange(num_segments, dtype=np.int64)[:, None] * step
+        return (starts + np.arange(bins, dtype=np.int64) * bin_bw).ravel()
+
+    @staticmethod
+    def segment_matrix(segments: SegmentInput, bins: int) -> NDArrayF64:
+        """
+        Stack segments into a ``(len(segments), bins)`` float64 matrix,
+        clipping long segments and NaN-padding short ones.
+        """
+        num_segments = len(segments)
+        if num_segments == 0 or bins <= 0:
+            return np.empty((num_segments, max(bins, 0)), dtype=np.float64)
+
+        if isinstance(segments, np.ndarray) and segments.ndim == 2:
+            return SpectrumSegmentStitcher._fit_width(segments.astype(np.float64, copy=False), bins)
+
+        lengths = np.fromiter((len(s) for s in segments), dtype=np.int64, count=num_segments)
+        if (lengths == lengths[0]).all():
+            matrix = np.asarray(segments, dtype=np.float64).reshape(num_segments, int(lengths[0]))
+            return SpectrumSegmentStitcher._fit_width(matrix, bins)
+
+        # ragged: scatter the flattened values into a NaN matrix at (row, position-in-row)
+        total = int(lengths.sum())
+        flat = np.fromiter(chain.from_iterable(segments), dtype=np.float64, count=total)
+        rows = np.repeat(np.arange(num_segments), lengths)
+        cols = np.arange(total) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        keep = cols < bins
+
+        out = np.full((num_segments, bins), np.nan, dtype=np.float64)
+        out[rows[keep], cols[keep]] = flat[keep]
+        return out
+
+    @staticmethod
+    def _fit_width(matrix: NDArrayF64, bins: int) -> NDArrayF64:
+        width = matrix.shape[1]
+        if width >= bins:
+            return matrix[:, :bins]
+        return np.pad(matrix, ((0, 0), (0, bins - width)), constant_values=np.nan)
@@ -0,0 +1,305 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import ClassVar, TypeVar
+
+__all__ = [
+    "CONTENT_TYPE_LATEST",
+    "DEFAULT_BUCKETS",
+    "REGISTRY",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+]
+
+CONTENT_TYPE_LATEST: str = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; extends the usual Prometheus defaults to cover slow SNMP walks and TFTP pulls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+_NAME_RE = re.compile(r"^[a-zA-Z_:][a-zA-Z0-9_:]*$")
+_LABEL_RE = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
+
+LabelKey = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True))
+    return "{" + pairs + "}"
+
+
+class _Metric(ABC):
+    """
+    Base class for a labelled metric family.
+
+    Children are created lazily per label-value combination and guarded by a
+    single lock, so instruments can be shared between the event loop and the
+    worker threads used for TFTP/SFTP fetches.
+    """
+    kind: ClassVar[str] = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        if not _NAME_RE.match(name):
+            raise ValueError(f"Invalid metric name: {name!r}")
+        for label in labelnames:
+            if not _LABEL_RE.match(label) or label.startswith("__") or label == "le":
+                raise ValueError(f"Invalid label name {label!r} for metric {name!r}")
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: tuple[str, ...] = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> LabelKey:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"Metric {self.name!r} expects labels {list(self.labelnames)}, got {sorted(labels)}")
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every recorded value."""
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Prometheus text exposition lines of this metric."""
+
+    def _header(self) -> list[str]:
+        doc = self.documentation.replace("\\", "\\\\").replace("\n", "\\n")
+        return [f"# HELP {self.name} {doc}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing value per label set."""
+    kind: ClassVar[str] = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only be incremented by non-negative amounts")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items
+        ]
+
+
+class Gauge(_Metric):
+    """Value per label set that can go up and down."""
+    kind: ClassVar[str] = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelKey, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: object) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(v)}" for key, v in items
+        ]
+
+
+class Histogram(_Metric):
+    """
+    Bucketed distribution per label set.
+
+    Observations are counted into their own bucket only and accumulated at
+    render time, which keeps ``observe`` to one ``bisect`` under the lock.
+    """
+    kind: ClassVar[str] = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        super().__init__(name, documentation, labelnames)
+        bounds = sorted(float(b) for b in buckets if not math.isinf(b))
+        if not bounds:
+            raise ValueError(f"Histogram {name!r} needs at least one finite bucket")
+        self.buckets: tuple[float, ...] = (*bounds, math.inf)
+        self._counts: dict[LabelKey, list[int]] = {}
+        self._sums: dict[LabelKey, float] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * len(self.buckets)
+                self._sums[key] = 0.0
+            counts[idx] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block, also when it raises."""
+        self._key(labels)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: object) -> int:
+        with self._lock:
+            return sum(self._counts.get(self._key(labels), ()))
+
+    def sum(self, **labels: object) -> float:
+        with self._lock:
+            return self._sums.get(self._key(labels), 0.0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+            self._sums.clear()
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        lines = self._header()
+        bucket_names = (*self.labelnames, "le")
+        for key, counts, total in items:
+            running = 0
+            for bound, n in zip(self.buckets, counts, strict=True):
+                running += n
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_names, (*key, _format_value(bound)))} {running}")
+            label_text = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {running}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """
+    In-process collection of metric families rendered in Prometheus text format.
+
+    Instruments are get-or-create: modules declare theirs at import time and a
+    repeated declaration (e.g. on reload) returns the existing family, as long
+    as its type and label names match.
+    """
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                metric = Histogram(name, documentation, labelnames, buckets)
+                self._metrics[name] = metric
+                return metric
+        return self._check(existing, Histogram, labelnames)
+
+    def get(self, name: str) -> _Metric | None:
+        with self._lock:
+            return self._metrics.get(name)
+
+    def clear(self) -> None:
+        """Reset every recorded value; registered families are kept."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines: list[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _get_or_create(self, cls: type[M], name: str, documentation: str, labelnames: Sequence[str]) -> M:
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is None:
+                metric = cls(name, documentation, labelnames)
+                self._metrics[name] = metric
+                return metric
+        return self._check(existing, cls, labelnames)
+
+    @staticmethod
+    def _check(existing: _Metric, cls: type[M], labelnames: Sequence[str]) -> M:
+        if not isinstance(existing, cls) or existing.labelnames != tuple(labelnames):
+            raise ValueError(
+                f"Metric {existing.name!r} already registered as {existing.kind} "
+                f"with labels {list(existing.labelnames)}")
+        return existing
+
+
+REGISTRY = MetricsRegistry()
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import logging
+import secrets
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from pypnm.lib.telemetry.metrics import REGISTRY
+
+__all__ = [
+    "SpanContext",
+    "SpanRecord",
+    "current_span",
+    "current_trace_id",
+    "recent_spans",
+    "trace_span",
+]
+
+_logger = logging.getLogger(__name__)
+
+SPAN_SECONDS = REGISTRY.histogram(
+    "pypnm_span_duration_seconds",
+    "Duration of traced pipeline spans.",
+    ("span",),
+)
+
+RECENT_SPAN_LIMIT: int = 2048
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """
+    Identity of an open span.
+
+    ``trace_id`` is shared by every span opened under the same request;
+    ``parent_id`` is the ``span_id`` of the enclosing span, or None for the root.
+    """
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """A finished span: its context, attributes, start (epoch seconds) and duration."""
+    context: SpanContext
+    start_time: float
+    duration_s: float
+    attributes: dict[str, object] = field(default_factory=dict)
+    error: str | None = None
+
+
+_current: ContextVar[SpanContext | None] = ContextVar("pypnm_trace_span", default=None)
+_recent: deque[SpanRecord] = deque(maxlen=RECENT_SPAN_LIMIT)
+_recent_lock = threading.Lock()
+
+
+def current_span() -> SpanContext | None:
+    """Return the innermost open span in this context, if any."""
+    return _current.get()
+
+
+def current_trace_id() -> str | None:
+    span = _current.get()
+    return span.trace_id if span else None
+
+
+@contextmanager
+def trace_span(name: str, *, trace_id: str | None = None, **attributes: object) -> Iterator[SpanContext]:
+    """
+    Open a span for the ``with`` block.
+
+    The span becomes the parent of any span opened inside the block, including
+    in awaited coroutines and tasks created there, since both inherit the
+    current ``contextvars`` context. Its duration is observed in
+    ``pypnm_span_duration_seconds{span=name}`` and the record is kept in a
+    bounded in-memory buffer (see :func:`recent_spans`).
+
+    Parameters
+    ----------
+    name : str
+        Span name, e.g. ``"snmp.get"``; used as the metric label, so keep it
+        low-cardinality and put variable data in ``attributes``.
+    trace_id : str | None
+        Continue an external trace (e.g. from a request header). Ignored when
+        a parent span is already open.
+    **attributes : object
+        Free-form values stored on the record and logged at DEBUG.
+    """
+    parent = _current.get()
+    ctx = SpanContext(
+        trace_id    = parent.trace_id if parent else (trace_id or secrets.token_hex(16)),
+        span_id     = secrets.token_hex(8),
+        parent_id   = parent.span_id if parent else None,
+        name        = name,
+    )
+    token = _current.set(ctx)
+    start_wall = time.time()
+    start = time.perf_counter()
+    error: str | None = None
+    try:
+        yield ctx
+    except BaseException as exc:
+        error = type(exc).__name__
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        _current.reset(token)
+        SPAN_SECONDS.observe(duration, span=name)
+        record = SpanRecord(ctx, start_wall, duration, dict(attributes), error)
+        with _recent_lock:
+            _recent.append(record)
+        _logger.debug("span %s trace=%s span=%s parent=%s duration=%.6fs%s",
+                      name, ctx.trace_id, ctx.span_id, ctx.parent_id, duration,
+                      f" error={error}" if error else "")
+
+
+def recent_spans(trace_id: str | None = None) -> list[SpanRecord]:
+    """Return buffered finished spans, oldest first, optionally for one trace."""
+    with _recent_lock:
+        spans = list(_recent)
+    if trace_id is None:
+        return spans
+    return [s for s in spans if s.context.trace_id == trace_id]
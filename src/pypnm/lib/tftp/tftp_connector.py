@@ -1,14 +1,23 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import logging
 import os
+import time
 
 from tftpy import TftpClient
 
 from pypnm.lib.inet import Inet
+from pypnm.lib.telemetry.metrics import REGISTRY
+from pypnm.lib.telemetry.tracing import trace_span
+
+TFTP_FETCH_SECONDS = REGISTRY.histogram(
+    "pypnm_tftp_fetch_duration_seconds",
+    "TFTP download duration by outcome.",
+    ("result",),
+)
 
 
 class TFTPConnector:
@@ -48,16 +57,20 @@ class TFTPConnector:
         """
         self.logger.debug(f"Starting TFTP download: {remote_filename} → {local_path}")
 
-        try:
-            os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
-            client = TftpClient(self.host, self.port)
-            client.download(remote_filename, local_path)
-            self.logger.debug(f"TFTP download complete: {local_path}")
-            return True
-
-        except Exception as e:
-            self.logger.error(f"TFTP download failed: {e}")
-            return False
+        start = time.perf_counter()
+        with trace_span("tftp.fetch", remote=remote_filename):
+            try:
+                os.makedirs(os.path.dirname(local_path) or '.', exist_ok=True)
+                client = TftpClient(self.host, self.port)
+                client.download(remote_filename, local_path)
+                self.logger.debug(f"TFTP download complete: {local_path}")
+                TFTP_FETCH_SECONDS.observe(time.perf_counter() - start, result="success")
+                return True
+
+            except Exception as e:
+                self.logger.error(f"TFTP download failed: {e}")
+                TFTP_FETCH_SECONDS.observe(time.perf_counter() - start, result="failure")
+                return False
 
     def upload_file(self, local_path: str, remote_filename: str) -> bool:
         """
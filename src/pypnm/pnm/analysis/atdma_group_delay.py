@@ -134,10 +134,8 @@ class GroupDelayCalculator:
 
     @staticmethod
     def _to_complex_array(coefficients: list[PreEqAtdmaCoefficients]) -> NDArray[np.complex128]:
-        taps: NDArray[np.complex128] = np.empty(len(coefficients), dtype=np.complex128)
-        for i, (re, im) in enumerate(coefficients):
-            taps[i] = complex(float(re), float(im))
-        return taps
+        pairs = np.asarray(coefficients, dtype=np.float64).reshape(-1, 2)
+        return pairs[:, 0] + 1j * pairs[:, 1]
 
     def symbol_rate(self) -> float:
         bw = float(int(self.channel_width_hz))
@@ -152,20 +150,24 @@ class GroupDelayCalculator:
         tsym_us = float(self.symbol_time_us())
         return Microseconds(tsym_us / float(self.taps_per_symbol))
 
-    def compute(self, coefficients: list[PreEqAtdmaCoefficients]) -> GroupDelayModel:
-        if len(coefficients) == 0:
+    @staticmethod
+    def delay_samples_batch(taps: NDArray[np.complex128]) -> NDArray[np.float64]:
+        """Group delay in tap-sample periods along the last axis of a ``(..., N)`` tap stack."""
+        h_time = np.asarray(taps, dtype=np.complex128)
+        n = int(h_time.shape[-1])
+        if n == 0:
             raise ValueError("coefficients cannot be empty.")
 
-        h_time = self._to_complex_array(coefficients)
-
-        n = int(h_time.shape[0])
-        h_freq = np.fft.fft(h_time, n=n)
-
-        phase = np.unwrap(np.angle(h_freq))
+        phase = np.unwrap(np.angle(np.fft.fft(h_time, n=n, axis=-1)), axis=-1)
         omega = TWO_PI * (np.arange(n, dtype=np.float64) / float(n))
+        return -np.gradient(phase, omega, axis=-1)
+
+    def compute(self, coefficients: list[PreEqAtdmaCoefficients]) -> GroupDelayModel:
+        if len(coefficients) == 0:
+            raise ValueError("coefficients cannot be empty.")
 
-        dphi_domega = np.gradient(phase, omega)
-        delay_samples = -dphi_domega
+        n = len(coefficients)
+        delay_samples = self.delay_samples_batch(self._to_complex_array(coefficients))
 
         tsamp_us = float(self.sample_period_us())
         delay_us = delay_samples * tsamp_us
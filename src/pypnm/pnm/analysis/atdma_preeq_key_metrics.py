@@ -8,10 +8,11 @@ from dataclasses import dataclass
 from typing import ClassVar, Final
 
 import numpy as np
+from numpy.typing import NDArray
 from pydantic import BaseModel, Field
 
 from pypnm.lib.constants import FEET_PER_METER, SPEED_OF_LIGHT, CableType
-from pypnm.lib.types import PreEqAtdmaCoefficients
+from pypnm.lib.types import NDArrayF64, PreEqAtdmaCoefficients
 
 
 class EqualizerMetrics:
@@ -206,6 +207,82 @@ class EqualizerMetrics:
         )
 
 
+@dataclass(frozen=True)
+class EqualizerMetricsBatch:
+    """
+    Key pre-equalization metrics (6.3.1–6.3.11) for a stack of 24-tap equalizers.
+
+    Every field is an array shaped like the leading axes of the tap stack
+    (e.g. ``(modems, channels)``), using the same dB conventions and ``±inf``
+    edge values as :class:`EqualizerMetrics`. Frequency response is not
+    included; use :class:`EqualizerMetrics` for a single record.
+    """
+    main_tap_energy: NDArrayF64
+    main_tap_nominal_energy: float
+    pre_main_tap_energy: NDArrayF64
+    post_main_tap_energy: NDArrayF64
+    total_tap_energy: NDArrayF64
+    main_tap_compression: NDArrayF64
+    main_tap_ratio: NDArrayF64
+    non_main_tap_energy_ratio: NDArrayF64
+    pre_main_tap_total_energy_ratio: NDArrayF64
+    post_main_tap_total_energy_ratio: NDArrayF64
+    pre_post_energy_symmetry_ratio: NDArrayF64
+    pre_post_tap_symmetry_ratio: NDArrayF64
+
+    @classmethod
+    def from_taps(
+        cls,
+        taps: NDArray[np.complex128],
+        nominal_amplitude: int = EqualizerMetrics.DEFAULT_NOMINAL_AMPLITUDE,
+        main_tap_index: int = EqualizerMetrics.DEFAULT_MAIN_TAP_INDEX,
+    ) -> EqualizerMetricsBatch:
+        """
+        Compute metrics over the last axis of ``taps``.
+
+        Args:
+            taps: Complex taps shaped ``(..., 24)``.
+            nominal_amplitude: CM implementation nominal amplitude.
+            main_tap_index: Main tap index (0-based).
+        """
+        taps = np.asarray(taps, dtype=np.complex128)
+        if taps.shape[-1] != EqualizerMetrics.EXPECTED_TAP_COUNT:
+            raise ValueError("Exactly 24 complex (real, imag) coefficients are required.")
+
+        energy = taps.real ** 2 + taps.imag ** 2
+        mte = energy[..., main_tap_index]
+        pre = energy[..., :main_tap_index].sum(axis=-1)
+        post = energy[..., main_tap_index + 1:].sum(axis=-1)
+        tte = energy.sum(axis=-1)
+
+        if 0 < main_tap_index < EqualizerMetrics.EXPECTED_TAP_COUNT - 1:
+            pptsr = cls._db_ratio(energy[..., main_tap_index - 1], energy[..., main_tap_index + 1], math.inf)
+        else:
+            pptsr = np.full(mte.shape, math.nan)
+
+        return cls(
+            main_tap_energy                  = mte,
+            main_tap_nominal_energy          = float(nominal_amplitude ** 2 * 2),
+            pre_main_tap_energy              = pre,
+            post_main_tap_energy             = post,
+            total_tap_energy                 = tte,
+            main_tap_compression             = cls._db_ratio(tte, mte, math.inf),
+            main_tap_ratio                   = cls._db_ratio(mte, tte - mte, math.inf),
+            non_main_tap_energy_ratio        = cls._db_ratio(pre + post, tte, -math.inf),
+            pre_main_tap_total_energy_ratio  = cls._db_ratio(pre, tte, -math.inf),
+            post_main_tap_total_energy_ratio = cls._db_ratio(post, tte, -math.inf),
+            pre_post_energy_symmetry_ratio   = cls._db_ratio(post, pre, math.inf),
+            pre_post_tap_symmetry_ratio      = pptsr,
+        )
+
+    @staticmethod
+    def _db_ratio(num: NDArrayF64, den: NDArrayF64, zero_den: float) -> NDArrayF64:
+        """``10·log10(num/den)`` with ``zero_den`` where ``den == 0`` (``-inf`` where only ``num`` is 0)."""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = 10.0 * np.log10(num / np.where(den != 0, den, 1.0))
+        return np.where(den != 0, out, zero_den)
+
+
 class EqualizerMetricsModel(BaseModel):
     main_tap_energy: float = Field(..., description="Main tap energy (MTE).")
     main_tap_nominal_energy: float = Field(..., description="Main tap nominal energy (MTNE).")
@@ -5,15 +5,27 @@ from __future__ import annotations
 
 import json
 import math
+from collections.abc import Sequence
+from dataclasses import dataclass, fields, replace
 from typing import Final, Literal
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from pydantic import BaseModel, Field
 
 from pypnm.lib.constants import DOCSIS_ROLL_OFF_FACTOR
-from pypnm.lib.types import BandwidthHz, ImginaryInt, PreEqAtdmaCoefficients, RealInt
+from pypnm.lib.types import (
+    BandwidthHz,
+    ImginaryInt,
+    NDArrayF64,
+    NDArrayI64,
+    PreEqAtdmaCoefficients,
+    RealInt,
+)
 from pypnm.pnm.analysis.atdma_group_delay import GroupDelayCalculator, GroupDelayModel
 from pypnm.pnm.analysis.atdma_preeq_key_metrics import (
     EqualizerMetrics,
+    EqualizerMetricsBatch,
     EqualizerMetricsModel,
     EqualizerTapDelayAnnotator,
     EqualizerTapDelaySummaryModel,
@@ -50,6 +62,42 @@ class UsEqDataModel(BaseModel):
     model_config = {"frozen": True}
 
 
+@dataclass(frozen=True)
+class UsEqTapBatch:
+    """
+    Decoded pre-EQ taps for a ``(modems, channels)`` grid of OctetStrings.
+
+    ``taps`` is ``(modems, channels, max_taps)`` complex, zero-padded past each
+    record's ``num_taps``; records that are missing or fail header validation
+    have ``valid`` False and ``num_taps`` 0.
+    """
+    taps: NDArray[np.complex128]
+    num_taps: NDArrayI64
+    taps_per_symbol: NDArrayI64
+    main_tap_location: NDArrayI64
+    valid: NDArray[np.bool_]
+    big_endian: NDArray[np.bool_]
+    four_nibble: NDArray[np.bool_]
+
+
+@dataclass(frozen=True)
+class UsEqBatchAnalysis:
+    """
+    Fleet pre-EQ analysis built by :meth:`DocsEqualizerData.analyze_batch`.
+
+    ``metrics`` fields are ``(modems, channels)`` arrays, NaN where the record
+    does not have exactly 24 taps (``metrics_valid`` False); None when no
+    record in the batch is that long. ``group_delay_samples`` is per FFT bin,
+    ``(modems, channels, max_taps)`` with NaN padding; ``group_delay_us`` is
+    additionally NaN where no channel width is known.
+    """
+    taps: UsEqTapBatch
+    metrics: EqualizerMetricsBatch | None
+    metrics_valid: NDArray[np.bool_]
+    group_delay_samples: NDArrayF64
+    group_delay_us: NDArrayF64
+
+
 class DocsEqualizerData:
     """
     Parse DOCS-IF3 upstream pre-equalization tap data.
@@ -167,6 +215,113 @@ class DocsEqualizerData:
     def to_json(self, indent: int = 2) -> str:
         return json.dumps(self.to_dict(), indent=indent)
 
+    @classmethod
+    def decode_batch(
+        cls,
+        payloads: Sequence[Sequence[bytes | None]],
+        *,
+        coeff_encoding: Literal["four-nibble", "three-nibble", "auto"] = "auto",
+        coeff_endianness: Literal["little", "big", "auto"] = "auto",
+    ) -> UsEqTapBatch:
+        """
+        Decode many raw pre-EQ OctetStrings into one complex tap array.
+
+        payloads is indexed ``[modem][channel]`` (ragged rows and None entries
+        are allowed). Endianness and nibble encoding are detected per record
+        with the same heuristics as add_from_bytes(), evaluated on the whole
+        ``(records, taps, bytes)`` array at once.
+        """
+        cls._check_decode_options(coeff_encoding, coeff_endianness)
+        shape = (len(payloads), max((len(row) for row in payloads), default=0))
+        num_taps = np.zeros(shape, dtype=np.int64)
+        taps_per_symbol = np.zeros(shape, dtype=np.int64)
+        main_tap_location = np.zeros(shape, dtype=np.int64)
+
+        blobs: list[tuple[int, int, bytes]] = []
+        for m, row in enumerate(payloads):
+            for c, payload in enumerate(row):
+                header = cls._validated_header(payload) if payload else None
+                if header is None:
+                    continue
+                main_tap_location[m, c], taps_per_symbol[m, c], num_taps[m, c], _ = header
+                end = cls.HEADER_SIZE + header[2] * cls.COMPLEX_TAP_SIZE
+                blobs.append((m, c, payload[cls.HEADER_SIZE:end]))
+
+        max_taps = int(num_taps.max()) if num_taps.size else 0
+        u8 = np.zeros(shape + (max_taps, cls.COMPLEX_TAP_SIZE), dtype=np.uint8)
+        for m, c, blob in blobs:
+            u8[m, c].reshape(-1)[: len(blob)] = np.frombuffer(blob, dtype=np.uint8)
+
+        flat_u8 = u8.reshape(shape[0] * shape[1], max_taps, cls.COMPLEX_TAP_SIZE)
+        flat_n = num_taps.reshape(-1)
+        big = cls._resolve_big_endian(flat_u8, flat_n, coeff_endianness)
+        words = cls._coeff_words(flat_u8, big)
+        four = cls._resolve_four_nibble(words, flat_n, coeff_encoding)
+        values = cls._decode_words(words, four)
+
+        taps = (values[..., 0] + 1j * values[..., 1]).reshape(shape + (max_taps,))
+        return UsEqTapBatch(
+            taps                = taps,
+            num_taps            = num_taps,
+            taps_per_symbol     = taps_per_symbol,
+            main_tap_location   = main_tap_location,
+            valid               = num_taps > 0,
+            big_endian          = big.reshape(shape),
+            four_nibble         = four.reshape(shape),
+        )
+
+    @classmethod
+    def analyze_batch(
+        cls,
+        payloads: Sequence[Sequence[bytes | None]],
+        *,
+        channel_widths_hz: ArrayLike | None = None,
+        rolloff: float = DOCSIS_ROLL_OFF_FACTOR,
+        coeff_encoding: Literal["four-nibble", "three-nibble", "auto"] = "auto",
+        coeff_endianness: Literal["little", "big", "auto"] = "auto",
+    ) -> UsEqBatchAnalysis:
+        """
+        Decode a CMTS-wide pre-EQ walk and compute key metrics and group delay for every record.
+
+        channel_widths_hz is a scalar or an array broadcastable to ``(modems, channels)``;
+        non-positive or NaN entries mean unknown (delay stays in samples only).
+        """
+        batch = cls.decode_batch(payloads, coeff_encoding=coeff_encoding, coeff_endianness=coeff_endianness)
+        expected = EqualizerMetrics.EXPECTED_TAP_COUNT
+
+        metrics_valid = batch.valid & (batch.num_taps == expected)
+        metrics: EqualizerMetricsBatch | None = None
+        if metrics_valid.any():
+            raw = EqualizerMetricsBatch.from_taps(batch.taps[..., :expected])
+            metrics = replace(raw, **{
+                f.name: np.where(metrics_valid, getattr(raw, f.name), np.nan)
+                for f in fields(raw) if isinstance(getattr(raw, f.name), np.ndarray)
+            })
+
+        delay_samples = np.full(batch.taps.shape, np.nan)
+        for n in np.unique(batch.num_taps[batch.valid]).tolist():
+            if n < 2:
+                continue
+            sel = batch.valid & (batch.num_taps == n)
+            delay_samples[sel, :n] = GroupDelayCalculator.delay_samples_batch(batch.taps[sel][:, :n])
+
+        widths = np.broadcast_to(
+            np.asarray(np.nan if channel_widths_hz is None else channel_widths_hz, dtype=np.float64),
+            batch.num_taps.shape,
+        )
+        known = batch.valid & (batch.taps_per_symbol > 0) & np.isfinite(widths) & (widths > 0) & (rolloff >= 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sample_period_us = (1.0 + rolloff) / widths * 1e6 / batch.taps_per_symbol
+        delay_us = delay_samples * np.where(known, sample_period_us, np.nan)[..., None]
+
+        return UsEqBatchAnalysis(
+            taps                = batch,
+            metrics             = metrics,
+            metrics_valid       = metrics_valid,
+            group_delay_samples = delay_samples,
+            group_delay_us      = delay_us,
+        )
+
     def _add_parsed(
         self,
         us_idx: int,
@@ -178,23 +333,12 @@ class DocsEqualizerData:
         channel_width_hz: BandwidthHz | None,
         rolloff: float,
     ) -> bool:
-        if len(payload) < self.HEADER_SIZE:
-            return False
-
-        main_tap_location = payload[0]
-        taps_per_symbol = payload[1]
-        num_taps = payload[2]
-        reserved = payload[3]
-
-        if num_taps == 0:
-            return False
-
-        if num_taps > self.MAX_TAPS:
+        header = self._validated_header(payload)
+        if header is None:
             return False
 
+        main_tap_location, taps_per_symbol, num_taps, reserved = header
         expected_len = self.HEADER_SIZE + (num_taps * self.COMPLEX_TAP_SIZE)
-        if len(payload) < expected_len:
-            return False
 
         header_hex = payload[: self.HEADER_SIZE].hex(" ", 1).upper()
         payload_hex = payload[:expected_len].hex(" ", 1).upper()
@@ -214,16 +358,19 @@ class DocsEqualizerData:
             coeff_encoding=coeff_encoding,
             coeff_endianness=coeff_endianness,
         )
+        coefficients: list[PreEqAtdmaCoefficients] = [
+            (RealInt(tap.real), ImginaryInt(tap.imag)) for tap in taps
+        ]
 
-        metrics = self._build_metrics(taps)
+        metrics = self._build_metrics(coefficients)
         group_delay = self._build_group_delay(
-            taps,
+            coefficients,
             channel_width_hz=channel_width_hz,
             taps_per_symbol=taps_per_symbol,
             rolloff=rolloff,
         )
         tap_delay_summary = self._build_tap_delay_summary(
-            taps,
+            coefficients,
             channel_width_hz=channel_width_hz,
             taps_per_symbol=taps_per_symbol,
             rolloff=rolloff,
@@ -252,60 +399,49 @@ class DocsEqualizerData:
         coeff_encoding: Literal["four-nibble", "three-nibble", "auto"],
         coeff_endianness: Literal["little", "big", "auto"],
     ) -> list[UsEqTapModel]:
-        taps: list[UsEqTapModel] = []
+        self._check_decode_options(coeff_encoding, coeff_endianness)
         step = self.COMPLEX_TAP_SIZE
-
-        endian = coeff_endianness
-        if endian == "auto":
-            endian = self._detect_coeff_endianness(data)
-
-        encoding = coeff_encoding
-        if encoding == "auto":
-            encoding = self._detect_coeff_encoding(data, coeff_endianness=endian)
-
         tap_count = len(data) // step
-        for tap_idx in range(tap_count):
-            base = tap_idx * step
-            real_b = data[base : base + self.COEFF_BYTES]
-            imag_b = data[base + self.COEFF_BYTES : base + step]
-
-            real_u16 = int.from_bytes(real_b, byteorder=endian, signed=False)
-            imag_u16 = int.from_bytes(imag_b, byteorder=endian, signed=False)
+        if tap_count == 0:
+            return []
 
-            real = self._decode_coeff(real_u16, coeff_encoding=encoding)
-            imag = self._decode_coeff(imag_u16, coeff_encoding=encoding)
+        u8 = np.frombuffer(data, dtype=np.uint8, count=tap_count * step).reshape(1, tap_count, step)
+        n = np.array([tap_count], dtype=np.int64)
+        words = self._coeff_words(u8, self._resolve_big_endian(u8, n, coeff_endianness))
+        values = self._decode_words(words, self._resolve_four_nibble(words, n, coeff_encoding))[0]
 
-            magnitude = math.hypot(float(real), float(imag))
-            if magnitude > 0.0:
-                power_db = 10.0 * math.log10(magnitude * magnitude)
-            else:
-                power_db = None
+        reals = values[:, 0].tolist()
+        imags = values[:, 1].tolist()
+        magnitudes = np.hypot(values[:, 0], values[:, 1]).tolist()
+        raw_hex = data[: tap_count * step].hex().upper()
+        width = self.COEFF_BYTES * 2
 
+        taps: list[UsEqTapModel] = []
+        for tap_idx, (real, imag, magnitude) in enumerate(zip(reals, imags, magnitudes, strict=True)):
+            power_db = 10.0 * math.log10(magnitude * magnitude) if magnitude > 0.0 else None
+            base = tap_idx * step * 2
             taps.append(
                 UsEqTapModel(
                     real=real,
                     imag=imag,
                     magnitude=round(magnitude, 2),
                     magnitude_power_dB=(round(power_db, 2) if power_db is not None else None),
-                    real_hex=real_b.hex().upper(),
-                    imag_hex=imag_b.hex().upper(),
+                    real_hex=raw_hex[base : base + width],
+                    imag_hex=raw_hex[base + width : base + 2 * width],
                 )
             )
 
         return taps
 
-    def _build_metrics(self, taps: list[UsEqTapModel]) -> EqualizerMetricsModel | None:
-        if len(taps) != EqualizerMetrics.EXPECTED_TAP_COUNT:
+    def _build_metrics(self, coefficients: list[PreEqAtdmaCoefficients]) -> EqualizerMetricsModel | None:
+        if len(coefficients) != EqualizerMetrics.EXPECTED_TAP_COUNT:
             return None
 
-        coefficients: list[PreEqAtdmaCoefficients] = [
-            (RealInt(tap.real), ImginaryInt(tap.imag)) for tap in taps
-        ]
         return EqualizerMetrics(coefficients=coefficients).to_model()
 
     def _build_group_delay(
         self,
-        taps: list[UsEqTapModel],
+        coefficients: list[PreEqAtdmaCoefficients],
         *,
         channel_width_hz: BandwidthHz | None,
         taps_per_symbol: int,
@@ -313,14 +449,11 @@ class DocsEqualizerData:
     ) -> GroupDelayModel | None:
         if channel_width_hz is None:
             return None
-        if len(taps) == 0:
+        if len(coefficients) == 0:
             return None
         if taps_per_symbol <= 0:
             return None
 
-        coefficients: list[PreEqAtdmaCoefficients] = [
-            (RealInt(tap.real), ImginaryInt(tap.imag)) for tap in taps
-        ]
         try:
             calculator = GroupDelayCalculator(
                 channel_width_hz=channel_width_hz,
@@ -333,7 +466,7 @@ class DocsEqualizerData:
 
     def _build_tap_delay_summary(
         self,
-        taps: list[UsEqTapModel],
+        coefficients: list[PreEqAtdmaCoefficients],
         *,
         channel_width_hz: BandwidthHz | None,
         taps_per_symbol: int,
@@ -343,14 +476,11 @@ class DocsEqualizerData:
             return None
         if taps_per_symbol <= 0:
             return None
-        if len(taps) != EqualizerTapDelayAnnotator.DEFAULT_TAP_COUNT:
+        if len(coefficients) != EqualizerTapDelayAnnotator.DEFAULT_TAP_COUNT:
             return None
         if rolloff < 0.0:
             return None
 
-        coefficients: list[PreEqAtdmaCoefficients] = [
-            (RealInt(tap.real), ImginaryInt(tap.imag)) for tap in taps
-        ]
         symbol_rate = float(int(channel_width_hz)) / (1.0 + float(rolloff))
         try:
             annotator = EqualizerTapDelayAnnotator(
@@ -361,98 +491,88 @@ class DocsEqualizerData:
         except Exception:
             return None
 
-    def _detect_coeff_endianness(self, data: bytes) -> Literal["little", "big"]:
-        """
-        Heuristic endianness detection.
+    @classmethod
+    def _validated_header(cls, payload: bytes) -> tuple[int, int, int, int] | None:
+        """Return (main_tap_location, taps_per_symbol, num_taps, reserved) when the payload is complete."""
+        if len(payload) < cls.HEADER_SIZE:
+            return None
 
-        Many deployed pre-EQ taps are small-magnitude, so the MSB of each 16-bit word is often 0x00 (positive)
-        or 0xFF (negative). We score both interpretations by counting how often the MSB matches {0x00, 0xFF}.
+        main_tap_location, taps_per_symbol, num_taps, reserved = payload[: cls.HEADER_SIZE]
+        if num_taps == 0 or num_taps > cls.MAX_TAPS:
+            return None
+        if len(payload) < cls.HEADER_SIZE + (num_taps * cls.COMPLEX_TAP_SIZE):
+            return None
+        return main_tap_location, taps_per_symbol, num_taps, reserved
+
+    @staticmethod
+    def _check_decode_options(coeff_encoding: str, coeff_endianness: str) -> None:
+        if coeff_encoding not in ("four-nibble", "three-nibble", "auto"):
+            raise ValueError(f"Unsupported coeff_encoding: {coeff_encoding}")
+        if coeff_endianness not in ("little", "big", "auto"):
+            raise ValueError(f"Unsupported coeff_endianness: {coeff_endianness}")
+
+    @classmethod
+    def _resolve_big_endian(
+        cls,
+        u8: NDArray[np.uint8],
+        num_taps: NDArrayI64,
+        coeff_endianness: Literal["little", "big", "auto"],
+    ) -> NDArray[np.bool_]:
         """
-        if len(data) < self.COMPLEX_TAP_SIZE:
-            return "little"
-
-        max_taps = self.AUTO_ENDIAN_SAMPLE_MAX_TAPS
-        tap_count = len(data) // self.COMPLEX_TAP_SIZE
-        if tap_count < max_taps:
-            max_taps = tap_count
-
-        good = (self.AUTO_ENDIAN_BYTE_GOOD_0, self.AUTO_ENDIAN_BYTE_GOOD_FF)
-
-        score_little = 0
-        score_big = 0
-
-        for tap_idx in range(max_taps):
-            base = tap_idx * self.COMPLEX_TAP_SIZE
-
-            r0 = data[base]
-            r1 = data[base + 1]
-            i0 = data[base + 2]
-            i1 = data[base + 3]
-
-            if r1 in good:
-                score_little += 1
-            if i1 in good:
-                score_little += 1
-
-            if r0 in good:
-                score_big += 1
-            if i0 in good:
-                score_big += 1
+        Per-record endianness for ``u8`` shaped (records, taps, 4).
 
-        if score_big > score_little:
-            return "big"
-        return "little"
-
-    def _detect_coeff_encoding(
-        self,
-        data: bytes,
-        *,
-        coeff_endianness: Literal["little", "big"],
-    ) -> Literal["four-nibble", "three-nibble"]:
+        Heuristic ("auto"): many deployed pre-EQ taps are small-magnitude, so the MSB of each 16-bit word
+        is often 0x00 (positive) or 0xFF (negative). Over the first AUTO_ENDIAN_SAMPLE_MAX_TAPS taps we count
+        how often the odd bytes (little-endian MSBs) vs. the even bytes (big-endian MSBs) are 0x00/0xFF;
+        ties resolve to little-endian.
         """
-        Auto-select coefficient decoding:
-
-        - If any coefficient uses the upper nibble (0xF000 mask != 0), assume 16-bit signed (four-nibble).
-        - Otherwise, default to 12-bit signed (three-nibble), which matches the "universal" decoding guidance.
+        if coeff_endianness != "auto":
+            return np.full(u8.shape[0], coeff_endianness == "big")
+
+        sample = min(cls.AUTO_ENDIAN_SAMPLE_MAX_TAPS, u8.shape[1])
+        head = u8[:, :sample, :]
+        in_window = np.arange(sample)[None, :] < num_taps[:, None]
+        good = ((head == cls.AUTO_ENDIAN_BYTE_GOOD_0) | (head == cls.AUTO_ENDIAN_BYTE_GOOD_FF)) & in_window[..., None]
+
+        score_little = good[:, :, 1::2].sum(axis=(1, 2))
+        score_big = good[:, :, 0::2].sum(axis=(1, 2))
+        return score_big > score_little
+
+    @staticmethod
+    def _coeff_words(u8: NDArray[np.uint8], big_endian: NDArray[np.bool_]) -> NDArrayI64:
+        """Assemble (records, taps, 2) unsigned 16-bit (real, imag) words from (records, taps, 4) bytes."""
+        b = u8.astype(np.int64)
+        little = b[..., 0::2] | (b[..., 1::2] << 8)
+        big = (b[..., 0::2] << 8) | b[..., 1::2]
+        return np.where(big_endian[:, None, None], big, little)
+
+    @classmethod
+    def _resolve_four_nibble(
+        cls,
+        words: NDArrayI64,
+        num_taps: NDArrayI64,
+        coeff_encoding: Literal["four-nibble", "three-nibble", "auto"],
+    ) -> NDArray[np.bool_]:
         """
-        step = self.COMPLEX_TAP_SIZE
-        tap_count = len(data) // step
+        Per-record coefficient encoding.
 
-        for tap_idx in range(tap_count):
-            base = tap_idx * step
-            real_b = data[base : base + self.COEFF_BYTES]
-            imag_b = data[base + self.COEFF_BYTES : base + step]
-
-            real_u16 = int.from_bytes(real_b, byteorder=coeff_endianness, signed=False)
-            imag_u16 = int.from_bytes(imag_b, byteorder=coeff_endianness, signed=False)
-
-            if (real_u16 & self.U16_MSN_MASK) != 0:
-                return "four-nibble"
-            if (imag_u16 & self.U16_MSN_MASK) != 0:
-                return "four-nibble"
-
-        return "three-nibble"
-
-    def _decode_coeff(self, raw_u16: int, *, coeff_encoding: Literal["four-nibble", "three-nibble"]) -> int:
-        match coeff_encoding:
-            case "four-nibble":
-                return self._decode_int16(raw_u16)
-            case "three-nibble":
-                return self._decode_int12(raw_u16)
-            case _:
-                raise ValueError(f"Unsupported coeff_encoding: {coeff_encoding}")
-
-    def _decode_int16(self, raw_u16: int) -> int:
-        value = raw_u16 & self.U16_MASK
-        if value & self.I16_SIGN:
-            return value - self.I16_RANGE
-        return value
-
-    def _decode_int12(self, raw_u16: int) -> int:
-        value = raw_u16 & self.U12_MASK
-        if value & self.I12_SIGN:
-            return value - self.I12_RANGE
-        return value
+        "auto": if any coefficient uses the upper nibble (0xF000 mask != 0), assume 16-bit signed
+        (four-nibble); otherwise default to 12-bit signed (three-nibble), which matches the
+        "universal" decoding guidance.
+        """
+        if coeff_encoding != "auto":
+            return np.full(words.shape[0], coeff_encoding == "four-nibble")
+
+        in_range = np.arange(words.shape[1])[None, :] < num_taps[:, None]
+        upper = (words & cls.U16_MSN_MASK) != 0
+        return (upper.any(axis=2) & in_range).any(axis=1)
+
+    @classmethod
+    def _decode_words(cls, words: NDArrayI64, four_nibble: NDArray[np.bool_]) -> NDArrayI64:
+        """Two's-complement decode: 16-bit for four-nibble records, 12-bit (upper nibble dropped) otherwise."""
+        i16 = ((words & cls.U16_MASK) ^ cls.I16_SIGN) - cls.I16_SIGN
+        i12 = ((words & cls.U12_MASK) ^ cls.I12_SIGN) - cls.I12_SIGN
+        return np.where(four_nibble[:, None, None], i16, i12)
 
     def _hex_to_bytes_strict(self, payload_hex: str) -> bytes:
         text = payload_hex.strip()
@@ -0,0 +1,254 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+
+from pypnm.lib.types import NDArrayC128, NDArrayF64, PathLike
+from pypnm.pnm.data_type.DsOfdmModulationType import DsOfdmModulationType
+from pypnm.pnm.parser.CmDsOfdmModulationProfile import ModulationOrderType
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.pnm.parser.pnm_header import PnmHeader
+
+__all__ = ["SyntheticPnmFactory"]
+
+# Payload headers, byte-for-byte the layouts unpacked by the parsers in pypnm.pnm.parser.
+_RXMER_HDR          = struct.Struct("!B6sIHBI")
+_CHAN_EST_HDR       = struct.Struct(">B6sIHBI")
+_CONST_DISP_HDR     = struct.Struct(">B6sIHHBI")
+_SPECTRUM_HDR       = struct.Struct(">B6sIIIHHHI")
+_FEC_SUMMARY_HDR    = struct.Struct("!B6sBB")
+_FEC_PROFILE_HDR    = struct.Struct("!BH")
+_HISTOGRAM_HDR      = struct.Struct(">6sB")
+_MOD_PROFILE_HDR    = struct.Struct(">B6sBIHBI")
+_SYMBOL_CAPTURE_HDR = struct.Struct("!B6sIIHHHI")
+
+_FEC_SET_DTYPE = np.dtype([("timestamp", ">u4"), ("total", ">u4"), ("corrected", ">u4"), ("uncorrectable", ">u4")])
+_MOD_PROFILE_ORDERS = (ModulationOrderType.qam_256, ModulationOrderType.qam_1024, ModulationOrderType.qam_4096)
+
+
+class SyntheticPnmFactory:
+    """
+    Deterministic generator of spec-conformant PNM files for tests and benchmarks.
+
+    Every method returns the complete file (``PnmHeader`` + type payload) as
+    bytes, using the same layouts the parsers in :mod:`pypnm.pnm.parser`
+    read, so the output round-trips through ``PnmFileTypeObjectFetcher``.
+    Sizes are configurable per call; payloads are built with NumPy so a
+    16K-subcarrier file costs about as much as a 1K one.
+
+    Values are plausible rather than realistic: RxMER is Gaussian around a
+    mean, channel estimates carry one echo, constellations are noisy square
+    QAM, and spectrum captures are a noise floor with OFDM-like plateaus.
+
+    Parameters
+    ----------
+    seed : int
+        Seed for the NumPy generator; equal seeds give byte-identical files.
+    mac_address : str
+        Cable modem MAC written into every payload.
+    channel_id : int
+        Downstream channel id written into every payload.
+    capture_time : int
+        Epoch seconds for the PNM header (FEC summary headers carry none).
+    subcarrier_zero_frequency : int
+        Subcarrier-zero frequency in Hz for OFDM file types.
+    first_active_subcarrier_index : int
+        First active subcarrier index for OFDM file types.
+    subcarrier_spacing_khz : int
+        Subcarrier spacing in kHz (25 or 50).
+
+    Example:
+        factory = SyntheticPnmFactory(seed=7)
+        blob = factory.rxmer(subcarriers=7600)
+        model = PnmFileTypeObjectFetcher(blob).get_parser().to_model()
+    """
+
+    MAJOR_VERSION: int = 1
+    MINOR_VERSION: int = 0
+
+    def __init__(self, *, seed: int = 0, mac_address: str = "aa:bb:cc:dd:ee:ff", channel_id: int = 33,
+                 capture_time: int = 1_735_689_600, subcarrier_zero_frequency: int = 631_100_000,
+                 first_active_subcarrier_index: int = 148, subcarrier_spacing_khz: int = 50) -> None:
+        self.rng = np.random.default_rng(seed)
+        self.mac = bytes.fromhex(mac_address.replace(":", "").replace("-", ""))
+        if len(self.mac) != 6:
+            raise ValueError(f"mac_address must have 6 octets: {mac_address!r}")
+        self.channel_id = channel_id
+        self.capture_time = capture_time
+        self.subcarrier_zero_frequency = subcarrier_zero_frequency
+        self.first_active_subcarrier_index = first_active_subcarrier_index
+        self.subcarrier_spacing_khz = subcarrier_spacing_khz
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Public API
+    # ──────────────────────────────────────────────────────────────────────
+    def build(self, file_type: PnmFileType, **kwargs: int | float) -> bytes:
+        """
+        Generate a file of ``file_type``; ``kwargs`` are passed to the matching method.
+
+        Raises
+        ------
+        ValueError
+            If the factory has no generator for ``file_type``.
+        """
+        builders: dict[PnmFileType, Callable[..., bytes]] = {
+            PnmFileType.SYMBOL_CAPTURE:                     self.symbol_capture,
+            PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT:  self.chan_est,
+            PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY:   self.const_disp,
+            PnmFileType.RECEIVE_MODULATION_ERROR_RATIO:     self.rxmer,
+            PnmFileType.DOWNSTREAM_HISTOGRAM:               self.histogram,
+            PnmFileType.OFDM_FEC_SUMMARY:                   self.fec_summary,
+            PnmFileType.SPECTRUM_ANALYSIS:                  self.spectrum,
+            PnmFileType.OFDM_MODULATION_PROFILE:            self.mod_profile,
+        }
+        if file_type not in builders:
+            raise ValueError(f"No synthetic generator for PNM file type: {file_type}")
+        return builders[file_type](**kwargs)
+
+    def write(self, directory: PathLike, filename: str, file_type: PnmFileType, **kwargs: int | float) -> Path:
+        """Generate a file with :meth:`build` and write it to ``directory/filename``."""
+        path = Path(directory) / filename
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(self.build(file_type, **kwargs))
+        return path
+
+    def header(self, file_type: PnmFileType) -> bytes:
+        """
+        Return the PNM header for ``file_type`` in the layout :class:`PnmHeader` parses.
+
+        FEC summary (PNN8) headers omit the capture time.
+        """
+        cann = file_type.get_pnm_cann()
+        type_num = int(cann[3:])
+        if file_type.value in PnmHeader._MISSING_CAPTURE_TYPES:
+            return struct.pack(PnmHeader._FMT_LE, cann[:3].encode(), type_num,
+                               self.MAJOR_VERSION, self.MINOR_VERSION)
+        return struct.pack(PnmHeader._FMT_BE, cann[:3].encode(), type_num,
+                           self.MAJOR_VERSION, self.MINOR_VERSION, self.capture_time)
+
+    def rxmer(self, subcarriers: int = 3800, *, mean_db: float = 38.0, std_db: float = 1.5) -> bytes:
+        """RxMER file (PNN4): one quarter-dB byte per active subcarrier."""
+        mer = self.rng.normal(mean_db, std_db, subcarriers)
+        data = np.clip(np.rint(mer * 4.0), 0, 254).astype(np.uint8).tobytes()
+        return self.header(PnmFileType.RECEIVE_MODULATION_ERROR_RATIO) + _RXMER_HDR.pack(
+            self.channel_id, self.mac, self.subcarrier_zero_frequency,
+            self.first_active_subcarrier_index, self.subcarrier_spacing_khz, len(data)) + data
+
+    def chan_est(self, subcarriers: int = 3800, *, echo_delay_s: float = 1.5e-6,
+                 echo_level_db: float = -25.0, noise_std: float = 0.005) -> bytes:
+        """Channel estimation file (PNN2): Q2.13 coefficients of a one-echo channel."""
+        f = np.arange(subcarriers) * self.subcarrier_spacing_khz * 1e3
+        echo = 10.0 ** (echo_level_db / 20.0)
+        h = 0.8 * np.exp(-2j * np.pi * f * 0.2e-6) * (1.0 + echo * np.exp(-2j * np.pi * f * echo_delay_s))
+        data = self._q_format(h + self._noise(subcarriers, noise_std), frac_bits=13)
+        return self.header(PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT) + _CHAN_EST_HDR.pack(
+            self.channel_id, self.mac, self.subcarrier_zero_frequency,
+            self.first_active_subcarrier_index, self.subcarrier_spacing_khz, len(data)) + data
+
+    def const_disp(self, samples: int = 8192, *, qam_order: int = 256, snr_db: float = 35.0) -> bytes:
+        """Constellation display file (PNN3): Q2.13 soft decisions of square QAM."""
+        code = DsOfdmModulationType.qpsk if qam_order == 4 else DsOfdmModulationType[f"qam{qam_order}"]
+        side = int(round(np.sqrt(qam_order)))
+        if side * side != qam_order:
+            raise ValueError(f"qam_order must be a square QAM order: {qam_order}")
+
+        levels = (2.0 * np.arange(side) - (side - 1)) / np.sqrt(2.0 * (qam_order - 1) / 3.0)
+        points = self.rng.choice(levels, samples) + 1j * self.rng.choice(levels, samples)
+        data = self._q_format(points + self._noise(samples, 10.0 ** (-snr_db / 20.0) / np.sqrt(2.0)), frac_bits=13)
+        return self.header(PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY) + _CONST_DISP_HDR.pack(
+            self.channel_id, self.mac, self.subcarrier_zero_frequency, int(code), samples,
+            self.subcarrier_spacing_khz, len(data)) + data
+
+    def spectrum(self, segments: int = 81, *, bins_per_segment: int = 256, first_center_hz: int = 300_000_000,
+                 segment_span_hz: int = 7_500_000, noise_floor_db: float = -45.0) -> bytes:
+        """Spectrum analysis file (PNN9): int16 amplitudes in hundredths of a dB."""
+        n = segments * bins_per_segment
+        amp = self.rng.normal(noise_floor_db, 1.0, n)
+        # OFDM-like plateaus over every other 192 MHz block.
+        freqs = first_center_hz - segment_span_hz / 2.0 + np.arange(n) * (segment_span_hz / bins_per_segment)
+        amp[(freqs // 192e6).astype(np.int64) % 2 == 1] += 40.0
+        data = np.clip(np.rint(amp * 100.0), -32768, 32767).astype(">i2").tobytes()
+        return self.header(PnmFileType.SPECTRUM_ANALYSIS) + _SPECTRUM_HDR.pack(
+            self.channel_id, self.mac, first_center_hz, first_center_hz + (segments - 1) * segment_span_hz,
+            segment_span_hz, bins_per_segment, 110, 1, len(data)) + data
+
+    def fec_summary(self, profiles: int = 4, sets: int = 600, *, summary_type: int = 2) -> bytes:
+        """
+        FEC summary file (PNN8): ``sets`` records per profile at the summary type's cadence.
+
+        Counters are cumulative and monotonic, as a modem reports them.
+        """
+        step = 60 if summary_type == 3 else 1
+        body = [_FEC_SUMMARY_HDR.pack(self.channel_id, self.mac, summary_type, profiles)]
+        for profile_id in range(profiles):
+            rec = np.empty(sets, dtype=_FEC_SET_DTYPE)
+            rec["timestamp"] = self.capture_time + np.arange(sets) * step
+            total = np.cumsum(self.rng.integers(90_000, 110_000, sets))
+            corrected = np.cumsum(self.rng.poisson(5.0, sets))
+            rec["total"] = total
+            rec["corrected"] = corrected
+            rec["uncorrectable"] = np.cumsum(self.rng.poisson(0.05, sets))
+            body.append(_FEC_PROFILE_HDR.pack(profile_id, sets))
+            body.append(rec.tobytes())
+        return self.header(PnmFileType.OFDM_FEC_SUMMARY) + b"".join(body)
+
+    def histogram(self, bins: int = 255, *, dwell_count: int = 1_000_000) -> bytes:
+        """
+        Histogram file (PNN5): one dwell count (as modems report it) and ``bins`` hit counts.
+
+        Hits follow a Gaussian amplitude profile centred on the middle bin.
+        """
+        x = np.arange(bins) - (bins - 1) / 2.0
+        hits = self.rng.poisson(dwell_count * np.exp(-0.5 * (x / (bins / 8.0)) ** 2) / bins)
+        dwell = np.array([dwell_count], dtype=">u4").tobytes()
+        hit = hits.astype(">u4").tobytes()
+        return (self.header(PnmFileType.DOWNSTREAM_HISTOGRAM) + _HISTOGRAM_HDR.pack(self.mac, 1)
+                + struct.pack(">I", len(dwell)) + dwell + struct.pack(">I", len(hit)) + hit)
+
+    def mod_profile(self, profiles: int = 4, subcarriers: int = 3800, *, runs: int = 8) -> bytes:
+        """
+        Modulation profile file (PNN10): per profile, ``runs`` range schemes plus one skip scheme.
+
+        Each profile covers ``subcarriers`` subcarriers in total.
+        """
+        blob = bytearray()
+        for profile_id in range(profiles):
+            cuts = np.sort(self.rng.choice(np.arange(1, subcarriers - 1), runs, replace=False))
+            widths = np.diff(np.concatenate(([0], cuts, [subcarriers])))
+            orders = self.rng.choice(len(_MOD_PROFILE_ORDERS), widths.size)
+            payload = bytearray()
+            for width, order in zip(widths[:-1].tolist(), orders[:-1].tolist(), strict=True):
+                payload += struct.pack(">BBH", 0, _MOD_PROFILE_ORDERS[order], width)
+            payload += struct.pack(">BBBH", 1, _MOD_PROFILE_ORDERS[orders[-1]],
+                                   ModulationOrderType.qam_256, int(widths[-1]))
+            blob += _FEC_PROFILE_HDR.pack(profile_id, len(payload)) + payload
+        return self.header(PnmFileType.OFDM_MODULATION_PROFILE) + _MOD_PROFILE_HDR.pack(
+            self.channel_id, self.mac, profiles, self.subcarrier_zero_frequency,
+            self.first_active_subcarrier_index, self.subcarrier_spacing_khz, len(blob)) + bytes(blob)
+
+    def symbol_capture(self, samples: int = 8192, *, fft_size: int = 8192,
+                       sample_rate_hz: int = 204_800_000) -> bytes:
+        """Symbol capture file (PNN1): Q3.12 time-domain samples of one OFDM symbol."""
+        x = self._noise(samples, 0.5 / np.sqrt(2.0))
+        data = self._q_format(x, frac_bits=12)
+        return self.header(PnmFileType.SYMBOL_CAPTURE) + _SYMBOL_CAPTURE_HDR.pack(
+            self.channel_id, self.mac, self.subcarrier_zero_frequency, sample_rate_hz,
+            fft_size, 0, 1, len(data)) + data
+
+    # ──────────────────────────────────────────────────────────────────────
+    # Helpers
+    # ──────────────────────────────────────────────────────────────────────
+    def _noise(self, n: int, std: float) -> NDArrayC128:
+        return std * (self.rng.standard_normal(n) + 1j * self.rng.standard_normal(n))
+
+    @staticmethod
+    def _q_format(z: NDArrayC128, *, frac_bits: int) -> bytes:
+        """Encode complex values as interleaved big-endian int16 (real, imag) in Q(15-frac).frac."""
+        iq: NDArrayF64 = np.column_stack((z.real, z.imag)) * float(1 << frac_bits)
+        return np.clip(np.rint(iq), -32768, 32767).astype(">i2").tobytes()
@@ -1,16 +1,24 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import logging
 from struct import calcsize, unpack
+from typing import Any
 
+import numpy as np
 from pydantic import BaseModel, ConfigDict, Field
 from pydantic.functional_serializers import field_serializer
 
 from pypnm.lib.mac_address import MacAddress, MacAddressFormat
-from pypnm.lib.types import ChannelId, FloatSeries, FrequencyHz, MacAddressStr
+from pypnm.lib.types import (
+    ChannelId,
+    FloatSeries,
+    FrequencyHz,
+    MacAddressStr,
+    NDArrayF64,
+)
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
 from pypnm.pnm.parser.pnm_header import PnmHeader, PnmHeaderParameters
 
@@ -71,6 +79,7 @@ class CmSpectrumAnalysis(PnmHeader):
         self._spectrum_analysis_data: bytes
         self._bin_frequency_spacing: int
         self._amplitude_bin_segments_float: list[FloatSeries] = []
+        self._amplitude_matrix: NDArrayF64 = np.empty((0, 0), dtype=np.float64)
         self._number_of_bin_segments: int
         self._num_of_bin_segments:int = 0
 
@@ -124,32 +133,42 @@ class CmSpectrumAnalysis(PnmHeader):
             return
 
         try:
-            segment_size_bytes = self._num_bins_per_segment * self.AMPLITUDE_BIN_SIZE
-            total_data_len = len(self._spectrum_analysis_data)
+            bins = int(self._num_bins_per_segment)
+            data = self._spectrum_analysis_data
+            segment_size_bytes = bins * self.AMPLITUDE_BIN_SIZE
+            total_data_len = len(data)
             self.logger.debug(f'Total Data Length: {total_data_len} bytes')
 
-            for offset in range(0, total_data_len, segment_size_bytes):
-                segment_bytes = self._spectrum_analysis_data[offset:offset + segment_size_bytes]
-                actual_bins = len(segment_bytes) // self.AMPLITUDE_BIN_SIZE
+            if segment_size_bytes <= 0:
+                raise ValueError(f"Invalid bins per segment: {bins}")
+            tail_bytes = total_data_len % segment_size_bytes
+            if tail_bytes % self.AMPLITUDE_BIN_SIZE and tail_bytes > self.AMPLITUDE_BIN_SIZE:
+                raise ValueError(f"Trailing segment of {tail_bytes} bytes is not a whole number of bins")
 
-                if actual_bins == 0:
-                    self.logger.warning(f"Empty segment encountered at offset {offset}, skipping.")
-                    continue
+            # decode every bin at once (big-endian int16, hundredths of a dB)
+            usable = total_data_len - total_data_len % self.AMPLITUDE_BIN_SIZE
+            values = np.frombuffer(data, dtype=">i2", count=usable // self.AMPLITUDE_BIN_SIZE) / 100.0
 
-                if actual_bins < self._num_bins_per_segment:
-                    self.logger.warning(f"Incomplete segment encountered at offset {offset} with only {actual_bins} bins.")
+            full_segments = values.size // bins
+            tail = values[full_segments * bins:]
+            if tail.size:
+                self.logger.warning(f"Incomplete segment encountered at offset {full_segments * segment_size_bytes} "
+                                    f"with only {tail.size} bins.")
 
-                format_string = f'>{actual_bins}h'
-                self.logger.debug(f'Unpack format: {format_string} for {actual_bins} bins')
+            matrix = np.full((full_segments + (1 if tail.size else 0), bins), np.nan, dtype=np.float64)
+            matrix[:full_segments] = values[:full_segments * bins].reshape(full_segments, bins)
+            matrix[full_segments:, :tail.size] = tail
 
-                raw_bins = unpack(format_string, segment_bytes)
-                amplitude_values = [val / 100.0 for val in raw_bins]
-                self._amplitude_bin_segments_float.append(amplitude_values)
-                self._num_of_bin_segments += 1
+            self._amplitude_matrix = matrix
+            self._amplitude_bin_segments_float = matrix[:full_segments].tolist()
+            if tail.size:
+                self._amplitude_bin_segments_float.append(tail.tolist())
+            self._num_of_bin_segments = matrix.shape[0]
 
         except Exception as e:
             self.logger.error(f"Failed to unpack spectrum amplitude data: {e}")
             self._amplitude_bin_segments_float = []
+            self._amplitude_matrix = np.empty((0, 0), dtype=np.float64)
 
     def _build_model(self) -> CmSpectrumAnalyzerModel:
         """
@@ -173,6 +192,13 @@ class CmSpectrumAnalysis(PnmHeader):
         )
         return self._model
 
+    def amplitude_bin_segments_array(self) -> NDArrayF64:
+        """
+        Return the amplitude segments as a ``(segments, num_bins_per_segment)``
+        float64 array in dB, with a short final segment NaN-padded.
+        """
+        return self._amplitude_matrix
+
     def to_model(self) -> CmSpectrumAnalyzerModel:
         """
         Return the fully built `CmSpectrumAnalyzerModel`.
@@ -198,3 +224,37 @@ class CmSpectrumAnalysis(PnmHeader):
             str: JSON representation of the spectrum analysis results.
         """
         return self._model.model_dump_json(indent=indent)
+
+    @classmethod
+    def slice_measurement(cls, measurement: dict[str, Any], start_hz: int, end_hz: int) -> dict[str, Any]:
+        """
+        Return the part of a parsed spectrum capture that covers ``[start_hz, end_hz]``.
+
+        ``measurement`` is a :meth:`to_dict` result. Segments whose span overlaps
+        the window are kept; the segment center bounds, the amplitude segments and
+        the raw amplitude data (bytes or hex string) are cut to match. A capture
+        without segments is returned unchanged.
+        """
+        segments = measurement.get("amplitude_bin_segments_float") or []
+        first = int(measurement.get("first_segment_center_frequency", 0))
+        span = int(measurement.get("segment_frequency_span", 0))
+        bins = int(measurement.get("num_bins_per_segment", 0))
+        if not segments or span <= 0:
+            return measurement
+
+        centers = first + np.arange(len(segments), dtype=np.int64) * span
+        keep = np.flatnonzero((centers + span / 2 > start_hz) & (centers - span / 2 < end_hz))
+        lo, hi = (int(keep[0]), int(keep[-1]) + 1) if keep.size else (0, 0)
+
+        out = dict(measurement)
+        out["first_segment_center_frequency"] = FrequencyHz(first + lo * span)
+        out["last_segment_center_frequency"] = FrequencyHz(first + max(lo, hi - 1) * span)
+        out["amplitude_bin_segments_float"] = segments[lo:hi]
+
+        raw = measurement.get("spectrum_analysis_data")
+        if isinstance(raw, (bytes, bytearray, str)) and bins > 0:
+            per_byte = 2 if isinstance(raw, str) else 1
+            unit = bins * cls.AMPLITUDE_BIN_SIZE * per_byte
+            out["spectrum_analysis_data"] = raw[lo * unit:hi * unit]
+            out["spectrum_analysis_data_length"] = len(out["spectrum_analysis_data"]) // per_byte
+        return out
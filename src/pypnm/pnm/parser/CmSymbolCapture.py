@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -44,8 +44,8 @@ class CmSymbolCapture(PnmHeader):
             error_cann = actual_type.get_pnm_cann() if actual_type else "Unknown"
             raise ValueError(f"PNM File Stream is not RxMER file type: {cann}, Error: {error_cann}")
 
-        # Extract CmSymbolCapture fields using struct.unpack
-        cm_symbol_capture_format = '<B6sII2HI'
+        # channel_id, mac(6), zero_freq, sample_rate, fft_size, trigger_group_id, transaction_id, data_len
+        cm_symbol_capture_format = '!B6sIIHHHI'
         cm_symbol_capture_size = unpack(cm_symbol_capture_format,
                                         self.pnm_data[:calcsize(cm_symbol_capture_format)])
 
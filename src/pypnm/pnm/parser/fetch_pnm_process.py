@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Union
 
+from pypnm.lib.telemetry.metrics import REGISTRY
+from pypnm.lib.telemetry.tracing import trace_span
 from pypnm.pnm.parser.pnm_file_type import PnmFileType
 from pypnm.pnm.parser.pnm_header import PnmHeader
 
@@ -33,6 +35,12 @@ PnmParserClass = Union[
     "CmLatencyRpt",
 ]
 
+PNM_PARSE_SECONDS = REGISTRY.histogram(
+    "pypnm_pnm_parse_duration_seconds",
+    "Time to decode a PNM file into its parser, by PNM file type.",
+    ("file_type",),
+)
+
 
 class PnmFileTypeObjectFetcher(PnmHeader):
     """
@@ -93,7 +101,8 @@ class PnmFileTypeObjectFetcher(PnmHeader):
         else:
             raise ValueError(f"Unsupported PNM file type: {pnm_type}")
 
-        self._parser = ParserClass(self._byte_stream)
+        with trace_span("pnm.parse", file_type=pnm_type.name), PNM_PARSE_SECONDS.time(file_type=pnm_type.name):
+            self._parser = ParserClass(self._byte_stream)
 
     def get_parser(self) -> PnmParserClass:
         """
@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
-from collections.abc import AsyncIterable
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
 from datetime import datetime, timedelta, timezone
-from typing import TypeVar
+from typing import Any, ParamSpec, TypeVar
 
 from pysnmp.hlapi.v3arch.asyncio import (
     CommunityData,
@@ -18,15 +20,19 @@ from pysnmp.hlapi.v3arch.asyncio import (
     UdpTransportTarget,
     bulk_cmd,
     get_cmd,
+    next_cmd,
     set_cmd,
-    walk_cmd,
 )
+from pysnmp.proto import errind
 from pysnmp.proto.rfc1902 import Integer32, OctetString
+from pysnmp.proto.rfc1905 import EndOfMibView
 
 from pypnm.config.pnm_config_manager import SystemConfigSettings
 from pypnm.lib.constants import T
 from pypnm.lib.inet import Inet
 from pypnm.lib.inet_utils import InetGenerate
+from pypnm.lib.telemetry.metrics import REGISTRY
+from pypnm.lib.telemetry.tracing import trace_span
 from pypnm.lib.types import (
     InetAddressStr,
     InterfaceIndex,
@@ -36,6 +42,43 @@ from pypnm.lib.types import (
 )
 from pypnm.snmp.compiled_oids import COMPILED_OIDS
 from pypnm.snmp.modules import InetAddressType
+from pypnm.snmp.transport_controller import SNMP_TRANSPORT
+
+SNMP_REQUEST_SECONDS = REGISTRY.histogram(
+    "pypnm_snmp_request_duration_seconds",
+    "SNMPv2c request latency by operation, including bulk-walk step-down and walk fallback.",
+    ("operation",),
+)
+SNMP_RETRIES = REGISTRY.counter(
+    "pypnm_snmp_retries_total",
+    "Client-side SNMP retries by operation and reason (transport retries inside pysnmp are not counted).",
+    ("operation", "reason"),
+)
+SNMP_ERRORS = REGISTRY.counter(
+    "pypnm_snmp_errors_total",
+    "SNMP error responses and indications by operation.",
+    ("operation",),
+)
+SNMP_SHORT_CIRCUITS = REGISTRY.counter(
+    "pypnm_snmp_short_circuits_total",
+    "SNMP requests refused without sending because the target's circuit breaker is open.",
+    ("operation",),
+)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def _instrumented(operation: str) -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Time an async SNMP operation and open a ``snmp.<operation>`` trace span around it."""
+    def decorate(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            host = getattr(args[0], "_host", None) if args else None
+            with trace_span(f"snmp.{operation}", host=host), SNMP_REQUEST_SECONDS.time(operation=operation):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorate
 
 
 class Snmp_v2c:
@@ -112,6 +155,7 @@ class Snmp_v2c:
         self._retries   = retries
         self._snmp_engine = SnmpEngine()
 
+    @_instrumented("get")
     async def get(
         self,
         oid: str | tuple[str, str, int],
@@ -127,11 +171,14 @@ class Snmp_v2c:
 
         Args:
             oid: OID to fetch, either as a numeric string, symbolic name, or tuple.
-            timeout: Request timeout in **seconds**. If None, uses self._timeout.
+            timeout: Longest request timeout in **seconds**. If None, uses self._timeout.
+                     Targets that have answered before get their learned timeout (see
+                     :class:`SnmpTransportController`) when it is shorter.
             retries: Number of retries. If None, uses self._retries.
 
         Returns:
-            Optional[List[ObjectType]]: List of SNMP variable bindings or None if no result.
+            Optional[List[ObjectType]]: List of SNMP variable bindings, or None if no result
+            or the target's circuit breaker is open.
 
         Raises:
             RuntimeError: On SNMP errors (transport/protocol).
@@ -141,31 +188,35 @@ class Snmp_v2c:
         resolved_oid = Snmp_v2c.resolve_oid(oid)
         obj = ObjectType(self._to_object_identity(resolved_oid))
 
-        timeout_s = float(timeout if timeout is not None else self._timeout)
-        retries_n = int(retries if retries is not None else self._retries)
-
-        errorIndication, errorStatus, errorIndex, varBinds = await get_cmd(
+        response = await self._send("get", lambda transport: get_cmd(
             self._snmp_engine,
             CommunityData(self._read_community, mpModel=1),
-            await UdpTransportTarget.create((self._host, self._port),
-                                            timeout=timeout_s,     # seconds
-                                            retries=retries_n,     # count
-                                            ),
+            transport,
             ContextData(),
             obj,
-        )
+        ), timeout=timeout, retries=retries)
+
+        if response is None:
+            return None
+        errorIndication, errorStatus, errorIndex, varBinds = response
 
         try:
             self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
         except Exception as e:
+            SNMP_ERRORS.inc(operation="get")
             self.logger.error(f"Failed GET for OID {resolved_oid}: {e}")
 
         return varBinds
 
+    @_instrumented("walk")
     async def walk(self, oid: str | tuple[str, str, int]) -> list[ObjectType] | None:
         """
         Perform an SNMP WALK operation.
 
+        Each GETNEXT is sent through :meth:`_send`, so every page gets the
+        per-attempt timeout backoff (capped by the configured timeout) and the
+        circuit breaker of :data:`SNMP_TRANSPORT`.
+
         Args:
             oid (str | Tuple[str, str, int]): The starting OID for the walk.
 
@@ -176,49 +227,52 @@ class Snmp_v2c:
         oid = Snmp_v2c.resolve_oid(oid)
         self.logger.debug(f"Converted: {oid}")
 
-        identity = self._to_object_identity(oid)
-        obj = ObjectType(identity)
         results: list[ObjectType] = []
+        next_oid: str = oid
 
-        transport = await UdpTransportTarget.create((self._host, self._port),
-                                                    timeout=self._timeout,
-                                                    retries=self._retries)
-
-        objects = walk_cmd(
-            self._snmp_engine,
-            CommunityData(self._read_community, mpModel=1),
-            transport,
-            ContextData(),
-            obj
-        )
-
-        async for item in objects:
-
-            errorIndication, errorStatus, errorIndex, varBinds = item
+        while True:
+            start_identity = self._to_object_identity(next_oid)
+            response = await self._send("walk", lambda transport, start=start_identity: next_cmd(
+                self._snmp_engine,
+                CommunityData(self._read_community, mpModel=1),
+                transport,
+                ContextData(),
+                ObjectType(start)
+            ))
+            if response is None:
+                break
 
+            errorIndication, errorStatus, errorIndex, varBinds = response
             try:
                 self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
 
             except Exception as e:
+                SNMP_ERRORS.inc(operation="walk")
                 self.logger.error(f"Failed walk : {e}")
-                continue
-
-            if not varBinds:
-                continue
+                break
 
-            for varBind in varBinds:
+            page_start = next_oid if results else ""
+            done = not varBinds
+            for varBind in varBinds or []:
                 oid_str = str(varBind[0])
 
-                if not self._is_oid_in_subtree(oid_str, str(identity)):
+                if (isinstance(varBind[1], EndOfMibView) or oid_str == page_start
+                        or not self._is_oid_in_subtree(oid_str, oid)):
                     self.logger.debug(f"End of OID subtree reached at {oid_str} -> {varBind} - List size {len(results)}")
-                    return results if results else None
+                    done = True
+                    break
 
                 results.append(varBind)
 
+            if done:
+                break
+            next_oid = str(results[-1][0])
+
         self.logger.debug(f'List size {len(results)}')
 
         return results if results else None
 
+    @_instrumented("bulk_walk")
     async def bulk_walk(
         self,
         oid: str | tuple[str, str, int],
@@ -247,6 +301,10 @@ class Snmp_v2c:
         Notes:
             - GETBULK is more efficient than WALK for large MIB tables
             - Not supported by SNMPv1 agents (will fall back to WALK)
+            - Pages through the subtree, continuing after the last row of each response
+            - On tooBig the request size is halved; the largest size the agent answered
+              and the smallest it rejected are remembered per target, so later walks
+              start at a size the agent handles (see SnmpTransportController)
             - max_repetitions should be tuned based on network conditions:
               * Small networks: 25-50
               * Large/slow networks: 10-25
@@ -254,45 +312,34 @@ class Snmp_v2c:
         """
         oid = Snmp_v2c.resolve_oid(oid)
 
-        identity = self._to_object_identity(oid)
-        attempt_values: list[int] = []
-        for value in [max_repetitions, 10, 5, 1]:
-            if value > 0 and value not in attempt_values:
-                attempt_values.append(value)
-
+        key = self._target_key()
+        attempt = SNMP_TRANSPORT.bulk_size(key, max_repetitions)
+        results: list[ObjectType] = []
+        next_oid: str = oid
         last_error: str | None = None
 
-        for attempt in attempt_values:
+        while True:
             self.logger.debug(
-                f"Starting SNMP BULK WALK with OID: {oid}, non_repeaters={non_repeaters}, max_repetitions={attempt}"
-            )
-            obj = ObjectType(identity)
-            results: list[ObjectType] = []
-            retry = False
-            hard_error = False
-
-            transport = await UdpTransportTarget.create(
-                (self._host, self._port),
-                timeout=self._timeout,
-                retries=self._retries
+                f"Starting SNMP BULK WALK with OID: {next_oid}, non_repeaters={non_repeaters}, max_repetitions={attempt}"
             )
-
-            objects = await bulk_cmd(
+            start_identity = self._to_object_identity(next_oid)
+            objects = await self._send("bulk_walk", lambda transport, start=start_identity, size=attempt: bulk_cmd(
                 self._snmp_engine,
                 CommunityData(self._read_community, mpModel=1),
                 transport,
                 ContextData(),
                 non_repeaters,
-                attempt,
-                obj
-            )
+                size,
+                ObjectType(start)
+            ))
+            if objects is None:
+                return None
+
+            page_rows = 0
+            page_start = next_oid if results else ""
+            done = retry = hard_error = False
 
-            def _process_item(
-                item: tuple[object, object, object, list[ObjectType]],
-                attempt_value: int,
-                identity_value: object,
-                results_list: list[ObjectType],
-            ) -> tuple[bool, bool, bool, str | None]:
+            async for item in self._bulk_items(objects):
                 errorIndication, errorStatus, errorIndex, varBinds = item
 
                 if errorIndication or errorStatus:
@@ -300,75 +347,58 @@ class Snmp_v2c:
                     if errorStatus:
                         pretty = getattr(errorStatus, "prettyPrint", None)
                         status_text = pretty() if callable(pretty) else str(errorStatus)
-                    error_message = status_text or str(errorIndication)
+                    last_error = status_text or str(errorIndication)
 
                     if status_text == "tooBig":
-                        self.logger.warning(
-                            f"Bulk walk tooBig with max_repetitions={attempt_value}; retrying with smaller value."
-                        )
-                        return True, True, False, error_message
-
+                        smaller = SNMP_TRANSPORT.on_bulk_too_big(key, attempt)
+                        if smaller is not None:
+                            self.logger.warning(
+                                f"Bulk walk tooBig with max_repetitions={attempt}; retrying with {smaller}."
+                            )
+                            SNMP_RETRIES.inc(operation="bulk_walk", reason="too_big")
+                            attempt, retry = smaller, True
+                            break
+
+                    SNMP_ERRORS.inc(operation="bulk_walk")
                     if status_text == "noSuchName" and suppress_no_such_name:
-                        self.logger.debug(f"Failed bulk walk: {error_message}")
+                        self.logger.debug(f"Failed bulk walk: {last_error}")
                     else:
-                        self.logger.error(f"Failed bulk walk: {error_message}")
-                    return True, False, True, error_message
+                        self.logger.error(f"Failed bulk walk: {last_error}")
+                    hard_error = True
+                    break
 
-                if not varBinds:
-                    return False, False, False, None
-
-                for varBind in varBinds:
+                for varBind in varBinds or []:
                     oid_str = str(varBind[0])
 
-                    if not self._is_oid_in_subtree(oid_str, str(identity_value)):
-                        self.logger.debug   (
-                            f"End of OID subtree reached at {oid_str} -> {varBind} - List size {len(results_list)}"
+                    if (isinstance(varBind[1], EndOfMibView) or oid_str == page_start
+                            or not self._is_oid_in_subtree(oid_str, oid)):
+                        self.logger.debug(
+                            f"End of OID subtree reached at {oid_str} -> {varBind} - List size {len(results)}"
                         )
-                        return True, False, False, None
-
-                    results_list.append(varBind)
-
-                return False, False, False, None
-
-            if isinstance(objects, tuple) and len(objects) == 4:
-                done, retry, hard_error, error_message = _process_item(
-                    objects,
-                    attempt,
-                    identity,
-                    results,
-                )
-                if error_message:
-                    last_error = error_message
-                if done and results:
-                    return results
-            elif isinstance(objects, AsyncIterable):
-                async for item in objects:
-                    done, retry, hard_error, error_message = _process_item(
-                        item,
-                        attempt,
-                        identity,
-                        results,
-                    )
-                    if error_message:
-                        last_error = error_message
-                    if done:
-                        if results:
-                            return results
+                        done = True
                         break
-            else:
-                last_error = f"unexpected bulk_cmd result type: {type(objects).__name__}"
-                self.logger.error(f"Failed bulk walk: {last_error}")
-                hard_error = True
 
-            if hard_error:
-                break
-            if results:
-                self.logger.debug(f'Bulk walk completed - List size {len(results)}')
-                return results
+                    results.append(varBind)
+                    page_rows += 1
+
+                if done:
+                    break
+
             if retry:
                 continue
+            if hard_error:
+                break
+            if page_rows:
+                SNMP_TRANSPORT.on_bulk_ok(key, attempt)
+            if done or not page_rows:
+                break
+
+            # page ended inside the subtree; continue after its last row
+            next_oid = str(results[-1][0])
 
-            self.logger.debug(f"Bulk walk returned no data with max_repetitions={attempt}.")
+        if results:
+            self.logger.debug(f'Bulk walk completed - List size {len(results)}')
+            return results
 
         if last_error:
             if last_error == "noSuchName" and suppress_no_such_name:
@@ -378,8 +408,10 @@ class Snmp_v2c:
         else:
             self.logger.warning("Bulk walk returned no data; falling back to walk.")
 
+        SNMP_RETRIES.inc(operation="bulk_walk", reason="walk_fallback")
         return await self.walk(oid)
 
+    @_instrumented("set")
     async def set(self, oid: str, value: str | int, value_type: type)-> list[ObjectType] | None:
         """
         Perform an SNMP SET operation with explicit value type.
@@ -406,21 +438,22 @@ class Snmp_v2c:
 
         oid = Snmp_v2c.resolve_oid(oid)
 
-        transport = await UdpTransportTarget.create((self._host, self._port),
-                                                    timeout=self._timeout, retries=self._retries)
-
         try:
             snmp_value = value_type(value)
         except Exception as e:
             raise ValueError(f"Failed to create SNMP value of type {value_type}: {e}") from e
 
-        errorIndication, errorStatus, errorIndex, varBinds = await set_cmd(
+        response = await self._send("set", lambda transport: set_cmd(
             self._snmp_engine,
             CommunityData(self._write_community, mpModel=1),
             transport,
             ContextData(),
             ObjectType(ObjectIdentity(oid), snmp_value),
-        )
+        ))
+
+        if response is None:
+            return None
+        errorIndication, errorStatus, errorIndex, varBinds = response
         
         if errorIndication:
             self.logger.warning(f'SNMP-SET error: {errorIndication}')
@@ -429,11 +462,77 @@ class Snmp_v2c:
             self._raise_on_snmp_error(errorIndication, errorStatus, errorIndex)
 
         except Exception as e:
+            SNMP_ERRORS.inc(operation="set")
             self.logger.error(f"Error extracting SNMP value: {e}")
             return None
 
         return varBinds # type: ignore
 
+    @staticmethod
+    async def _bulk_items(objects: object) -> AsyncIterator[tuple[Any, Any, Any, list[ObjectType]]]:
+        """Yield the ``(errorIndication, errorStatus, errorIndex, varBinds)`` responses of a ``bulk_cmd`` result."""
+        if isinstance(objects, tuple) and len(objects) == 4:
+            yield objects  # type: ignore[misc]
+        elif isinstance(objects, AsyncIterable):
+            async for item in objects:
+                yield item
+        else:
+            yield (f"unexpected bulk_cmd result type: {type(objects).__name__}", None, 0, [])
+
+    def _target_key(self) -> str:
+        return SNMP_TRANSPORT.key(self._host, self._port)
+
+    async def _send(
+        self,
+        operation: str,
+        request: Callable[[UdpTransportTarget], Awaitable[R]],
+        timeout: float | None = None,
+        retries: int | None = None,
+    ) -> R | None:
+        """
+        Send one request through :data:`SNMP_TRANSPORT`.
+
+        Every attempt is a fresh request (pysnmp's own retries are disabled)
+        whose timeout comes from the target's learned RTT and doubles per
+        retry, capped by ``timeout`` (default ``self._timeout``). Responses
+        and timeouts are reported back to the controller; the RTT of an answer
+        to a retry is not used to learn the timeout.
+
+        Returns:
+            The ``request`` result, or None without sending when the target's
+            circuit breaker is open.
+        """
+        key = self._target_key()
+        if not SNMP_TRANSPORT.allow(key):
+            SNMP_SHORT_CIRCUITS.inc(operation=operation)
+            self.logger.debug(f"{key} - circuit open, {operation} not sent")
+            return None
+
+        configured_s = float(timeout if timeout is not None else self._timeout)
+        retries_n = max(0, int(retries if retries is not None else self._retries))
+
+        result: R | None = None
+        timeout_s = configured_s
+        for attempt in range(retries_n + 1):
+            timeout_s = SNMP_TRANSPORT.timeout(key, configured_s, attempt)
+            transport = await UdpTransportTarget.create((self._host, self._port),
+                                                        timeout=timeout_s,     # seconds
+                                                        retries=0)
+            started = time.monotonic()
+            result = await request(transport)
+            elapsed = time.monotonic() - started
+
+            timed_out = isinstance(result, tuple) and bool(result) and isinstance(result[0], errind.RequestTimedOut)
+            if not timed_out:
+                if isinstance(result, tuple):
+                    SNMP_TRANSPORT.on_response(key, elapsed, retransmitted=attempt > 0)
+                return result
+            if attempt < retries_n:
+                SNMP_RETRIES.inc(operation=operation, reason="timeout")
+
+        SNMP_TRANSPORT.on_timeout(key, timeout_s)
+        return result
+
     def close(self) -> None:
         """
         Close the SNMP engine dispatcher and release resources.
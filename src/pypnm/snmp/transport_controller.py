@@ -0,0 +1,234 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+__all__ = [
+    "SNMP_TRANSPORT",
+    "SnmpTargetState",
+    "SnmpTransportController",
+]
+
+MIN_TIMEOUT_S: float = 1.0
+MAX_TIMEOUT_S: float = 60.0
+FAILURE_THRESHOLD: int = 3
+BREAKER_BASE_S: float = 5.0
+BREAKER_MAX_S: float = 300.0
+
+RTT_ALPHA: float = 1 / 8
+RTT_BETA: float = 1 / 4
+RTT_K: float = 4.0
+CLOCK_GRANULARITY_S: float = 0.01
+
+
+@dataclass
+class SnmpTargetState:
+    """
+    Transport state learned for one SNMP agent (``host:port``).
+
+    Attributes
+    ----------
+    srtt, rttvar : float | None
+        Smoothed round-trip time and its mean deviation, in seconds; None until
+        the first unambiguous response.
+    rto : float | None
+        Current retransmission timeout; None until an RTT was measured or a
+        timeout doubled the initial value.
+    consecutive_failures : int
+        Requests in a row that timed out on every attempt.
+    open_until : float
+        :func:`time.monotonic` deadline while the circuit breaker is open.
+    bulk_ok : int
+        Largest GETBULK ``max-repetitions`` the agent answered.
+    bulk_too_big : int | None
+        Smallest ``max-repetitions`` the agent rejected with ``tooBig``.
+    """
+    srtt: float | None = None
+    rttvar: float | None = None
+    rto: float | None = None
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+    bulk_ok: int = 0
+    bulk_too_big: int | None = None
+
+
+class SnmpTransportController:
+    """
+    Per-target SNMP timeout, backoff, circuit-breaker and GETBULK-size memory.
+
+    Timeouts follow the TCP retransmission timer (RFC 6298): every response
+    that arrived on the first transmission updates ``srtt``/``rttvar`` and the
+    next timeout is ``srtt + max(G, K * rttvar)``, clamped to
+    ``[min_timeout_s, max_timeout_s]`` and never above the caller's own
+    timeout. Until a target has answered, the caller's configured timeout is
+    used. Each retry doubles the timeout of the previous attempt (up to the
+    caller's timeout), and a request that timed out on every attempt doubles
+    the stored timeout (Karn's backoff).
+
+    After ``failure_threshold`` failed requests in a row the circuit opens:
+    requests are refused without touching the network for ``breaker_base_s``,
+    doubling with every further failure up to ``breaker_max_s``. Once the
+    deadline passes one probe is let through; a response closes the circuit.
+
+    GETBULK sizes are remembered the same way: the largest ``max-repetitions``
+    the agent answered and the smallest one it rejected with ``tooBig``, so
+    later walks start at a size the agent is known to handle.
+
+    State is kept per ``host:port`` and shared by every client in the process,
+    since clients are usually created per request.
+    """
+
+    def __init__(self,
+                 min_timeout_s: float = MIN_TIMEOUT_S,
+                 max_timeout_s: float = MAX_TIMEOUT_S,
+                 failure_threshold: int = FAILURE_THRESHOLD,
+                 breaker_base_s: float = BREAKER_BASE_S,
+                 breaker_max_s: float = BREAKER_MAX_S) -> None:
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.min_timeout_s = float(min_timeout_s)
+        self.max_timeout_s = float(max_timeout_s)
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.breaker_base_s = float(breaker_base_s)
+        self.breaker_max_s = float(breaker_max_s)
+        self._targets: dict[str, SnmpTargetState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(host: str, port: int) -> str:
+        return f"{host}:{port}"
+
+    def state(self, key: str) -> SnmpTargetState:
+        """Learned state of ``key`` (created empty on first use)."""
+        with self._lock:
+            return self._targets.setdefault(key, SnmpTargetState())
+
+    def reset(self, key: str | None = None) -> None:
+        """Forget what was learned about ``key`` (or every target)."""
+        with self._lock:
+            if key is None:
+                self._targets.clear()
+            else:
+                self._targets.pop(key, None)
+
+    # ------------------------------------------------------------------
+    # Timeouts
+    # ------------------------------------------------------------------
+
+    def timeout(self, key: str, configured_s: float, attempt: int = 0) -> float:
+        """
+        Timeout of transmission ``attempt`` (0 = first) to ``key``.
+
+        ``configured_s`` is the client's own timeout: it is used until an RTT
+        was measured and caps every attempt, so a target is never waited on
+        longer than it was before it had been learned.
+        """
+        state = self.state(key)
+        ceiling = min(configured_s, self.max_timeout_s)
+        base = ceiling if state.rto is None else min(state.rto, ceiling)
+        return min(base * (2 ** attempt), ceiling)
+
+    def on_response(self, key: str, rtt_s: float, retransmitted: bool = False) -> None:
+        """
+        Record a response from ``key``.
+
+        ``rtt_s`` only updates the estimator for a first transmission, since
+        the RTT of a retransmitted request is ambiguous (Karn's algorithm).
+        """
+        state = self.state(key)
+        state.consecutive_failures = 0
+        state.open_until = 0.0
+        if retransmitted:
+            return
+
+        if state.srtt is None or state.rttvar is None:
+            state.srtt = rtt_s
+            state.rttvar = rtt_s / 2
+        else:
+            state.rttvar = (1 - RTT_BETA) * state.rttvar + RTT_BETA * abs(state.srtt - rtt_s)
+            state.srtt = (1 - RTT_ALPHA) * state.srtt + RTT_ALPHA * rtt_s
+        rto = state.srtt + max(CLOCK_GRANULARITY_S, RTT_K * state.rttvar)
+        state.rto = min(max(rto, self.min_timeout_s), self.max_timeout_s)
+
+    def on_timeout(self, key: str, timeout_s: float) -> None:
+        """Record a request to ``key`` that got no response within ``timeout_s`` on any attempt."""
+        state = self.state(key)
+        state.rto = min(max(timeout_s, self.min_timeout_s) * 2, self.max_timeout_s)
+        state.consecutive_failures += 1
+
+        if state.consecutive_failures >= self.failure_threshold:
+            excess = state.consecutive_failures - self.failure_threshold
+            hold = min(self.breaker_base_s * (2 ** excess), self.breaker_max_s)
+            state.open_until = time.monotonic() + hold
+            self.logger.warning(f"{key} - {state.consecutive_failures} requests timed out, "
+                                f"circuit open for {hold:.0f}s")
+
+    # ------------------------------------------------------------------
+    # Circuit breaker
+    # ------------------------------------------------------------------
+
+    def allow(self, key: str) -> bool:
+        """
+        Whether a request to ``key`` may be sent now.
+
+        While open, the first caller after the deadline is let through as the
+        probe and the deadline moves out by one base period for the others.
+        """
+        with self._lock:
+            state = self._targets.get(key)
+            if state is None or state.open_until == 0.0:
+                return True
+            now = time.monotonic()
+            if now < state.open_until:
+                return False
+            state.open_until = now + self.breaker_base_s
+            return True
+
+    def is_open(self, key: str) -> bool:
+        """True while requests to ``key`` are being refused."""
+        state = self._targets.get(key)
+        return state is not None and time.monotonic() < state.open_until
+
+    # ------------------------------------------------------------------
+    # GETBULK sizing
+    # ------------------------------------------------------------------
+
+    def bulk_size(self, key: str, requested: int) -> int:
+        """``max-repetitions`` to start a walk of ``key`` with, given the caller's request."""
+        state = self.state(key)
+        requested = max(1, int(requested))
+        if state.bulk_too_big is None or requested < state.bulk_too_big:
+            return requested
+        if 0 < state.bulk_ok < state.bulk_too_big:
+            return state.bulk_ok
+        return max(1, state.bulk_too_big // 2)
+
+    def on_bulk_ok(self, key: str, max_repetitions: int) -> None:
+        """Record that ``key`` answered a GETBULK of ``max_repetitions``."""
+        state = self.state(key)
+        state.bulk_ok = max(state.bulk_ok, int(max_repetitions))
+        if state.bulk_too_big is not None and state.bulk_too_big <= state.bulk_ok:
+            # the agent's limit depends on the row size; forget the stale bound
+            state.bulk_too_big = None
+
+    def on_bulk_too_big(self, key: str, max_repetitions: int) -> int | None:
+        """
+        Record a ``tooBig`` from ``key`` and return the next size to try, or
+        None when ``max_repetitions`` was already 1.
+        """
+        state = self.state(key)
+        max_repetitions = int(max_repetitions)
+        state.bulk_too_big = max_repetitions if state.bulk_too_big is None else min(state.bulk_too_big, max_repetitions)
+        if state.bulk_ok >= max_repetitions:
+            state.bulk_ok = 0
+        if max_repetitions <= 1:
+            return None
+        return self.bulk_size(key, max_repetitions)
+
+
+SNMP_TRANSPORT = SnmpTransportController()
+"""Process-wide controller used by :class:`Snmp_v2c`."""
@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from pypnm.tools.snmp_simulator.device import (
+    DEFAULT_PNM_TESTS,
+    PnmTestModel,
+    SimulatedDevice,
+)
+from pypnm.tools.snmp_simulator.server import (
+    NetworkConditions,
+    SimulatorStats,
+    SnmpSimulator,
+)
+from pypnm.tools.snmp_simulator.snapshot import MibSnapshot, oid_key, oid_name
+
+__all__ = [
+    "DEFAULT_PNM_TESTS",
+    "MibSnapshot",
+    "NetworkConditions",
+    "PnmTestModel",
+    "SimulatedDevice",
+    "SimulatorStats",
+    "SnmpSimulator",
+    "oid_key",
+    "oid_name",
+]
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+from pysnmp.proto import rfc1902
+
+from pypnm.tools.snmp_simulator.server import NetworkConditions, SnmpSimulator
+from pypnm.tools.snmp_simulator.snapshot import MibSnapshot, SnmpValue
+
+
+def _mac_override(index: int) -> dict[str, SnmpValue]:
+    """Give each simulated modem a distinct locally administered MAC."""
+    mac = bytes([0x02, 0x00, 0x00]) + index.to_bytes(3, "big")
+    return {"ifPhysAddress.2": rfc1902.OctetString(mac)}
+
+
+def _parse_args(argv: Sequence[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="pypnm-snmp-simulator",
+        description="Serve simulated DOCSIS cable modems over SNMPv2c from a MIB snapshot.")
+    parser.add_argument("--snapshot", type=Path, required=True,
+                        help="Snapshot file (.json keyed by OID name, or snmpwalk text).")
+    parser.add_argument("--count", type=int, default=1, help="Number of simulated modems.")
+    parser.add_argument("--host", default="127.0.0.1", help="Bind address.")
+    parser.add_argument("--base-port", type=int, default=16100,
+                        help="UDP port of the first modem; modem i listens on base-port + i.")
+    parser.add_argument("--read-community", default="public")
+    parser.add_argument("--write-community", default="private")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Fixed response delay.")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Extra uniform response delay.")
+    parser.add_argument("--loss", type=float, default=0.0, help="Request drop probability (0-1).")
+    parser.add_argument("--max-varbinds", type=int, default=None,
+                        help="Answer larger responses with tooBig.")
+    parser.add_argument("--tftp-dir", type=Path, default=None,
+                        help="Directory receiving the simulated PNM capture files.")
+    parser.add_argument("--measure-delay", type=float, default=1.0,
+                        help="Seconds from test trigger to sampleReady.")
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    conditions = NetworkConditions(
+        latency_s               = args.latency_ms / 1000.0,
+        jitter_s                = args.jitter_ms / 1000.0,
+        loss                    = args.loss,
+        max_response_varbinds   = args.max_varbinds,
+    )
+    simulator = SnmpSimulator.fleet(
+        MibSnapshot.load(args.snapshot), args.count,
+        overrides       = _mac_override if args.count > 1 else None,
+        host            = args.host,
+        base_port       = args.base_port,
+        conditions      = conditions,
+        seed            = args.seed,
+        read_community  = args.read_community,
+        write_community = args.write_community,
+        tftp_dir        = args.tftp_dir,
+        measure_delay_s = args.measure_delay,
+    )
+    async with simulator:
+        for host, port in simulator.endpoints:
+            print(f"{host}:{port}", flush=True)
+        await asyncio.Event().wait()
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    logging.basicConfig(level=logging.INFO)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(_serve(_parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
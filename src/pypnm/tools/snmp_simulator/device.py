@@ -0,0 +1,191 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from bisect import bisect_right, insort
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from pyasn1.type import univ
+from pysnmp.proto import rfc1902
+
+from pypnm.docsis.cm_snmp_operation import (
+    DocsPnmBulkFileUploadStatus,
+    DocsPnmCmCtlStatus,
+)
+from pypnm.docsis.data_type.enums import MeasStatusType
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+from pypnm.tools.snmp_simulator.snapshot import MibSnapshot, Oid, SnmpValue, oid_key
+
+__all__ = ["DEFAULT_PNM_TESTS", "PnmTestModel", "SimulatedDevice"]
+
+TRUTH_TRUE = 1
+
+
+@dataclass(frozen=True)
+class PnmTestModel:
+    """
+    State machine of one PNM measurement table.
+
+    Setting ``<table><trigger>.<idx>`` to true(1) moves
+    ``<table><status>.<idx>`` to busy and ``docsPnmCmCtlStatus.0`` to
+    testInProgress; after the device's ``measure_delay_s`` the file named by
+    ``<table><filename>.<idx>`` is written to the TFTP directory, the status
+    becomes sampleReady, the trigger drops back to false(2) and a
+    ``docsPnmBulkFileTable`` row reports the upload.
+    """
+    table: str
+    file_type: PnmFileType
+    trigger: str = "FileEnable"
+    status: str = "MeasStatus"
+    filename: str = "FileName"
+
+
+DEFAULT_PNM_TESTS: tuple[PnmTestModel, ...] = (
+    PnmTestModel("docsPnmCmDsOfdmRxMer",       PnmFileType.RECEIVE_MODULATION_ERROR_RATIO),
+    PnmTestModel("docsPnmCmOfdmChEstCoef",     PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT, trigger="TrigEnable"),
+    PnmTestModel("docsPnmCmDsConstDisp",       PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY, trigger="TrigEnable"),
+    PnmTestModel("docsPnmCmDsOfdmFec",         PnmFileType.OFDM_FEC_SUMMARY),
+    PnmTestModel("docsPnmCmDsHist",            PnmFileType.DOWNSTREAM_HISTOGRAM, trigger="Enable"),
+    PnmTestModel("docsPnmCmDsOfdmModProf",     PnmFileType.OFDM_MODULATION_PROFILE),
+    PnmTestModel("docsPnmCmDsOfdmSym",         PnmFileType.SYMBOL_CAPTURE, trigger="TrigEnable", filename="CaptFileName"),
+    PnmTestModel("docsIf3CmSpectrumAnalysisCtrlCmd", PnmFileType.SPECTRUM_ANALYSIS),
+)
+
+
+class SimulatedDevice:
+    """
+    One simulated SNMP agent: a shared read-only :class:`MibSnapshot` plus a
+    private copy-on-write overlay that receives SETs and PNM state changes.
+
+    Parameters
+    ----------
+    snapshot : MibSnapshot
+        Base MIB view (may be shared by every device of a fleet).
+    read_community, write_community : str
+        GET/GETNEXT/GETBULK accept either; SET requires ``write_community``.
+    overrides : Mapping[str, SnmpValue] | None
+        Per-device values layered over the snapshot (e.g. a unique
+        ``ifPhysAddress.2``), keyed like the snapshot file.
+    pnm_tests : tuple[PnmTestModel, ...]
+        Measurement tables with modelled state machines.
+    tftp_dir : Path | None
+        Where finished captures are written; None disables file output.
+    measure_delay_s : float
+        Time from trigger to sampleReady.
+    seed : int
+        Seed of this device's synthetic capture data.
+    """
+
+    def __init__(self, snapshot: MibSnapshot, *,
+                 read_community: str = "public",
+                 write_community: str = "private",
+                 overrides: Mapping[str, SnmpValue] | None = None,
+                 pnm_tests: tuple[PnmTestModel, ...] = DEFAULT_PNM_TESTS,
+                 tftp_dir: Path | None = None,
+                 measure_delay_s: float = 1.0,
+                 seed: int = 0) -> None:
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.snapshot = snapshot
+        self.read_community = read_community
+        self.write_community = write_community
+        self.tftp_dir = Path(tftp_dir) if tftp_dir is not None else None
+        self.measure_delay_s = float(measure_delay_s)
+        self.factory = SyntheticPnmFactory(seed=seed)
+        self._overlay: dict[Oid, SnmpValue] = {}
+        self._overlay_oids: list[Oid] = []
+        self._timers: dict[tuple[str, int], asyncio.TimerHandle] = {}
+        self._bulk_rows = 0
+
+        # trigger column OID -> model; a SET on <column>.<idx> is matched by stripping the instance
+        self._triggers: dict[Oid, PnmTestModel] = {}
+        for model in pnm_tests:
+            self._triggers[oid_key(model.table + model.trigger)] = model
+
+        ctl_status = oid_key("docsPnmCmCtlStatus.0")
+        if snapshot.get(ctl_status) is None:
+            self._store(ctl_status, rfc1902.Integer32(DocsPnmCmCtlStatus.READY.value))
+        for name, value in (overrides or {}).items():
+            self._store(oid_key(name), value)
+
+    # ------------------------------------------------------------------
+    # MIB access
+    # ------------------------------------------------------------------
+
+    def get(self, oid: Oid) -> SnmpValue | None:
+        value = self._overlay.get(oid)
+        return value if value is not None else self.snapshot.get(oid)
+
+    def get_next(self, oid: Oid) -> tuple[Oid, SnmpValue] | None:
+        base = self.snapshot.next_oid(oid)
+        idx = bisect_right(self._overlay_oids, oid)
+        over = self._overlay_oids[idx] if idx < len(self._overlay_oids) else None
+        if base is None and over is None:
+            return None
+        if base is None or (over is not None and over <= base):
+            assert over is not None
+            nxt: Oid = over
+        else:
+            nxt = base
+        value = self.get(nxt)
+        return (nxt, value) if value is not None else None
+
+    def set(self, oid: Oid, value: SnmpValue) -> None:
+        self._store(oid, value)
+        model = self._triggers.get(oid[:-1]) if oid else None
+        # only an integer true(1) starts a test; other types are stored and ignored
+        if model is not None and isinstance(value, (rfc1902.Integer32, univ.Integer)) and int(value) == TRUTH_TRUE:
+            self._start_test(model, oid[-1])
+
+    def _store(self, oid: Oid, value: SnmpValue) -> None:
+        if oid not in self._overlay:
+            insort(self._overlay_oids, oid)
+        self._overlay[oid] = value
+
+    # ------------------------------------------------------------------
+    # PNM state machines
+    # ------------------------------------------------------------------
+
+    def _start_test(self, model: PnmTestModel, index: int) -> None:
+        self._store(oid_key(f"{model.table}{model.status}.{index}"), rfc1902.Integer32(MeasStatusType.BUSY.value))
+        self._store(oid_key("docsPnmCmCtlStatus.0"), rfc1902.Integer32(DocsPnmCmCtlStatus.TEST_IN_PROGRESS.value))
+        pending = self._timers.pop((model.table, index), None)
+        if pending is not None:
+            pending.cancel()
+        self._timers[(model.table, index)] = asyncio.get_running_loop().call_later(
+            self.measure_delay_s, self._finish_test, model, index)
+
+    def _finish_test(self, model: PnmTestModel, index: int) -> None:
+        self._timers.pop((model.table, index), None)
+        status = MeasStatusType.SAMPLE_READY
+        filename = self.get(oid_key(f"{model.table}{model.filename}.{index}"))
+        name = filename.asOctets().decode("utf-8", "replace") if isinstance(filename, rfc1902.OctetString) else ""
+
+        if name and self.tftp_dir is not None:
+            try:
+                self.factory.write(self.tftp_dir, name, model.file_type)
+            except (OSError, ValueError) as exc:
+                self.logger.warning(f"Unable to write simulated {model.file_type.name} file {name}: {exc}")
+                status = MeasStatusType.ERROR
+
+        if name:
+            self._bulk_rows += 1
+            upload = (DocsPnmBulkFileUploadStatus.UPLOAD_COMPLETED if status is MeasStatusType.SAMPLE_READY
+                      else DocsPnmBulkFileUploadStatus.ERROR)
+            self._store(oid_key(f"docsPnmBulkFileName.{self._bulk_rows}"), rfc1902.OctetString(name))
+            self._store(oid_key(f"docsPnmBulkFileUploadStatus.{self._bulk_rows}"), rfc1902.Integer32(upload.value))
+
+        self._store(oid_key(f"{model.table}{model.status}.{index}"), rfc1902.Integer32(status.value))
+        self._store(oid_key(f"{model.table}{model.trigger}.{index}"), rfc1902.Integer32(2))
+        self._store(oid_key("docsPnmCmCtlStatus.0"), rfc1902.Integer32(DocsPnmCmCtlStatus.READY.value))
+
+    def close(self) -> None:
+        """Cancel pending measurement timers."""
+        for handle in self._timers.values():
+            handle.cancel()
+        self._timers.clear()
@@ -0,0 +1,277 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from pyasn1.codec.ber import decoder, encoder
+from pyasn1.error import PyAsn1Error
+from pysnmp.proto import api, rfc1902, rfc1905
+
+from pypnm.tools.snmp_simulator.device import (
+    DEFAULT_PNM_TESTS,
+    PnmTestModel,
+    SimulatedDevice,
+)
+from pypnm.tools.snmp_simulator.snapshot import MibSnapshot, Oid, SnmpValue
+
+__all__ = ["NetworkConditions", "SimulatorStats", "SnmpSimulator"]
+
+_V2C = api.PROTOCOL_MODULES[api.SNMP_VERSION_2C]
+
+# RFC 3416 error-status
+ERROR_TOO_BIG = 1
+
+VarBind = tuple[Any, Any]
+
+
+@dataclass(frozen=True)
+class NetworkConditions:
+    """
+    Per-request network impairments applied by :class:`SnmpSimulator`.
+
+    Attributes
+    ----------
+    latency_s : float
+        Fixed delay before every response.
+    jitter_s : float
+        Extra uniform delay in ``[0, jitter_s]`` drawn per request.
+    loss : float
+        Probability in ``[0, 1]`` that a request is silently dropped.
+    max_response_varbinds : int | None
+        Responses larger than this are answered with ``tooBig``, which
+        exercises the GETBULK step-down in :meth:`Snmp_v2c.bulk_walk`.
+    """
+    latency_s: float = 0.0
+    jitter_s: float = 0.0
+    loss: float = 0.0
+    max_response_varbinds: int | None = None
+
+
+@dataclass
+class SimulatorStats:
+    """Request counters across every simulated endpoint."""
+    received: int = 0
+    dropped: int = 0
+    rejected: int = 0
+    responded: int = 0
+
+
+class _Endpoint(asyncio.DatagramProtocol):
+    def __init__(self, simulator: SnmpSimulator, device: SimulatedDevice) -> None:
+        self._simulator = simulator
+        self._device = device
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        self._simulator._on_request(self, self._device, data, addr)
+
+
+class SnmpSimulator:
+    """
+    Local SNMPv2c responder serving one UDP endpoint per :class:`SimulatedDevice`.
+
+    Messages are decoded and encoded with the pysnmp protocol API, so clients
+    (``Snmp_v2c``, ``CmSnmpOperation``, the remote agent) see the same BER
+    they would get from a modem. GET, GETNEXT, GETBULK and SET are supported;
+    requests with an unknown community, and SETs without the write
+    community, are dropped the way a real agent drops authentication failures.
+
+    Parameters
+    ----------
+    devices : Sequence[SimulatedDevice]
+        Agents to serve; device ``i`` listens on ``(host, base_port + i)``, or
+        on an ephemeral port when ``base_port`` is 0 (see :attr:`endpoints`).
+    host : str
+        Bind address.
+    base_port : int
+        First UDP port.
+    conditions : NetworkConditions
+        Latency, jitter, loss and response-size limits.
+    seed : int
+        Seed of the loss/jitter random stream.
+    """
+
+    def __init__(self, devices: Sequence[SimulatedDevice], *, host: str = "127.0.0.1", base_port: int = 16100,
+                 conditions: NetworkConditions | None = None, seed: int = 0) -> None:
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.devices = list(devices)
+        self.host = host
+        self.base_port = int(base_port)
+        self.conditions = conditions or NetworkConditions()
+        self.stats = SimulatorStats()
+        self._rng = random.Random(seed)
+        self._endpoints: list[_Endpoint] = []
+
+    @classmethod
+    def fleet(cls, snapshot: MibSnapshot, count: int, *,
+              overrides: Callable[[int], Mapping[str, SnmpValue]] | None = None,
+              host: str = "127.0.0.1", base_port: int = 16100,
+              conditions: NetworkConditions | None = None, seed: int = 0,
+              read_community: str = "public", write_community: str = "private",
+              pnm_tests: tuple[PnmTestModel, ...] = DEFAULT_PNM_TESTS,
+              tftp_dir: Path | None = None, measure_delay_s: float = 1.0) -> SnmpSimulator:
+        """
+        Build ``count`` devices over one shared snapshot.
+
+        ``overrides(i)`` supplies the per-device values of device ``i`` (e.g.
+        its MAC address); every device gets its own synthetic-data seed. The
+        remaining keywords are passed to each :class:`SimulatedDevice`.
+        """
+        devices = [
+            SimulatedDevice(snapshot,
+                            read_community  = read_community,
+                            write_community = write_community,
+                            overrides       = overrides(i) if overrides else None,
+                            pnm_tests       = pnm_tests,
+                            tftp_dir        = tftp_dir,
+                            measure_delay_s = measure_delay_s,
+                            seed            = seed + i)
+            for i in range(count)
+        ]
+        return cls(devices, host=host, base_port=base_port, conditions=conditions, seed=seed)
+
+    @property
+    def endpoints(self) -> list[tuple[str, int]]:
+        """Bound ``(host, port)`` of each device, in device order (available after :meth:`start`)."""
+        out: list[tuple[str, int]] = []
+        for endpoint in self._endpoints:
+            assert endpoint.transport is not None
+            sockname = endpoint.transport.get_extra_info("sockname")
+            out.append((str(sockname[0]), int(sockname[1])))
+        return out
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        for i, device in enumerate(self.devices):
+            port = self.base_port + i if self.base_port else 0
+            _, protocol = await loop.create_datagram_endpoint(
+                lambda d=device: _Endpoint(self, d), local_addr=(self.host, port))
+            self._endpoints.append(protocol)
+        self.logger.info(f"Serving {len(self.devices)} simulated SNMP agent(s) on {self.host}")
+
+    async def stop(self) -> None:
+        for endpoint in self._endpoints:
+            if endpoint.transport is not None:
+                endpoint.transport.close()
+        self._endpoints.clear()
+        for device in self.devices:
+            device.close()
+
+    async def __aenter__(self) -> SnmpSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type: type[BaseException] | None, exc: BaseException | None,
+                        tb: TracebackType | None) -> None:
+        await self.stop()
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def _on_request(self, endpoint: _Endpoint, device: SimulatedDevice, data: bytes,
+                    addr: tuple[str | Any, int]) -> None:
+        self.stats.received += 1
+        cond = self.conditions
+        if cond.loss > 0.0 and self._rng.random() < cond.loss:
+            self.stats.dropped += 1
+            return
+
+        response = self.respond(device, data)
+        if response is None:
+            self.stats.rejected += 1
+            return
+
+        delay = cond.latency_s + (self._rng.uniform(0.0, cond.jitter_s) if cond.jitter_s > 0.0 else 0.0)
+        if delay > 0.0:
+            asyncio.get_running_loop().call_later(delay, self._send, endpoint, response, addr)
+        else:
+            self._send(endpoint, response, addr)
+
+    def _send(self, endpoint: _Endpoint, payload: bytes, addr: tuple[str | Any, int]) -> None:
+        if endpoint.transport is None or endpoint.transport.is_closing():
+            return
+        endpoint.transport.sendto(payload, addr)
+        self.stats.responded += 1
+
+    def respond(self, device: SimulatedDevice, data: bytes) -> bytes | None:
+        """Build the encoded response to one request, or None if it should be dropped."""
+        try:
+            if int(api.decodeMessageVersion(data)) != api.SNMP_VERSION_2C:
+                return None
+            request, _ = decoder.decode(data, asn1Spec=_V2C.Message())
+        except PyAsn1Error:
+            return None
+
+        community = _V2C.apiMessage.get_community(request).asOctets().decode("latin-1")
+        pdu = _V2C.apiMessage.get_pdu(request)
+        is_set = pdu.isSameTypeWith(_V2C.SetRequestPDU())
+        allowed = (device.write_community,) if is_set else (device.read_community, device.write_community)
+        if community not in allowed:
+            return None
+
+        response = _V2C.apiMessage.get_response(request)
+        rsp_pdu = _V2C.apiMessage.get_pdu(response)
+        var_binds: list[VarBind] = [(oid, value) for oid, value in _V2C.apiPDU.get_varbinds(pdu)]
+
+        if pdu.isSameTypeWith(_V2C.GetRequestPDU()):
+            out = []
+            for oid, _ in var_binds:
+                value = device.get(tuple(oid))
+                out.append((oid, value if value is not None else rfc1905.noSuchInstance))
+        elif pdu.isSameTypeWith(_V2C.GetNextRequestPDU()):
+            out = [self._next(device, oid) for oid, _ in var_binds]
+        elif pdu.isSameTypeWith(_V2C.GetBulkRequestPDU()):
+            out = self._bulk(device, var_binds, int(_V2C.apiBulkPDU.get_non_repeaters(pdu)),
+                             int(_V2C.apiBulkPDU.get_max_repetitions(pdu)))
+        elif is_set:
+            out = var_binds
+            for oid, value in var_binds:
+                device.set(tuple(oid), value)
+        else:
+            return None
+
+        limit = self.conditions.max_response_varbinds
+        if limit is not None and len(out) > limit:
+            _V2C.apiPDU.set_error_status(rsp_pdu, ERROR_TOO_BIG)
+            out = []
+        _V2C.apiPDU.set_varbinds(rsp_pdu, out)
+        return bytes(encoder.encode(response))
+
+    @staticmethod
+    def _next(device: SimulatedDevice, oid: rfc1902.ObjectName) -> VarBind:
+        nxt = device.get_next(tuple(oid))
+        return nxt if nxt is not None else (oid, rfc1905.endOfMibView)
+
+    def _bulk(self, device: SimulatedDevice, var_binds: list[VarBind], non_repeaters: int,
+              max_repetitions: int) -> list[VarBind]:
+        n = max(0, min(non_repeaters, len(var_binds)))
+        out = [self._next(device, oid) for oid, _ in var_binds[:n]]
+        cursor: list[Oid] = [tuple(oid) for oid, _ in var_binds[n:]]
+        for _ in range(max(0, max_repetitions)):
+            if not cursor:
+                break
+            ended = True
+            for j, oid in enumerate(cursor):
+                nxt = device.get_next(oid)
+                if nxt is None:
+                    out.append((oid, rfc1905.endOfMibView))
+                    continue
+                out.append(nxt)
+                cursor[j] = nxt[0]
+                ended = False
+            if ended:
+                break
+        return out
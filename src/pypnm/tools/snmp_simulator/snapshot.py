@@ -0,0 +1,235 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import json
+import re
+import string
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pysnmp.proto import rfc1902
+
+from pypnm.snmp.compiled_oids import COMPILED_OIDS
+
+if TYPE_CHECKING:
+    from pypnm.snmp.snmp_v2c import Snmp_v2c
+
+__all__ = ["MibSnapshot", "Oid", "SnmpValue", "oid_key", "oid_name"]
+
+Oid = tuple[int, ...]
+SnmpValue = (
+    rfc1902.Integer32 | rfc1902.OctetString | rfc1902.Counter32 | rfc1902.Counter64
+    | rfc1902.Gauge32 | rfc1902.Unsigned32 | rfc1902.TimeTicks | rfc1902.IpAddress
+    | rfc1902.ObjectName
+)
+
+_NUMERIC_OID = re.compile(r"^\.?\d+(\.\d+)*$")
+_PRINTABLE = set(string.printable) - set("\x0b\x0c")
+
+_NAME_BY_OID: dict[str, str] = {}
+
+
+def oid_key(oid: str | Sequence[int]) -> Oid:
+    """
+    Resolve ``oid`` to a numeric tuple.
+
+    Accepts dotted numerics (``"1.3.6.1.2.1.1.1.0"``), ``COMPILED_OIDS`` names
+    with an optional instance suffix (``"sysDescr.0"``,
+    ``"docsPnmCmDsOfdmRxMerFileName.3"``) or an already numeric sequence.
+    """
+    if not isinstance(oid, str):
+        return tuple(int(x) for x in oid)
+    text = oid.strip().lstrip(".")
+    if _NUMERIC_OID.match(text):
+        return tuple(int(x) for x in text.split("."))
+    name, _, suffix = text.partition(".")
+    base = COMPILED_OIDS.get(name)
+    if base is None:
+        raise KeyError(f"Unknown OID name: {name!r}")
+    return tuple(int(x) for x in f"{base}.{suffix}".rstrip(".").split("."))
+
+
+def oid_name(oid: Oid) -> str:
+    """Return ``<name>.<instance>`` for the longest ``COMPILED_OIDS`` prefix of ``oid``, else dotted numerics."""
+    if not _NAME_BY_OID:
+        _NAME_BY_OID.update({v: k for k, v in COMPILED_OIDS.items()})
+    for cut in range(len(oid), 0, -1):
+        name = _NAME_BY_OID.get(".".join(map(str, oid[:cut])))
+        if name is not None:
+            rest = oid[cut:]
+            return f"{name}.{'.'.join(map(str, rest))}" if rest else name
+    return ".".join(map(str, oid))
+
+
+_TYPES: dict[str, type] = {
+    "Integer32":        rfc1902.Integer32,
+    "Integer":          rfc1902.Integer32,
+    "OctetString":      rfc1902.OctetString,
+    "Counter32":        rfc1902.Counter32,
+    "Counter64":        rfc1902.Counter64,
+    "Gauge32":          rfc1902.Gauge32,
+    "Unsigned32":       rfc1902.Unsigned32,
+    "TimeTicks":        rfc1902.TimeTicks,
+    "IpAddress":        rfc1902.IpAddress,
+    "ObjectIdentifier": rfc1902.ObjectName,
+}
+
+# snmpwalk/net-snmp text type tags
+_WALK_TYPES: dict[str, str] = {
+    "INTEGER":      "Integer32",
+    "STRING":       "OctetString",
+    "Counter32":    "Counter32",
+    "Counter64":    "Counter64",
+    "Gauge32":      "Gauge32",
+    "Unsigned32":   "Unsigned32",
+    "Timeticks":    "TimeTicks",
+    "IpAddress":    "IpAddress",
+    "OID":          "ObjectIdentifier",
+}
+
+
+def _make_value(type_name: str, raw: object) -> SnmpValue:
+    if type_name == "Hex":
+        return rfc1902.OctetString(hexValue=str(raw).replace(" ", "").replace(":", ""))
+    cls = _TYPES.get(type_name)
+    if cls is None:
+        raise ValueError(f"Unsupported SNMP value type: {type_name!r}")
+    if cls is rfc1902.ObjectName:
+        return rfc1902.ObjectName(oid_key(str(raw)))
+    return cls(raw)
+
+
+def _dump_value(value: SnmpValue) -> list[Any]:
+    if isinstance(value, rfc1902.IpAddress):
+        return ["IpAddress", ".".join(str(b) for b in value.asOctets())]
+    if isinstance(value, rfc1902.OctetString):
+        raw = value.asOctets()
+        text = raw.decode("latin-1")
+        if raw and all(c in _PRINTABLE for c in text):
+            return ["OctetString", text]
+        return ["Hex", raw.hex()]
+    if isinstance(value, rfc1902.ObjectName):
+        return ["ObjectIdentifier", ".".join(map(str, value.asTuple()))]
+    for type_name, cls in _TYPES.items():
+        if type(value) is cls:
+            return [type_name, int(value)]
+    return ["Integer32", int(value)]
+
+
+class MibSnapshot:
+    """
+    Immutable, ordered MIB view used as the base data of simulated devices.
+
+    Entries are kept as a sorted OID list plus a value map, so GET is a dict
+    lookup and GETNEXT/GETBULK a ``bisect``.
+
+    File formats
+    ------------
+    ``.json``: an object keyed by ``COMPILED_OIDS`` name plus instance (or a
+    dotted numeric OID), each value a ``[type, value]`` pair::
+
+        {
+          "sysDescr.0": ["OctetString", "<<HW_REV: 1.0; VENDOR: ...>>"],
+          "docsIf31CmDsOfdmChanChannelId.3": ["Integer32", 193],
+          "ifPhysAddress.2": ["Hex", "aabbccddeeff"]
+        }
+
+    Any other suffix is read as a net-snmp ``snmpwalk`` dump
+    (``NAME-OR-OID = TYPE: value`` per line, e.g. from ``snmpwalk -On``).
+    """
+
+    def __init__(self, entries: Mapping[Oid, SnmpValue] | Iterable[tuple[Oid, SnmpValue]] = ()) -> None:
+        items: dict[Oid, SnmpValue] = {}
+        items.update(entries)
+        self._values: dict[Oid, SnmpValue] = items
+        self._oids: list[Oid] = sorted(items)
+
+    def __len__(self) -> int:
+        return len(self._oids)
+
+    def __iter__(self) -> Iterator[tuple[Oid, SnmpValue]]:
+        return ((oid, self._values[oid]) for oid in self._oids)
+
+    def get(self, oid: Oid) -> SnmpValue | None:
+        return self._values.get(oid)
+
+    def next_oid(self, oid: Oid) -> Oid | None:
+        """Smallest OID strictly after ``oid``, or None at the end of the view."""
+        idx = bisect_right(self._oids, oid)
+        return self._oids[idx] if idx < len(self._oids) else None
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Sequence[Any]]) -> MibSnapshot:
+        """Build from a ``{name_or_oid: [type, value]}`` mapping (the JSON file layout)."""
+        return cls((oid_key(key), _make_value(str(spec[0]), spec[1])) for key, spec in data.items())
+
+    @classmethod
+    def load(cls, path: str | Path) -> MibSnapshot:
+        path = Path(path)
+        text = path.read_text(encoding="utf-8")
+        if path.suffix.lower() == ".json":
+            return cls.from_mapping(json.loads(text))
+        return cls.from_walk_text(text)
+
+    @classmethod
+    def from_walk_text(cls, text: str) -> MibSnapshot:
+        """Parse net-snmp ``snmpwalk`` output; lines that are not ``OID = TYPE: value`` are skipped."""
+        entries: dict[Oid, SnmpValue] = {}
+        for line in text.splitlines():
+            oid_text, sep, rest = line.partition(" = ")
+            if not sep:
+                continue
+            tag, sep, raw = rest.partition(": ")
+            if not sep:
+                if rest.strip() == '""':
+                    entries[oid_key(oid_text.split("::")[-1])] = rfc1902.OctetString(b"")
+                continue
+            raw = raw.strip()
+            if tag == "Hex-STRING":
+                value: SnmpValue = _make_value("Hex", raw)
+            elif tag in _WALK_TYPES:
+                if tag == "STRING":
+                    raw = raw[1:-1] if len(raw) >= 2 and raw[0] == raw[-1] == '"' else raw
+                elif tag in ("INTEGER", "Timeticks"):
+                    # "ready(2)" / "(12345) 0:02:03.45"
+                    match = re.search(r"\((-?\d+)\)", raw)
+                    raw = match.group(1) if match else raw.split()[0]
+                elif tag != "IpAddress" and tag != "OID":
+                    raw = raw.split()[0]
+                value = _make_value(_WALK_TYPES[tag], raw)
+            else:
+                continue
+            entries[oid_key(oid_text.split("::")[-1])] = value
+        return cls(entries)
+
+    def to_mapping(self) -> dict[str, list[Any]]:
+        return {oid_name(oid): _dump_value(value) for oid, value in self}
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_mapping(), indent=2), encoding="utf-8")
+        return path
+
+    @classmethod
+    async def record(cls, snmp: Snmp_v2c, roots: Iterable[str]) -> MibSnapshot:
+        """
+        Record a snapshot from a live agent by bulk-walking each root.
+
+        Parameters
+        ----------
+        snmp : Snmp_v2c
+            Client bound to the device to record.
+        roots : Iterable[str]
+            Subtrees to walk, as ``COMPILED_OIDS`` names or numeric OIDs
+            (e.g. ``["system", "docsPnmCmObjects", "docsIf31CmDsOfdmChanTable"]``).
+        """
+        entries: dict[Oid, SnmpValue] = {}
+        for root in roots:
+            for var_bind in await snmp.bulk_walk(root) or []:
+                entries[oid_key(str(var_bind[0]))] = var_bind[1]
+        return cls(entries)
@@ -0,0 +1,42 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pypnm.config.system_config_settings import SystemConfigSettings
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+
+# Subcarrier counts: 96 MHz @ 50 kHz, 190 MHz @ 50 kHz, 190 MHz @ 25 kHz.
+OFDM_SIZES = (1900, 3800, 7600)
+
+
+@pytest.fixture(params=OFDM_SIZES, ids=lambda n: f"{n}sc")
+def subcarriers(request: pytest.FixtureRequest) -> int:
+    return int(request.param)
+
+
+@pytest.fixture
+def factory() -> SyntheticPnmFactory:
+    return SyntheticPnmFactory(seed=2026)
+
+
+@pytest.fixture
+def pnm_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the file-backed services (transaction/capture-group DBs, PNM and output dirs) at ``tmp_path``."""
+    paths = {
+        "pnm_dir":          tmp_path / "pnm",
+        "png_dir":          tmp_path / "png",
+        "csv_dir":          tmp_path / "csv",
+        "json_dir":         tmp_path / "json",
+        "archive_dir":      tmp_path / "archive",
+        "transaction_db":   tmp_path / "db" / "transactions.json",
+        "capture_group_db": tmp_path / "db" / "capture_group.json",
+    }
+    for name, path in paths.items():
+        monkeypatch.setattr(SystemConfigSettings, name, staticmethod(lambda p=path: str(p)))
+    paths["pnm_dir"].mkdir(parents=True)
+    return tmp_path
@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pypnm.api.routes.common.classes.analysis.analysis import Analysis
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.fetch_pnm_process import PnmFileTypeObjectFetcher
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark(group="basic-analysis")
+
+
+def _model(blob: bytes) -> Any:  # noqa: ANN401 - parser model union
+    return PnmFileTypeObjectFetcher(blob).get_parser().to_model()
+
+
+def test_basic_analysis_rxmer(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory, subcarriers: int) -> None:
+    model = _model(factory.rxmer(subcarriers))
+    out = benchmark(Analysis.basic_analysis_rxmer_from_model, model)
+    assert out.carrier_values.carrier_count == subcarriers
+
+
+def test_basic_analysis_ds_chan_est(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory, subcarriers: int) -> None:
+    model = _model(factory.chan_est(subcarriers))
+    benchmark(Analysis.basic_analysis_ds_chan_est_from_model, model)
+
+
+def test_basic_analysis_ds_constellation_display(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory) -> None:
+    model = _model(factory.const_disp(8192, qam_order=4096))
+    benchmark(Analysis.basic_analysis_ds_constellation_display_from_model, model)
+
+
+def test_basic_analysis_ds_histogram(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory) -> None:
+    model = _model(factory.histogram())
+    benchmark(Analysis.basic_analysis_ds_histogram_from_model, model)
+
+
+def test_basic_analysis_ds_ofdm_fec_summary(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory) -> None:
+    model = _model(factory.fec_summary(profiles=4, sets=1440, summary_type=3))
+    benchmark(Analysis.basic_analysis_ds_ofdm_fec_summary_from_model, model)
+
+
+def test_basic_analysis_ds_modulation_profile(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory) -> None:
+    model = _model(factory.mod_profile(profiles=16, subcarriers=7600))
+    benchmark(Analysis.basic_analysis_ds_modulation_profile_from_model, model)
+
+
+@pytest.mark.parametrize("segments", [81, 240])
+def test_basic_analysis_spectrum_analyzer(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory, segments: int) -> None:
+    measurement = _model(factory.spectrum(segments)).model_dump() | {"device_details": {}}
+    benchmark(Analysis.basic_analysis_spectrum_analyzer, measurement, None)
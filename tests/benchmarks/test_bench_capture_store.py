@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pypnm.api.routes.advance.analysis.signal_analysis.multi_rxmer_signal_analysis import (
+    MultiRxMerAnalysisType,
+    MultiRxMerSignalAnalysis,
+)
+from pypnm.api.routes.advance.common.capture_data_aggregator import (
+    CaptureDataAggregator,
+)
+from pypnm.api.routes.common.classes.file_capture.capture_group import CaptureGroup
+from pypnm.api.routes.common.classes.file_capture.pnm_file_transaction import (
+    PnmFileTransaction,
+)
+from pypnm.lib.mac_address import MacAddress
+from pypnm.lib.types import FileName, GroupId
+from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+MAC = MacAddress("aa:bb:cc:dd:ee:ff")
+CAPTURES = 60
+
+
+def _capture_group(pnm_dir: Path, factory: SyntheticPnmFactory, captures: int, subcarriers: int) -> GroupId:
+    """Write ``captures`` RxMER files one second apart and register them in a new capture group."""
+    group = CaptureGroup()
+    group_id = group.create_group()
+    start = factory.capture_time
+    for i in range(captures):
+        factory.capture_time = start + i
+        name = f"rxmer_{i:04d}.bin"
+        (pnm_dir / name).write_bytes(factory.rxmer(subcarriers))
+        group.add_transaction(PnmFileTransaction.set_file_by_user(
+            MAC, DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, FileName(name)))
+    return group_id
+
+
+@pytest.mark.benchmark(group="transaction-db")
+@pytest.mark.parametrize("records", [100, 1000])
+def test_transaction_insert(benchmark: BenchmarkFixture, pnm_dirs: Path, records: int) -> None:
+    txn = PnmFileTransaction()
+    counter = iter(range(10**9))
+
+    def seed() -> tuple[tuple[()], dict[str, Any]]:
+        txn.transaction_db_path.write_text("{}")
+        for i in range(records - 1):
+            txn._insert_generic(MAC, DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, f"seed_{i}.bin")
+        return (), {}
+
+    def insert() -> None:
+        txn._insert_generic(MAC, DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, f"bench_{next(counter)}.bin")
+
+    benchmark.pedantic(insert, setup=seed, rounds=5)
+
+
+@pytest.mark.benchmark(group="transaction-db")
+@pytest.mark.parametrize("records", [100, 1000])
+def test_transaction_lookup(benchmark: BenchmarkFixture, pnm_dirs: Path, records: int) -> None:
+    txn = PnmFileTransaction()
+    ids = [txn._insert_generic(MAC, DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, f"file_{i}.bin")
+           for i in range(records)]
+
+    record = benchmark(txn.getRecordModel, ids[records // 2])
+
+    assert record.filename == f"file_{records // 2}.bin"
+
+
+@pytest.mark.benchmark(group="capture-aggregation")
+def test_capture_data_aggregator_collect(benchmark: BenchmarkFixture, pnm_dirs: Path, factory: SyntheticPnmFactory) -> None:
+    group_id = _capture_group(pnm_dirs / "pnm", factory, CAPTURES, 3800)
+
+    collection = benchmark(lambda: CaptureDataAggregator(group_id).collect())
+
+    assert collection.length() == CAPTURES
+
+
+@pytest.mark.benchmark(group="multi-rxmer")
+@pytest.mark.parametrize("analysis_type", [MultiRxMerAnalysisType.MIN_AVG_MAX, MultiRxMerAnalysisType.RXMER_HEAT_MAP],
+                         ids=lambda t: t.value)
+def test_multi_rxmer_signal_analysis(benchmark: BenchmarkFixture, pnm_dirs: Path, factory: SyntheticPnmFactory,
+                                     analysis_type: MultiRxMerAnalysisType) -> None:
+    group_id = _capture_group(pnm_dirs / "pnm", factory, CAPTURES, 3800)
+
+    def analyze() -> Any:  # noqa: ANN401 - result model
+        return MultiRxMerSignalAnalysis(CaptureDataAggregator(group_id), analysis_type).to_model()
+
+    result = benchmark.pedantic(analyze, rounds=3)
+
+    assert not result.error
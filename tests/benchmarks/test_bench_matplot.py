@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+from pypnm.lib.matplot.manager import MatplotManager, PlotConfig
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.CmDsConstDispMeas import CmDsConstDispMeas
+from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark(group="matplot")
+
+
+def _manager(tmp_path: Path, *, reuse_figures: bool = False) -> MatplotManager:
+    return MatplotManager(tmp_path, dpi=100, default_cfg=PlotConfig(title="benchmark"), reuse_figures=reuse_figures)
+
+
+@pytest.mark.parametrize("reuse_figures", [False, True], ids=["new-figure", "reuse-figure"])
+def test_plot_line_rxmer(benchmark: BenchmarkFixture, tmp_path: Path, factory: SyntheticPnmFactory, reuse_figures: bool) -> None:
+    values = CmDsOfdmRxMer(factory.rxmer(7600)).to_model().values
+    mgr = _manager(tmp_path, reuse_figures=reuse_figures)
+
+    path = benchmark(mgr.plot_line, "rxmer.png", x=np.arange(len(values)), y=values)
+
+    assert path.is_file()
+
+
+def test_plot_constellation(benchmark: BenchmarkFixture, tmp_path: Path, factory: SyntheticPnmFactory) -> None:
+    samples = CmDsConstDispMeas(factory.const_disp(8192, qam_order=1024)).to_model().samples
+    mgr = _manager(tmp_path)
+
+    path = benchmark(mgr.plot_constellation, "constellation.png", soft=samples, show_boundaries=False)
+
+    assert path.is_file()
+
+
+def test_heatmap2d_rxmer(benchmark: BenchmarkFixture, tmp_path: Path, factory: SyntheticPnmFactory) -> None:
+    z = np.vstack([CmDsOfdmRxMer(factory.rxmer(3800)).to_model().values for _ in range(120)])
+    mgr = _manager(tmp_path)
+
+    path = benchmark(mgr.heatmap2d, z, "heatmap.png")
+
+    assert path.is_file()
@@ -0,0 +1,60 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.fetch_pnm_process import PnmFileTypeObjectFetcher
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark(group="parse")
+
+# Subcarrier counts: 96 MHz @ 50 kHz, 190 MHz @ 50 kHz, 190 MHz @ 25 kHz.
+OFDM_SIZES = (1900, 3800, 7600)
+
+CASES: list[tuple[PnmFileType, dict[str, Any]]] = [
+    *[(PnmFileType.RECEIVE_MODULATION_ERROR_RATIO, {"subcarriers": n}) for n in OFDM_SIZES],
+    *[(PnmFileType.OFDM_CHANNEL_ESTIMATE_COEFFICIENT, {"subcarriers": n}) for n in OFDM_SIZES],
+    (PnmFileType.DOWNSTREAM_CONSTELLATION_DISPLAY, {"samples": 8192}),
+    (PnmFileType.SPECTRUM_ANALYSIS, {"segments": 81}),
+    (PnmFileType.SPECTRUM_ANALYSIS, {"segments": 240}),
+    (PnmFileType.OFDM_FEC_SUMMARY, {"profiles": 4, "sets": 600}),
+    (PnmFileType.OFDM_FEC_SUMMARY, {"profiles": 4, "sets": 1440, "summary_type": 3}),
+    (PnmFileType.DOWNSTREAM_HISTOGRAM, {"bins": 255}),
+    (PnmFileType.OFDM_MODULATION_PROFILE, {"profiles": 16, "subcarriers": 7600}),
+]
+
+
+def _case_id(case: tuple[PnmFileType, dict[str, Any]]) -> str:
+    file_type, kwargs = case
+    return "-".join([file_type.name.lower(), *(f"{k}{v}" for k, v in kwargs.items())])
+
+
+@pytest.mark.parametrize("case", CASES, ids=[_case_id(c) for c in CASES])
+def test_fetch_parse_to_model(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory,
+                              case: tuple[PnmFileType, dict[str, Any]]) -> None:
+    file_type, kwargs = case
+    blob = factory.build(file_type, **kwargs)
+
+    model = benchmark(lambda: PnmFileTypeObjectFetcher(blob).get_parser().to_model())
+
+    assert model.pnm_header.file_type_version == int(file_type.get_pnm_cann()[3:])
+
+
+def test_symbol_capture_parse(benchmark: BenchmarkFixture, factory: SyntheticPnmFactory) -> None:
+    blob = factory.symbol_capture(samples=8192)
+
+    def parse() -> int:
+        parser = PnmFileTypeObjectFetcher(blob).get_parser()
+        parser.process_cm_symbol_capture()
+        return len(parser.process_capture_data() or [])
+
+    assert benchmark(parse) == 8192
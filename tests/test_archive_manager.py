@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import io
+import zipfile
 from pathlib import Path
 from typing import Literal, cast
 
@@ -205,3 +206,37 @@ def test_list_contents_errors(tmp_path: Path) -> None:
     dummy.write_bytes(b"\x00\x01")
     with pytest.raises(ValueError):
         _ = ArchiveManager.list_contents(dummy)
+
+
+def test_zip_files_stores_png_members(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    write_files(src, ["plot.png", "data.csv"])
+
+    zip_path = ArchiveManager.zip_files([src / "plot.png", src / "data.csv"], tmp_path / "out.zip")
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.getinfo("plot.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("data.csv").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_stream_zip_matches_zipfile_reader(tmp_path: Path) -> None:
+    src = tmp_path / "src"
+    write_files(src, ["a.csv", "b.json", "c.png", "dir/d.csv"])
+    (src / "a.csv").write_text("freq,mer\n" * 500, encoding="utf-8")
+    files = [src / "a.csv", src / "b.json", src / "c.png", src / "dir" / "d.csv", src / "missing.csv", src / "a.csv"]
+
+    blob = b"".join(ArchiveManager.stream_zip(files))
+
+    with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["a.csv", "b.json", "c.png", "d.csv"]
+        assert zf.getinfo("a.csv").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("c.png").compress_type == zipfile.ZIP_STORED
+        assert zf.read("a.csv") == (src / "a.csv").read_bytes()
+        assert zf.read("d.csv") == b"payload:dir/d.csv"
+
+
+def test_stream_zip_empty_is_valid_archive() -> None:
+    blob = b"".join(ArchiveManager.stream_zip([]))
+    with zipfile.ZipFile(io.BytesIO(blob)) as zf:
+        assert zf.namelist() == []
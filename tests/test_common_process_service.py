@@ -58,3 +58,18 @@ def test_update_pnm_data_from_message_response_extension_missing_extension() ->
     updated = service._update_pnm_data_from_message_response_extension(transaction_record, pnm_data)
 
     assert updated == {"existing": "data"}
+
+
+def test_get_message_response_extension_returns_channel_window() -> None:
+    window = {"channel_id": 3, "start_hz": 561_000_000, "end_hz": 567_000_000}
+    service = _service_stub([
+        {
+            "status": ServiceStatusCode.SUCCESS.name,
+            "message_type": "PNM_FILE_TRANSACTION",
+            "message": {"transaction_id": "abc123", "extension": {"spectrum_analysis_channel_window": window}},
+        },
+    ])
+
+    assert service._get_message_response_extension({"transaction_id": TransactionId("abc123")}) == \
+        {"spectrum_analysis_channel_window": window}
+    assert service._get_message_response_extension({"transaction_id": TransactionId("other")}) == {}
@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pytest
+from fastapi import APIRouter
+from pydantic import BaseModel, Field
+from starlette.requests import Request
+
+from pypnm.api.routes.common.classes.common_endpoint_classes.compact_encoding import (
+    CompactArrayEncoder,
+    CompactArrayRoute,
+    CompactPrecision,
+)
+from pypnm.lib.types import ComplexArray, FloatSeries, IntSeries, TwoDFloatSeries
+
+MEDIA = CompactArrayEncoder.MEDIA_TYPE
+
+
+class _Carrier(BaseModel):
+    frequency: IntSeries        = Field(..., description="Frequencies.")
+    magnitude: FloatSeries      = Field(..., description="Magnitudes.")
+    complex: ComplexArray       = Field(..., description="Complex pairs.")
+    heat_map: TwoDFloatSeries   = Field(..., description="2-D values.")
+    label: str                  = Field(default="ch33", description="Label.")
+    short: FloatSeries          = Field(default=[1.0, 2.0], description="Below threshold.")
+
+
+def _carrier(n: int = 64) -> _Carrier:
+    return _Carrier(
+        frequency=[1_200_000_000 + i * 50_000 for i in range(n)],
+        magnitude=[float(i) / 4.0 for i in range(n)],
+        complex=[(float(i), -float(i)) for i in range(n)],
+        heat_map=[[float(r * n + c) for c in range(n)] for r in range(3)],
+    )
+
+
+def test_negotiate_parses_media_type_and_parameters() -> None:
+    assert CompactArrayEncoder.negotiate(None) is None
+    assert CompactArrayEncoder.negotiate("application/json") is None
+    assert CompactArrayEncoder.negotiate(f"{MEDIA};q=0") is None
+
+    opts = CompactArrayEncoder.negotiate(f"application/json;q=0.5, {MEDIA}; precision=64; min_length=4")
+    assert opts is not None
+    assert opts.precision == CompactPrecision.F64
+    assert opts.min_length == 4
+
+
+def test_encode_decode_roundtrip_packs_large_arrays() -> None:
+    model = _carrier()
+    doc = CompactArrayEncoder.decode(CompactArrayEncoder.encode(model))
+
+    assert doc["label"] == "ch33"
+    assert doc["short"] == [1.0, 2.0]
+    assert doc["frequency"].dtype == np.dtype("<i8")
+    assert doc["frequency"].tolist() == model.frequency
+    assert doc["magnitude"].dtype == np.dtype("<f4")
+    assert np.allclose(doc["magnitude"], model.magnitude)
+    assert doc["complex"].dtype == np.dtype("<c8")
+    assert np.allclose(doc["complex"].real, [c[0] for c in model.complex])
+    assert np.allclose(doc["complex"].imag, [c[1] for c in model.complex])
+    assert doc["heat_map"].shape == (3, 64)
+
+
+def test_encoded_body_is_plain_json_with_metadata() -> None:
+    raw = json.loads(CompactArrayEncoder.encode({"values": list(range(32))}))
+    packed = raw["values"]
+    assert packed["__ndarray__"] is True
+    assert packed["dtype"] == "<i8"
+    assert packed["shape"] == [32]
+
+
+async def _call(router: APIRouter, accept: str | None) -> tuple[str, bytes]:
+    route = router.routes[0]
+    headers = [(b"accept", accept.encode())] if accept else []
+    scope = {"type": "http", "method": "GET", "path": "/carrier", "headers": headers, "query_string": b""}
+
+    async def receive() -> dict[str, object]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    response = await route.get_route_handler()(Request(scope, receive))
+    return response.headers["content-type"], bytes(response.body)
+
+
+@pytest.mark.asyncio
+async def test_compact_route_negotiates_per_request() -> None:
+    router = APIRouter(route_class=CompactArrayRoute)
+
+    @router.get("/carrier")
+    async def carrier() -> _Carrier:
+        return _carrier()
+
+    content_type, body = await _call(router, None)
+    assert content_type.startswith("application/json")
+    assert json.loads(body)["magnitude"][1] == 0.25
+
+    content_type, body = await _call(router, MEDIA)
+    assert content_type.startswith(MEDIA)
+    assert CompactArrayEncoder.decode(body)["magnitude"][1] == pytest.approx(0.25)
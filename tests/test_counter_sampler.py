@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from pysnmp.proto.rfc1902 import Counter32, Counter64, TimeTicks
+
+from pypnm.docsis.cm_snmp_operation import CmSnmpOperation
+from pypnm.docsis.lib.counter_sampler import (
+    COUNTER_SAMPLER,
+    SIGNAL_QUALITY_CODEWORDS,
+    CounterColumn,
+    CounterSampler,
+)
+from pypnm.lib.inet import Inet
+from pypnm.snmp.snmp_v2c import Snmp_v2c
+from pypnm.tools.snmp_simulator import MibSnapshot, SnmpSimulator
+from pypnm.tools.snmp_simulator.snapshot import oid_key
+
+SNAPSHOT = {
+    "sysUpTime.0": ["TimeTicks", 1000],
+    "ifType.3": ["Integer32", 128],
+    "ifType.4": ["Integer32", 128],
+    "ifInOctets.3": ["Counter32", 2**32 - 100],
+    "ifInOctets.4": ["Counter32", 10],
+    "ifHCInOctets.3": ["Counter64", 5],
+    "docsIfDownChannelId.3": ["Integer32", 5],
+    "docsIfDownChannelId.4": ["Integer32", 6],
+    "docsIfSigQExtUnerroreds.3": ["Counter64", 1000],
+    "docsIfSigQExtUnerroreds.4": ["Counter64", 1000],
+    "docsIfSigQExtCorrecteds.3": ["Counter64", 0],
+    "docsIfSigQExtCorrecteds.4": ["Counter64", 0],
+    "docsIfSigQExtUncorrectables.3": ["Counter64", 0],
+    "docsIfSigQExtUncorrectables.4": ["Counter64", 0],
+}
+
+
+def test_deltas_handle_wrap_and_agent_restart() -> None:
+    async def run() -> None:
+        async with SnmpSimulator.fleet(MibSnapshot.from_mapping(SNAPSHOT), 1, base_port=0) as sim:
+            host, port = sim.endpoints[0]
+            device = sim.devices[0]
+            snmp = Snmp_v2c(Inet(host), community="public", port=port, timeout=1, retries=0)
+            sampler = CounterSampler(interval_s=60, capacity=4)
+            sampler.track("cm", snmp, [CounterColumn("ifInOctets"), CounterColumn("ifHCInOctets", 64)], start=False)
+
+            assert sampler.delta("cm") is None
+            first = await sampler.sample("cm")
+            assert first is not None and first.uptime == 1000
+            assert first.values["ifInOctets"] == {3: 2**32 - 100, 4: 10}
+
+            device.set(oid_key("ifInOctets.3"), Counter32(50))
+            device.set(oid_key("ifHCInOctets.3"), Counter64(2005))
+            device.set(oid_key("sysUpTime.0"), TimeTicks(1100))
+            await asyncio.sleep(0.05)
+            await sampler.sample("cm")
+
+            delta = sampler.delta("cm")
+            assert delta is not None and delta.elapsed_s >= 0.05
+            assert delta.deltas == {"ifInOctets": {3: 150, 4: 0}, "ifHCInOctets": {3: 2000}}
+            rates = sampler.rates("cm")
+            assert rates is not None and rates["ifHCInOctets"][3] == 2000 / delta.elapsed_s
+            assert sampler.delta("cm", min_elapsed_s=60) is None
+
+            device.set(oid_key("sysUpTime.0"), TimeTicks(5))
+            device.set(oid_key("ifInOctets.3"), Counter32(1))
+            await sampler.sample("cm")
+            assert len(sampler.samples("cm")) == 1
+            assert sampler.delta("cm") is None
+
+            await sampler.stop()
+            assert not sampler.is_tracked("cm")
+
+    asyncio.run(run())
+
+
+def test_codeword_error_rate_answers_from_buffer() -> None:
+    async def run() -> None:
+        async with SnmpSimulator.fleet(MibSnapshot.from_mapping(SNAPSHOT), 1, base_port=0) as sim:
+            host, port = sim.endpoints[0]
+            device = sim.devices[0]
+            cm = CmSnmpOperation(Inet(host), "private", port=port)
+
+            key = f"{host}:{port}"
+
+            try:
+                COUNTER_SAMPLER.track(key, cm._snmp, SIGNAL_QUALITY_CODEWORDS, start=False)
+                await COUNTER_SAMPLER.sample(key)
+                device.set(oid_key("docsIfSigQExtUnerroreds.3"), Counter64(1900))
+                device.set(oid_key("docsIfSigQExtCorrecteds.3"), Counter64(50))
+                device.set(oid_key("docsIfSigQExtUncorrectables.3"), Counter64(50))
+
+                entries = await cm.getDocsIfDownstreamChannelCwErrorRate(0.3)
+                assert [(e.index, e.channel_id) for e in entries] == [(3, 5), (4, 6)]
+                totals = entries[0].codeword_totals
+                assert (totals.total_codewords, totals.total_errors, totals.error_rate) == (1000, 50, 0.05)
+                assert totals.time_elapsed >= 0.3
+                assert entries[1].codeword_totals.total_codewords == 0
+
+                started = time.monotonic()
+                cached = await cm.getDocsIfDownstreamChannelCwErrorRate(0.3)
+                assert time.monotonic() - started < 0.3
+                assert cached == entries
+                assert {c.name for c in SIGNAL_QUALITY_CODEWORDS} <= set(COUNTER_SAMPLER.samples(key)[-1].values)
+            finally:
+                await COUNTER_SAMPLER.stop()
+
+    asyncio.run(run())
+
+
+def test_sample_reads_every_row_past_one_getbulk_page() -> None:
+    channels = range(1, 33)
+    snapshot = {"sysUpTime.0": ["TimeTicks", 1000]}
+    for name in ("docsIfSigQExtUnerroreds", "docsIfSigQExtCorrecteds", "docsIfSigQExtUncorrectables"):
+        snapshot |= {f"{name}.{idx}": ["Counter64", idx] for idx in channels}
+
+    async def run() -> None:
+        async with SnmpSimulator.fleet(MibSnapshot.from_mapping(snapshot), 1, base_port=0) as sim:
+            host, port = sim.endpoints[0]
+            snmp = Snmp_v2c(Inet(host), community="public", port=port, timeout=1, retries=0)
+            sampler = CounterSampler(interval_s=60)
+            sampler.track("cm", snmp, SIGNAL_QUALITY_CODEWORDS, start=False)
+
+            sample = await sampler.sample("cm")
+            assert sample is not None
+            assert sampler.max_repetitions < len(channels)
+            for col in SIGNAL_QUALITY_CODEWORDS:
+                assert sample.values[col.name] == {idx: idx for idx in channels}
+
+    asyncio.run(run())
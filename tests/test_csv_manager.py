@@ -1,11 +1,14 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import csv
+import io
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from pypnm.lib.csv.manager import (
@@ -153,3 +156,61 @@ def test_custom_delimiter_vertical(tmp_path: Path) -> None:
     # Header and row separated by semicolons
     assert "a;b" in content
     assert "10;20" in content
+
+
+@pytest.mark.parametrize("orientation", [CSVOrientation.VERTICAL, CSVOrientation.HORIZONTAL])
+def test_insert_columns_matches_row_api(tmp_path: Path, orientation: CSVOrientation) -> None:
+    freq = np.arange(5, dtype=np.int64) * 25_000
+    mag = np.array([1.5, -2.25, np.nan, 3.0, 0.1])
+    label = ["a", None, 'q"t', "x;y", "z"]
+
+    by_row = CSVManager(orientation)
+    by_row.set_header(["Freq", "Mag", "Label"])
+    by_row.insert_row([0, "pre", "row"])
+    by_row.insert_multiple_rows([[int(f), float(m), lb] for f, m, lb in zip(freq, mag, label, strict=True)])
+
+    by_col = CSVManager(orientation)
+    by_col.set_header(["Freq", "Mag", "Label"])
+    by_col.insert_row([0, "pre", "row"])
+    by_col.insert_columns({"Label": label, "Freq": freq, "Mag": mag})
+
+    assert by_col.get_row_count() == 6
+    assert by_col.get_data() == by_row.get_data()
+    for delimiter in (",", ";"):
+        a, b = tmp_path / "row.csv", tmp_path / "col.csv"
+        by_row.set_path_fname(a)
+        by_col.set_path_fname(b)
+        by_row.write(include_index=True, delimiter=delimiter)
+        by_col.write(include_index=True, delimiter=delimiter, chunk_rows=2)
+        assert b.read_bytes() == a.read_bytes()
+
+
+def test_insert_columns_validation_and_precision() -> None:
+    mgr = CSVManager()
+    with pytest.raises(CSVValidationError):
+        mgr.insert_columns([[1]])
+    mgr.set_header(["a", "b"])
+    with pytest.raises(CSVValidationError):
+        mgr.insert_columns([[1, 2], [3]])
+    with pytest.raises(CSVValidationError):
+        mgr.insert_columns({"a": [1], "c": [2]})
+
+    mgr.insert_columns([np.array([1.23456, 2.0]), np.array([True, False])], float_precision=2)
+    buf = io.BytesIO()
+    mgr.write_stream(buf)
+    assert buf.getvalue() == b"a,b\r\n1.23,True\r\n2.00,False\r\n"
+
+
+def test_from_dataframe_keeps_datetime_text() -> None:
+    df = pd.DataFrame({
+        "when": pd.to_datetime(["2025-01-01 00:00:00", "2025-01-02 03:04:05"]),
+        "took": pd.to_timedelta(["1s", "2 days"]),
+        "n": [1, 2],
+    })
+    mgr = CSVManager()
+    mgr.from_dataframe(df)
+    buf = io.BytesIO()
+    mgr.write_stream(buf)
+    assert buf.getvalue() == (b"when,took,n\r\n"
+                              b"2025-01-01 00:00:00,0 days 00:00:01,1\r\n"
+                              b"2025-01-02 03:04:05,2 days 00:00:00,2\r\n")
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypnm.lib.code_word.cw_generator import CodeWordGenerator
+from pypnm.lib.qam.types import QamModulation
+
+
+def _reference_bits(seed: int, taps: int, n: int) -> list[int]:
+    state, out = seed, []
+    for _ in range(n):
+        bit = state & 1
+        state >>= 1
+        if bit:
+            state ^= taps
+        state &= 0xFF
+        out.append(bit)
+    return out
+
+
+@pytest.mark.parametrize("seed,taps", [(0xA5, 0b10110111), (0x01, 0b10111000), (0x3C, 0b00000110)])
+@pytest.mark.parametrize("qam", [QamModulation.QAM_4, QamModulation.QAM_256, QamModulation.QAM_4096,
+                                 QamModulation.QAM_65536])
+def test_table_driven_matches_bitwise_lfsr(seed: int, taps: int, qam: QamModulation) -> None:
+    gen = CodeWordGenerator(seed=seed, taps=taps)
+    bps = qam.get_bit_per_symbol()
+    n = 700
+    bits = _reference_bits(seed, taps, max(n * bps, 300 * 8))
+
+    expected_cw = [sum(b << i for i, b in enumerate(bits[k * bps:(k + 1) * bps])) for k in range(n)]
+    assert gen.generate(qam, n) == expected_cw
+    assert gen.generate_array(qam, n).dtype == np.int64
+
+    expected_prbs = [sum(b << (7 - i) for i, b in enumerate(bits[k * 8:(k + 1) * 8])) for k in range(300)]
+    assert gen.prbs(300) == expected_prbs
+    assert gen.prbs_array(0).size == 0
+    assert gen.generate(qam, 0) == []
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypnm.lib.code_word.cw_sym_mapper import QamByteToSymbolMapper
+from pypnm.lib.qam.types import QamModulation
+
+PAYLOAD = bytes(np.random.default_rng(7).integers(0, 256, 301, dtype=np.uint8))
+
+
+def _iter_reference(mapper: QamByteToSymbolMapper, data: bytes) -> np.ndarray:
+    return np.asarray([complex(i, q) for i, q in mapper.iter_symbols(data)], dtype=np.complex128)
+
+
+@pytest.mark.parametrize("qam", [QamModulation.QAM_4, QamModulation.QAM_64, QamModulation.QAM_1024,
+                                 QamModulation.QAM_4096])
+@pytest.mark.parametrize("bit_order", ["msb", "lsb"])
+@pytest.mark.parametrize("pad", ["drop", "zero"])
+def test_vectorized_mapping_matches_iterator(qam: QamModulation, bit_order: str, pad: str) -> None:
+    mapper = QamByteToSymbolMapper.from_lut_manager(qam, pad=pad, bit_order=bit_order)  # type: ignore[arg-type]
+    ref = _iter_reference(mapper, PAYLOAD)
+
+    out = mapper.map_bytes_array(PAYLOAD, as_complex=True)
+    np.testing.assert_array_equal(out, ref)
+
+    pairs = mapper.map_bytes_array(PAYLOAD)
+    assert pairs.shape == (ref.size, 2)
+    np.testing.assert_array_equal(pairs[:, 0] + 1j * pairs[:, 1], ref)
+    assert mapper.map_bytes_array(b"").shape == (0, 2)
+
+
+@pytest.mark.parametrize("on_unknown", ["skip", "mod", "error"])
+def test_sparse_lut_unknown_policy(on_unknown: str) -> None:
+    lut = {0: (-1.0, -1.0), 1: (-1.0, 1.0), 5: (1.0, 1.0), 6: (1.0, -1.0)}
+    mapper = QamByteToSymbolMapper(lut, require_dense=False, on_unknown=on_unknown)  # type: ignore[arg-type]
+
+    if on_unknown == "error":
+        with pytest.raises(KeyError):
+            mapper.map_bytes_array(PAYLOAD)
+        return
+    np.testing.assert_array_equal(mapper.map_bytes_array(PAYLOAD, as_complex=True), _iter_reference(mapper, PAYLOAD))
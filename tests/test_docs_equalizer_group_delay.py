@@ -3,6 +3,9 @@
 
 from __future__ import annotations
 
+import numpy as np
+import pytest
+
 from pypnm.lib.types import BandwidthHz
 from pypnm.pnm.data_type.DocsEqualizerData import DocsEqualizerData
 
@@ -49,3 +52,52 @@ def test_group_delay_missing_without_channel_width() -> None:
     record = ded.get_record(81)
     assert record is not None
     assert record.group_delay is None
+
+
+def _encode_taps(values: list[tuple[int, int]], byteorder: str, bits: int = 16) -> bytes:
+    header = bytes([8, 1, len(values), 0])
+    body = bytearray()
+    for real, imag in values:
+        for v in (real, imag):
+            body.extend((v % (1 << bits)).to_bytes(2, byteorder=byteorder, signed=False))  # type: ignore[arg-type]
+    return header + bytes(body)
+
+
+def test_decode_batch_detects_endianness_and_encoding_per_record() -> None:
+    taps = [(0, 0)] * 7 + [(2047, 0)] + [(3, 5)] * 12 + [(-3, 5)] * 4
+    little16 = _encode_taps([(r * 8, i * 8) for r, i in taps], "little")
+    big12 = _encode_taps(taps, "big", bits=12)
+
+    batch = DocsEqualizerData.decode_batch([[little16, big12], [None]])
+
+    assert batch.taps.shape == (2, 2, 24)
+    assert batch.valid.tolist() == [[True, True], [False, False]]
+    assert batch.big_endian[0].tolist() == [False, True]
+    assert batch.four_nibble[0].tolist() == [True, False]
+    assert batch.taps[0, 0, 20] == complex(-24, 40)
+    assert batch.taps[0, 1, 7] == complex(2047, 0)
+    assert batch.taps[0, 1, 20] == complex(-3, 5)
+
+
+def test_analyze_batch_matches_per_record_models() -> None:
+    rng = np.random.default_rng(4)
+    payloads = []
+    for _ in range(6):
+        values = [(int(r), int(i)) for r, i in rng.integers(-200, 200, size=(24, 2))]
+        values[7] = (1800, 40)
+        payloads.append(_encode_taps(values, "little"))
+    grid = [payloads[:3], payloads[3:]]
+
+    analysis = DocsEqualizerData.analyze_batch(grid, channel_widths_hz=[[3_200_000], [6_400_000]])
+
+    for m, row in enumerate(grid):
+        for c, payload in enumerate(row):
+            ded = DocsEqualizerData()
+            assert ded.add_from_bytes(0, payload, channel_width_hz=BandwidthHz(3_200_000 * (m + 1)))
+            record = ded.get_record(0)
+            assert record is not None and record.metrics is not None and record.group_delay is not None
+
+            assert analysis.metrics is not None
+            assert analysis.metrics.main_tap_ratio[m, c] == pytest.approx(record.metrics.main_tap_ratio)
+            assert analysis.metrics.total_tap_energy[m, c] == pytest.approx(record.metrics.total_tap_energy)
+            np.testing.assert_allclose(analysis.group_delay_us[m, c], record.group_delay.delay_us)
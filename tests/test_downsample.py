@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from matplotlib.axes import Axes
+
+from pypnm.api.routes.common.classes.analysis.analysis import Analysis
+from pypnm.api.routes.common.classes.common_endpoint_classes.common_req_resp import (
+    DownsampleParameters,
+)
+from pypnm.lib.matplot.manager import MatplotManager, PlotConfig
+from pypnm.lib.signal_processing.downsample import (
+    DownsampleMethod,
+    SeriesDownsampler,
+    lttb_indices,
+    min_max_indices,
+)
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
+
+
+def test_lttb_and_min_max_keep_endpoints_and_peaks() -> None:
+    x = np.arange(20_000, dtype=float)
+    y = np.sin(x / 500.0)
+    y[12_345] = 25.0
+    y[7_777] = -25.0
+    y[100:200] = np.nan
+
+    idx = lttb_indices(x, y, 500)
+    assert idx.size == 500 and idx[0] == 0 and idx[-1] == x.size - 1
+    assert np.all(np.diff(idx) > 0)
+    assert {12_345, 7_777} <= set(idx.tolist())
+
+    env = min_max_indices(y, 500)
+    assert env.size <= 500 and env[0] == 0 and env[-1] == x.size - 1
+    assert {12_345, 7_777} <= set(env.tolist())
+    assert not np.isnan(y[env]).any()
+
+    assert lttb_indices(x[:10], y[:10], 500).tolist() == list(range(10))
+    sx, sy = SeriesDownsampler(points=100, method=DownsampleMethod.MIN_MAX).apply(x, y)
+    assert sx.size == sy.size <= 100 and np.nanmax(sy) == 25.0
+
+
+def test_analysis_result_downsampled_with_aligned_series() -> None:
+    raw = SyntheticPnmFactory(seed=5).spectrum(20, bins_per_segment=256)
+    measurement = CmSpectrumAnalysis(raw).to_model().model_dump() | {"device_details": {}}
+    model = Analysis.basic_analysis_spectrum_analyzer(measurement, None)
+    full = model.model_dump()
+    n = len(full["signal_analysis"]["magnitudes"])
+
+    assert Analysis.downsample_result(full, DownsampleParameters(), ("signal_analysis",),
+                                      "frequencies", "magnitudes") is full
+
+    params = DownsampleParameters(method=DownsampleMethod.MIN_MAX, points=400)
+    out = Analysis.downsample_result(full, params, ("signal_analysis",), "frequencies", "magnitudes")
+    sig = out["signal_analysis"]
+    kept = len(sig["magnitudes"])
+    assert kept <= 400 and out["downsample"] == {"method": "min_max", "points": kept, "source_points": n}
+    assert len(sig["frequencies"]) == len(sig["window_average"]["magnitudes"]) == kept
+    assert max(sig["magnitudes"]) == max(full["signal_analysis"]["magnitudes"])
+    assert set(sig["frequencies"]) <= set(full["signal_analysis"]["frequencies"])
+    assert len(full["signal_analysis"]["magnitudes"]) == n
+
+
+def test_area_plot_keeps_y2_aligned_after_downsampling(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[object, ...]] = []
+    monkeypatch.setattr(Axes, "fill_between", lambda _ax, *args, **_kw: calls.append(args))
+    x = np.arange(5_000, dtype=float)
+    y = np.sin(x / 50.0)
+    y2 = y - 1.0 - x / 1e4
+
+    cfg = PlotConfig(downsample=DownsampleMethod.MIN_MAX, downsample_points=100)
+    MatplotManager(tmp_path, dpi=40, figsize=(2.0, 2.0)).plot_area(x, y, "area.png", y2=y2, cfg=cfg)
+
+    xs, ys, y2s = (np.asarray(a) for a in calls[0])
+    kept = xs.astype(int)
+    assert xs.size <= 100
+    np.testing.assert_array_equal(ys, y[kept])
+    np.testing.assert_array_equal(y2s, y2[kept])
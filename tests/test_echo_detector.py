@@ -9,6 +9,7 @@ import pytest
 
 # Import your detector from its project path
 from pypnm.api.routes.advance.analysis.signal_analysis.detection.echo.echo_detector import (
+    BatchEchoDetector,
     EchoDetector,
 )
 from pypnm.lib.types import ChannelId
@@ -161,3 +162,38 @@ def test_snapshot_average_with_guard_and_min_separation():
     bins_sorted = sorted(bins)
     for i in range(1, len(bins_sorted)):
         assert (bins_sorted[i] - bins_sorted[i - 1]) >= 8 - 1, "Echo picks violate min separation constraint"
+
+
+def test_batch_detector_matches_per_capture_reports() -> None:
+    """
+    A batch of captures with echoes at different distances goes through one
+    IFFT; each row must agree with the single-capture detector, and rows with
+    fewer echoes are padded.
+    """
+    distances_ft = [(20.0,), (35.0, 80.0), ()]
+    H = np.vstack([
+        _make_freq_response_from_impulses([(0, 1.0)] + [(_bins_for_distance_ft(d), 0.25) for d in ds])
+        for ds in distances_ft
+    ])
+    params = dict(threshold_frac=0.05, min_separation_s=8.0 / FS, max_delay_s=3.5e-6, max_peaks=3)
+
+    batch = BatchEchoDetector(subcarrier_spacing_hz=DF_HZ, n_fft=NFFT).detect(H, local_maxima=False, **params)
+
+    assert batch.echoes.shape == (3, 3)
+    for row in range(len(distances_ft)):
+        rep = EchoDetector(H[row], subcarrier_spacing_hz=DF_HZ, n_fft=NFFT).multi_echo(**params)
+        n = int(batch.counts[row])
+        assert [e.bin_index for e in rep.echoes] == batch.echoes["bin_index"][row, :n].tolist()
+        assert np.all(batch.echoes["bin_index"][row, n:] == -1)
+        assert np.all(np.isnan(batch.echoes["distance_ft"][row, n:]))
+
+    # Local-maximum picking keeps one peak per echo, at the expected distance and level
+    peaks = BatchEchoDetector(subcarrier_spacing_hz=DF_HZ, n_fft=NFFT).detect(H, **params)
+    assert peaks.counts.tolist() == [len(ds) for ds in distances_ft]
+    for row, ds in enumerate(distances_ft):
+        assert peaks.echoes["bin_index"][row, :len(ds)].tolist() == [_bins_for_distance_ft(d) for d in ds]
+        assert peaks.echoes["distance_ft"][row, :len(ds)] == pytest.approx(ds, rel=0.05)
+        assert np.all(peaks.echoes["level_db"][row, :len(ds)] < 0.0)
+    assert np.all(peaks.direct["bin_index"] == 0)
+    assert np.all(peaks.direct["level_db"] == 0.0)
+
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 # tests/test_file_processor_hexdump.py
 
@@ -157,3 +157,42 @@ def test_hexdump_empty_file_returns_empty_list(tmp_path: Path) -> None:
 
     assert isinstance(lines, list)
     assert len(lines) == 0
+
+
+@pytest.mark.pnm
+def test_hexdump_window_matches_full_dump(tmp_path: Path) -> None:
+    """
+    A windowed dump must equal the matching lines of the full dump, keep
+    absolute offsets, and only cover the requested bytes.
+    """
+    payload   = bytes(range(256)) * 600
+    file_path = tmp_path / "big.bin"
+    file_path.write_bytes(payload)
+
+    fp   = FileProcessor(file_path)
+    full = fp.hexdump(bytes_per_line=16)
+    assert len(full) == len(payload) // 16
+
+    window = list(fp.iter_hexdump(offset=70_000, length=4_000, bytes_per_line=16))
+    assert window == full[70_000 // 16 : 74_000 // 16]
+    assert fp.hexdump(bytes_per_line=16, offset=70_000, limit_bytes=4_000) == window
+
+    tail = fp.hexdump(bytes_per_line=16, offset=len(payload) - 4)
+    assert tail == [f"{len(payload) - 4:08x}  fc fd fe ff{' ' * 36}  |....|"]
+    assert fp.read_range(70_000, 8) == payload[70_000:70_008]
+    assert fp.read_range(len(payload) + 1, 8) == b""
+    assert fp.to_hex(offset=16, length=4) == payload[16:20].hex()
+    assert fp.file_size() == len(payload)
+
+
+@pytest.mark.pnm
+def test_peek_header_is_cached_until_file_changes(tmp_path: Path) -> None:
+    file_path = tmp_path / "hdr.bin"
+    file_path.write_bytes(b"PNN\x04" + bytes(100))
+
+    fp = FileProcessor(file_path)
+    assert fp.peek_header(4) == b"PNN\x04"
+    assert FileProcessor(file_path).peek_header(4) is fp.peek_header(4)
+
+    file_path.write_bytes(b"PNN\x05" + bytes(200))
+    assert fp.peek_header(4) == b"PNN\x05"
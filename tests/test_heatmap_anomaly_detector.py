@@ -6,6 +6,10 @@ from __future__ import annotations
 import numpy as np
 import pytest
 
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.anolamaly.components import (
+    StreamingRegionLabeler,
+    label_regions,
+)
 from pypnm.api.routes.advance.analysis.signal_analysis.detection.anolamaly.heatmap_anomaly_detection import (
     HeatmapAnomalyDetector,
 )
@@ -105,3 +109,48 @@ def test_to_json_structure_after_detection():
     assert "boxes" in payload and isinstance(payload["boxes"], list)
     # one 1x1 box expected
     assert payload["boxes"] == [{"row_min": 2, "col_min": 2, "row_max": 2, "col_max": 2}]
+
+
+@pytest.mark.pnm
+def test_regions_report_area_and_signed_peak():
+    a = np.zeros((6, 8), dtype=float)
+    a[0:2, 0:3] = 10.0
+    a[1, 1] = 20.0
+    a[4:6, 5] = -30.0
+
+    det = HeatmapAnomalyDetector(a, threshold=1.0)
+    det.find_boxes()
+    regions = det.regions
+
+    assert regions is not None
+    assert regions.region_ids.tolist() == [1, 2]
+    assert regions.areas.tolist() == [6, 2]
+    assert regions.boxes.tolist() == [[0, 0, 1, 2], [4, 5, 5, 5]]
+    assert regions.peak_deviation[0] == pytest.approx(det.zmap[1, 1])
+    assert regions.peak_deviation[1] == pytest.approx(det.zmap[4, 5])
+    assert regions.peak_deviation[1] < 0.0
+    assert set(np.unique(regions.labels).tolist()) == {0, 1, 2}
+
+
+@pytest.mark.pnm
+def test_streaming_labeler_merges_regions_across_appended_rows():
+    # Two columns that only join at the last row: a "U" shape.
+    mask = np.zeros((5, 5), dtype=bool)
+    mask[:, 0] = True
+    mask[:, 4] = True
+    mask[4, :] = True
+
+    stream = StreamingRegionLabeler(cols=5)
+    for row in mask[:4]:
+        stream.append(row)
+    assert len(stream.regions()) == 2
+
+    stream.append(mask[4:])
+    streamed = stream.regions(include_labels=True)
+    batch = label_regions(mask)
+
+    assert len(streamed) == len(batch) == 1
+    assert streamed.region_ids.tolist() == [1]
+    assert streamed.boxes.tolist() == batch.boxes.tolist() == [[0, 0, 4, 4]]
+    assert streamed.areas.tolist() == batch.areas.tolist() == [13]
+    assert np.array_equal(streamed.labels > 0, mask)
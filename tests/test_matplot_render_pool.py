@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from pypnm.lib.matplot.manager import MatplotManager, PlotConfig, PlotRenderJob
+from pypnm.lib.matplot.render_pool import MatplotRenderPool, PlotRenderCache
+
+
+def _plot(out_dir: Path, name: str, title: str = "line") -> MatplotManager:
+    mgr = MatplotManager(out_dir, dpi=60, figsize=(4.0, 3.0), default_cfg=PlotConfig(title=title))
+    x = np.arange(32, dtype=float)
+    mgr.plot_line(name, x=x, y=np.sin(x / 4.0))
+    return mgr
+
+
+def test_deferred_rendering_records_jobs_without_drawing(tmp_path: Path) -> None:
+    with MatplotManager.deferred_rendering() as jobs:
+        mgr = _plot(tmp_path, "deferred")
+
+    expected = tmp_path.resolve() / "deferred.png"
+    assert mgr.get_png_files() == [expected]
+    assert [job.output for job in jobs] == [expected]
+    assert jobs[0].method == "plot_line"
+    assert not expected.exists()
+
+    assert MatplotRenderPool.render(jobs, max_workers=1) == [expected]
+    assert expected.is_file()
+
+
+def test_cache_key_ignores_filename_but_tracks_content(tmp_path: Path) -> None:
+    with MatplotManager.deferred_rendering() as jobs:
+        _plot(tmp_path, "a")
+        _plot(tmp_path, "b")
+        _plot(tmp_path, "c", title="other")
+
+    assert jobs[0].cache_key() == jobs[1].cache_key()
+    assert jobs[0].cache_key() != jobs[2].cache_key()
+
+
+def test_render_cache_hit_copies_previous_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = PlotRenderCache(tmp_path / "cache")
+
+    with MatplotManager.deferred_rendering() as first:
+        _plot(tmp_path, "first")
+    MatplotRenderPool.render(first, cache=cache, max_workers=1)
+
+    with MatplotManager.deferred_rendering() as second:
+        _plot(tmp_path, "second")
+
+    def fail_render(self: PlotRenderJob, **_: object) -> Path:
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(PlotRenderJob, "render", fail_render)
+    written = MatplotRenderPool.render(second, cache=cache, max_workers=1)
+
+    assert written == [second[0].output]
+    assert second[0].output.read_bytes() == first[0].output.read_bytes()
+
+
+def test_preview_renders_at_reduced_dpi(tmp_path: Path) -> None:
+    with MatplotManager.deferred_rendering() as jobs:
+        mgr = MatplotManager(tmp_path, dpi=150, figsize=(4.0, 3.0))
+        mgr.plot_line("full", y=[1.0, 2.0, 3.0])
+        mgr.plot_line("preview", y=[1.0, 2.0, 3.0])
+
+    full, = MatplotRenderPool.render(jobs[:1], max_workers=1)
+    preview, = MatplotRenderPool.render(jobs[1:], preview=True, max_workers=1)
+
+    with Image.open(full) as f, Image.open(preview) as p:
+        assert p.width < f.width
+        assert p.height < f.height
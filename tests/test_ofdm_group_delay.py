@@ -1,17 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
 import json
 import math
 
+import numpy as np
 import pytest
 from pydantic import BaseModel, ValidationError
 
 from pypnm.lib.signal_processing.groupdelay.ofdm import (
     GroupDelayOptions,
     OFDMGroupDelay,
+    OFDMGroupDelayKernel,
     SignConvention,
     SpacedFrequencyAxisHz,
 )
@@ -233,3 +235,39 @@ def test_invalid_active_mask_type_rejected__length_check() -> None:
     axis = SpacedFrequencyAxisHz(f0_hz=FrequencyHz(int(f0_hz)), df_hz=df_hz)
     with pytest.raises(ValueError):
         OFDMGroupDelay(H=H, axis=axis, active_mask=[1, 0, 1])  # wrong length
+
+
+# ── Batch kernel ──────────────────────────────────────────────────────────────
+
+def test_kernel_batch__matches_per_capture_model() -> None:
+    n_bins, f0_hz, df_hz = 300, 400e6, 50_000.0
+    rng = np.random.default_rng(11)
+    rows = [synth_constant_tau_channel(n_bins, f0_hz, df_hz, tau) for tau in (1e-6, 4e-6, 9e-6)]
+    H = np.asarray(rows) * np.exp(1j * 0.2 * rng.standard_normal((3, n_bins)))
+    H[1, 40:60] = complex("nan")
+    mask = np.ones((3, n_bins), dtype=int)
+    mask[2, 100:130] = 0
+
+    axis = SpacedFrequencyAxisHz(f0_hz=FrequencyHz(int(f0_hz)), df_hz=df_hz)
+    opts = GroupDelayOptions(smooth_win=11)
+    batch = OFDMGroupDelayKernel.compute(H, axis, opts, mask)
+
+    assert batch.tau_s.shape == (3, n_bins)
+    for m in range(3):
+        single = OFDMGroupDelay(H=H[m].tolist(), axis=axis, options=opts, active_mask=mask[m].tolist()).result()
+        np.testing.assert_allclose(batch.tau_s[m], single.tau_s, equal_nan=True, rtol=1e-12)
+        np.testing.assert_allclose(batch.unwrapped_phase[m], single.unwrapped_phase, equal_nan=True, rtol=1e-12)
+        assert batch.valid_mask[m].astype(int).tolist() == single.valid_mask
+        assert batch.mean_group_delay_us[m] == pytest.approx(single.mean_group_delay_us)
+
+    assert not batch.valid_mask[1, 40:60].any()
+    assert not batch.valid_mask[2, 100:130].any()
+
+
+def test_kernel_unwrap__restarts_each_active_run() -> None:
+    wrapped = np.array([[3.0, -3.0, 3.0, np.nan, -3.0, 3.0]])
+    mask = np.array([[True, True, True, False, True, True]])
+    out = OFDMGroupDelayKernel._unwrap_on_mask(wrapped, mask)
+    np.testing.assert_allclose(out[0, :3], [3.0, 2.0 * math.pi - 3.0, 3.0])
+    assert math.isnan(out[0, 3])
+    np.testing.assert_allclose(out[0, 4:], [-3.0, 3.0 - 2.0 * math.pi])
@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
+
 import pytest
 
 from pypnm.api.routes.common.extended.common_messaging_service import (
@@ -19,6 +21,7 @@ from pypnm.api.routes.docs.pnm.spectrumAnalyzer.service import (
 )
 from pypnm.lib.conversions.rbw import RBWConversion
 from pypnm.lib.types import ChannelId, FrequencyHz, ResolutionBw
+from pypnm.lib.vendor_capabilities import VendorCapabilities
 
 
 class _FakeCableModem:
@@ -56,6 +59,12 @@ async def test_ofdm_analyzer_uses_resolution_bandwidth(monkeypatch: pytest.Monke
             self._params = capture_parameters
             captured.append(capture_parameters)
 
+        def setSampleReadyHook(self, hook: Callable[[], Awaitable[object]] | None) -> None:
+            pass
+
+        def setVendorCapabilities(self, capabilities: VendorCapabilities | None) -> None:
+            pass
+
         async def set_and_go(self) -> MessageResponse:
             return MessageResponse(ServiceStatusCode.SUCCESS)
 
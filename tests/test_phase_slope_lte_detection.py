@@ -0,0 +1,59 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pypnm.api.routes.advance.analysis.signal_analysis.detection.lte.phase_slope_lte_detection import (
+    GroupDelayAnomalyDetector,
+    PhaseSlopeLteDetector,
+)
+
+K = 1900
+FREQS = 600e6 + np.arange(K) * 50e3
+LTE_PERIOD_HZ = 6e6
+
+
+def _capture(rng: np.random.Generator, lte: bool) -> np.ndarray:
+    phase = 2 * np.pi * FREQS * 1.2e-6
+    if lte:
+        phase = phase + 0.8 * np.sin(2 * np.pi * (FREQS - FREQS[0]) / LTE_PERIOD_HZ)
+    noise = 0.01 * (rng.normal(size=K) + 1j * rng.normal(size=K))
+    return np.exp(-1j * phase) + noise
+
+
+def test_batch_flags_only_rippled_captures() -> None:
+    rng = np.random.default_rng(7)
+    lte = np.array([True, False, True, False, False])
+    H = np.vstack([_capture(rng, flag) for flag in lte])
+
+    batch = PhaseSlopeLteDetector(threshold_s=1e-9).detect(H, FREQS)
+
+    assert batch.detected.tolist() == lte.tolist()
+    assert np.all(batch.confidence[lte] > 0.5)
+    assert np.all(batch.confidence[~lte] < 0.2)
+    assert batch.ripple_period_hz[lte] == pytest.approx(LTE_PERIOD_HZ, rel=0.05)
+    assert batch.residual_s.shape == (lte.size, K - 1)
+
+
+def test_batch_accepts_real_imag_pairs_and_rejects_shape_mismatch() -> None:
+    rng = np.random.default_rng(1)
+    H = _capture(rng, True)
+    pairs = np.stack((H.real, H.imag), axis=-1)[None, ...]
+
+    det = PhaseSlopeLteDetector()
+    assert det.detect(pairs, FREQS).detected.tolist() == det.detect(H, FREQS).detected.tolist() == [True]
+    with pytest.raises(ValueError):
+        det.detect(H, FREQS[:-1])
+
+
+def test_group_delay_matches_central_differences() -> None:
+    rng = np.random.default_rng(3)
+    H = _capture(rng, False)
+    tau = GroupDelayAnomalyDetector(H, FREQS).compute_group_delay()
+
+    phi = np.unwrap(np.angle(H))
+    expected = np.abs(-np.gradient(phi, FREQS) / (2 * np.pi)) / 2
+    assert tau == pytest.approx(expected, rel=1e-9)
@@ -1,14 +1,25 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import socket
 import subprocess
+from pathlib import Path
 
 import pytest
 
-from pypnm.lib.ping import Ping
+from pypnm.lib.ping import AsyncPinger, Ping, PingResult
+
+FAKE_PING = """#!/bin/sh
+# last argument is the target; 127.0.0.1 answers, anything else is lost
+for target; do :; done
+[ "$target" = "127.0.0.1" ] || exit 1
+echo "64 bytes from $target: icmp_seq=1 ttl=64 time=0.125 ms"
+echo "64 bytes from $target: icmp_seq=2 ttl=64 time=0.375 ms"
+"""
 
 
 class DummyCompleted:
@@ -88,3 +99,52 @@ def test_subprocess_exception_returns_false(
     assert ok is False
     # Optional: assert we actually logged the error
     assert "[Ping Error] no ping here" in caplog.text
+
+
+def test_async_pinger_subprocess_fallback_reports_rtt_and_loss(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("platform.system", lambda: "Linux")
+    script = tmp_path / "ping"
+    script.write_text(FAKE_PING)
+    script.chmod(0o755)
+    monkeypatch.setenv("PATH", str(tmp_path))
+
+    pinger = AsyncPinger(timeout=1, count=2, use_icmp_socket=False)
+    results = asyncio.run(pinger.probe_many(["127.0.0.1", "127.0.0.2", "127.0.0.1"]))
+
+    assert list(results) == ["127.0.0.1", "127.0.0.2"]
+    up, down = results["127.0.0.1"], results["127.0.0.2"]
+    assert (up.method, up.sent, up.received, up.loss) == ("subprocess", 2, 2, 0.0)
+    assert up.rtts_ms == (0.125, 0.375)
+    assert up.rtt_avg_ms == pytest.approx(0.25)
+    assert not down.reachable and down.loss == 1.0 and down.rtt_min_ms is None
+
+
+def test_async_pinger_bounds_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    in_flight, peak = 0, 0
+
+    async def fake_probe(self: AsyncPinger, host: str, family: int, address: str) -> PingResult:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return PingResult(host=host, address=address, sent=1, received=1, rtts_ms=(1.0,), method="icmp")
+
+    monkeypatch.setattr(AsyncPinger, "_probe_address", fake_probe)
+    hosts = [f"10.0.0.{i}" for i in range(1, 41)]
+    results = asyncio.run(AsyncPinger(concurrency=8).probe_many(hosts))
+
+    assert len(results) == 40 and all(r.reachable for r in results.values())
+    assert peak == 8
+
+
+def test_async_pinger_icmp_socket_loopback() -> None:
+    try:
+        socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP).close()
+    except OSError:
+        pytest.skip("unprivileged ICMP sockets not permitted (net.ipv4.ping_group_range)")
+
+    result = asyncio.run(AsyncPinger(timeout=1, count=3).probe("127.0.0.1"))
+    assert result.method == "icmp"
+    assert result.received == 3 and result.loss == 0.0
+    assert result.rtt_max_ms is not None and result.rtt_max_ms < 1000
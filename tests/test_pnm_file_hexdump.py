@@ -1,15 +1,17 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 # tests/test_pnm_file_hexdump.py
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any
 
 import pytest
 from fastapi import HTTPException
+from fastapi.responses import FileResponse
 
 from pypnm.api.routes.docs.pnm.files.service import PnmFileService, PnmFileTransaction
 from pypnm.config.system_config_settings import SystemConfigSettings
@@ -113,3 +115,58 @@ def test_hexdump_missing_transaction_raises(tmp_path: Path, monkeypatch: pytest.
     err = excinfo.value
     assert err.status_code == 404
     assert "Transaction ID not found" in str(err.detail)
+
+
+@pytest.mark.pnm
+def test_hexdump_window_and_range_download(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    The hexdump window is addressable by offset/length, and the raw download
+    answers HTTP Range requests with 206 Partial Content.
+    """
+    transaction_id: TransactionId = TransactionId("0123456789abcdef")
+    filename = "window.bin"
+    payload  = bytes(range(256)) * 4
+    (tmp_path / filename).write_bytes(payload)
+
+    def _fake_pnm_dir(cls: type[SystemConfigSettings]) -> str:
+        return str(tmp_path)
+
+    def fake_get_record(self: PnmFileTransaction, txn_id: TransactionId) -> dict[str, Any] | None:
+        return {"filename": filename} if txn_id == transaction_id else None
+
+    monkeypatch.setattr(SystemConfigSettings, "pnm_dir", classmethod(_fake_pnm_dir), raising=False)
+    monkeypatch.setattr(PnmFileTransaction, "get_record", fake_get_record, raising=True)
+
+    service = PnmFileService()
+    rsp = service.get_hexdump_by_transaction_id(transaction_id, 16, offset=512, length=40)
+    assert rsp.file_size == len(payload)
+    assert (rsp.offset, rsp.length) == (512, 40)
+    assert [line[:8] for line in rsp.lines] == ["00000200", "00000210", "00000220"]
+
+    with pytest.raises(HTTPException) as excinfo:
+        service.get_hexdump_by_transaction_id(transaction_id, 16, offset=len(payload))
+    assert excinfo.value.status_code == 416
+
+    response = service.get_file_by_transaction_id(transaction_id)
+    status, body = asyncio.run(_serve(response, {"range": "bytes=100-163"}))
+    assert status == 206
+    assert body == payload[100:164]
+
+
+async def _serve(app: FileResponse, headers: dict[str, str]) -> tuple[int, bytes]:
+    """Drive an ASGI response for a single GET and collect status and body."""
+    sent: list[dict[str, Any]] = []
+    scope = {
+        "type": "http", "method": "GET", "path": "/", "query_string": b"",
+        "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+    }
+
+    async def receive() -> dict[str, Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict[str, Any]) -> None:
+        sent.append(message)
+
+    await app(scope, receive, send)
+    status = next(m["status"] for m in sent if m["type"] == "http.response.start")
+    return status, b"".join(m.get("body", b"") for m in sent if m["type"] == "http.response.body")
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 from __future__ import annotations
 
@@ -100,3 +100,78 @@ def test_infer_modulation_order_unknown_on_mismatch(mgr_qam4: QamLutManager) ->
     est = mgr_qam4.infer_modulation_order(samples, threshold=0.15)
     # Could be UNKNOWN depending on clustering result; enforce not a high-order guess
     assert est in (QamModulation.UNKNOWN, QamModulation.QAM_4)
+
+
+def _brute_nearest(points: np.ndarray, z: np.ndarray) -> np.ndarray:
+    return np.argmin(np.abs(z[:, None] - points[None, :]), axis=1)
+
+
+@pytest.mark.parametrize("qam_mod", [QamModulation.QAM_8, QamModulation.QAM_16,
+                                     QamModulation.QAM_128, QamModulation.QAM_512])
+def test_slice_soft_decisions_matches_brute_force(qam_mod: QamModulation) -> None:
+    mgr = QamLutManager()
+    ref = np.asarray(list(mgr.qam_lut[qam_mod.name]["code_words"].values()), dtype=float)
+    points = ref[:, 0] + 1j * ref[:, 1]
+
+    rng = np.random.default_rng(7)
+    span = 1.3 * np.max(np.abs(ref))
+    z = rng.uniform(-span, span, 5000) + 1j * rng.uniform(-span, span, 5000)
+
+    result = mgr.slice_soft_decisions(qam_mod, np.column_stack((z.real, z.imag)))
+    expected = _brute_nearest(points, z)
+
+    np.testing.assert_allclose(np.abs(z - result.hard), np.abs(z - points[expected]), atol=1e-12)
+    np.testing.assert_allclose(result.error, z - result.hard)
+
+
+def test_slice_soft_decisions_codewords_and_mer(mgr_qam4: QamLutManager) -> None:
+    clean = mgr_qam4.slice_soft_decisions(QamModulation.QAM_4, [(1.0, 1.0), (-1.0, 1.0), (1.0, -1.0)])
+    assert clean.codewords.tolist() == [3, 1, 2]
+    assert clean.mer_db == float("inf")
+    assert clean.evm_percent == 0.0
+
+    rng = np.random.default_rng(1)
+    sym = rng.choice([-1.0, 1.0], size=(20000, 2))
+    sigma = 0.05
+    noisy = sym + sigma * rng.standard_normal(sym.shape)
+    result = mgr_qam4.slice_soft_decisions(QamModulation.QAM_4, noisy[:, 0] + 1j * noisy[:, 1])
+
+    expected_mer = 10.0 * np.log10(2.0 / (2.0 * sigma**2))
+    assert result.mer_db == pytest.approx(expected_mer, abs=0.1)
+    assert result.evm_percent == pytest.approx(100.0 * sigma, rel=0.02)
+
+
+def test_slicer_cache_follows_lut_replacement(mgr_qam4: QamLutManager) -> None:
+    assert mgr_qam4.get_symbol_codeword(QamModulation.QAM_4, (1.0, 1.0)) == 3
+    mgr_qam4.qam_lut = {"QAM_4": {**mgr_qam4.qam_lut["QAM_4"], "code_words": {7: (1.0, 1.0), 5: (-1.0, -1.0)}}}
+    assert mgr_qam4.get_symbol_codeword(QamModulation.QAM_4, (1.0, 1.0)) == 7
+    assert mgr_qam4.get_symbol_codeword(QamModulation.QAM_4, (0.0, 0.0)) is None
+
+
+def test_infer_modulation_orders_batch_with_confidence() -> None:
+    mgr = QamLutManager()
+    rng = np.random.default_rng(5)
+    captures = []
+    for name in ("QAM_16", "QAM_64", "QAM_256"):
+        ref = np.asarray(list(mgr.qam_lut[name]["code_words"].values()), dtype=float)
+        captures.append(ref[rng.integers(0, len(ref), 30000)])
+    captures.append([])
+
+    estimates = mgr.infer_modulation_orders(captures)
+
+    assert [e.modulation for e in estimates] == [
+        QamModulation.QAM_16, QamModulation.QAM_64, QamModulation.QAM_256, QamModulation.UNKNOWN]
+    assert [e.confidence for e in estimates] == [1.0, 1.0, 1.0, 0.0]
+    assert all(e.samples_used < 30000 for e in estimates[:3])
+
+
+def test_infer_modulation_orders_full_pass_matches_single(mgr_qam4: QamLutManager) -> None:
+    rng = np.random.default_rng(2)
+    samples = rng.standard_normal((5000, 2))
+    single = mgr_qam4.infer_modulation_order(samples.tolist())
+    full, = mgr_qam4.infer_modulation_orders([samples[:, 0] + 1j * samples[:, 1]], early_exit=False)
+
+    assert full.modulation == single
+    assert full.samples_used == 5000
+    grid = np.round(samples / np.mean(np.hypot(samples[:, 0], samples[:, 1])) / 0.15)
+    assert full.clusters == len(np.unique(grid, axis=0))
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from pypnm.api.routes.common.classes.analysis.analysis import (
+    RXMER_CLIPPED_HIGH,
+    RXMER_CLIPPED_LOW,
+    RXMER_EXCLUSION,
+    Analysis,
+    RxMerCarrierType,
+)
+from pypnm.lib.signal_processing.linear_regression import LinearRegression1D
+from pypnm.lib.signal_processing.shan.series import ShannonSeries
+from pypnm.pnm.parser.CmDsOfdmRxMer import CmDsOfdmRxMer
+
+RXMER_PATH = Path(__file__).parent / "files" / "rxmer.bin"
+
+
+def _measurement(values: list[float]) -> dict[str, Any]:
+    return {
+        "channel_id": 33,
+        "mac_address": "aa:bb:cc:dd:ee:ff",
+        "subcarrier_spacing": 50_000,
+        "first_active_subcarrier_index": 148,
+        "subcarrier_zero_frequency": 1_121_600_000,
+        "values": values,
+    }
+
+
+def _reference_status(v: float) -> int:
+    if v == RXMER_EXCLUSION:
+        return int(RxMerCarrierType.EXCLUSION.value)
+    if v in (RXMER_CLIPPED_LOW, RXMER_CLIPPED_HIGH):
+        return int(RxMerCarrierType.CLIPPED.value)
+    return int(RxMerCarrierType.NORMAL.value)
+
+
+def test_basic_analysis_rxmer_matches_scalar_reference() -> None:
+    values = [RXMER_CLIPPED_LOW, 12.25, 35.5, RXMER_EXCLUSION, RXMER_CLIPPED_HIGH, 41.0, 38.75]
+    measurement = _measurement(values)
+    out = Analysis.basic_analysis_rxmer(measurement)
+
+    base = (50_000 * 148) + 1_121_600_000
+    freqs = [base + (i * 50_000) for i in range(len(values))]
+
+    assert out.carrier_values.frequency == freqs
+    assert out.carrier_values.magnitude == values
+    assert out.carrier_values.carrier_status == [_reference_status(v) for v in values]
+    assert out.carrier_values.carrier_count == len(values)
+    assert out.regression.slope == pytest.approx(LinearRegression1D(values, freqs).regression_line().tolist())
+    assert out.modulation_statistics.model_dump() == ShannonSeries(values).to_model().model_dump()
+
+
+def test_basic_analysis_rxmer_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        Analysis.basic_analysis_rxmer(_measurement([10.0, -1.0]))
+    with pytest.raises(ValueError):
+        Analysis.basic_analysis_rxmer(_measurement([]))
+
+
+@pytest.mark.pnm
+def test_basic_analysis_rxmer_from_model_matches_dict_path() -> None:
+    model = CmDsOfdmRxMer(RXMER_PATH.read_bytes()).to_model()
+    from_model = Analysis.basic_analysis_rxmer_from_model(model)
+    from_dict = Analysis.basic_analysis_rxmer(model.model_dump())
+
+    assert from_model.carrier_values.model_dump() == from_dict.carrier_values.model_dump()
+    assert from_model.regression.slope == pytest.approx(from_dict.regression.slope)
+    assert from_model.carrier_values.frequency[1] - from_model.carrier_values.frequency[0] == model.subcarrier_spacing
@@ -1,5 +1,5 @@
 # SPDX-License-Identifier: Apache-2.0
-# Copyright (c) 2025 Maurice Garcia
+# Copyright (c) 2025-2026 Maurice Garcia
 
 # tests/test_shannon_series.py
 from __future__ import annotations
@@ -7,6 +7,7 @@ from __future__ import annotations
 import json
 import math
 
+import numpy as np
 import pytest
 
 from pypnm.lib.signal_processing.shan.series import ShannonSeries
@@ -88,3 +89,33 @@ def test_repr_and_str() -> None:
     s = str(series)
     assert "ShannonSeries" in r
     assert "SNR values" in s
+
+
+def test_build_model_matches_per_sample_shannon() -> None:
+    snrs = [0.0, 0.25, 6.0, 12.5, 24.0, 33.75, 42.0, 63.5, 63.75]
+    model = ShannonSeries.build_model(snrs)
+
+    exp_bits = [Shannon(s).bits for s in snrs]
+    assert model.bits_per_symbol == exp_bits
+    assert model.modulations == [Shannon(s).get_modulation() for s in snrs]
+    assert model.snr_db_min == [Shannon.bits_to_snr(b) for b in exp_bits]
+    assert model.supported_modulation_counts == {
+        mod: sum(1 for b in exp_bits if bits <= b) for bits, mod in Shannon.QAM_MODULATIONS.items()
+    }
+
+
+def test_ndarray_input_matches_list_input() -> None:
+    snrs = [3.0, 18.25, 27.5, 40.0]
+    from_list = ShannonSeries(snrs)
+    from_array = ShannonSeries(np.asarray(snrs, dtype=np.float64))
+
+    assert from_array.to_dict() == from_list.to_dict()
+    assert from_array.limit() == from_list.snr_db_limit
+    assert from_array.max_modulation() == Shannon(40.0).get_modulation()
+
+
+def test_build_model_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        ShannonSeries.build_model([1.0, -0.5])
+    with pytest.raises(ValueError):
+        ShannonSeries.build_model([float("nan")])
@@ -0,0 +1,163 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from pysnmp.proto.rfc1902 import Integer32, OctetString
+
+from pypnm.docsis.cm_snmp_operation import CmSnmpOperation, DocsPnmBulkFileUploadStatus
+from pypnm.docsis.data_type.enums import MeasStatusType
+from pypnm.lib.inet import Inet
+from pypnm.pnm.data_type.pnm_test_types import DocsPnmCmCtlTest
+from pypnm.pnm.parser.fetch_pnm_process import PnmFileTypeObjectFetcher
+from pypnm.snmp.snmp_v2c import SNMP_RETRIES, Snmp_v2c
+from pypnm.snmp.transport_controller import SNMP_TRANSPORT
+from pypnm.tools.snmp_simulator import MibSnapshot, NetworkConditions, SnmpSimulator
+from pypnm.tools.snmp_simulator.device import DEFAULT_PNM_TESTS, SimulatedDevice
+from pypnm.tools.snmp_simulator.snapshot import oid_key
+
+SNAPSHOT = {
+    "sysDescr.0": ["OctetString", "<<HW_REV: 1.0; VENDOR: Simulated; MODEL: SIM-1>>"],
+    "docsIf31CmDsOfdmChanChannelId.3": ["Integer32", 193],
+    "docsIf31CmDsOfdmChanChannelId.4": ["Integer32", 194],
+    "docsIf31CmDsOfdmChanChannelId.5": ["Integer32", 195],
+    "docsPnmCmDsOfdmRxMerMeasStatus.3": ["Integer32", 2],
+    "docsIf31CmUsOfdmaChanChannelId.4": ["Integer32", 1],
+}
+
+
+def _snapshot() -> MibSnapshot:
+    return MibSnapshot.from_mapping(SNAPSHOT)
+
+
+def test_default_pnm_tests_resolve_to_compiled_oids() -> None:
+    for model in DEFAULT_PNM_TESTS:
+        for column in (model.trigger, model.status, model.filename):
+            assert oid_key(f"{model.table}{column}.3")[-1] == 3
+
+
+def test_non_integer_trigger_set_is_stored_without_starting_a_test() -> None:
+    device = SimulatedDevice(_snapshot())
+    trigger = oid_key("docsPnmCmDsOfdmRxMerFileEnable.3")
+
+    device.set(trigger, OctetString("1"))
+
+    assert device.get(trigger) == OctetString("1")
+    assert device.get(oid_key("docsPnmCmDsOfdmRxMerMeasStatus.3")) == Integer32(2)
+    device.close()
+
+
+def test_snapshot_round_trips_and_parses_walk_text(tmp_path: Path) -> None:
+    snap = _snapshot()
+    restored = MibSnapshot.load(snap.save(tmp_path / "cm.json"))
+    assert list(restored) == list(snap)
+
+    walk = MibSnapshot.from_walk_text(
+        'SNMPv2-MIB::sysDescr.0 = STRING: "cm"\n'
+        ".1.3.6.1.2.1.2.2.1.6.2 = Hex-STRING: AA BB CC DD EE FF\n"
+        ".1.3.6.1.2.1.2.2.1.8.2 = INTEGER: up(1)\n")
+    assert len(walk) == 3
+    assert walk.to_mapping()["ifPhysAddress.2"] == ["Hex", "aabbccddeeff"]
+
+
+def test_snmp_v2c_against_simulator() -> None:
+    async def run() -> None:
+        sim = SnmpSimulator.fleet(_snapshot(), 2, base_port=0, overrides=lambda i: {"sysContact.0": OctetString(f"cm{i}")})
+        async with sim:
+            (host, port), (_, port_b) = sim.endpoints
+            snmp = Snmp_v2c(Inet(host), community="private", port=port, timeout=1, retries=0)
+
+            descr = await snmp.get("sysDescr.0")
+            assert str(descr[0][1]).startswith("<<HW_REV")
+
+            walked = await snmp.walk("docsIf31CmDsOfdmChanChannelId")
+            bulk = await snmp.bulk_walk("docsIf31CmDsOfdmChanChannelId", max_repetitions=5)
+            assert [int(v[1]) for v in walked] == [int(v[1]) for v in bulk] == [193, 194, 195]
+
+            await snmp.set("docsIf31CmDsOfdmChanChannelId.3", 200, Integer32)
+            assert int((await snmp.get("docsIf31CmDsOfdmChanChannelId.3"))[0][1]) == 200
+
+            other = Snmp_v2c(Inet(host), community="public", port=port_b, timeout=1, retries=0)
+            assert str((await other.get("sysContact.0"))[0][1]) == "cm1"
+            assert int((await other.get("docsIf31CmDsOfdmChanChannelId.3"))[0][1]) == 193
+
+    asyncio.run(run())
+
+
+def test_too_big_steps_down_and_loss_drops_requests() -> None:
+    async def run() -> None:
+        sim = SnmpSimulator.fleet(_snapshot(), 1, base_port=0,
+                                  conditions=NetworkConditions(max_response_varbinds=2))
+        async with sim:
+            host, port = sim.endpoints[0]
+            snmp = Snmp_v2c(Inet(host), community="public", port=port, timeout=1, retries=0)
+            too_big = SNMP_RETRIES.value(operation="bulk_walk", reason="too_big")
+            rows = await snmp.bulk_walk("docsIf31CmDsOfdmChanChannelId", max_repetitions=25)
+            assert [int(v[1]) for v in rows] == [193, 194, 195]
+            assert SNMP_RETRIES.value(operation="bulk_walk", reason="too_big") == too_big + 4
+
+            rows = await snmp.bulk_walk("docsIf31CmDsOfdmChanChannelId", max_repetitions=25)
+            assert [int(v[1]) for v in rows] == [193, 194, 195]
+            assert SNMP_RETRIES.value(operation="bulk_walk", reason="too_big") == too_big + 4
+
+        lossy = SnmpSimulator.fleet(_snapshot(), 1, base_port=0, conditions=NetworkConditions(loss=1.0))
+        async with lossy:
+            host, port = lossy.endpoints[0]
+            snmp = Snmp_v2c(Inet(host), community="public", port=port, timeout=0.2, retries=0)
+            for _ in range(SNMP_TRANSPORT.failure_threshold):
+                assert not await snmp.get("sysDescr.0")
+            assert lossy.stats.dropped == lossy.stats.received == SNMP_TRANSPORT.failure_threshold
+            assert lossy.stats.responded == 0
+
+            assert await snmp.get("sysDescr.0") is None
+            assert lossy.stats.received == SNMP_TRANSPORT.failure_threshold
+            SNMP_TRANSPORT.reset(f"{host}:{port}")
+
+    asyncio.run(run())
+
+
+def test_walk_backs_off_after_latency_rises() -> None:
+    async def run() -> None:
+        async with SnmpSimulator.fleet(_snapshot(), 1, base_port=0) as sim:
+            host, port = sim.endpoints[0]
+            snmp = Snmp_v2c(Inet(host), community="public", port=port, timeout=4, retries=3)
+            try:
+                for _ in range(5):
+                    assert await snmp.get("sysDescr.0")
+                learned = SNMP_TRANSPORT.timeout(f"{host}:{port}", 4)
+                assert SNMP_TRANSPORT.min_timeout_s <= learned < 1.5
+
+                # Slower than the learned timeout, faster than the configured one:
+                # the first attempt of each request times out and the doubled retry answers.
+                retries = SNMP_RETRIES.value(operation="walk", reason="timeout")
+                sim.conditions = NetworkConditions(latency_s=1.5)
+                rows = await snmp.walk("docsIf31CmDsOfdmChanChannelId")
+                assert [int(v[1]) for v in rows or []] == [193, 194, 195]
+                assert SNMP_RETRIES.value(operation="walk", reason="timeout") > retries
+            finally:
+                SNMP_TRANSPORT.reset(f"{host}:{port}")
+
+    asyncio.run(run())
+
+
+def test_rxmer_capture_state_machine_writes_tftp_file(tmp_path: Path) -> None:
+    async def run() -> None:
+        sim = SnmpSimulator.fleet(_snapshot(), 1, base_port=0, tftp_dir=tmp_path, measure_delay_s=0.05)
+        async with sim:
+            host, port = sim.endpoints[0]
+            cm = CmSnmpOperation(Inet(host), "private", port=port)
+
+            assert await cm.setDocsPnmCmDsOfdmRxMer(3, "rxmer_sim.bin")
+            assert await cm.getPnmMeasurementStatus(DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, 3) \
+                is MeasStatusType.BUSY
+
+            await asyncio.sleep(0.1)
+            assert await cm.getPnmMeasurementStatus(DocsPnmCmCtlTest.DS_OFDM_RXMER_PER_SUBCAR, 3) \
+                is MeasStatusType.SAMPLE_READY
+            assert await cm.getBulkFileUploadStatus("rxmer_sim.bin") is DocsPnmBulkFileUploadStatus.UPLOAD_COMPLETED
+
+    asyncio.run(run())
+    PnmFileTypeObjectFetcher((tmp_path / "rxmer_sim.bin").read_bytes())
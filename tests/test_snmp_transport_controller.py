@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import pytest
+
+from pypnm.snmp.transport_controller import SnmpTransportController
+
+
+def test_timeout_tracks_smoothed_rtt_and_backs_off() -> None:
+    ctl = SnmpTransportController(min_timeout_s=0.1)
+    key = ctl.key("10.0.0.1", 161)
+
+    assert ctl.timeout(key, 5.0) == 5.0
+    ctl.on_response(key, 0.2)
+    assert ctl.timeout(key, 5.0) == pytest.approx(0.2 + 4 * 0.1)
+    ctl.on_response(key, 0.2)
+    state = ctl.state(key)
+    assert (state.srtt, state.rttvar) == (pytest.approx(0.2), pytest.approx(0.075))
+    assert [ctl.timeout(key, 5.0, attempt) for attempt in range(5)] == \
+        pytest.approx([0.5, 1.0, 2.0, 4.0, 5.0])
+    assert ctl.timeout(key, 0.3) == 0.3
+
+    ctl.on_response(key, 4.0, retransmitted=True)
+    assert state.srtt == pytest.approx(0.2)
+
+    ctl.on_timeout(key, 0.5)
+    assert ctl.timeout(key, 5.0) == 1.0
+
+
+def test_circuit_opens_after_repeated_timeouts_and_probe_closes_it(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr("pypnm.snmp.transport_controller.time.monotonic", lambda: now[0])
+    ctl = SnmpTransportController(failure_threshold=2, breaker_base_s=10, breaker_max_s=25)
+    key = ctl.key("10.0.0.2", 161)
+
+    ctl.on_timeout(key, 1.0)
+    assert ctl.allow(key)
+    ctl.on_timeout(key, 1.0)
+    assert not ctl.allow(key) and ctl.is_open(key)
+
+    now[0] += 10
+    assert ctl.allow(key)
+    assert not ctl.allow(key)
+    ctl.on_timeout(key, 1.0)
+    assert ctl.state(key).open_until == now[0] + 20
+    ctl.on_timeout(key, 1.0)
+    assert ctl.state(key).open_until == now[0] + 25
+
+    ctl.on_response(key, 0.05)
+    assert ctl.allow(key) and not ctl.is_open(key)
+
+
+def test_bulk_size_remembers_agent_limit() -> None:
+    ctl = SnmpTransportController()
+    key = ctl.key("10.0.0.3", 161)
+
+    assert ctl.bulk_size(key, 25) == 25
+    assert ctl.on_bulk_too_big(key, 25) == 12
+    ctl.on_bulk_ok(key, 12)
+    assert ctl.bulk_size(key, 50) == 12
+    assert ctl.bulk_size(key, 8) == 8
+
+    assert ctl.on_bulk_too_big(key, 12) == 6
+    assert ctl.state(key).bulk_ok == 0
+    assert ctl.on_bulk_too_big(key, 1) is None
+
+    ctl.on_bulk_ok(key, 40)
+    assert ctl.state(key).bulk_too_big is None
+    assert ctl.bulk_size(key, 60) == 60
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from pypnm.api.routes.common.extended.common_messaging_service import (
+    MessageResponse,
+    MessageResponseType,
+)
+from pypnm.api.routes.common.extended.types import (
+    CommonMessagingServiceExtension as CMSE,
+)
+from pypnm.api.routes.common.service.status_codes import ServiceStatusCode
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer import service as spectrum_service
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.abstract.com_spec_chan_ana import (
+    CommonChannelSpectumBwLut,
+)
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.capture_planner import (
+    SpectrumCapturePlanner,
+)
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.schemas import SpecAnCapturePara
+from pypnm.api.routes.docs.pnm.spectrumAnalyzer.service import (
+    DsScQamChannelSpectrumAnalyzer,
+)
+from pypnm.lib.types import ChannelId, FrequencyHz
+from pypnm.lib.vendor_capabilities import VendorCapabilities
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
+
+MHZ = 1_000_000
+
+
+def _scqam(*starts_mhz: int) -> CommonChannelSpectumBwLut:
+    return {ChannelId(i + 1): (FrequencyHz(s * MHZ), FrequencyHz(s * MHZ + 3 * MHZ), FrequencyHz(s * MHZ + 6 * MHZ))
+            for i, s in enumerate(starts_mhz)}
+
+
+def test_planner_merges_adjacent_channels_within_segment_limit() -> None:
+    bw = _scqam(555, 117, 561, 567, 603, 573)
+    plans = SpectrumCapturePlanner(1 * MHZ).plan(bw)
+    assert [(p.first_segment_center_freq // MHZ, p.last_segment_center_freq // MHZ) for p in plans] == \
+        [(117, 123), (555, 579), (603, 609)]
+    assert [c.channel_id for c in plans[1].channels] == [1, 3, 4, 6]
+    assert plans[1].segment_count(1 * MHZ) == 25
+
+    capped = SpectrumCapturePlanner(1 * MHZ, max_segments=13).plan(bw)
+    assert [len(p.channels) for p in capped] == [1, 2, 2, 1]
+    assert all(p.segment_count(1 * MHZ) <= 13 for p in capped)
+
+    bridged = SpectrumCapturePlanner(1 * MHZ, max_gap_hz=30 * MHZ).plan(bw)
+    assert [len(p.channels) for p in bridged] == [1, 5]
+
+    assert SpectrumCapturePlanner(1 * MHZ).max_segments == 500
+
+    single = SpectrumCapturePlanner(1 * MHZ).plan(bw, merge=False)
+    assert [p.channels[0].channel_id for p in single] == list(bw)
+
+
+def test_slice_matches_capture_window_and_splits_responses() -> None:
+    span = 1 * MHZ
+    raw = SyntheticPnmFactory(seed=3).spectrum(25, bins_per_segment=16, first_center_hz=555 * MHZ,
+                                              segment_span_hz=span)
+    merged = CmSpectrumAnalysis(raw).to_dict()
+
+    view = CmSpectrumAnalysis.slice_measurement(merged, 561 * MHZ, 567 * MHZ)
+    assert view["first_segment_center_frequency"] == 561 * MHZ
+    assert view["last_segment_center_frequency"] == 567 * MHZ
+    assert view["amplitude_bin_segments_float"] == merged["amplitude_bin_segments_float"][6:13]
+    assert view["spectrum_analysis_data"] == merged["spectrum_analysis_data"][6 * 16 * 4:13 * 16 * 4]
+    assert view["spectrum_analysis_data_length"] == 7 * 16 * 2
+    assert CmSpectrumAnalysis.slice_measurement({"amplitude_bin_segments_float": []}, 0, 1) == \
+        {"amplitude_bin_segments_float": []}
+
+    plan = SpectrumCapturePlanner(span).plan(_scqam(555, 561))[0]
+    response = MessageResponse(ServiceStatusCode.SUCCESS, [{
+        "status": "SUCCESS",
+        "message_type": MessageResponseType.PNM_FILE_TRANSACTION.name,
+        "message": {"transaction_id": "abc", "filename": "spec.bin"},
+    }])
+    split = plan.channel_responses(response)
+    assert [chan for chan, _ in split] == [1, 2]
+    window = split[1][1].payload[0]["message"]["extension"][CMSE.SPECTRUM_ANALYSIS_CHANNEL_WINDOW.value]
+    assert (window["start_hz"], window["end_hz"]) == (561 * MHZ, 567 * MHZ)
+    assert "extension" not in response.payload[0]["message"]
+
+
+class _FakeCableModem:
+    def __init__(self, sys_descr: str = "Ubee DOCSIS-3.1 EMTA") -> None:
+        self.triggered = ""
+        self.sys_descr = sys_descr
+        self.sys_descr_reads = 0
+
+    @property
+    def get_mac_address(self) -> str:
+        return "aa:bb:cc:dd:ee:ff"
+
+    async def getDocsIf3CmSpectrumAnalysisEntry(self) -> list[str]:
+        return [self.triggered]
+
+    async def getSysDescr(self) -> str:
+        self.sys_descr_reads += 1
+        return self.sys_descr
+
+
+class _TestScQamAnalyzer(DsScQamChannelSpectrumAnalyzer):
+    async def calculate_channel_spectrum_bandwidth(self) -> CommonChannelSpectumBwLut:
+        return _scqam(555, 561, 567, 603, 609, 700)
+
+
+@pytest.mark.asyncio
+async def test_planner_uses_the_modem_vendor_segment_limit() -> None:
+    ubee = _TestScQamAnalyzer(cable_modem=_FakeCableModem())  # type: ignore[arg-type]
+    arris = _TestScQamAnalyzer(cable_modem=_FakeCableModem("ARRIS DOCSIS 3.1 Touchstone"))  # type: ignore[arg-type]
+    other = _TestScQamAnalyzer(cable_modem=_FakeCableModem("Acme CM"))  # type: ignore[arg-type]
+
+    assert (await ubee.getVendorCapabilities()).max_spectrum_segments == 500
+    assert (await arris.getVendorCapabilities()).max_spectrum_segments == 1000
+    assert (await other.getVendorCapabilities()).vendor == "Unknown"
+
+
+@pytest.mark.asyncio
+async def test_captures_are_merged_and_pipelined(monkeypatch: pytest.MonkeyPatch) -> None:
+    events: list[str] = []
+
+    class _FakeScQamService:
+        def __init__(self, cm: _FakeCableModem, *_args: object, capture_gate: asyncio.Lock | None = None,
+                     **_kwargs: object) -> None:
+            self._cm = cm
+            self._gate = capture_gate
+            self._params: SpecAnCapturePara
+            self._hook: Callable[[], Awaitable[object]] | None = None
+            self._caps: VendorCapabilities | None = None
+
+        def setSpectrumCaptureParameters(self, capture_parameters: SpecAnCapturePara) -> None:
+            self._params = capture_parameters
+
+        def setSampleReadyHook(self, hook: Callable[[], Awaitable[object]] | None) -> None:
+            self._hook = hook
+
+        def setVendorCapabilities(self, capabilities: VendorCapabilities | None) -> None:
+            self._caps = capabilities
+
+        async def set_and_go(self) -> MessageResponse:
+            name = str(self._params.first_segment_center_freq // MHZ)
+            assert self._gate is not None and self._hook is not None
+            assert self._caps is not None and self._caps.vendor == "Ubee"
+            async with self._gate:
+                events.append(f"trigger {name}")
+                self._cm.triggered = name
+                await asyncio.sleep(0.01)
+                await self._hook()
+            await asyncio.sleep(0.05)
+            events.append(f"fetched {name}")
+            return MessageResponse(ServiceStatusCode.SUCCESS, [{
+                "status": "SUCCESS",
+                "message_type": MessageResponseType.PNM_FILE_TRANSACTION.name,
+                "message": {"transaction_id": name, "filename": f"{name}.bin"},
+            }])
+
+    monkeypatch.setattr(spectrum_service, "ScQamChanSpecAnalyzerService", _FakeScQamService)
+
+    cm = _FakeCableModem()
+    analyzer = _TestScQamAnalyzer(cable_modem=cm)  # type: ignore[arg-type]
+    out = await analyzer.start()
+
+    assert [chan for chan, _ in out] == [1, 2, 3, 4, 5, 6]
+    assert [rsp.payload[0]["message"]["transaction_id"] for _, rsp in out] == ["555"] * 3 + ["603"] * 2 + ["700"]
+    assert events[:3] == ["trigger 555", "trigger 603", "trigger 700"]
+    stats = await analyzer.getPnmMeasurementStatistics()
+    assert stats == {1: ["555"], 2: ["555"], 3: ["555"], 4: ["603"], 5: ["603"], 6: ["700"]}
+
+    events.clear()
+    per_channel = await analyzer.start(capture_per_channel=True)
+    assert len(per_channel) == 6
+    assert sum(e.startswith("trigger") for e in events) == 6
+    stats = await analyzer.getPnmMeasurementStatistics()
+    assert stats == {chan: [str(start)] for chan, start in enumerate((555, 561, 567, 603, 609, 700), start=1)}
+    assert cm.sys_descr_reads == 1
@@ -0,0 +1,56 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import numpy as np
+
+from pypnm.lib.signal_processing.averager import MovingAverage
+from pypnm.lib.signal_processing.spectrum_stitch import SpectrumSegmentStitcher
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.CmSpectrumAnalysis import CmSpectrumAnalysis
+
+
+def _reference(segments: list[list[float]], bins: int, first_cf: int, last_cf: int, span: int,
+               bin_bw: int) -> tuple[list[int], list[float]]:
+    mags = [float(x) for s in segments for x in (list(s[:bins]) + [float("nan")] * (bins - len(s)))]
+    step = (last_cf - first_cf) // (len(segments) - 1) if len(segments) > 1 else 0
+    start = first_cf - span // 2 + bin_bw // 2
+    freqs = [start + k * step + i * bin_bw for k in range(len(segments)) for i in range(bins)]
+    return freqs, mags
+
+
+def test_stitch_matches_list_reference_for_ragged_segments() -> None:
+    rng = np.random.default_rng(5)
+    segments = [rng.normal(-30, 3, n).tolist() for n in (64, 64, 70, 12, 64)]
+    stitcher = SpectrumSegmentStitcher(100_000_000, 104_000_000, 1_000_000, bin_bandwidth_hz=0, bins_per_segment=64)
+
+    out = stitcher.stitch(segments, window_points=7)
+    freqs, mags = _reference(segments, 64, 100_000_000, 104_000_000, 1_000_000, 1_000_000 // 64)
+
+    assert out.frequencies.dtype == np.int64 and out.frequencies.tolist() == freqs
+    np.testing.assert_array_equal(out.magnitudes, np.asarray(mags))
+    assert out.smoothed.dtype == np.float64
+    np.testing.assert_array_equal(out.smoothed, np.asarray(MovingAverage(7).apply(mags)))
+    assert (out.bin_bandwidth, out.segment_length) == (15_625, 64)
+
+    empty = SpectrumSegmentStitcher(0, 0, 1_000_000, bins_per_segment=64).stitch(segments, 7)
+    assert empty.frequencies.size == empty.magnitudes.size == empty.smoothed.size == 0
+
+
+def test_parser_matrix_feeds_stitcher_like_segment_lists() -> None:
+    parser = CmSpectrumAnalysis(SyntheticPnmFactory(seed=2).spectrum(9)[:-100])
+    model = parser.to_model()
+    matrix = parser.amplitude_bin_segments_array()
+
+    assert matrix.shape == (9, model.num_bins_per_segment)
+    assert np.isnan(matrix[-1, -50:]).all()
+
+    stitcher = SpectrumSegmentStitcher(model.first_segment_center_frequency, model.last_segment_center_frequency,
+                                       model.segment_frequency_span, model.bin_frequency_spacing,
+                                       model.num_bins_per_segment)
+    from_lists = stitcher.stitch(model.amplitude_bin_segments_float, 5)
+    from_matrix = stitcher.stitch(matrix, 5)
+    np.testing.assert_array_equal(from_lists.magnitudes, from_matrix.magnitudes)
+    np.testing.assert_array_equal(from_lists.smoothed, from_matrix.smoothed)
+    np.testing.assert_array_equal(from_lists.frequencies, from_matrix.frequencies)
@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import pytest
+
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.CmSymbolCapture import CmSymbolCapture
+from pypnm.pnm.parser.fetch_pnm_process import PnmFileTypeObjectFetcher
+from pypnm.pnm.parser.pnm_file_type import PnmFileType
+
+
+@pytest.mark.pnm
+def test_factory_files_round_trip_through_parsers() -> None:
+    factory = SyntheticPnmFactory(seed=5, channel_id=193)
+
+    rxmer = PnmFileTypeObjectFetcher(factory.rxmer(7600)).get_parser().to_model()
+    assert rxmer.channel_id == 193
+    assert rxmer.mac_address == "aa:bb:cc:dd:ee:ff"
+    assert len(rxmer.values) == 7600
+    assert 30.0 < sum(rxmer.values) / len(rxmer.values) < 46.0
+
+    chan_est = PnmFileTypeObjectFetcher(factory.chan_est(1900)).get_parser().to_model()
+    assert len(chan_est.values) == 1900
+
+    const = PnmFileTypeObjectFetcher(factory.const_disp(4096, qam_order=1024)).get_parser().to_model()
+    assert const.num_sample_symbols == len(const.samples) == 4096
+
+    spectrum = PnmFileTypeObjectFetcher(factory.spectrum(10, bins_per_segment=128)).get_parser().to_model()
+    assert spectrum.num_bins_per_segment == 128
+    assert len(spectrum.amplitude_bin_segments_float) == 10
+
+    fec = PnmFileTypeObjectFetcher(factory.fec_summary(profiles=3, sets=60)).get_parser().to_model()
+    assert fec.num_profiles == len(fec.fec_summary_data) == 3
+
+    hist = PnmFileTypeObjectFetcher(factory.histogram(bins=255)).get_parser().to_model()
+    assert len(hist.hit_count_values) == 255
+
+    prof = PnmFileTypeObjectFetcher(factory.mod_profile(profiles=2, subcarriers=3800)).get_parser().to_model()
+    assert [p.profile_id for p in prof.profiles] == [0, 1]
+    assert all(sum(s.num_subcarriers for s in p.schemes) == 3800 for p in prof.profiles)
+
+
+@pytest.mark.pnm
+def test_factory_symbol_capture_matches_parser_layout() -> None:
+    parser = PnmFileTypeObjectFetcher(SyntheticPnmFactory().symbol_capture(1024, fft_size=4096)).get_parser()
+    assert isinstance(parser, CmSymbolCapture)
+
+    parser.process_cm_symbol_capture()
+    assert parser.fft_size == 4096
+    assert parser.capture_data_length == 1024 * 4
+    assert len(parser.process_capture_data() or []) == 1024
+
+
+def test_factory_is_deterministic_per_seed() -> None:
+    assert SyntheticPnmFactory(seed=3).build(PnmFileType.RECEIVE_MODULATION_ERROR_RATIO) == \
+        SyntheticPnmFactory(seed=3).build(PnmFileType.RECEIVE_MODULATION_ERROR_RATIO)
+    assert SyntheticPnmFactory(seed=3).rxmer() != SyntheticPnmFactory(seed=4).rxmer()
+    with pytest.raises(ValueError):
+        SyntheticPnmFactory().build(PnmFileType.LATENCY_REPORT)
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from pypnm.lib.db.json_file_lock import JSON_DB_LOCK_WAIT_SECONDS, JsonFileLock
+from pypnm.lib.telemetry.metrics import MetricsRegistry
+from pypnm.lib.telemetry.tracing import (
+    SPAN_SECONDS,
+    current_trace_id,
+    recent_spans,
+    trace_span,
+)
+from pypnm.pnm.lib.synthetic_pnm import SyntheticPnmFactory
+from pypnm.pnm.parser.fetch_pnm_process import (
+    PNM_PARSE_SECONDS,
+    PnmFileTypeObjectFetcher,
+)
+
+
+def test_registry_renders_prometheus_text() -> None:
+    reg = MetricsRegistry()
+    retries = reg.counter("pypnm_test_retries_total", "Retries.", ("operation",))
+    depth = reg.gauge("pypnm_test_depth", "Queue depth.")
+    latency = reg.histogram("pypnm_test_seconds", "Latency.", ("operation",), buckets=(0.1, 1.0))
+
+    retries.inc(operation="bulk_walk")
+    retries.inc(2, operation="bulk_walk")
+    depth.set(3)
+    latency.observe(0.05, operation='g"et')
+    latency.observe(0.5, operation='g"et')
+    latency.observe(5.0, operation='g"et')
+
+    text = reg.render()
+    assert "# TYPE pypnm_test_retries_total counter" in text
+    assert 'pypnm_test_retries_total{operation="bulk_walk"} 3.0' in text
+    assert "pypnm_test_depth 3.0" in text
+    assert 'pypnm_test_seconds_bucket{operation="g\\"et",le="0.1"} 1' in text
+    assert 'pypnm_test_seconds_bucket{operation="g\\"et",le="1.0"} 2' in text
+    assert 'pypnm_test_seconds_bucket{operation="g\\"et",le="+Inf"} 3' in text
+    assert 'pypnm_test_seconds_count{operation="g\\"et"} 3' in text
+    assert latency.sum(operation='g"et') == pytest.approx(5.55)
+
+    assert reg.counter("pypnm_test_retries_total", "Retries.", ("operation",)) is retries
+    with pytest.raises(ValueError):
+        reg.gauge("pypnm_test_retries_total", "Retries.")
+    with pytest.raises(ValueError):
+        retries.inc(op="get")
+
+
+def test_spans_nest_across_tasks_and_record_durations() -> None:
+    before = SPAN_SECONDS.count(span="test.child")
+
+    async def child(n: int) -> str | None:
+        with trace_span("test.child", n=n):
+            await asyncio.sleep(0)
+            return current_trace_id()
+
+    async def root() -> tuple[str, list[str | None]]:
+        with trace_span("test.root", trace_id="abc123") as span:
+            ids = await asyncio.gather(*(asyncio.create_task(child(n)) for n in range(3)))
+        return span.span_id, list(ids)
+
+    root_id, ids = asyncio.run(root())
+    assert ids == ["abc123"] * 3
+    assert current_trace_id() is None
+
+    spans = recent_spans("abc123")
+    assert [s.context.name for s in spans].count("test.child") == 3
+    assert all(s.context.parent_id == root_id for s in spans if s.context.name == "test.child")
+    assert SPAN_SECONDS.count(span="test.child") == before + 3
+
+
+def test_parse_and_lock_wait_are_instrumented(tmp_path: Path) -> None:
+    parsed = PNM_PARSE_SECONDS.count(file_type="RECEIVE_MODULATION_ERROR_RATIO")
+    PnmFileTypeObjectFetcher(SyntheticPnmFactory().rxmer(200))
+    assert PNM_PARSE_SECONDS.count(file_type="RECEIVE_MODULATION_ERROR_RATIO") == parsed + 1
+
+    db = tmp_path / "groups.json"
+    waits = JSON_DB_LOCK_WAIT_SECONDS.count(db="groups.json")
+    with JsonFileLock(db):
+        pass
+    assert JSON_DB_LOCK_WAIT_SECONDS.count(db="groups.json") == waits + 1
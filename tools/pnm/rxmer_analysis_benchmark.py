@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2026 Maurice Garcia
+
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from typing import Any
+
+import numpy as np
+
+from pypnm.api.routes.common.classes.analysis.analysis import (
+    RXMER_CLIPPED_HIGH,
+    RXMER_CLIPPED_LOW,
+    RXMER_EXCLUSION,
+    Analysis,
+    RxMerCarrierType,
+)
+from pypnm.api.routes.common.classes.analysis.model.schema import (
+    DsRxMerAnalysisModel,
+    RegressionModel,
+    RxMerCarrierValuesModel,
+)
+from pypnm.lib.signal_processing.linear_regression import LinearRegression1D
+from pypnm.lib.signal_processing.shan.series import ShannonSeriesModel
+from pypnm.lib.signal_processing.shan.shannon import Shannon
+
+DEFAULT_SUBCARRIERS: int = 7600
+DEFAULT_REPEAT: int      = 20
+
+
+class RxMerAnalysisBenchmark:
+    """
+    Compare the list-based RxMER analysis path against the ndarray path in
+    ``Analysis.basic_analysis_rxmer`` on a synthetic 4K-FFT style channel.
+
+    The legacy path is kept here verbatim (per-carrier ``classify()``, one
+    ``Shannon`` instance per subcarrier, regression fitted from Python lists)
+    so the comparison remains meaningful after the library moved on.
+    """
+
+    def __init__(self, subcarriers: int, seed: int = 7) -> None:
+        rng = np.random.default_rng(seed)
+        values = np.round(rng.normal(38.0, 3.0, subcarriers).clip(0.0, 63.5) * 4.0) / 4.0
+        values[: subcarriers // 50] = RXMER_EXCLUSION
+        values[-(subcarriers // 100):] = RXMER_CLIPPED_HIGH
+
+        self.measurement: dict[str, Any] = {
+            "channel_id": 33,
+            "mac_address": "aa:bb:cc:dd:ee:ff",
+            "subcarrier_spacing": 50_000,
+            "first_active_subcarrier_index": 148,
+            "subcarrier_zero_frequency": 1_121_600_000,
+            "values": values.tolist(),
+        }
+
+    @staticmethod
+    def legacy_basic_analysis_rxmer(measurement: dict[str, Any]) -> DsRxMerAnalysisModel:
+        spacing: int    = measurement["subcarrier_spacing"]
+        first_idx: int  = measurement["first_active_subcarrier_index"]
+        zero_freq: int  = measurement["subcarrier_zero_frequency"]
+        values          = measurement["values"]
+
+        base_freq = (spacing * first_idx) + zero_freq
+        freqs = [base_freq + (i * spacing) for i in range(len(values))]
+
+        def classify(v: float) -> int:
+            if v == RXMER_EXCLUSION:
+                return int(RxMerCarrierType.EXCLUSION.value)
+            if v in (RXMER_CLIPPED_LOW, RXMER_CLIPPED_HIGH):
+                return int(RxMerCarrierType.CLIPPED.value)
+            return int(RxMerCarrierType.NORMAL.value)
+
+        carrier_status = [classify(v) for v in values]
+
+        instances = [Shannon(v) for v in values]
+        bits = [inst.bits for inst in instances]
+        counts: dict[str, int] = {mod: 0 for mod in Shannon.QAM_MODULATIONS.values()}
+        for inst in instances:
+            for b, mod in Shannon.QAM_MODULATIONS.items():
+                if b <= inst.bits:
+                    counts[mod] += 1
+
+        shannon = ShannonSeriesModel(
+            snr_db_values               = list(values),
+            bits_per_symbol             = bits,
+            modulations                 = [inst.get_modulation() for inst in instances],
+            snr_db_min                  = Shannon.snr_to_snr_limit(list(values)),
+            supported_modulation_counts = counts,
+        )
+
+        regression = RegressionModel(slope=list(LinearRegression1D(values, freqs).regression_line()))
+
+        return DsRxMerAnalysisModel(
+            channel_id                      = measurement["channel_id"],
+            mac_address                     = measurement["mac_address"],
+            subcarrier_spacing              = spacing,
+            first_active_subcarrier_index   = first_idx,
+            subcarrier_zero_frequency       = zero_freq,
+            carrier_values                  = RxMerCarrierValuesModel(
+                carrier_status_map  = {t.name.lower(): t.value for t in RxMerCarrierType},
+                carrier_count       = len(freqs),
+                magnitude           = values,
+                frequency           = freqs,
+                carrier_status      = carrier_status,
+            ),
+            regression                      = regression,
+            modulation_statistics           = shannon,
+        )
+
+    def verify(self) -> bool:
+        """Return True when both paths produce equivalent models."""
+        legacy = self.legacy_basic_analysis_rxmer(self.measurement)
+        vector = Analysis.basic_analysis_rxmer(self.measurement)
+
+        return (
+            legacy.carrier_values.model_dump() == vector.carrier_values.model_dump()
+            and legacy.modulation_statistics.model_dump() == vector.modulation_statistics.model_dump()
+            and bool(np.allclose(legacy.regression.slope, vector.regression.slope))
+        )
+
+    def run(self, repeat: int) -> tuple[float, float]:
+        """Return the best-of-``repeat`` wall time (seconds) for (legacy, vectorized)."""
+        legacy = min(timeit.repeat(lambda: self.legacy_basic_analysis_rxmer(self.measurement), number=1, repeat=repeat))
+        vector = min(timeit.repeat(lambda: Analysis.basic_analysis_rxmer(self.measurement), number=1, repeat=repeat))
+        return legacy, vector
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark legacy vs ndarray RxMER basic analysis.")
+    parser.add_argument("--subcarriers", type=int, default=DEFAULT_SUBCARRIERS, help="Active subcarriers per channel.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Timing repetitions (best-of).")
+    args = parser.parse_args()
+
+    bench = RxMerAnalysisBenchmark(args.subcarriers)
+    if not bench.verify():
+        print("ERROR: legacy and vectorized RxMER analysis results differ", file=sys.stderr)
+        return 1
+
+    legacy, vector = bench.run(args.repeat)
+    print(f"subcarriers : {args.subcarriers}")
+    print(f"legacy      : {legacy * 1e3:8.2f} ms")
+    print(f"vectorized  : {vector * 1e3:8.2f} ms")
+    print(f"speedup     : {legacy / vector:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())